@@ -26,6 +26,11 @@
 #include <string>
 #include <unordered_set>
 
+#include "parallel/parallel.hpp"
+
+
+using namespace ccore::parallel;
+
 
 namespace ccore {
 
@@ -58,6 +63,8 @@ void dbscan::process(const dataset & p_data, const dbscan_data_t p_type, cluster
     m_visited = std::vector<bool>(m_data_ptr->size(), false);
     m_belong = std::vector<bool>(m_data_ptr->size(), false);
 
+    calculate_neighbors();
+
     m_result_ptr = (dbscan_data *) &p_result;
 
     for (size_t i = 0; i < m_data_ptr->size(); i++) {
@@ -82,6 +89,9 @@ void dbscan::process(const dataset & p_data, const dbscan_data_t p_type, cluster
         }
     }
 
+    m_neighbor_indexes.clear();
+    m_neighbor_indexes.shrink_to_fit();
+
     m_data_ptr = nullptr;
     m_result_ptr = nullptr;
 }
@@ -130,6 +140,20 @@ void dbscan::expand_cluster(const std::size_t p_index, cluster & allocated_clust
 
 
 void dbscan::get_neighbors(const size_t p_index, std::vector<size_t> & p_neighbors) {
+    p_neighbors = m_neighbor_indexes[p_index];
+}
+
+
+void dbscan::calculate_neighbors(void) {
+    m_neighbor_indexes = std::vector<std::vector<std::size_t>>(m_data_ptr->size());
+
+    parallel_for(std::size_t(0), m_data_ptr->size(), [this](const std::size_t p_index) {
+        find_neighbors(p_index, m_neighbor_indexes[p_index]);
+    });
+}
+
+
+void dbscan::find_neighbors(const size_t p_index, std::vector<size_t> & p_neighbors) {
     switch(m_type) {
     case dbscan_data_t::POINTS:
         get_neighbors_from_points(p_index, p_neighbors);
@@ -67,6 +67,8 @@ private:
 
     container::kdtree   m_kdtree          = container::kdtree();
 
+    std::vector<std::vector<std::size_t>>   m_neighbor_indexes = { };   /* neighbors of each object that are found in parallel before processing */
+
 public:
     /**
     *
@@ -127,6 +129,10 @@ private:
     */
     void get_neighbors(const size_t p_index, std::vector<size_t> & p_neighbors);
 
+    void calculate_neighbors(void);
+
+    void find_neighbors(const size_t p_index, std::vector<size_t> & p_neighbors);
+
     void get_neighbors_from_points(const size_t p_index, std::vector<size_t> & p_neighbors);
 
     void get_neighbors_from_distance_matrix(const size_t p_index, std::vector<size_t> & p_neighbors);
@@ -27,6 +27,8 @@
 #include "cluster/kmeans.hpp"
 #include "cluster/kmeans_plus_plus.hpp"
 
+#include "parallel/parallel.hpp"
+
 #include "utils/metric.hpp"
 
 #include "definitions.hpp"
@@ -73,16 +75,19 @@ public:
         m_result = &p_result;
         m_elbow.clear();
 
-        for (std::size_t i = m_kmin; i < m_kmax; i++) {
+        m_result->get_wce().resize(m_kmax - m_kmin);
+
+        /* each amount of clusters is processed independently */
+        parallel::parallel_for(m_kmin, m_kmax, [this, &p_data](const std::size_t p_amount) {
             dataset initial_centers;
-            TypeInitializer(i).initialize(p_data, initial_centers);
+            TypeInitializer(p_amount).initialize(p_data, initial_centers);
 
             kmeans_data result;
             kmeans instance(initial_centers, 0.0001);
             instance.process(p_data, result);
 
-            m_result->get_wce().push_back(result.wce());
-        }
+            m_result->get_wce()[p_amount - m_kmin] = result.wce();
+        });
 
         calculate_elbows();
         m_result->set_amount(find_optimal_kvalue());
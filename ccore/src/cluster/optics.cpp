@@ -29,6 +29,11 @@
 
 #include "ordering_analyser.hpp"
 
+#include "parallel/parallel.hpp"
+
+
+using namespace ccore::parallel;
+
 
 namespace ccore {
 
@@ -74,6 +79,9 @@ void optics::process(const dataset & p_data, const optics_data_t p_type, cluster
 
     m_result_ptr->set_radius(m_radius);
 
+    m_neighbor_objects.clear();
+    m_neighbor_objects.shrink_to_fit();
+
     m_data_ptr    = nullptr;
     m_result_ptr  = nullptr;
 }
@@ -91,6 +99,8 @@ void optics::initialize(void) {
         create_kdtree();
     }
 
+    calculate_neighbors();
+
     m_optics_objects = &(m_result_ptr->optics_objects());
     if (m_optics_objects->empty()) {
         m_optics_objects->reserve(m_data_ptr->size());
@@ -222,6 +232,20 @@ void optics::extract_clusters(void) {
 
 
 void optics::get_neighbors(const size_t p_index, neighbors_collection & p_neighbors) {
+    p_neighbors = m_neighbor_objects[p_index];
+}
+
+
+void optics::calculate_neighbors(void) {
+    m_neighbor_objects = std::vector<neighbors_collection>(m_data_ptr->size());
+
+    parallel_for(std::size_t(0), m_data_ptr->size(), [this](const std::size_t p_index) {
+        find_neighbors(p_index, m_neighbor_objects[p_index]);
+    });
+}
+
+
+void optics::find_neighbors(const size_t p_index, neighbors_collection & p_neighbors) {
     switch(m_type) {
     case optics_data_t::POINTS:
         get_neighbors_from_points(p_index, p_neighbors);
@@ -85,6 +85,8 @@ private:
 
     std::vector<optics_descriptor *>    m_ordered_database  = { };
 
+    std::vector<neighbors_collection>   m_neighbor_objects  = { };   /* neighbors of each object that are found in parallel before processing */
+
 public:
     /**
      *
@@ -173,6 +175,10 @@ private:
 
     void get_neighbors(const std::size_t p_index, neighbors_collection & p_neighbors);
 
+    void calculate_neighbors(void);
+
+    void find_neighbors(const std::size_t p_index, neighbors_collection & p_neighbors);
+
     void get_neighbors_from_points(const std::size_t p_index, neighbors_collection & p_neighbors);
 
     void get_neighbors_from_distance_matrix(const std::size_t p_index, neighbors_collection & p_neighbors);
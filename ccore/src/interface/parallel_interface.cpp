@@ -0,0 +1,40 @@
+/**
+*
+* @authors Andrei Novikov (pyclustering@yandex.ru)
+* @date 2014-2019
+* @copyright GNU Public License
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#include "interface/parallel_interface.h"
+
+#include "parallel/parallel.hpp"
+
+
+void parallel_set_thread_amount(const std::size_t p_amount) {
+    ccore::parallel::set_thread_amount(p_amount);
+}
+
+
+std::size_t parallel_get_thread_amount(void) {
+    return ccore::parallel::get_thread_amount();
+}
+
+
+std::size_t parallel_get_hardware_thread_amount(void) {
+    return ccore::parallel::AMOUNT_HARDWARE_THREADS;
+}
@@ -0,0 +1,56 @@
+/**
+*
+* @authors Andrei Novikov (pyclustering@yandex.ru)
+* @date 2014-2019
+* @copyright GNU Public License
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+#pragma once
+
+
+#include <cstddef>
+
+#include "definitions.hpp"
+
+
+/**
+ *
+ * @brief   Sets amount of threads (including caller thread) that is used by parallel algorithms of the library.
+ * @details Amount of threads is limited by amount of hardware threads, '1' means that algorithms are processed
+ *           sequentially, '0' resets amount of threads to amount of hardware threads.
+ *
+ * @param[in] p_amount: amount of threads that should be used.
+ *
+ */
+extern "C" DECLARATION void parallel_set_thread_amount(const std::size_t p_amount);
+
+
+/**
+ *
+ * @brief   Returns amount of threads (including caller thread) that is used by parallel algorithms of the library.
+ *
+ */
+extern "C" DECLARATION std::size_t parallel_get_thread_amount(void);
+
+
+/**
+ *
+ * @brief   Returns amount of hardware threads that is maximum amount of threads for parallel algorithms.
+ *
+ */
+extern "C" DECLARATION std::size_t parallel_get_hardware_thread_amount(void);
@@ -0,0 +1,59 @@
+/**
+*
+* @authors Andrei Novikov (pyclustering@yandex.ru)
+* @date 2014-2019
+* @copyright GNU Public License
+*
+* GNU_PUBLIC_LICENSE
+*   pyclustering is free software: you can redistribute it and/or modify
+*   it under the terms of the GNU General Public License as published by
+*   the Free Software Foundation, either version 3 of the License, or
+*   (at your option) any later version.
+*
+*   pyclustering is distributed in the hope that it will be useful,
+*   but WITHOUT ANY WARRANTY; without even the implied warranty of
+*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+*   GNU General Public License for more details.
+*
+*   You should have received a copy of the GNU General Public License
+*   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+*/
+
+
+#include "parallel.hpp"
+
+#include <algorithm>
+#include <atomic>
+
+
+namespace ccore {
+
+namespace parallel {
+
+
+static std::atomic<std::size_t> THREAD_AMOUNT(AMOUNT_HARDWARE_THREADS);
+
+
+void set_thread_amount(const std::size_t p_amount) {
+    THREAD_AMOUNT = (p_amount == DEFAULT_THREAD_AMOUNT) ? AMOUNT_HARDWARE_THREADS : std::min(p_amount, AMOUNT_HARDWARE_THREADS);
+}
+
+
+std::size_t get_thread_amount(void) {
+    return THREAD_AMOUNT;
+}
+
+
+std::size_t get_call_thread_amount(const std::size_t p_amount) {
+    if (p_amount == DEFAULT_THREAD_AMOUNT) {
+        return THREAD_AMOUNT;
+    }
+
+    return std::min(p_amount, AMOUNT_HARDWARE_THREADS);
+}
+
+
+}
+
+}
@@ -27,6 +27,7 @@
 #include <cstddef>
 #include <functional>
 #include <future>
+#include <thread>
 #include <vector>
 
 #include "spinlock.hpp"
@@ -55,23 +56,61 @@ namespace ccore {
 namespace parallel {
 
 
+/* Amount of threads that is used if it has not been specified by user. */
+const std::size_t AMOUNT_HARDWARE_THREADS = (std::thread::hardware_concurrency() > 0) ? std::thread::hardware_concurrency() : 1;
+
+/* Special value of amount of threads that means global setting (see 'set_thread_amount'). */
+const std::size_t DEFAULT_THREAD_AMOUNT = 0;
+
+
+/**
+ *
+ * @brief   Sets amount of threads (including caller thread) that is used by parallel algorithms.
+ * @details Amount of threads is limited by amount of hardware threads. '1' means that parallel processing
+ *           is not used, 'DEFAULT_THREAD_AMOUNT' resets amount of threads to amount of hardware threads.
+ *
+ * @param[in] p_amount: amount of threads that should be used.
+ *
+ */
+void set_thread_amount(const std::size_t p_amount);
+
+
+/**
+ *
+ * @brief   Returns amount of threads (including caller thread) that is used by parallel algorithms.
+ *
+ */
+std::size_t get_thread_amount(void);
+
+
+/**
+ *
+ * @brief   Returns amount of threads that should be used for the call taking into account limitation.
+ *
+ * @param[in] p_amount: amount of threads that is specified for the call ('DEFAULT_THREAD_AMOUNT' means global setting).
+ *
+ */
+std::size_t get_call_thread_amount(const std::size_t p_amount);
+
+
 /* Pool of threads is used to prevent overhead in case of nested loop */
-static const std::size_t AMOUNT_HARDWARE_THREADS = std::thread::hardware_concurrency();
 static const std::size_t AMOUNT_THREADS = (AMOUNT_HARDWARE_THREADS > 1) ? (AMOUNT_HARDWARE_THREADS - 1) : 0;
 static std::vector<std::future<void>> FUTURE_STORAGE(AMOUNT_THREADS);
 static std::vector<spinlock> FUTURE_LOCKS(AMOUNT_THREADS);
 
 
 template <typename TypeIndex, typename TypeAction>
-void parallel_for(const TypeIndex p_start, const TypeIndex p_end, const TypeAction & p_task) {
+void parallel_for(const TypeIndex p_start, const TypeIndex p_end, const TypeAction & p_task, const std::size_t p_threads = DEFAULT_THREAD_AMOUNT) {
+    const std::size_t amount_async_tasks = get_call_thread_amount(p_threads) - 1;
+
 #if defined(PARALLEL_IMPLEMENTATION_ASYNC_POOL)
-    const TypeIndex step = (p_end - p_start) / (AMOUNT_THREADS + 1);
+    const TypeIndex step = (p_end - p_start) / (amount_async_tasks + 1);
     TypeIndex current_start = p_start;
     TypeIndex current_end = p_start + step;
 
     std::vector<std::size_t> captured_feature;
 
-    for (std::size_t i = 0; i < AMOUNT_THREADS; ++i) {
+    for (std::size_t i = 0; i < amount_async_tasks; ++i) {
         const auto async_task = [&p_task, current_start, current_end](){
             for (TypeIndex i = current_start; i < current_end; ++i) {
                 p_task(i);
@@ -107,9 +146,17 @@ void parallel_for(const TypeIndex p_start, const TypeIndex p_end, const TypeActi
         FUTURE_LOCKS[index_feature].unlock();
     }
 #elif defined(PARALLEL_IMPLEMENTATION_PPL)
-    concurrency::parallel_for(p_start, p_end, p_task);
+    if (amount_async_tasks > 0) {
+        concurrency::parallel_for(p_start, p_end, p_task);
+    }
+    else {
+        for (TypeIndex i = p_start; i < p_end; i++) {
+            p_task(i);
+        }
+    }
 #else
-    for (std::size_t i = p_start; i < p_end; i++) {
+    (void) amount_async_tasks;
+    for (TypeIndex i = p_start; i < p_end; i++) {
         p_task(i);
     }
 #endif
@@ -117,16 +164,18 @@ void parallel_for(const TypeIndex p_start, const TypeIndex p_end, const TypeActi
 
 
 template <typename TypeIter, typename TypeAction>
-void parallel_for_each(const TypeIter p_begin, const TypeIter p_end, const TypeAction & p_task) {
+void parallel_for_each(const TypeIter p_begin, const TypeIter p_end, const TypeAction & p_task, const std::size_t p_threads = DEFAULT_THREAD_AMOUNT) {
+    const std::size_t amount_async_tasks = get_call_thread_amount(p_threads) - 1;
+
 #if defined(PARALLEL_IMPLEMENTATION_ASYNC_POOL)
-    const std::size_t step = std::distance(p_begin, p_end) / (AMOUNT_THREADS + 1);
+    const std::size_t step = std::distance(p_begin, p_end) / (amount_async_tasks + 1);
 
     auto current_start = p_begin;
     auto current_end = p_begin + step;
 
     std::vector<std::size_t> captured_feature;
 
-    for (std::size_t i = 0; i < AMOUNT_THREADS; ++i) {
+    for (std::size_t i = 0; i < amount_async_tasks; ++i) {
         auto async_task = [&p_task, current_start, current_end](){
             for (auto iter = current_start; iter != current_end; ++iter) {
                 p_task(*iter);
@@ -162,8 +211,16 @@ void parallel_for_each(const TypeIter p_begin, const TypeIter p_end, const TypeA
         FUTURE_LOCKS[index_feature].unlock();
     }
 #elif defined(PARALLEL_IMPLEMENTATION_PPL)
-    concurrency::parallel_for_each(p_begin, p_end, p_task);
+    if (amount_async_tasks > 0) {
+        concurrency::parallel_for_each(p_begin, p_end, p_task);
+    }
+    else {
+        for (auto iter = p_begin; iter != p_end; ++iter) {
+            p_task(*iter);
+        }
+    }
 #else
+    (void) amount_async_tasks;
     for (auto iter = p_begin; iter != p_end; ++iter) {
         p_task(*iter);
     }
@@ -172,8 +229,8 @@ void parallel_for_each(const TypeIter p_begin, const TypeIter p_end, const TypeA
 
 
 template <typename TypeContainer, typename TypeAction>
-void parallel_for_each(const TypeContainer & p_container, const TypeAction & p_task) {
-    parallel_for_each(std::begin(p_container), std::end(p_container), p_task);
+void parallel_for_each(const TypeContainer & p_container, const TypeAction & p_task, const std::size_t p_threads = DEFAULT_THREAD_AMOUNT) {
+    parallel_for_each(std::begin(p_container), std::end(p_container), p_task, p_threads);
 }
 
 
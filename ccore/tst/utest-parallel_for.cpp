@@ -58,4 +58,45 @@ TEST(utest_parallel_for, square_10_elements) {
 
 TEST(utest_parallel_for, square_10000_elements) {
     template_parallel_square(10000);
+}
+
+
+static void template_parallel_square_threads(const std::size_t p_length, const std::size_t p_threads) {
+    std::vector<double> values(p_length);
+    std::iota(values.begin(), values.end(), 0);
+
+    std::vector<double> results(p_length);
+    parallel_for(std::size_t(0), values.size(), [&values, &results](const std::size_t p_index) {
+        results[p_index] = values[p_index] * values[p_index];
+    }, p_threads);
+
+    for (std::size_t i = 0; i < p_length; i++) {
+        ASSERT_EQ(values[i] * values[i], results[i]);
+    }
+}
+
+
+TEST(utest_parallel_for, square_10000_elements_one_thread) {
+    template_parallel_square_threads(10000, 1);
+}
+
+
+TEST(utest_parallel_for, square_10000_elements_two_threads) {
+    template_parallel_square_threads(10000, 2);
+}
+
+
+TEST(utest_parallel_for, thread_amount) {
+    const std::size_t default_amount = get_thread_amount();
+    ASSERT_EQ(AMOUNT_HARDWARE_THREADS, default_amount);
+
+    set_thread_amount(1);
+    ASSERT_EQ(1U, get_thread_amount());
+    template_parallel_square(1000);
+
+    set_thread_amount(AMOUNT_HARDWARE_THREADS + 10);
+    ASSERT_EQ(AMOUNT_HARDWARE_THREADS, get_thread_amount());
+
+    set_thread_amount(DEFAULT_THREAD_AMOUNT);
+    ASSERT_EQ(AMOUNT_HARDWARE_THREADS, get_thread_amount());
 }
\ No newline at end of file
@@ -36,6 +36,7 @@ Cluster analysis algorithms and methods (module pyclustering.cluster):
 - BANG (pyclustering.cluster.bang);
 - BIRCH (pyclustering.cluster.birch);
 - BSAS (pyclustering.cluster.bsas);
+- CLARA (pyclustering.cluster.clara);
 - CLARANS (pyclustering.cluster.clarans);
 - CLIQUE (pyclustering.cluster.clique);
 - CURE (pyclustering.cluster.cure);
@@ -43,6 +44,7 @@ Cluster analysis algorithms and methods (module pyclustering.cluster):
 - Elbow (pyclustering.cluster.elbow);
 - EMA (pyclustering.cluster.ema);
 - GA (genetic algorithm pyclustering.cluster.ga);
+- Incremental DBSCAN (pyclustering.cluster.incremental_dbscan);
 - HSyncNet (bio-inspired algorithm pyclustering.cluster.hsyncnet);
 - K-Means (pyclustering.cluster.kmeans);
 - K-Means++ (pyclustering.cluster.center_initializer);
@@ -50,6 +52,7 @@ Cluster analysis algorithms and methods (module pyclustering.cluster):
 - K-Medoids (pyclustering.cluster.kmedoids);
 - MBSAS (pyclustering.cluster.mbsas);
 - OPTICS (pyclustering.cluster.optics);
+- Partitioned DBSCAN (pyclustering.cluster.partitioned_dbscan);
 - ROCK (pyclustering.cluster.rock);
 - Silhouette (pyclustering.cluster.silhouette);
 - SOM-SC (pyclustering.cluster.somsc);
@@ -75,8 +78,10 @@ Graph coloring algorithms (module pyclustering.gcolor):
 - Sync: Oscillatory Network based on Kuramoto model for graph coloring (pyclustering.gcolor.sync);
 
 Containers (module pyclustering.container):
+- Ball-Tree (pyclustering.container.balltree);
 - CF-Tree (pyclustering.container.cftree);
 - KD-Tree (pyclustering.container.kdtree);
+- Radius Neighbor Graph (pyclustering.container.neighbor_graph);
 
 
 Utils that can be used for analysis, visualization, etc are placed in module pyclustering.utils.
@@ -25,14 +25,11 @@
 
 import itertools
 import math
-import warnings
-
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.gridspec as gridspec
-except Exception:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available.")
+
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot', ['mpl_toolkits.mplot3d'])
+gridspec = lazy_module('matplotlib.gridspec')
 
 from pyclustering.utils.color import color as color_list
 
@@ -128,7 +128,7 @@ class agglomerative:
             self.__ccore = ccore_library.workable();
         
         if (self.__similarity == type_link.CENTROID_LINK):
-            self.__centers = self.__pointer_data.copy();    # used in case of usage of centroid links
+            self.__centers = list(self.__pointer_data);    # used in case of usage of centroid links
     
     
     def process(self):
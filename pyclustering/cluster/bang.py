@@ -25,17 +25,14 @@
 """
 
 import itertools
-import warnings
-
-try:
-    import matplotlib
-    import matplotlib.gridspec as gridspec
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+
+from pyclustering.utils.lazy_import import lazy_module
+
+matplotlib = lazy_module('matplotlib')
+gridspec = lazy_module('matplotlib.gridspec')
+plt = lazy_module('matplotlib.pyplot')
+patches = lazy_module('matplotlib.patches')
+animation = lazy_module('matplotlib.animation')
 
 from pyclustering.cluster import cluster_visualizer
 from pyclustering.cluster.encoder import type_encoding
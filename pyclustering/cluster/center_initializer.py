@@ -28,9 +28,17 @@
 """
 
 
+import os
 import numpy
 import random
 
+from concurrent.futures import ThreadPoolExecutor
+
+from pyclustering.cluster.kmedoids import kmedoids_distance_calculator
+
+from pyclustering.utils.blockwise_distance import blockwise_distance
+from pyclustering.utils.metric import distance_metric, type_metric
+
 
 class random_center_initializer:
     """!
@@ -176,7 +184,7 @@ class kmeans_plusplus_initializer:
 
         """
         
-        self.__data = numpy.array(data)
+        self.__data = numpy.asarray(data)
         self.__amount = amount_centers
         self.__candidates = amount_candidates
 
@@ -201,37 +209,35 @@ class kmeans_plusplus_initializer:
             raise AttributeError("Data is empty.")
 
 
-    def __calculate_shortest_distances(self, data, centers, index_representation):
+    def __update_shortest_distances(self, shortest_distances, center, index_representation):
         """!
-        @brief Calculates distance from each data point to nearest center.
+        @brief Updates distance from each data point to nearest center using the last initialized center, therefore
+                distances to previous centers are not calculated again.
         
-        @param[in] data (numpy.array): Array of points for that initialization is performed.
-        @param[in] centers (numpy.array): Array of points or indexes that represents centers.
-        @param[in] index_representation (bool): If 'True' then index representation is used in 'centers', otherwise
-                    points itself are used for representation.
+        @param[in] shortest_distances (numpy.array): Distances to nearest centers or None if there is no centers yet.
+        @param[in] center (array_like|uint): The last initialized center (point or its index).
+        @param[in] index_representation (bool): If 'True' then index representation is used for 'center', otherwise
+                    point itself is used for representation.
         
         @return (numpy.array) List of distances to closest center for each data point.
         
         """
 
-        dataset_differences = numpy.zeros((len(centers), len(data)))
-        for index_center in range(len(centers)):
-            if index_representation:
-                center = data[centers[index_center]]
-            else:
-                center = centers[index_center]
+        if index_representation:
+            center = self.__data[center]
 
-            dataset_differences[index_center] = numpy.sum(numpy.square(data - center), axis=1).T
+        distances = numpy.sum(numpy.square(self.__data - center), axis=1)
+        if shortest_distances is None:
+            return distances
 
-        shortest_distances = numpy.min(dataset_differences, axis=0)
-        return shortest_distances
+        return numpy.minimum(shortest_distances, distances)
 
 
-    def __get_next_center(self, centers, return_index):
+    def __get_next_center(self, distances, return_index):
         """!
         @brief Calculates the next center for the data.
 
-        @param[in] centers (array_like): Current initialized centers.
+        @param[in] distances (numpy.array): Distances from each point to closest center.
         @param[in] return_index (bool): If True then return center's index instead of point.
 
         @return (array_like) Next initialized center.<br>
@@ -239,8 +245,6 @@ class kmeans_plusplus_initializer:
 
         """
 
-        distances = self.__calculate_shortest_distances(self.__data, centers, return_index)
-
         if self.__candidates == kmeans_plusplus_initializer.FARTHEST_CENTER_CANDIDATE:
             center_index = numpy.argmax(distances)
         else:
@@ -303,12 +307,9 @@ class kmeans_plusplus_initializer:
         index_best_candidate = -1
         for _ in range(self.__candidates):
             candidate_probability = random.random()
-            index_candidate = 0
-
-            for index_object in range(len(probabilities)):
-                if candidate_probability < probabilities[index_object]:
-                    index_candidate = index_object
-                    break
+            index_candidate = int(numpy.searchsorted(probabilities, candidate_probability, side='right'))
+            if index_candidate == len(probabilities):
+                index_candidate = 0
 
             if index_best_candidate == -1:
                 index_best_candidate = index_candidate
@@ -335,10 +336,413 @@ class kmeans_plusplus_initializer:
 
         return_index = kwargs.get('return_index', False)
         centers = [self.__get_initial_center(return_index)]
+        distances = None
 
         # For each next center
         for _ in range(1, self.__amount):
-            next_center = self.__get_next_center(centers, return_index)
+            distances = self.__update_shortest_distances(distances, centers[-1], return_index)
+            next_center = self.__get_next_center(distances, return_index)
             centers.append(next_center)
 
-        return centers
\ No newline at end of file
+        return centers
+
+
+class kmeans_parallel_initializer:
+    """!
+    @brief Scalable K-Means++ (K-Means||) is an algorithm for choosing the initial centers for K-Means that needs only
+            a few passes over the data.
+    @details K-Means++ chooses centers one by one, therefore it passes over the data K times. K-Means|| oversamples
+              candidates instead: the first candidate is chosen randomly with uniform distribution and then several
+              rounds are performed, on each round each point becomes a candidate independently with probability
+              \f[p_{i}=\min\left(1, \frac{l \cdot D(x_{i})}{\sum_{j=0}^{N}D(x_{j})}\right)\f]
+              where \f$l\f$ is an oversampling factor and \f$D(x_{i})\f$ is a square distance from point \f$i\f$ to the
+              closest candidate. Shortest distances are updated using only new candidates of the round. Each candidate
+              is weighted by amount of points that are closer to it than to other candidates, and weighted candidates
+              are reduced to K centers using K-Means++ method.
+
+    Distances of each round are calculated by blocks of the data that are processed by pool of threads, each block
+    is processed by tiles with bounded memory.
+
+    Code example where initial centers are prepared for K-Means algorithm:
+    @code
+        # Read data 'SampleSimple3' from Simple Sample collection.
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+
+        # Calculate initial centers using K-Means|| method with three rounds and four threads.
+        centers = kmeans_parallel_initializer(sample, 4, rounds=3, pool_size=4).initialize()
+
+        # Perform cluster analysis using K-Means algorithm with initial centers.
+        kmeans_instance = kmeans(sample, centers)
+        kmeans_instance.process()
+        clusters = kmeans_instance.get_clusters()
+    @endcode
+
+    @see kmeans_plusplus_initializer
+
+    """
+
+    def __init__(self, data, amount_centers, **kwargs):
+        """!
+        @brief Creates K-Means|| center initializer instance.
+
+        @param[in] data (array_like): List of points where each point is represented by list of coordinates.
+        @param[in] amount_centers (uint): Amount of centers that should be initialized.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'oversampling', 'rounds', 'pool_size',
+                    'random_state', 'memory_limit').
+
+        <b>Keyword Args:</b><br>
+            - oversampling (double): Expected amount of candidates that are chosen on each round (by default: 2 * amount_centers).
+            - rounds (uint): Amount of rounds of oversampling (by default: 2).
+            - pool_size (uint): Amount of threads that calculate distances on each round (by default: amount of CPUs).
+            - random_state (int): Seed for random generator (by default: None).
+            - memory_limit (uint): Amount of memory in bytes that is used for one tile of distance matrix between points
+               and candidates (by default: blockwise_distance.DEFAULT_MEMORY_LIMIT).
+
+        """
+
+        self.__data = numpy.asarray(data, dtype=numpy.float64)
+        self.__amount = amount_centers
+
+        self.__oversampling = kwargs.get('oversampling', 2.0 * amount_centers)
+        self.__rounds = kwargs.get('rounds', 2)
+        self.__pool_size = kwargs.get('pool_size', None) or os.cpu_count() or 1
+        self.__random_state = kwargs.get('random_state', None)
+        self.__memory_limit = kwargs.get('memory_limit', blockwise_distance.DEFAULT_MEMORY_LIMIT)
+
+        self.__check_parameters()
+
+
+    def __check_parameters(self):
+        """!
+        @brief Checks input parameters of the algorithm and if something wrong then corresponding exception is thrown.
+
+        """
+        if len(self.__data) == 0:
+            raise AttributeError("Data is empty.")
+
+        if (self.__amount <= 0) or (self.__amount > len(self.__data)):
+            raise AttributeError("Amount of cluster centers '" + str(self.__amount) + "' should be at least 1 and "
+                                 "should be less or equal to amount of points in data.")
+
+        if self.__oversampling <= 0:
+            raise AttributeError("Oversampling factor '" + str(self.__oversampling) + "' should be greater than 0.")
+
+        if self.__rounds < 0:
+            raise AttributeError("Amount of rounds '" + str(self.__rounds) + "' should not be negative.")
+
+        if self.__pool_size <= 0:
+            raise AttributeError("Pool size '" + str(self.__pool_size) + "' should be greater than 0.")
+
+
+    def initialize(self, **kwargs):
+        """!
+        @brief Calculates initial centers using K-Means|| method.
+
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'return_index').
+
+        <b>Keyword Args:</b><br>
+            - return_index (bool): If True then returns indexes of points from input data instead of points itself.
+
+        @return (list) List of initialized initial centers.
+                  If argument 'return_index' is False then returns list of points.
+                  If argument 'return_index' is True then returns list of indexes.
+
+        """
+
+        return_index = kwargs.get('return_index', False)
+        random_generator = numpy.random.RandomState(self.__random_state)
+
+        candidates, weights = self.__oversample(random_generator)
+        if len(candidates) <= self.__amount:
+            centers = self.__complement(candidates, random_generator)
+        else:
+            centers = candidates[self.__reduce(candidates, weights, random_generator)]
+
+        if return_index:
+            return centers.tolist()
+
+        return [self.__data[index_center] for index_center in centers]
+
+
+    def __oversample(self, random_generator):
+        """!
+        @brief Chooses candidates in line with K-Means|| rounds and calculates their weights.
+
+        @param[in] random_generator (numpy.random.RandomState): Random generator.
+
+        @return (tuple) Indexes of candidates and their weights (amount of points that are the closest to each candidate).
+
+        """
+
+        borders = numpy.linspace(0, len(self.__data), min(self.__pool_size, len(self.__data)) + 1).astype(int)
+        blocks = [(borders[i], blockwise_distance(self.__data[borders[i]:borders[i + 1]], self.__memory_limit))
+                  for i in range(len(borders) - 1)]
+
+        shortest_distances = numpy.full(len(self.__data), float('inf'))
+        nearest_candidates = numpy.zeros(len(self.__data), dtype=numpy.int64)
+
+        candidates = numpy.array([random_generator.randint(len(self.__data))])
+
+        with ThreadPoolExecutor(max_workers=len(blocks)) as executor:
+            self.__update_shortest_distances(executor, blocks, candidates, 0, shortest_distances, nearest_candidates)
+
+            for _ in range(self.__rounds):
+                total_distance = numpy.sum(shortest_distances)
+                if total_distance == 0.0:
+                    break
+
+                probabilities = numpy.minimum(1.0, self.__oversampling * shortest_distances / total_distance)
+                round_candidates = numpy.flatnonzero(random_generator.random_sample(len(self.__data)) < probabilities)
+                if len(round_candidates) == 0:
+                    continue
+
+                self.__update_shortest_distances(executor, blocks, round_candidates, len(candidates), shortest_distances, nearest_candidates)
+                candidates = numpy.concatenate((candidates, round_candidates))
+
+        weights = numpy.bincount(nearest_candidates, minlength=len(candidates))
+        return candidates, weights
+
+
+    def __update_shortest_distances(self, executor, blocks, candidates, offset, shortest_distances, nearest_candidates):
+        """!
+        @brief Updates distance from each point to the closest candidate using new candidates, blocks of data are
+                processed in parallel.
+
+        @param[in] executor (ThreadPoolExecutor): Pool of threads that processes blocks.
+        @param[in] blocks (list): Blocks of data as list of pairs (index of the first point, distance calculator).
+        @param[in] candidates (numpy.array): Indexes of new candidates.
+        @param[in] offset (uint): Amount of previous candidates.
+        @param[in,out] shortest_distances (numpy.array): Distance from each point to the closest candidate.
+        @param[in,out] nearest_candidates (numpy.array): Index of the closest candidate for each point.
+
+        """
+
+        metric = distance_metric(type_metric.EUCLIDEAN_SQUARE)
+        candidate_points = self.__data[candidates]
+
+        def update_block(block):
+            begin, calculator = block
+            end = begin + len(calculator)
+
+            labels, distances = calculator.nearest(candidate_points, metric)
+            closer = distances < shortest_distances[begin:end]
+
+            shortest_distances[begin:end][closer] = distances[closer]
+            nearest_candidates[begin:end][closer] = labels[closer] + offset
+
+        list(executor.map(update_block, blocks))
+        shortest_distances[candidates] = 0.0
+
+
+    def __reduce(self, candidates, weights, random_generator):
+        """!
+        @brief Reduces weighted candidates to required amount of centers using weighted K-Means++ method.
+
+        @param[in] candidates (numpy.array): Indexes of candidates.
+        @param[in] weights (numpy.array): Weight of each candidate.
+        @param[in] random_generator (numpy.random.RandomState): Random generator.
+
+        @return (numpy.array) Indexes of chosen candidates.
+
+        """
+
+        points = self.__data[candidates]
+        probabilities = weights.astype(numpy.float64)
+        shortest_distances = numpy.full(len(candidates), float('inf'))
+
+        chosen = []
+        for _ in range(self.__amount):
+            index_chosen = self.__choose_probable(probabilities, random_generator)
+            chosen.append(index_chosen)
+
+            shortest_distances = numpy.minimum(shortest_distances, numpy.sum(numpy.square(points - points[index_chosen]), axis=1))
+            shortest_distances[chosen] = 0.0
+            probabilities = weights * shortest_distances
+
+            if numpy.sum(probabilities) == 0.0:
+                # All weighted candidates coincide with chosen ones, the rest are taken with uniform distribution.
+                probabilities = numpy.ones(len(candidates))
+                probabilities[chosen] = 0.0
+
+        return numpy.array(chosen)
+
+
+    @staticmethod
+    def __choose_probable(probabilities, random_generator):
+        """!
+        @brief Chooses index in line with non-normalized probabilities.
+
+        @param[in] probabilities (numpy.array): Non-negative probabilities, at least one of them is positive.
+        @param[in] random_generator (numpy.random.RandomState): Random generator.
+
+        @return (uint) Chosen index.
+
+        """
+
+        cumulative = numpy.cumsum(probabilities)
+        index = int(numpy.searchsorted(cumulative, random_generator.random_sample() * cumulative[-1], side='right'))
+
+        # protection from rounding: index of the last positive probability
+        return min(index, int(numpy.flatnonzero(probabilities)[-1]))
+
+
+    def __complement(self, candidates, random_generator):
+        """!
+        @brief Complements candidates by points that are chosen with uniform distribution when amount of candidates is
+                not enough, for example, in case of data with a few unique points.
+
+        @param[in] candidates (numpy.array): Indexes of candidates.
+        @param[in] random_generator (numpy.random.RandomState): Random generator.
+
+        @return (numpy.array) Indexes of centers.
+
+        """
+
+        available = numpy.setdiff1d(numpy.arange(len(self.__data)), candidates)
+        additional = random_generator.choice(available, self.__amount - len(candidates), replace=False)
+
+        return numpy.concatenate((candidates, additional))
+
+
+
+class pam_build_initializer:
+    r"""!
+    @brief BUILD phase of PAM (Partitioning Around Medoids) is a greedy algorithm for choosing the initial medoids for
+            K-Medoids.
+    @details The first medoid is an object with the smallest total distance to all objects. Each next medoid is an
+              object that decreases total deviation the most:
+              \f[g_{c}=\sum_{o}\max\left(D(x_{o})-d(x_{o},x_{c}),0\right)\f]
+              where \f$D(x_{o})\f$ is a distance from object \f$o\f$ to the closest medoid. Distances from candidates to
+              all objects are calculated by blocks with bounded memory, therefore each medoid requires one pass over
+              all pairs of objects, but the whole distance matrix is not stored in case of points.
+
+    Initializer is deterministic, both points and distance matrix can be used as input data.
+
+    Code example where initial medoids are prepared for K-Medoids algorithm:
+    @code
+        # Read data 'SampleSimple3' from Simple Sample collection.
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+
+        # Calculate initial medoids using BUILD phase of PAM.
+        initial_medoids = pam_build_initializer(sample, 4).initialize(return_index=True)
+
+        # Perform cluster analysis using FastPAM algorithm with initial medoids.
+        kmedoids_instance = kmedoids(sample, initial_medoids, ccore=False, algorithm=kmedoids_algorithm.FASTPAM)
+        kmedoids_instance.process()
+        clusters = kmedoids_instance.get_clusters()
+    @endcode
+
+    @see kmedoids
+
+    """
+
+    def __init__(self, data, amount_medoids, **kwargs):
+        """!
+        @brief Creates PAM BUILD medoid initializer instance.
+
+        @param[in] data (array_like): Input data that is presented as list of points or as distance matrix.
+        @param[in] amount_medoids (uint): Amount of medoids that should be initialized.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric', 'data_type', 'memory_limit').
+
+        <b>Keyword Args:</b><br>
+            - metric (distance_metric): Metric that is used for distance calculation between two points (by default: Square Euclidean).
+            - data_type (string): Data type of input sample 'data' ('points', 'distance_matrix').
+            - memory_limit (uint): Amount of memory in bytes that is used for one block of distances between objects
+               (by default: blockwise_distance.DEFAULT_MEMORY_LIMIT).
+
+        """
+
+        self.__data = data
+        self.__amount = amount_medoids
+        self.__data_type = kwargs.get('data_type', 'points')
+
+        self.__calculator = kmedoids_distance_calculator(data, kwargs.get('metric', None), self.__data_type,
+                                                         kwargs.get('memory_limit', blockwise_distance.DEFAULT_MEMORY_LIMIT))
+
+        self.__check_parameters()
+
+
+    def __check_parameters(self):
+        """!
+        @brief Checks input parameters of the algorithm and if something wrong then corresponding exception is thrown.
+
+        """
+        if len(self.__calculator) == 0:
+            raise AttributeError("Data is empty.")
+
+        if (self.__amount <= 0) or (self.__amount > len(self.__calculator)):
+            raise AttributeError("Amount of medoids '" + str(self.__amount) + "' should be at least 1 and "
+                                 "should be less or equal to amount of objects in data.")
+
+
+    def initialize(self, **kwargs):
+        """!
+        @brief Calculates initial medoids using BUILD phase of PAM.
+
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'return_index').
+
+        <b>Keyword Args:</b><br>
+            - return_index (bool): If True then returns indexes of objects from input data instead of points itself.
+
+        @return (list) List of initialized medoids.
+                  If argument 'return_index' is False then returns list of points (only in case of points as input data).
+                  If argument 'return_index' is True or distance matrix is used then returns list of indexes.
+
+        """
+
+        return_index = kwargs.get('return_index', False)
+
+        medoids = [self.__find_central_object()]
+        nearest_distances = self.__calculator.calculate([medoids[0]])[0]
+
+        while len(medoids) < self.__amount:
+            medoids.append(self.__find_best_candidate(nearest_distances, medoids))
+            nearest_distances = numpy.minimum(nearest_distances, self.__calculator.calculate([medoids[-1]])[0])
+
+        if return_index or self.__data_type == 'distance_matrix':
+            return medoids
+
+        return [self.__data[index_medoid] for index_medoid in medoids]
+
+
+    def __find_central_object(self):
+        """!
+        @brief Finds object with the smallest total distance to all objects.
+
+        @return (uint) Index of the object.
+
+        """
+
+        amount_objects = len(self.__calculator)
+        total_distances = numpy.empty(amount_objects)
+
+        block_size = self.__calculator.get_block_size(amount_objects)
+        for begin in range(0, amount_objects, block_size):
+            end = min(begin + block_size, amount_objects)
+            total_distances[begin:end] = numpy.sum(self.__calculator.calculate(numpy.arange(begin, end)), axis=1)
+
+        return int(numpy.argmin(total_distances))
+
+
+    def __find_best_candidate(self, nearest_distances, medoids):
+        """!
+        @brief Finds object that decreases total deviation the most when it becomes a medoid.
+
+        @param[in] nearest_distances (numpy.array): Distance from each object to the closest medoid.
+        @param[in] medoids (list): Indexes of already initialized medoids.
+
+        @return (uint) Index of the object.
+
+        """
+
+        amount_objects = len(self.__calculator)
+        gains = numpy.empty(amount_objects)
+
+        block_size = self.__calculator.get_block_size(amount_objects, 2)
+        for begin in range(0, amount_objects, block_size):
+            end = min(begin + block_size, amount_objects)
+            distances = self.__calculator.calculate(numpy.arange(begin, end))
+            gains[begin:end] = numpy.sum(numpy.maximum(nearest_distances - distances, 0.0), axis=1)
+
+        gains[medoids] = -1.0
+        return int(numpy.argmax(gains))
@@ -0,0 +1,338 @@
+"""!
+
+@brief Cluster analysis algorithm: CLARA (Clustering LARge Applications) - sampled K-Medoids.
+@details Implementation based on book @cite book::finding_groups_in_data.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import os
+
+import numpy
+
+from pyclustering.cluster.center_initializer import pam_build_initializer
+from pyclustering.cluster.encoder import type_encoding
+from pyclustering.cluster.kmedoids import kmedoids, kmedoids_algorithm
+
+from pyclustering.utils.blockwise_distance import blockwise_distance
+from pyclustering.utils.metric import distance_metric, type_metric
+from pyclustering.utils.shared_dataset import shared_dataset
+
+
+def _process_sample_in_worker(seed, amount_clusters, parameters):
+    """!
+    @brief Processes one sample in worker process using dataset from shared memory.
+
+    @param[in] seed (uint): Seed that is used to draw the sample.
+    @param[in] amount_clusters (uint): Amount of clusters that should be allocated.
+    @param[in] parameters (dict): Parameters of K-Medoids algorithm.
+
+    @return (tuple) Total deviation of the full dataset and medoids of the sample.
+
+    """
+    return _process_sample(shared_dataset.get_worker_dataset(), seed, amount_clusters, parameters)
+
+
+def _draw_sample(amount_points, sample_size, seed):
+    """!
+    @brief Draws sample of points without replacement.
+
+    @param[in] amount_points (uint): Amount of points in the dataset.
+    @param[in] sample_size (uint): Amount of points in the sample.
+    @param[in] seed (uint): Seed of random generator.
+
+    @return (numpy.array) Sorted indexes of points of the sample.
+
+    """
+    return numpy.sort(numpy.random.default_rng(seed).choice(amount_points, sample_size, replace=False))
+
+
+def _process_sample(data, seed, amount_clusters, parameters):
+    """!
+    @brief Clusters one sample using K-Medoids with BUILD initialization and scores medoids against the full dataset.
+
+    @param[in] data (numpy.array): Input dataset.
+    @param[in] seed (uint): Seed that is used to draw the sample.
+    @param[in] amount_clusters (uint): Amount of clusters that should be allocated.
+    @param[in] parameters (dict): Parameters of K-Medoids algorithm.
+
+    @return (tuple) Total deviation of the full dataset and medoids (indexes in the dataset).
+
+    """
+    sample = _draw_sample(len(data), parameters['sample_size'], seed)
+    sample_data = data[sample]
+
+    metric = distance_metric(parameters['metric_type'], **parameters['metric_arguments'])
+    initial_medoids = pam_build_initializer(sample_data, amount_clusters, metric=metric,
+                                            memory_limit=parameters['memory_limit']).initialize(return_index=True)
+
+    kmedoids_instance = kmedoids(sample_data, initial_medoids, parameters['tolerance'], False, metric=metric,
+                                 algorithm=parameters['algorithm'], itermax=parameters['itermax'],
+                                 memory_limit=parameters['memory_limit'])
+    kmedoids_instance.process()
+
+    medoids = sample[kmedoids_instance.get_medoids()].tolist()
+    _, distances = blockwise_distance(data, parameters['memory_limit']).nearest(data[medoids], metric)
+
+    return float(numpy.sum(distances)), medoids
+
+
+class clara:
+    """!
+    @brief Class represents clustering algorithm CLARA (Clustering LARge Applications).
+    @details K-Medoids requires quadratic amount of distance calculations, therefore CLARA applies it to several random
+              samples of the dataset. Each sample is clustered by K-Medoids (FastPAM algorithm by default) from medoids
+              that are chosen by BUILD phase of PAM. Medoids of each sample are scored by total deviation of the full
+              dataset: points are assigned to the nearest medoids by chunks with bounded memory. Medoids with the
+              lowest total deviation are kept, therefore cost of the algorithm is linear in amount of points.
+
+              Samples are independent, therefore they are processed by pool of processes, dataset is placed to shared
+              memory once and worker processes use it without copying. Each sample is drawn using its own seed that is
+              generated using 'random_state', therefore results are reproducible and do not depend on amount of workers.
+
+    Example:
+    @code
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+
+        # cluster 8 samples of 100 points using 4 processes
+        clara_instance = clara(sample, 3, 8, sample_size=100, random_state=1000, pool_size=4)
+        clara_instance.process()
+
+        # medoids with the lowest total deviation and clusters of the full dataset
+        medoids = clara_instance.get_medoids()
+        clusters = clara_instance.get_clusters()
+
+        # total deviation of medoids of each sample
+        print(clara_instance.get_samples_deviation())
+    @endcode
+
+    @see kmedoids
+    @see pam_build_initializer
+
+    """
+
+    def __init__(self, data, amount_clusters, samples=5, **kwargs):
+        """!
+        @brief Creates CLARA algorithm.
+
+        @param[in] data (array_like): Input data that is presented as array of points (objects), each point should be represented by array_like data structure.
+        @param[in] amount_clusters (uint): Amount of clusters that should be allocated.
+        @param[in] samples (uint): Amount of random samples that are clustered by K-Medoids.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'sample_size', 'metric', 'algorithm',
+                    'tolerance', 'itermax', 'random_state', 'pool_size', 'memory_limit').
+
+        <b>Keyword Args:</b><br>
+            - sample_size (uint): Amount of points in each sample (by default: 40 + 2 * amount_clusters).
+            - metric (distance_metric): Metric that is used for distance calculation between two points (by default euclidean square distance).
+                       User-defined function of the metric should be picklable in case of several workers.
+            - algorithm (kmedoids_algorithm): Algorithm that is used by K-Medoids for each sample (by default: kmedoids_algorithm.FASTPAM).
+            - tolerance (double): Stop condition of K-Medoids for each sample (by default: 0.001).
+            - itermax (uint): Maximum amount of iterations (swaps) of K-Medoids for each sample (by default: 200).
+            - random_state (uint): Seed that is used to generate seeds of samples (by default: None).
+            - pool_size (uint): Amount of processes that cluster samples (by default: amount of CPUs).
+            - memory_limit (uint): Amount of memory in bytes that is used for one chunk of distances between points and
+               medoids (by default: blockwise_distance.DEFAULT_MEMORY_LIMIT).
+
+        """
+        self.__data = data
+        self.__amount_clusters = amount_clusters
+        self.__samples = samples
+
+        self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        self.__memory_limit = kwargs.get('memory_limit', blockwise_distance.DEFAULT_MEMORY_LIMIT)
+
+        sample_size = kwargs.get('sample_size', 40 + 2 * amount_clusters)
+        self.__parameters = { 'sample_size': min(sample_size, len(data)),
+                              'algorithm': kwargs.get('algorithm', kmedoids_algorithm.FASTPAM),
+                              'tolerance': kwargs.get('tolerance', 0.001),
+                              'itermax': kwargs.get('itermax', 200),
+                              'memory_limit': self.__memory_limit,
+                              'metric_type': self.__metric.get_type(),
+                              'metric_arguments': self.__metric.get_arguments() }
+
+        self.__random_state = kwargs.get('random_state', None)
+        self.__pool_size = kwargs.get('pool_size', None) or os.cpu_count() or 1
+
+        self.__clusters = []
+        self.__medoids = []
+        self.__total_deviation = float('inf')
+        self.__samples_deviation = []
+        self.__best_sample = -1
+
+        self.__verify_arguments(sample_size)
+
+
+    def process(self):
+        """!
+        @brief Performs cluster analysis in line with rules of CLARA algorithm.
+
+        @return (clara) Returns itself (CLARA instance).
+
+        @see get_clusters()
+        @see get_medoids()
+
+        """
+        data = numpy.ascontiguousarray(self.__data, dtype=numpy.float64)
+        seeds = numpy.random.RandomState(self.__random_state).randint(0, 2 ** 31 - 1, self.__samples).tolist()
+
+        if (self.__pool_size == 1) or (self.__samples == 1):
+            results = [_process_sample(data, seed, self.__amount_clusters, self.__parameters) for seed in seeds]
+        else:
+            results = self.__process_in_pool(data, seeds)
+
+        self.__samples_deviation = [result[0] for result in results]
+        self.__best_sample = int(numpy.argmin(self.__samples_deviation))
+
+        self.__total_deviation, self.__medoids = results[self.__best_sample]
+        self.__clusters = self.__allocate_clusters(data)
+        return self
+
+
+    def get_clusters(self):
+        """!
+        @brief Returns list of allocated clusters of the full dataset, each cluster contains indexes of objects in list of data.
+
+        @see process()
+        @see get_medoids()
+
+        """
+        return self.__clusters
+
+
+    def get_medoids(self):
+        """!
+        @brief Returns list of medoids of allocated clusters represented by indexes from the input data.
+
+        @see process()
+        @see get_clusters()
+
+        """
+        return self.__medoids
+
+
+    def get_total_deviation(self):
+        """!
+        @brief Returns total deviation (sum of distances between points and their medoids) of the full dataset.
+
+        @see process()
+        @see get_samples_deviation()
+
+        """
+        return self.__total_deviation
+
+
+    def get_samples_deviation(self):
+        """!
+        @brief Returns total deviation of the full dataset for medoids of each sample in order of samples.
+
+        @see process()
+        @see get_best_sample()
+
+        """
+        return self.__samples_deviation
+
+
+    def get_best_sample(self):
+        """!
+        @brief Returns index of sample whose medoids have the lowest total deviation.
+
+        @see process()
+        @see get_samples_deviation()
+
+        """
+        return self.__best_sample
+
+
+    def get_cluster_encoding(self):
+        """!
+        @brief Returns clustering result representation type that indicate how clusters are encoded.
+
+        @return (type_encoding) Clustering result representation.
+
+        @see get_clusters()
+
+        """
+        return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
+
+
+    def __process_in_pool(self, data, seeds):
+        """!
+        @brief Processes samples in pool of processes, dataset is shared using shared memory.
+
+        @param[in] data (numpy.array): Input dataset.
+        @param[in] seeds (list): Seeds that are used to draw samples.
+
+        @return (list) Results of samples.
+
+        """
+        with shared_dataset(data) as dataset, dataset.create_executor(min(self.__pool_size, self.__samples)) as executor:
+            futures = [executor.submit(_process_sample_in_worker, seed, self.__amount_clusters, self.__parameters)
+                       for seed in seeds]
+
+            return [future.result() for future in futures]
+
+
+    def __allocate_clusters(self, data):
+        """!
+        @brief Assigns each point of the full dataset to the nearest medoid.
+
+        @param[in] data (numpy.array): Input dataset.
+
+        @return (list) Clusters where the first object of each cluster is its medoid.
+
+        """
+        labels, _ = blockwise_distance(data, self.__memory_limit).nearest(data[self.__medoids], self.__metric)
+        labels[self.__medoids] = numpy.arange(len(self.__medoids))
+
+        order = numpy.argsort(labels, kind='stable')
+        bounds = numpy.searchsorted(labels[order], numpy.arange(len(self.__medoids) + 1))
+
+        clusters = []
+        for index_medoid, medoid in enumerate(self.__medoids):
+            cluster = order[bounds[index_medoid]:bounds[index_medoid + 1]]
+            clusters.append([medoid] + cluster[cluster != medoid].tolist())
+
+        return clusters
+
+
+    def __verify_arguments(self, sample_size):
+        """!
+        @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
+
+        @param[in] sample_size (uint): Amount of points in each sample that is specified by user.
+
+        """
+        if len(self.__data) == 0:
+            raise ValueError("Input data is empty (size: '%d')." % len(self.__data))
+
+        if (self.__amount_clusters <= 0) or (self.__amount_clusters > len(self.__data)):
+            raise ValueError("Amount of clusters (current value: '%d') should be greater than 0 and less or equal "
+                             "to amount of points in data." % self.__amount_clusters)
+
+        if self.__samples <= 0:
+            raise ValueError("Amount of samples should be greater than 0 (current value: '%d')." % self.__samples)
+
+        if sample_size < self.__amount_clusters:
+            raise ValueError("Sample size (current value: '%d') should be greater or equal to amount of clusters." % sample_size)
+
+        if self.__pool_size <= 0:
+            raise ValueError("Pool size should be greater than 0 (current value: '%d')." % self.__pool_size)
@@ -25,20 +25,148 @@
 """
 
 
-import random;
+import numpy;
 
 from pyclustering.cluster.encoder import type_encoding;
 
-from pyclustering.utils import euclidean_distance_square;
+from pyclustering.utils.blockwise_distance import blockwise_distance;
+from pyclustering.utils.metric import distance_metric, type_metric;
+from pyclustering.utils.shared_dataset import shared_dataset;
+
+
+def _search_local_minimum_in_worker(seed, number_clusters, maxneighbor):
+    """!
+    @brief Searches local minimum in worker process using dataset from shared memory.
+
+    @param[in] seed (uint): Seed of random generator of the search.
+    @param[in] number_clusters (uint): Amount of clusters that should be allocated.
+    @param[in] maxneighbor (uint): The maximum number of neighbors examined.
+
+    @return (tuple) Estimation of the local minimum and its medoids.
+
+    """
+    return _search_local_minimum(shared_dataset.get_worker_dataset(), seed, number_clusters, maxneighbor)
+
+
+def _calculate_distances(data, point):
+    """!
+    @brief Calculates euclidean square distances from each point of the dataset to the specified point.
+
+    @param[in] data (numpy.array): Input dataset.
+    @param[in] point (numpy.array): Point to which distances are calculated.
+
+    @return (numpy.array) Distances from each point of the dataset to the specified point.
+
+    """
+    difference = data - point
+    return numpy.einsum('ij,ij->i', difference, difference)
+
+
+def _search_local_minimum(data, seed, number_clusters, maxneighbor):
+    """!
+    @brief Searches one local minimum from random medoids in line with rules of CLARANS algorithm.
+    @details Distances from each point to all current medoids are kept in a table, nearest and second nearest distances
+              are cached, therefore cost of swap of a medoid with a candidate is calculated using only one vector of
+              distances from points to the candidate.
+
+    @param[in] data (numpy.array): Input dataset.
+    @param[in] seed (uint): Seed of random generator of the search.
+    @param[in] number_clusters (uint): Amount of clusters that should be allocated.
+    @param[in] maxneighbor (uint): The maximum number of neighbors examined.
+
+    @return (tuple) Estimation (total deviation) of the local minimum and its medoids.
+
+    """
+    generator = numpy.random.default_rng(seed)
+    amount_points = len(data)
+
+    medoids = generator.choice(amount_points, number_clusters, replace=False)
+    is_medoid = numpy.zeros(amount_points, dtype=bool)
+    is_medoid[medoids] = True
+
+    table = numpy.empty((amount_points, number_clusters))
+    for index_cluster, index_medoid in enumerate(medoids):
+        table[:, index_cluster] = _calculate_distances(data, data[index_medoid])
+
+    belong, nearest, second = _update_nearest_medoids(table)
+
+    index_neighbor = 0
+    while (index_neighbor < maxneighbor) and (amount_points > number_clusters):
+        # get random current medoid that is to be replaced and new candidate to be medoid
+        current_cluster_index = generator.integers(number_clusters)
+        candidate_medoid_index = generator.integers(amount_points)
+        while is_medoid[candidate_medoid_index]:
+            candidate_medoid_index = generator.integers(amount_points)
+
+        candidate_distances = _calculate_distances(data, data[candidate_medoid_index])
+
+        # points of replaced medoid move to the candidate or to their second nearest medoid, others may move to the candidate
+        replacement = numpy.where(belong == current_cluster_index, second, nearest)
+        candidate_cost = numpy.sum(numpy.minimum(candidate_distances, replacement) - nearest)
+
+        if candidate_cost < 0.0:
+            is_medoid[medoids[current_cluster_index]] = False
+            is_medoid[candidate_medoid_index] = True
+            medoids[current_cluster_index] = candidate_medoid_index
+
+            table[:, current_cluster_index] = candidate_distances
+            belong, nearest, second = _update_nearest_medoids(table)
+
+            # reset iterations and starts investigation from the begining
+            index_neighbor = 0
+
+        else:
+            index_neighbor += 1
+
+    return float(numpy.sum(nearest)), medoids.tolist()
+
+
+def _update_nearest_medoids(table):
+    """!
+    @brief Finds nearest medoid of each point and distances to the nearest and the second nearest medoids.
+
+    @param[in] table (numpy.array): Distances where rows correspond to points and columns correspond to medoids.
+
+    @return (tuple) Index of the nearest medoid of each point, distances to the nearest and the second nearest medoids.
+
+    """
+    belong = numpy.argmin(table, axis=1)
+    nearest = table[numpy.arange(len(table)), belong]
+
+    if table.shape[1] > 1:
+        second = numpy.partition(table, 1, axis=1)[:, 1]
+    else:
+        second = numpy.full(len(table), float('inf'))
+
+    return belong, nearest, second
 
 
 class clarans:
     """!
     @brief Class represents clustering algorithm CLARANS (a method for clustering objects for spatial data mining).
+    @details Each local search keeps table of distances from points to current medoids and caches distances to the
+              nearest and the second nearest medoids, therefore cost of each examined neighbor (swap of a medoid with
+              a candidate) is calculated by vectorized operations using one vector of distances to the candidate.
+
+              Local searches ('numlocal') are independent, therefore they can be performed by pool of processes, dataset
+              is placed to shared memory once. Each search uses its own random generator whose seed is generated using
+              'random_state', therefore results are reproducible and do not depend on amount of workers.
+
+    Example:
+    @code
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+
+        # perform 10 local searches by 4 processes
+        clarans_instance = clarans(sample, 4, 10, 5, random_state=1000, pool_size=4)
+        clarans_instance.process()
+
+        clusters = clarans_instance.get_clusters()
+        medoids = clarans_instance.get_medoids()
+    @endcode
     
     """
 
-    def __init__(self, data, number_clusters, numlocal, maxneighbor):
+    def __init__(self, data, number_clusters, numlocal, maxneighbor, **kwargs):
         """!
         @brief Constructor of clustering algorithm CLARANS.
         @details The higher the value of maxneighbor, the closer is CLARANS to K-Medoids (PAM - Partitioning Around Medoids), and the longer is each search of a local minima.
@@ -47,6 +175,11 @@ class clarans:
         @param[in] number_clusters (uint): amount of clusters that should be allocated.
         @param[in] numlocal (uint): the number of local minima obtained (amount of iterations for solving the problem).
         @param[in] maxneighbor (uint): the maximum number of neighbors examined.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'random_state', 'pool_size').
+
+        <b>Keyword Args:</b><br>
+            - random_state (uint): Seed that is used to generate seeds of local searches (by default: None).
+            - pool_size (uint): Amount of processes that perform local searches (by default: 1).
         
         """
         
@@ -55,42 +188,42 @@ class clarans:
         self.__maxneighbor = maxneighbor;
         self.__number_clusters = number_clusters;
         
+        self.__random_state = kwargs.get('random_state', None);
+        self.__pool_size = kwargs.get('pool_size', 1);
+        
         self.__clusters = [];
-        self.__current = [];
-        self.__belong = [];
         
         self.__optimal_medoids = [];
         self.__optimal_estimation = float('inf');
+        
+        self.__verify_arguments();
     
     
     def process(self):
         """!
         @brief Performs cluster analysis in line with rules of CLARANS algorithm.
         
+        @return (clarans) Returns itself (CLARANS instance).
+        
         @see get_clusters()
         @see get_medoids()
         
         """
         
-        random.seed();
-        
-        for _ in range(0, self.__numlocal):
-            # set (current) random medoids
-            self.__current = random.sample(range(0, len(self.__pointer_data)), self.__number_clusters);
-            
-            # update clusters in line with random allocated medoids
-            self.__update_clusters(self.__current);
-            
-            # optimize configuration
-            self.__optimize_configuration();
-            
-            # obtain cost of current cluster configuration and compare it with the best obtained
-            estimation = self.__calculate_estimation();
-            if (estimation < self.__optimal_estimation):
-                self.__optimal_medoids = self.__current[:];
-                self.__optimal_estimation = estimation;
-        
-        self.__update_clusters(self.__optimal_medoids);
+        data = numpy.ascontiguousarray(self.__pointer_data, dtype=numpy.float64);
+        seeds = numpy.random.RandomState(self.__random_state).randint(0, 2 ** 31 - 1, self.__numlocal).tolist();
+        
+        if (self.__pool_size == 1) or (self.__numlocal == 1):
+            results = [_search_local_minimum(data, seed, self.__number_clusters, self.__maxneighbor) for seed in seeds];
+        else:
+            results = self.__process_in_pool(data, seeds);
+        
+        # the first local minimum with the lowest estimation is chosen
+        index_optimal = int(numpy.argmin([result[0] for result in results]));
+        self.__optimal_estimation, self.__optimal_medoids = results[index_optimal];
+        
+        self.__update_clusters(data, self.__optimal_medoids);
+        return self;
     
     
     def get_clusters(self):
@@ -134,141 +267,59 @@ class clarans:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION;
 
 
-    def __update_clusters(self, medoids):
+    def __process_in_pool(self, data, seeds):
         """!
-        @brief Forms cluster in line with specified medoids by calculation distance from each point to medoids. 
+        @brief Performs local searches in pool of processes, dataset is shared using shared memory.
         
-        """
+        @param[in] data (numpy.array): Input dataset.
+        @param[in] seeds (list): Seeds of random generators of local searches.
         
-        self.__belong = [0] * len(self.__pointer_data);
-        self.__clusters = [[] for i in range(len(medoids))];
-        for index_point in range(len(self.__pointer_data)):
-            index_optim = -1;
-            dist_optim = 0.0;
-             
-            for index in range(len(medoids)):
-                dist = euclidean_distance_square(self.__pointer_data[index_point], self.__pointer_data[medoids[index]]);
-                 
-                if ( (dist < dist_optim) or (index is 0)):
-                    index_optim = index;
-                    dist_optim = dist;
-             
-            self.__clusters[index_optim].append(index_point);
-            self.__belong[index_point] = index_optim;
-        
-        # If cluster is not able to capture object it should be removed
-        self.__clusters = [cluster for cluster in self.__clusters if len(cluster) > 0];
-    
-    
-    def __optimize_configuration(self):
-        """!
-        @brief Finds quasi-optimal medoids and updates in line with them clusters in line with algorithm's rules. 
+        @return (list) Estimations and medoids of local minima.
         
         """
-        index_neighbor = 0;
-        while (index_neighbor < self.__maxneighbor):
-            # get random current medoid that is to be replaced
-            current_medoid_index = self.__current[random.randint(0, self.__number_clusters - 1)];
-            current_medoid_cluster_index = self.__belong[current_medoid_index];
-            
-            # get new candidate to be medoid
-            candidate_medoid_index = random.randint(0, len(self.__pointer_data) - 1);
-            
-            while (candidate_medoid_index in self.__current):
-                candidate_medoid_index = random.randint(0, len(self.__pointer_data) - 1);
-            
-            candidate_cost = 0.0;
-            for point_index in range(0, len(self.__pointer_data)):
-                if (point_index not in self.__current):
-                    # get non-medoid point and its medoid
-                    point_cluster_index = self.__belong[point_index];
-                    point_medoid_index = self.__current[point_cluster_index];
-                    
-                    # get other medoid that is nearest to the point (except current and candidate)
-                    other_medoid_index = self.__find_another_nearest_medoid(point_index, current_medoid_index);
-                    other_medoid_cluster_index = self.__belong[other_medoid_index];
-                    
-                    # for optimization calculate all required distances
-                    # from the point to current medoid
-                    distance_current = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[current_medoid_index]);
-                    
-                    # from the point to candidate median
-                    distance_candidate = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[candidate_medoid_index]);
-                    
-                    # from the point to nearest (own) medoid
-                    distance_nearest = float('inf');
-                    if ( (point_medoid_index != candidate_medoid_index) and (point_medoid_index != current_medoid_cluster_index) ):
-                        distance_nearest = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[point_medoid_index]);
-                    
-                    # apply rules for cost calculation
-                    if (point_cluster_index == current_medoid_cluster_index):
-                        # case 1:
-                        if (distance_candidate >= distance_nearest):
-                            candidate_cost += distance_nearest - distance_current;
-                        
-                        # case 2:
-                        else:
-                            candidate_cost += distance_candidate - distance_current;
-                    
-                    elif (point_cluster_index == other_medoid_cluster_index):
-                        # case 3 ('nearest medoid' is the representative object of that cluster and object is more similar to 'nearest' than to 'candidate'):
-                        if (distance_candidate > distance_nearest):
-                            pass;
-                        
-                        # case 4:
-                        else:
-                            candidate_cost += distance_candidate - distance_nearest;
-            
-            if (candidate_cost < 0):
-                # set candidate that has won
-                self.__current[current_medoid_cluster_index] = candidate_medoid_index;
-                
-                # recalculate clusters
-                self.__update_clusters(self.__current);
-                
-                # reset iterations and starts investigation from the begining
-                index_neighbor = 0;
+        
+        with shared_dataset(data) as dataset, dataset.create_executor(min(self.__pool_size, self.__numlocal)) as executor:
+            futures = [executor.submit(_search_local_minimum_in_worker, seed, self.__number_clusters,
+                                       self.__maxneighbor) for seed in seeds];
                 
-            else:
-                index_neighbor += 1;
+            return [future.result() for future in futures];
     
     
-    def __find_another_nearest_medoid(self, point_index, current_medoid_index):
+    def __update_clusters(self, data, medoids):
         """!
-        @brief Finds the another nearest medoid for the specified point that is differ from the specified medoid. 
-        
-        @param[in] point_index: index of point in dataspace for that searching of medoid in current list of medoids is perfomed.
-        @param[in] current_medoid_index: index of medoid that shouldn't be considered as a nearest.
+        @brief Forms cluster in line with specified medoids by calculation distance from each point to medoids. 
         
-        @return (uint) index of the another nearest medoid for the point.
+        @param[in] data (numpy.array): Input dataset.
+        @param[in] medoids (list): Indexes of medoids in the dataset.
         
         """
-        other_medoid_index = -1;
-        other_distance_nearest = float('inf');
-        for index_medoid in self.__current:
-            if (index_medoid != current_medoid_index):
-                other_distance_candidate = euclidean_distance_square(self.__pointer_data[point_index], self.__pointer_data[current_medoid_index]);
-                
-                if (other_distance_candidate < other_distance_nearest):
-                    other_distance_nearest = other_distance_candidate;
-                    other_medoid_index = index_medoid;
         
-        return other_medoid_index;
+        metric = distance_metric(type_metric.EUCLIDEAN_SQUARE);
+        labels, _ = blockwise_distance(data).nearest(data[medoids], metric);
+        
+        order = numpy.argsort(labels, kind='stable');
+        bounds = numpy.searchsorted(labels[order], numpy.arange(len(medoids) + 1));
+        
+        # If cluster is not able to capture object it should be removed
+        self.__clusters = [order[bounds[index]:bounds[index + 1]].tolist() for index in range(len(medoids))];
+        self.__clusters = [cluster for cluster in self.__clusters if len(cluster) > 0];
     
     
-    def __calculate_estimation(self):
+    def __verify_arguments(self):
         """!
-        @brief Calculates estimation (cost) of the current clusters. The lower the estimation,
-               the more optimally configuration of clusters.
-        
-        @return (double) estimation of current clusters.
+        @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
         
         """
-        estimation = 0.0;
-        for index_cluster in range(0, len(self.__clusters)):
-            cluster = self.__clusters[index_cluster];
-            index_medoid = self.__current[index_cluster];
-            for index_point in cluster:
-                estimation += euclidean_distance_square(self.__pointer_data[index_point], self.__pointer_data[index_medoid]);
-        
-        return estimation;
+        
+        if len(self.__pointer_data) == 0:
+            raise ValueError("Input data is empty (size: '%d')." % len(self.__pointer_data));
+        
+        if (self.__number_clusters <= 0) or (self.__number_clusters > len(self.__pointer_data)):
+            raise ValueError("Amount of clusters (current value: '%d') should be greater than 0 and less or equal "
+                             "to amount of points in data." % self.__number_clusters);
+        
+        if self.__numlocal <= 0:
+            raise ValueError("Amount of local searches should be greater than 0 (current value: '%d')." % self.__numlocal);
+        
+        if self.__pool_size <= 0:
+            raise ValueError("Pool size should be greater than 0 (current value: '%d')." % self.__pool_size);
@@ -37,6 +37,8 @@ from pyclustering.core.wrapper import ccore_library
 
 import pyclustering.core.cure_wrapper as wrapper
 
+from pyclustering.core.pyclustering_package import ccore_dataset
+
 
 class cure_cluster:
     """!
@@ -121,8 +123,6 @@ class cure:
         
         """
         
-        self.__pointer_data = self.__prepare_data_points(data)
-        
         self.__clusters = None
         self.__representors = None
         self.__means = None
@@ -135,6 +135,8 @@ class cure:
         if self.__ccore:
             self.__ccore = ccore_library.workable()
 
+        self.__pointer_data = self.__prepare_data_points(data)
+
         self.__validate_arguments()
 
 
@@ -307,6 +309,9 @@ class cure:
         if isinstance(sample, numpy.ndarray):
             return sample.tolist()
 
+        if isinstance(sample, ccore_dataset) and not self.__ccore:
+            return sample.get_data().tolist()
+
         return sample
 
 
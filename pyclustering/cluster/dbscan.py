@@ -25,10 +25,15 @@
 """
 
 
+import numpy
+
 from pyclustering.container.kdtree import kdtree
+from pyclustering.container.neighbor_graph import neighbor_graph
 
 from pyclustering.cluster.encoder import type_encoding
 
+from pyclustering.utils.metric import type_metric
+
 from pyclustering.core.wrapper import ccore_library
 
 import pyclustering.core.dbscan_wrapper as wrapper
@@ -37,7 +42,14 @@ import pyclustering.core.dbscan_wrapper as wrapper
 class dbscan:
     """!
     @brief Class represents clustering algorithm DBSCAN.
-    @details This DBSCAN algorithm is KD-tree optimized.
+    @details Python implementation finds eps-neighborhoods of all points at once (using KD-tree in case of points) and
+             stores them as compressed sparse rows (CSR): neighbors of point 'i' are 'indices[indptr[i]:indptr[i + 1]]'.
+             Neighborhoods can be precomputed by neighbor graph (container.neighbor_graph) for the maximum radius, then
+             DBSCAN with any smaller radius uses truncated rows of the graph instead of region queries.
+             Core points are marked by amount of neighbors and clusters are expanded by breadth-first search where
+             neighbors of the whole front are gathered by one vectorized operation. Distance between points can be
+             measured by any metric that satisfies triangle inequality, in this case neighborhoods are found by
+             ball-tree (container.balltree).
              
              CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
     
@@ -66,31 +78,33 @@ class dbscan:
         @param[in] data (list): Input data that is presented as list of points (objects), each point should be represented by list or tuple.
         @param[in] eps (double): Connectivity radius between points, points may be connected if distance between them less then the radius.
         @param[in] neighbors (uint): minimum number of shared neighbors that is required for establish links between points.
-        @param[in] ccore (bool): if True than DLL CCORE (C++ solution) will be used for solving the problem.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'data_type').
+        @param[in] ccore (bool): if True than DLL CCORE (C++ solution) will be used for solving the problem, it is not used in case of
+                    neighbor graph or non-Euclidean metric.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'data_type', 'metric').
 
         <b>Keyword Args:</b><br>
-            - data_type (string): Data type of input sample 'data' that is processed by the algorithm ('points', 'distance_matrix').
+            - data_type (string): Data type of input sample 'data' that is processed by the algorithm ('points', 'distance_matrix',
+               'neighbor_graph'). In case of 'neighbor_graph' data is neighbor graph (container.neighbor_graph) whose maximum
+               radius is greater or equal to 'eps'.
+            - metric (distance_metric): Metric that is used for distance calculation between points (by default Euclidean),
+               it should satisfy triangle inequality.
         
         """
         
         self.__pointer_data = data
-        self.__kdtree = None
         self.__eps = eps
-        self.__sqrt_eps = eps * eps
         self.__neighbors = neighbors
 
-        self.__visited = [False] * len(self.__pointer_data)
-        self.__belong = [False] * len(self.__pointer_data)
-
         self.__data_type = kwargs.get('data_type', 'points')
+        self.__metric = kwargs.get('metric', None)
 
         self.__clusters = []
         self.__noise = []
 
         self.__neighbor_searcher = self.__create_neighbor_searcher(self.__data_type)
 
-        self.__ccore = ccore
+        self.__euclidean = (self.__metric is None) or (self.__metric.get_type() == type_metric.EUCLIDEAN)
+        self.__ccore = ccore and (self.__data_type != 'neighbor_graph') and (self.__euclidean or self.__data_type != 'points')
         if self.__ccore:
             self.__ccore = ccore_library.workable()
 
@@ -108,18 +122,7 @@ class dbscan:
             (self.__clusters, self.__noise) = wrapper.dbscan(self.__pointer_data, self.__eps, self.__neighbors, self.__data_type)
             
         else:
-            if self.__data_type == 'points':
-                self.__kdtree = kdtree(self.__pointer_data, range(len(self.__pointer_data)))
-
-            for i in range(0, len(self.__pointer_data)):
-                if self.__visited[i] is False:
-                    cluster = self.__expand_cluster(i)
-                    if cluster is not None:
-                        self.__clusters.append(cluster)
-
-            for i in range(0, len(self.__pointer_data)):
-                if self.__belong[i] is False:
-                    self.__noise.append(i)
+            self.__process_by_python()
 
 
     def get_clusters(self):
@@ -167,78 +170,123 @@ class dbscan:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
+    def __process_by_python(self):
+        """!
+        @brief Performs cluster analysis using python code.
+        @details Clusters are expanded from core points in order of their indexes, border point belongs to the first
+                  cluster that reaches it and points of each cluster are placed in order of expansion, therefore results
+                  are the same as in case of expansion point by point.
+
+        """
+
+        indptr, indices = self.__neighbor_searcher()
+        core = numpy.diff(indptr) >= self.__neighbors
+
+        labels = numpy.full(len(indptr) - 1, -1, dtype=numpy.int64)
+        for index_point in numpy.flatnonzero(core):
+            if labels[index_point] == -1:
+                self.__clusters.append(self.__expand_cluster(index_point, len(self.__clusters), indptr, indices, core, labels))
+
+        self.__noise = numpy.flatnonzero(labels == -1).tolist()
+
+
     def __create_neighbor_searcher(self, data_type):
         """!
         @brief Returns neighbor searcher in line with data type.
 
-        @param[in] data_type (string): Data type (points or distance matrix).
+        @param[in] data_type (string): Data type (points, distance matrix or neighbor graph).
 
         """
-        if data_type == 'points':
-            return self.__neighbor_indexes_points
-        elif data_type == 'distance_matrix':
-            return self.__neighbor_indexes_distance_matrix
+        if (data_type == 'points') or (data_type == 'distance_matrix'):
+            return self.__neighbor_indexes_data
+        elif data_type == 'neighbor_graph':
+            return self.__neighbor_indexes_graph
         else:
             raise TypeError("Unknown type of data is specified '%s'" % data_type)
 
 
-    def __expand_cluster(self, index_point):
+    def __expand_cluster(self, index_point, index_cluster, indptr, indices, core, labels):
         """!
-        @brief Expands cluster from specified point in the input data space.
-        
-        @param[in] index_point (list): Index of a point from the data.
+        @brief Expands cluster from specified core point in the input data space by breadth-first search.
+
+        @param[in] index_point (uint): Index of a core point from the data that does not belong to any cluster.
+        @param[in] index_cluster (uint): Index of the cluster that is assigned to its points.
+        @param[in] indptr (numpy.array): Boundaries of neighborhoods in 'indices' (CSR format).
+        @param[in] indices (numpy.array): Indexes of neighbors of points (CSR format).
+        @param[in] core (numpy.array): Flags that indicate core points.
+        @param[in|out] labels (numpy.array): Index of cluster of each point, -1 if point does not belong to any cluster.
+
+        @return (list) List of indexes that belong to the cluster.
 
-        @return (list) Return tuple of list of indexes that belong to the same cluster and list of points that are marked as noise: (cluster, noise), or None if nothing has been expanded.
-        
         """
-        
-        cluster = None
-        self.__visited[index_point] = True
-        neighbors = self.__neighbor_searcher(index_point)
-         
-        if len(neighbors) >= self.__neighbors:
-            cluster = [index_point]
-             
-            self.__belong[index_point] = True
-             
-            for i in neighbors:
-                if self.__visited[i] is False:
-                    self.__visited[i] = True
 
-                    next_neighbors = self.__neighbor_searcher(i)
-                     
-                    if len(next_neighbors) >= self.__neighbors:
-                        neighbors += [k for k in next_neighbors if ( (k in neighbors) == False) and k != index_point]
-                 
-                if self.__belong[i] is False:
-                    cluster.append(i)
-                    self.__belong[i] = True
+        labels[index_point] = index_cluster
+        cluster = [index_point]
+
+        front = numpy.array([index_point])
+        while len(front) > 0:
+            starts = indptr[front]
+            lengths = indptr[front + 1] - starts
+
+            # positions of neighbors of all points of the front in 'indices'
+            positions = numpy.repeat(starts - numpy.cumsum(lengths) + lengths, lengths) + numpy.arange(numpy.sum(lengths))
+
+            # each neighbor is taken once in order of its first appearance like in case of queue of points
+            neighbors = indices[positions]
+            _, firsts = numpy.unique(neighbors, return_index=True)
+            neighbors = neighbors[numpy.sort(firsts)]
+            neighbors = neighbors[labels[neighbors] == -1]
+
+            labels[neighbors] = index_cluster
+            cluster += neighbors.tolist()
 
-        return cluster
+            front = neighbors[core[neighbors]]
 
+        return [int(index) for index in cluster]
 
-    def __neighbor_indexes_points(self, index_point):
+
+    def __neighbor_indexes_data(self):
         """!
-        @brief Return neighbors of the specified object in case of sequence of points.
+        @brief Returns neighbors of all objects in case of sequence of points or distance matrix.
+        @details Neighbors of each object are ordered in the same way as they are found by kd-tree (kdtree) in case of
+                  points and by indexes in case of distance matrix.
+
+        @return (tuple) Neighborhoods in CSR format: boundaries of neighborhoods and indexes of neighbors.
+
+        """
+        graph = neighbor_graph.create(self.__pointer_data, self.__eps, self.__data_type, self.__metric)
+        indptr, indices, _ = graph.csr()
 
-        @param[in] index_point (uint): Index point whose neighbors are should be found.
+        keys = indices
+        if (self.__data_type == 'points') and self.__euclidean:
+            keys = kdtree.search_order(self.__pointer_data)[indices]
+
+        return indptr, self.__sort_neighbors(indptr, indices, keys)
+
+
+    def __neighbor_indexes_graph(self):
+        """!
+        @brief Returns neighbors of all objects in case of neighbor graph, rows of the graph are truncated by the connectivity radius.
+        @details Neighbors of each object are ordered by indexes as in case of distance matrix.
 
-        @return (list) List of indexes of neighbors in line the connectivity radius.
+        @return (tuple) Neighborhoods in CSR format: boundaries of neighborhoods and indexes of neighbors.
 
         """
-        kdnodes = self.__kdtree.find_nearest_dist_nodes(self.__pointer_data[index_point], self.__eps)
-        return [node_tuple[1].payload for node_tuple in kdnodes if node_tuple[1].payload != index_point]
+        indptr, indices, _ = self.__pointer_data.csr(self.__eps)
+        return indptr, self.__sort_neighbors(indptr, indices, indices)
 
 
-    def __neighbor_indexes_distance_matrix(self, index_point):
+    @staticmethod
+    def __sort_neighbors(indptr, indices, keys):
         """!
-        @brief Return neighbors of the specified object in case of distance matrix.
+        @brief Sorts neighbors of each object by specified keys.
 
-        @param[in] index_point (uint): Index point whose neighbors are should be found.
+        @param[in] indptr (numpy.array): Boundaries of neighborhoods in 'indices' (CSR format).
+        @param[in] indices (numpy.array): Indexes of neighbors of objects (CSR format).
+        @param[in] keys (numpy.array): Key of each neighbor in 'indices'.
 
-        @return (list) List of indexes of neighbors in line the connectivity radius.
+        @return (numpy.array) Indexes of neighbors of objects that are sorted inside of each neighborhood.
 
         """
-        distances = self.__pointer_data[index_point]
-        return [index_neighbor for index_neighbor in range(len(distances))
-                if ((distances[index_neighbor] <= self.__eps) and (index_neighbor != index_point))]
\ No newline at end of file
+        rows = numpy.repeat(numpy.arange(len(indptr) - 1), numpy.diff(indptr))
+        return indices[numpy.lexsort((keys, rows))]
@@ -31,6 +31,8 @@ from pyclustering.cluster.kmeans import kmeans
 from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer, random_center_initializer
 from pyclustering.core.wrapper import ccore_library
 
+from pyclustering.utils.blockwise_distance import blockwise_distance
+
 import pyclustering.core.elbow_wrapper as wrapper
 
 
@@ -91,11 +93,13 @@ class elbow:
         @param[in] data (array_like): Input data that is presented as array of points (objects), each point should be represented by array_like data structure.
         @param[in] kmin (int): Minimum amount of clusters that should be considered.
         @param[in] kmax (int): Maximum amount of clusters that should be considered.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'ccore', 'initializer').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'ccore', 'initializer', 'memory_limit').
 
         <b>Keyword Args:</b><br>
             - ccore (bool): If True then CCORE (C++ implementation of pyclustering library) is used (be default True).
             - initializer (callable): Center initializer that is used by K-Means algorithm (by default K-Means++).
+            - memory_limit (uint): Amount of memory in bytes that is used by Python implementation of K-Means for one
+               tile of distance matrix (by default: blockwise_distance.DEFAULT_MEMORY_LIMIT).
 
         """
         if kmax - kmin < 3:
@@ -115,6 +119,7 @@ class elbow:
             self.__ccore = ccore_library.workable()
 
         self.__data = data
+        self.__memory_limit = kwargs.get('memory_limit', blockwise_distance.DEFAULT_MEMORY_LIMIT)
         self.__kmin = kmin
         self.__kmax = kmax
 
@@ -155,9 +160,11 @@ class elbow:
         @brief Performs processing using python implementation.
 
         """
+        distance_calculator = blockwise_distance(self.__data, self.__memory_limit)
+
         for amount in range(self.__kmin, self.__kmax):
             centers = self.__initializer(self.__data, amount).initialize()
-            instance = kmeans(self.__data, centers, ccore=True)
+            instance = kmeans(self.__data, centers, ccore=False, distance_calculator=distance_calculator)
             instance.process()
 
             self.__wce.append(instance.get_total_wce())
@@ -0,0 +1,83 @@
+"""!
+
+@brief Examples of usage and demonstration of abilities of Mini-Batch K-Means algorithm in cluster analysis.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+import numpy
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.cluster import cluster_visualizer
+from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+from pyclustering.cluster.minibatch_kmeans import minibatch_kmeans
+
+from pyclustering.utils import read_sample
+from pyclustering.utils import timedcall
+
+
+def template_clustering(start_centers, path, batch_size=16):
+    sample = read_sample(path)
+
+    minibatch_instance = minibatch_kmeans(sample, start_centers, batch_size=batch_size, random_state=1000)
+    (ticks, _) = timedcall(minibatch_instance.process)
+
+    clusters = minibatch_instance.get_clusters()
+    centers = minibatch_instance.get_centers()
+
+    print("Sample: ", path, "\t\tExecution time: ", ticks, "\t\tWCE: ", minibatch_instance.get_total_wce(), "\n")
+
+    visualizer = cluster_visualizer()
+    visualizer.append_clusters(clusters, sample)
+    visualizer.append_cluster(centers, marker='*', markersize=10)
+    visualizer.show()
+
+
+def cluster_sample1():
+    start_centers = [[4.7, 5.9], [5.7, 6.5]]
+    template_clustering(start_centers, SIMPLE_SAMPLES.SAMPLE_SIMPLE1)
+
+def cluster_sample3():
+    start_centers = [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]]
+    template_clustering(start_centers, SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+
+def cluster_lsun():
+    start_centers = kmeans_plusplus_initializer(read_sample(FCPS_SAMPLES.SAMPLE_LSUN), 3).initialize()
+    template_clustering(start_centers, FCPS_SAMPLES.SAMPLE_LSUN, 64)
+
+def cluster_large_stream():
+    # points are generated by blocks and they are never stored in memory together
+    def generate_blocks():
+        generator = numpy.random.RandomState(1000)
+        for _ in range(100):
+            yield numpy.concatenate([generator.randn(5000, 2) + offset for offset in [[0, 0], [8, 8], [0, 8]]])
+
+    minibatch_instance = minibatch_kmeans(generate_blocks, [[1.0, 1.0], [7.0, 7.0], [1.0, 7.0]], batch_size=4096)
+    (ticks, _) = timedcall(minibatch_instance.process)
+
+    print("Stream of 1500000 points\t\tExecution time: ", ticks, "\t\tCenters: ", minibatch_instance.get_centers())
+
+
+cluster_sample1()
+cluster_sample3()
+cluster_lsun()
+cluster_large_stream()
@@ -27,14 +27,11 @@
 
 import numpy as np
 import math
-import warnings
-
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot')
+animation = lazy_module('matplotlib.animation')
 
 from pyclustering.cluster import cluster_visualizer
 from pyclustering.cluster.ga_maths import ga_math
@@ -0,0 +1,359 @@
+"""!
+
+@brief Cluster analysis algorithm: Incremental DBSCAN (DBSCAN with insertion and deletion of points).
+@details Implementation based on paper @cite inproceedings::dbscan::2.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+from pyclustering.container.kdtree import kdtree
+
+from pyclustering.cluster.encoder import type_encoding
+
+
+class incremental_dbscan:
+    """!
+    @brief Class represents DBSCAN algorithm that maintains clusters while points are inserted and removed.
+    @details Points are stored in KD-tree (container.kdtree) that is updated by each insertion and removal, neighbors
+              of each point in line with connectivity radius are kept, therefore only points around inserted or removed
+              point are considered:
+              - insertion may create new core points, clusters that are connected by them are merged (smaller clusters
+                are relabeled to the biggest one);
+              - removal may remove core points, cluster that loses core points is split if its remaining core points are
+                not connected anymore (search is stopped as soon as all neighbors of removed core points are reached).
+
+              Core points of each cluster and noise are the same as in case of DBSCAN that processes current points
+              from scratch. Border point that is reachable from several clusters belongs to one of them.
+
+    Example:
+    @code
+        # create algorithm with initial points, each point is identified by its index in the list
+        dbscan_instance = incremental_dbscan(0.5, 3, read_sample(path_to_sample))
+
+        # new point gets next index
+        index_point = dbscan_instance.insert([1.2, 3.4])
+
+        # expired point is removed by its index
+        dbscan_instance.remove(0)
+
+        clusters = dbscan_instance.get_clusters()
+        noise = dbscan_instance.get_noise()
+    @endcode
+
+    @see dbscan
+
+    """
+
+    def __init__(self, eps, neighbors, data=None):
+        """!
+        @brief Constructor of incremental DBSCAN algorithm.
+
+        @param[in] eps (double): Connectivity radius between points, points may be connected if distance between them less or equal to the radius.
+        @param[in] neighbors (uint): Minimum number of neighbors that is required for point to be a core point.
+        @param[in] data (array_like): Initial points that are inserted in order, index of each point is its position in the list.
+
+        """
+
+        self.__eps = eps
+        self.__neighbors = neighbors
+
+        self.__tree = kdtree()
+        self.__points = {}
+        self.__adjacency = {}
+
+        self.__labels = {}
+        self.__clusters = {}
+        self.__next_point = 0
+        self.__next_label = 0
+
+        if eps < 0:
+            raise ValueError("Connectivity radius should be non-negative (current value: '%s')." % str(eps))
+
+        if data is not None:
+            for point in data:
+                self.insert(point)
+
+
+    def insert(self, point):
+        """!
+        @brief Inserts new point and updates clusters in line with it.
+
+        @param[in] point (list): Coordinates of the point.
+
+        @return (uint) Index of the inserted point that is used by clusters and noise.
+
+        @see remove()
+
+        """
+
+        point = list(point)
+        index_point = self.__next_point
+        self.__next_point += 1
+
+        neighbors = set(node_tuple[1].payload for node_tuple in self.__tree.find_nearest_dist_nodes(point, self.__eps))
+
+        self.__tree.insert(point, index_point)
+        self.__points[index_point] = point
+        self.__adjacency[index_point] = neighbors
+
+        new_cores = [index_point] if self.__is_core(index_point) else []
+        for index_neighbor in neighbors:
+            self.__adjacency[index_neighbor].add(index_point)
+            if len(self.__adjacency[index_neighbor]) == self.__neighbors:
+                new_cores.append(index_neighbor)
+
+        for index_core in new_cores:
+            self.__connect_core(index_core)
+
+        if index_point not in self.__labels:
+            self.__attach_border(index_point)
+
+        return index_point
+
+
+    def remove(self, index_point):
+        """!
+        @brief Removes point and updates clusters in line with it.
+
+        @param[in] index_point (uint): Index of the point that has been returned by insert().
+
+        @see insert()
+
+        """
+
+        if index_point not in self.__points:
+            raise KeyError("Point with index '%s' does not exist." % str(index_point))
+
+        point = self.__points.pop(index_point)
+        self.__tree.remove(point, payload=index_point)
+
+        # neighbors of points that are not core points anymore
+        removed_cores = {}
+        if self.__is_core(index_point):
+            removed_cores[index_point] = self.__adjacency[index_point]
+
+        neighbors = self.__adjacency.pop(index_point)
+        for index_neighbor in neighbors:
+            self.__adjacency[index_neighbor].discard(index_point)
+            if len(self.__adjacency[index_neighbor]) == self.__neighbors - 1:
+                removed_cores[index_neighbor] = self.__adjacency[index_neighbor]
+
+        affected_labels = set(self.__labels[index_core] for index_core in removed_cores if index_core in self.__labels)
+        self.__detach(index_point)
+
+        for label in affected_labels:
+            if label in self.__clusters:
+                self.__split_cluster(label, removed_cores)
+
+        # border points of removed core points are attached to other clusters or become noise
+        for index_candidate in set(neighbors).union(*removed_cores.values()):
+            if (index_candidate in self.__points) and not self.__is_core(index_candidate):
+                self.__detach(index_candidate)
+                self.__attach_border(index_candidate)
+
+
+    def get_clusters(self):
+        """!
+        @brief Returns allocated clusters.
+
+        @return (list) List of allocated clusters, each cluster contains sorted indexes of points that are returned by insert().
+
+        @see get_noise()
+
+        """
+
+        return [sorted(self.__clusters[label]) for label in sorted(self.__clusters)]
+
+
+    def get_noise(self):
+        """!
+        @brief Returns allocated noise.
+
+        @return (list) Sorted list of indexes of points that are marked as a noise.
+
+        @see get_clusters()
+
+        """
+
+        return sorted(index_point for index_point in self.__points if index_point not in self.__labels)
+
+
+    def get_cluster_encoding(self):
+        """!
+        @brief Returns clustering result representation type that indicate how clusters are encoded.
+
+        @return (type_encoding) Clustering result representation.
+
+        @see get_clusters()
+
+        """
+
+        return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of points that are currently stored.
+
+        """
+
+        return len(self.__points)
+
+
+    def __is_core(self, index_point):
+        """!
+        @brief Returns True if the point has enough neighbors to be a core point.
+
+        @param[in] index_point (uint): Index of the point.
+
+        """
+
+        return len(self.__adjacency[index_point]) >= self.__neighbors
+
+
+    def __connect_core(self, index_core):
+        """!
+        @brief Merges new core point with clusters of its core neighbors, new cluster is created if there are no such clusters.
+        @details Clusters are relabeled to the biggest one, therefore each point is relabeled logarithmic amount of times.
+
+        @param[in] index_core (uint): Index of the point that has become a core point.
+
+        """
+
+        labels = set(self.__labels[index_neighbor] for index_neighbor in self.__adjacency[index_core]
+                     if self.__is_core(index_neighbor) and (index_neighbor in self.__labels))
+
+        if len(labels) == 0:
+            target = self.__next_label
+            self.__next_label += 1
+            self.__clusters[target] = set()
+        else:
+            target = max(labels, key=lambda label: len(self.__clusters[label]))
+
+        for label in labels:
+            if label != target:
+                for index_point in self.__clusters.pop(label):
+                    self.__labels[index_point] = target
+                    self.__clusters[target].add(index_point)
+
+        self.__detach(index_core)
+        self.__labels[index_core] = target
+        self.__clusters[target].add(index_core)
+
+        for index_neighbor in self.__adjacency[index_core]:
+            if index_neighbor not in self.__labels:
+                self.__labels[index_neighbor] = target
+                self.__clusters[target].add(index_neighbor)
+
+
+    def __attach_border(self, index_point):
+        """!
+        @brief Assigns non-core point to cluster of one of its core neighbors (cluster with the lowest label), otherwise point is noise.
+
+        @param[in] index_point (uint): Index of the non-core point that does not belong to any cluster.
+
+        """
+
+        labels = [self.__labels[index_neighbor] for index_neighbor in self.__adjacency[index_point]
+                  if self.__is_core(index_neighbor)]
+
+        if len(labels) > 0:
+            label = min(labels)
+            self.__labels[index_point] = label
+            self.__clusters[label].add(index_point)
+
+
+    def __detach(self, index_point):
+        """!
+        @brief Removes point from its cluster, empty cluster is removed.
+
+        @param[in] index_point (uint): Index of the point.
+
+        """
+
+        label = self.__labels.pop(index_point, None)
+        if label is not None:
+            self.__clusters[label].discard(index_point)
+            if len(self.__clusters[label]) == 0:
+                del self.__clusters[label]
+
+
+    def __split_cluster(self, label, removed_cores):
+        """!
+        @brief Splits cluster if its core points are not connected anymore after removal of core points.
+        @details Each component of remaining core points contains a core neighbor of removed core points, therefore
+                  components are searched from them. Search is stopped as soon as the first component reaches all of
+                  them, otherwise the biggest component keeps the label and other components get new labels.
+
+        @param[in] label (uint): Label of the cluster that has lost core points.
+        @param[in] removed_cores (dict): Neighbors of each point that is not a core point anymore.
+
+        """
+
+        seeds = set()
+        for neighbors in removed_cores.values():
+            seeds.update(index_neighbor for index_neighbor in neighbors
+                         if self.__is_core(index_neighbor) and (self.__labels.get(index_neighbor) == label))
+
+        components = []
+        unreached = set(seeds)
+        while len(unreached) > 0:
+            index_seed = unreached.pop()
+            component, front = {index_seed}, [index_seed]
+
+            while (len(front) > 0) and ((len(components) > 0) or (len(unreached) > 0)):
+                index_current = front.pop()
+                for index_neighbor in self.__adjacency[index_current]:
+                    if (index_neighbor not in component) and self.__is_core(index_neighbor):
+                        component.add(index_neighbor)
+                        front.append(index_neighbor)
+                        unreached.discard(index_neighbor)
+
+            if (len(components) == 0) and (len(unreached) == 0):
+                # all seeds are connected, therefore cluster is not split
+                return
+
+            components.append(component)
+
+        if len(components) == 0:
+            # cluster does not have core points anymore
+            for index_point in list(self.__clusters.get(label, ())):
+                self.__detach(index_point)
+            return
+
+        components.sort(key=len, reverse=True)
+        members = self.__clusters.pop(label)
+        for index_point in members:
+            del self.__labels[index_point]
+
+        for position, component in enumerate(components):
+            target = label if position == 0 else self.__next_label
+            if position > 0:
+                self.__next_label += 1
+
+            self.__clusters[target] = set(component)
+            for index_point in component:
+                self.__labels[index_point] = target
+
+        for index_point in members:
+            if (index_point not in self.__labels) and not self.__is_core(index_point):
+                self.__attach_border(index_point)
@@ -26,24 +26,155 @@
 
 
 import numpy
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from enum import IntEnum
+
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot')
+animation = lazy_module('matplotlib.animation')
 
 import pyclustering.core.kmeans_wrapper as wrapper
 
 from pyclustering.core.wrapper import ccore_library
 from pyclustering.core.metric_wrapper import metric_wrapper
+from pyclustering.core.pyclustering_package import ccore_dataset
 
 from pyclustering.cluster.encoder import type_encoding
 from pyclustering.cluster import cluster_visualizer
 
+from pyclustering.container.kdtree import kdtree_balanced
+
 from pyclustering.utils.metric import distance_metric, type_metric
+from pyclustering.utils.blockwise_distance import blockwise_distance
+
+
+class kmeans_algorithm(IntEnum):
+    """!
+    @brief Enumeration of algorithms that can be used by Python implementation of K-Means to allocate clusters.
+    @details All algorithms produce the same clustering results, they differ only in amount of distance calculations.
+
+    @see kmeans
+
+    """
+
+    ## Lloyd's algorithm: distance between each point and each center is calculated on each iteration.
+    LLOYD = 0
+
+    ## Elkan's algorithm: triangle inequality is used to skip distance calculations that cannot change an assignment.
+    ## Upper bound of distance to the own center, lower bounds of distances to other centers and distances between
+    ## centers are kept for each point. It is applicable only for metrics that satisfy triangle inequality (Euclidean,
+    ## Square Euclidean, Manhattan, Chebyshev, Canberra), otherwise Lloyd's algorithm is used.
+    ELKAN = 1
+
+    ## Filtering algorithm: points are organized into kd-tree once, on each iteration candidate centers are filtered
+    ## for each cell of the tree and the whole cell is assigned to a center by its sum and amount of points when only
+    ## one candidate remains. It is efficient for low-dimensional data and applicable only for Square Euclidean metric,
+    ## otherwise Lloyd's algorithm is used.
+    FILTERING = 2
+
+
+class kmeans_filtering_tree:
+    """!
+    @brief Array-backed kd-tree of points that is used by filtering algorithm of K-Means.
+    @details Tree is bulk-loaded once by the same split as balanced kd-tree: each cell is divided by median of its
+              widest dimension until it contains not more than leaf size points. In addition to kd-tree, each cell
+              stores its bounding box, sum of its points and indexes of its children, that are required by filtering
+              algorithm. Points of each cell occupy contiguous range of the index array, therefore nodes are stored in
+              arrays instead of objects.
+
+    @see kmeans_algorithm.FILTERING
+    @see kdtree_balanced
+
+    """
+
+    ## Default maximum amount of points in a leaf cell.
+    DEFAULT_LEAF_SIZE = 32
+
+    def __init__(self, data, leaf_size=DEFAULT_LEAF_SIZE):
+        """!
+        @brief Builds tree for the specified dataset.
+
+        @param[in] data (numpy.array): Input data that is presented as two-dimensional array of points.
+        @param[in] leaf_size (uint): Maximum amount of points in a leaf cell.
+
+        """
+        if leaf_size <= 0:
+            raise ValueError("Leaf size '%s' should be greater than 0." % str(leaf_size))
+
+        self.__data = numpy.asarray(data, dtype=numpy.float64)
+        self.__leaf_size = leaf_size
+        self.__indexes = numpy.arange(len(self.__data))
+
+        self.__begins, self.__ends = None, None
+        self.__lefts, self.__rights = None, None
+        self.__lowers, self.__uppers, self.__sums = None, None, None
+
+        self.__build()
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of cells in the tree.
+
+        """
+        return len(self.__begins)
+
+
+    def get_leaf_size(self):
+        """!
+        @brief Returns maximum amount of points in a leaf cell.
+
+        """
+        return self.__leaf_size
+
+
+    def get_indexes(self):
+        """!
+        @brief Returns indexes of points that are ordered by cells, points of a cell are stored in range [begin, end).
+
+        """
+        return self.__indexes
+
+
+    def get_cells(self):
+        """!
+        @brief Returns arrays that describe cells, root cell has index 0.
+
+        @return (tuple) Begins and ends of ranges of points, indexes of left and right cells (-1 in case of leaf), lower
+                 and upper corners of bounding boxes, sums of points.
+
+        """
+        return self.__begins, self.__ends, self.__lefts, self.__rights, self.__lowers, self.__uppers, self.__sums
+
+
+    def __build(self):
+        """!
+        @brief Splits dataset into cells level by level by the same procedure as balanced kd-tree, cells are indexed
+                in breadth-first order.
+
+        @see kdtree_balanced.split_levels()
+
+        """
+        amount_cells = 0
+
+        levels = []
+        for begins, ends, lowers, uppers, sums, dimensions, _, _ in \
+                kdtree_balanced.split_levels(self.__data, self.__indexes, self.__leaf_size):
+            divided = dimensions >= 0
+
+            lefts = numpy.full(len(begins), -1, dtype=numpy.int64)
+            rights = numpy.full(len(begins), -1, dtype=numpy.int64)
+
+            amount_divided = numpy.count_nonzero(divided)
+            lefts[divided] = amount_cells + len(begins) + 2 * numpy.arange(amount_divided)
+            rights[divided] = lefts[divided] + 1
+
+            levels.append((begins, ends, lefts, rights, lowers, uppers, sums))
+            amount_cells += len(begins)
+
+        self.__begins, self.__ends, self.__lefts, self.__rights, self.__lowers, self.__uppers, self.__sums = \
+            [numpy.concatenate(arrays) for arrays in zip(*levels)]
 
 
 class kmeans_observer:
@@ -326,6 +457,26 @@ class kmeans:
         clusters = kmeans_instance.get_clusters()
     @endcode
 
+    Example #4 - Clustering using Elkan's algorithm that skips distance calculations that cannot change assignments:
+    @code
+        # create instance of K-Means that uses Elkan's algorithm (Python implementation)
+        kmeans_instance = kmeans(sample, initial_centers, ccore=False, algorithm=kmeans_algorithm.ELKAN)
+
+        # run cluster analysis and obtain results that are the same as in case of Lloyd's algorithm
+        kmeans_instance.process()
+        clusters = kmeans_instance.get_clusters()
+    @endcode
+
+    Example #5 - Clustering of low-dimensional data using filtering algorithm that assigns whole cells of kd-tree:
+    @code
+        # create instance of K-Means that uses filtering algorithm (Python implementation)
+        kmeans_instance = kmeans(sample, initial_centers, ccore=False, algorithm=kmeans_algorithm.FILTERING)
+
+        # run cluster analysis and obtain results
+        kmeans_instance.process()
+        clusters = kmeans_instance.get_clusters()
+    @endcode
+
     @see center_initializer
     
     """
@@ -339,17 +490,25 @@ class kmeans:
         @param[in] initial_centers (array_like): Initial coordinates of centers of clusters that are represented by array_like data structure: [center1, center2, ...].
         @param[in] tolerance (double): Stop condition: if maximum value of change of centers of clusters is less than tolerance then algorithm stops processing.
         @param[in] ccore (bool): Defines should be CCORE library (C++ pyclustering library) used instead of Python code or not.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'observer', 'metric', 'itermax').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'observer', 'metric', 'itermax', 'algorithm',
+                    'memory_limit', 'distance_calculator').
         
         <b>Keyword Args:</b><br>
             - observer (kmeans_observer): Observer of the algorithm to collect information about clustering process on each iteration.
             - metric (distance_metric): Metric that is used for distance calculation between two points (by default euclidean square distance).
             - itermax (uint): Maximum number of iterations that is used for clustering process (by default: 200).
+            - algorithm (kmeans_algorithm): Algorithm that is used by Python implementation to allocate clusters (by default: kmeans_algorithm.LLOYD).
+            - memory_limit (uint): Amount of memory in bytes that is used by Python implementation for one tile of distance
+               matrix between points and centers (by default: blockwise_distance.DEFAULT_MEMORY_LIMIT).
+            - distance_calculator (blockwise_distance): Calculator of distances that has been created for the input data,
+               it can be shared by several K-Means instances to reuse cached norms of points (by default it is created
+               by K-Means instance).
         
         @see center_initializer
         
         """
-        self.__pointer_data = numpy.array(data)
+        self.__dataset = data if isinstance(data, ccore_dataset) else None
+        self.__pointer_data = numpy.asarray(data) if self.__dataset is None else self.__dataset.get_data()
         self.__clusters = []
         self.__centers = numpy.array(initial_centers)
         self.__tolerance = tolerance
@@ -358,11 +517,24 @@ class kmeans:
         self.__observer = kwargs.get('observer', None)
         self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
         self.__maxiter = kwargs.get('maxiter', 200)
+        self.__algorithm = kwargs.get('algorithm', kmeans_algorithm.LLOYD)
+        self.__memory_limit = kwargs.get('memory_limit', blockwise_distance.DEFAULT_MEMORY_LIMIT)
+        self.__distance_calculator = kwargs.get('distance_calculator', None)
+
+        self.__assignment = None
+        self.__nearest_distances = None
+        self.__upper_bounds = None
+        self.__lower_bounds = None
+        self.__tight_bounds = None
+        self.__surviving_clusters = None
+        self.__filtering_tree = None
 
         if self.__metric.get_type() != type_metric.USER_DEFINED:
             self.__metric.enable_numpy_usage()
         else:
             self.__metric.disable_numpy_usage()
+
+        self.__numpy_metric = blockwise_distance.create_numpy_metric(self.__metric)
         
         self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED
         if self.__ccore is True:
@@ -400,7 +572,8 @@ class kmeans:
         """
         ccore_metric = metric_wrapper.create_instance(self.__metric)
 
-        results = wrapper.kmeans(self.__pointer_data, self.__centers, self.__tolerance, (self.__observer is not None), ccore_metric.get_pointer())
+        data = self.__pointer_data if self.__dataset is None else self.__dataset
+        results = wrapper.kmeans(data, self.__centers, self.__tolerance, (self.__observer is not None), ccore_metric.get_pointer())
         self.__clusters = results[0]
         self.__centers = results[1]
 
@@ -417,6 +590,17 @@ class kmeans:
 
         """
 
+        if self.__distance_calculator is None:
+            self.__distance_calculator = blockwise_distance(self.__pointer_data, self.__memory_limit)
+
+        if (self.__algorithm == kmeans_algorithm.ELKAN) and (self.__metric.get_type() in kmeans.__TRIANGLE_METRICS):
+            self.__process_by_python_elkan()
+            return
+
+        if (self.__algorithm == kmeans_algorithm.FILTERING) and (self.__metric.get_type() in kmeans.__FILTERING_METRICS):
+            self.__process_by_python_filtering()
+            return
+
         maximum_change = float('inf')
         stop_condition = self.__tolerance * self.__tolerance
         iteration = 0
@@ -440,6 +624,254 @@ class kmeans:
         self.__calculate_total_wce()
 
 
+    def __process_by_python_elkan(self):
+        """!
+        @brief Performs cluster analysis using Elkan's algorithm.
+        @details Clustering results are the same as in case of Lloyd's algorithm, but distance between a point and a center
+                  is calculated only when bounds cannot guarantee that the center is farther than the current one.
+
+        """
+
+        maximum_change = float('inf')
+        stop_condition = self.__tolerance * self.__tolerance
+        iteration = 0
+
+        if self.__observer is not None:
+            initial_clusters = self.__update_clusters()
+            self.__observer.notify(initial_clusters, self.__centers.tolist())
+
+        while maximum_change > stop_condition and iteration < self.__maxiter:
+            if iteration == 0:
+                self.__initialize_bounds()
+            else:
+                self.__update_assignment()
+
+            self.__clusters = self.__extract_clusters()
+            updated_centers = self.__update_centers()  # changes should be calculated before assignment
+
+            if self.__observer is not None:
+                self.__observer.notify(self.__clusters, updated_centers.tolist())
+
+            maximum_change = self.__calculate_changes(updated_centers)
+
+            self.__shift_bounds(updated_centers)
+            self.__centers = updated_centers    # assign center after change calculation
+            iteration += 1
+
+        self.__calculate_total_wce()
+
+
+    def __process_by_python_filtering(self):
+        """!
+        @brief Performs cluster analysis using filtering algorithm.
+        @details Assignments are the same as in case of Lloyd's algorithm, centers are calculated using sums of points
+                  that are stored by cells of kd-tree, therefore they may differ from Lloyd's centers by rounding errors.
+
+        """
+
+        maximum_change = float('inf')
+        stop_condition = self.__tolerance * self.__tolerance
+        iteration = 0
+
+        if self.__filtering_tree is None:
+            self.__filtering_tree = kmeans_filtering_tree(self.__pointer_data)
+
+        if self.__observer is not None:
+            initial_clusters = self.__update_clusters()
+            self.__observer.notify(initial_clusters, self.__centers.tolist())
+
+        while maximum_change > stop_condition and iteration < self.__maxiter:
+            labels, sums, counts = self.__filter_centers()
+
+            surviving_clusters = numpy.nonzero(counts)[0]
+            if len(surviving_clusters) != len(self.__centers):
+                index_map = numpy.full(len(self.__centers), -1, dtype=labels.dtype)
+                index_map[surviving_clusters] = numpy.arange(len(surviving_clusters))
+                labels = index_map[labels]
+
+            order = numpy.argsort(labels, kind='stable')
+            borders = numpy.cumsum(counts[surviving_clusters])[:-1]
+            self.__clusters = [cluster.tolist() for cluster in numpy.split(order, borders)]
+
+            updated_centers = sums[surviving_clusters] / counts[surviving_clusters, None]
+
+            if self.__observer is not None:
+                self.__observer.notify(self.__clusters, updated_centers.tolist())
+
+            maximum_change = self.__calculate_changes(updated_centers)
+
+            self.__centers = updated_centers    # assign center after change calculation
+            iteration += 1
+
+        self.__calculate_total_wce()
+
+
+    def __filter_centers(self):
+        """!
+        @brief Assigns points to the nearest centers traversing kd-tree level by level and filtering candidate centers
+                for each cell.
+        @details Candidates of cells are stored as pairs (cell, center) that are ordered by cells and by indexes of
+                  centers. Cells of one level are processed by blocks whose amount of pairs is bounded by memory limit.
+
+        @return (tuple) Index of center for each point, sum of points and amount of points that are assigned to each center.
+
+        """
+        amount_centers, dimension = self.__centers.shape
+        begins, ends, lefts, rights, lowers, uppers, cell_sums = self.__filtering_tree.get_cells()
+
+        labels = numpy.zeros(len(self.__pointer_data), dtype=numpy.int64)
+        sums = numpy.zeros((amount_centers, dimension))
+        counts = numpy.zeros(amount_centers, dtype=numpy.int64)
+
+        pair_limit = max(amount_centers, self.__memory_limit // (8 * (dimension + 4) * self.__filtering_tree.get_leaf_size()))
+        stack = [(numpy.zeros(1, dtype=numpy.int64), numpy.zeros(amount_centers, dtype=numpy.int64), numpy.arange(amount_centers))]
+
+        while len(stack) > 0:
+            cells, pair_cells, pair_centers = stack.pop()
+
+            if (len(pair_cells) > pair_limit) and (len(cells) > 1):
+                half = len(cells) // 2
+                left_pairs = pair_cells < half
+                stack.append((cells[half:], pair_cells[~left_pairs] - half, pair_centers[~left_pairs]))
+                stack.append((cells[:half], pair_cells[left_pairs], pair_centers[left_pairs]))
+                continue
+
+            remaining = self.__filter_candidates_by_cells(lowers[cells], uppers[cells], pair_cells, pair_centers)
+            pair_cells, pair_centers = pair_cells[remaining], pair_centers[remaining]
+
+            amount_candidates = numpy.bincount(pair_cells, minlength=len(cells))
+            pair_borders = numpy.cumsum(amount_candidates) - amount_candidates
+
+            owned = amount_candidates == 1
+            owners = pair_centers[pair_borders[owned]]
+            point_cells, point_indexes = self.__get_cell_points(cells[owned])
+
+            labels[point_indexes] = owners[point_cells]
+            numpy.add.at(sums, owners, cell_sums[cells[owned]])
+            numpy.add.at(counts, owners, ends[cells[owned]] - begins[cells[owned]])
+
+            shared_leaves = ~owned & (lefts[cells] == -1)
+            if numpy.any(shared_leaves):
+                leaf_pairs = shared_leaves[pair_cells]
+                self.__assign_leaves(cells[shared_leaves], amount_candidates[shared_leaves], pair_centers[leaf_pairs],
+                                     labels, sums, counts)
+
+            shared_nodes = ~owned & (lefts[cells] != -1)
+            if numpy.any(shared_nodes):
+                node_pairs = shared_nodes[pair_cells]
+                node_positions = numpy.cumsum(shared_nodes) - 1
+                children_pair_cells = node_positions[pair_cells[node_pairs]]
+
+                children = numpy.concatenate((lefts[cells[shared_nodes]], rights[cells[shared_nodes]]))
+                children_pair_cells = numpy.concatenate((children_pair_cells, children_pair_cells + numpy.count_nonzero(shared_nodes)))
+                children_pair_centers = numpy.tile(pair_centers[node_pairs], 2)
+
+                stack.append((children, children_pair_cells, children_pair_centers))
+
+        return labels, sums, counts
+
+
+    def __filter_candidates_by_cells(self, lowers, uppers, pair_cells, pair_centers):
+        """!
+        @brief Finds out candidates that can be the nearest centers for points of cells.
+        @details Candidate is removed for a cell if it is farther than the candidate that is the closest to the middle
+                  of the cell even from the vertex of the cell that is the most favourable to the candidate. Therefore
+                  each removed candidate is strictly farther for each point of the cell and ties are resolved in favour
+                  of center with smaller index as it is done by Lloyd's algorithm.
+
+        @param[in] lowers (numpy.array): Lower corners of bounding boxes of cells.
+        @param[in] uppers (numpy.array): Upper corners of bounding boxes of cells.
+        @param[in] pair_cells (numpy.array): Cell of each pair (cell, center).
+        @param[in] pair_centers (numpy.array): Center of each pair (cell, center).
+
+        @return (numpy.array) Boolean mask of pairs whose centers cannot be removed from candidates.
+
+        """
+        candidate_centers = self.__centers[pair_centers]
+
+        middles = (lowers + uppers) / 2.0
+        middle_distances = numpy.sum(numpy.square(middles[pair_cells] - candidate_centers), axis=1)
+
+        best_pairs = kmeans.__find_nearest_pairs(middle_distances, pair_cells)
+        best_centers = candidate_centers[best_pairs][pair_cells]
+
+        vertexes = numpy.where(candidate_centers > best_centers, uppers[pair_cells], lowers[pair_cells])
+        best_distances = numpy.sum(numpy.square(vertexes - best_centers), axis=1)
+        candidate_distances = numpy.sum(numpy.square(vertexes - candidate_centers), axis=1)
+
+        bounds = best_distances * (1.0 + kmeans.__BOUND_RELATIVE_MARGIN) + kmeans.__BOUND_ABSOLUTE_MARGIN
+        return candidate_distances <= bounds
+
+
+    def __assign_leaves(self, leaves, amount_candidates, candidate_centers, labels, sums, counts):
+        """!
+        @brief Assigns points of leaf cells that have several candidates to the nearest candidates.
+        @details Distances are calculated only between points and candidates of their cells.
+
+        @param[in] leaves (numpy.array): Indexes of leaf cells.
+        @param[in] amount_candidates (numpy.array): Amount of candidates of each leaf cell.
+        @param[in] candidate_centers (numpy.array): Candidates of leaf cells that are ordered by cells and by indexes.
+        @param[in,out] labels (numpy.array): Index of center for each point.
+        @param[in,out] sums (numpy.array): Sum of points that are assigned to each center.
+        @param[in,out] counts (numpy.array): Amount of points that are assigned to each center.
+
+        """
+        point_leaves, point_indexes = self.__get_cell_points(leaves)
+        candidate_offsets = numpy.cumsum(amount_candidates) - amount_candidates
+
+        pair_amounts = amount_candidates[point_leaves]
+        pair_points = numpy.repeat(numpy.arange(len(point_indexes)), pair_amounts)
+        pair_offsets = numpy.arange(len(pair_points)) - numpy.repeat(numpy.cumsum(pair_amounts) - pair_amounts, pair_amounts)
+        pair_centers = candidate_centers[candidate_offsets[point_leaves[pair_points]] + pair_offsets]
+
+        points = self.__pointer_data[point_indexes]
+        distances = numpy.sum(numpy.square(points[pair_points] - self.__centers[pair_centers]), axis=1)
+        point_labels = pair_centers[kmeans.__find_nearest_pairs(distances, pair_points)]
+
+        labels[point_indexes] = point_labels
+        counts += numpy.bincount(point_labels, minlength=len(counts))
+        for index_dimension in range(points.shape[1]):
+            sums[:, index_dimension] += numpy.bincount(point_labels, weights=points[:, index_dimension], minlength=len(counts))
+
+
+    def __get_cell_points(self, cells):
+        """!
+        @brief Returns points of the specified cells.
+
+        @param[in] cells (numpy.array): Indexes of cells.
+
+        @return (tuple) Position of cell in the specified array for each point and index of each point.
+
+        """
+        begins, ends = self.__filtering_tree.get_cells()[:2]
+        sizes = ends[cells] - begins[cells]
+
+        point_cells = numpy.repeat(numpy.arange(len(cells)), sizes)
+        point_positions = numpy.arange(len(point_cells)) + numpy.repeat(begins[cells] - numpy.cumsum(sizes) + sizes, sizes)
+
+        return point_cells, self.__filtering_tree.get_indexes()[point_positions]
+
+
+    @staticmethod
+    def __find_nearest_pairs(distances, pair_groups):
+        """!
+        @brief Finds the nearest pair in each group, ties are resolved in favour of the first pair in the group.
+
+        @param[in] distances (numpy.array): Distance of each pair.
+        @param[in] pair_groups (numpy.array): Non-decreasing group index of each pair, each group is not empty.
+
+        @return (numpy.array) Index of the nearest pair for each group.
+
+        """
+        borders = numpy.flatnonzero(numpy.concatenate(([True], pair_groups[1:] != pair_groups[:-1])))
+        nearest_distances = numpy.minimum.reduceat(distances, borders)
+
+        nearest_pairs = numpy.flatnonzero(distances == nearest_distances[pair_groups])
+        nearest_groups = pair_groups[nearest_pairs]
+
+        return nearest_pairs[numpy.concatenate(([True], nearest_groups[1:] != nearest_groups[:-1]))]
+
+
     def get_clusters(self):
         """!
         @brief Returns list of allocated clusters, each cluster contains indexes of objects in list of data.
@@ -497,23 +929,19 @@ class kmeans:
     def __update_clusters(self):
         """!
         @brief Calculate Euclidean distance to each point from the each cluster. Nearest points are captured by according clusters and as a result clusters are updated.
-        
+        @details Distances are calculated by tiles, therefore distance matrix between all points and all centers is not
+                  allocated.
+
         @return (list) Updated clusters as list of clusters. Each cluster contains indexes of objects from data.
         
         """
-        
-        clusters = [[] for _ in range(len(self.__centers))]
-        
-        dataset_differences = self.__calculate_dataset_difference(len(clusters))
-        
-        optimum_indexes = numpy.argmin(dataset_differences, axis=0)
-        for index_point in range(len(optimum_indexes)):
-            index_cluster = optimum_indexes[index_point]
-            clusters[index_cluster].append(index_point)
-        
-        clusters = [cluster for cluster in clusters if len(cluster) > 0]
+        labels, _ = self.__distance_calculator.nearest(self.__centers, self.__metric)
 
-        return clusters
+        sizes = numpy.bincount(labels, minlength=len(self.__centers))
+        order = numpy.argsort(labels, kind='stable')
+        borders = numpy.cumsum(sizes[sizes > 0])[:-1]
+
+        return [cluster.tolist() for cluster in numpy.split(order, borders)]
 
 
     def __update_centers(self):
@@ -540,12 +968,12 @@ class kmeans:
 
         """
 
-        dataset_differences = self.__calculate_dataset_difference(len(self.__clusters))
-
-        self.__total_wce = 0
+        labels = numpy.zeros(len(self.__pointer_data), dtype=numpy.int64)
         for index_cluster in range(len(self.__clusters)):
-            for index_point in self.__clusters[index_cluster]:
-                self.__total_wce += dataset_differences[index_cluster][index_point]
+            labels[self.__clusters[index_cluster]] = index_cluster
+
+        distances = self.__distance_calculator.assigned(self.__centers, labels, self.__metric)
+        self.__total_wce = float(numpy.sum(distances))
 
 
     def __calculate_dataset_difference(self, amount_clusters):
@@ -556,7 +984,7 @@ class kmeans:
         dataset_differences = numpy.zeros((amount_clusters, len(self.__pointer_data)))
         for index_center in range(amount_clusters):
             if self.__metric.get_type() != type_metric.USER_DEFINED:
-                dataset_differences[index_center] = self.__metric(self.__pointer_data, self.__centers[index_center])
+                dataset_differences[index_center] = self.__numpy_metric(self.__pointer_data, self.__centers[index_center])
             else:
                 dataset_differences[index_center] = [ self.__metric(point, self.__centers[index_center])
                                                       for point in self.__pointer_data ]
@@ -564,6 +992,164 @@ class kmeans:
         return dataset_differences
 
 
+    def __calculate_bound(self, distances):
+        """!
+        @brief Converts distances that are calculated by the metric to values that satisfy triangle inequality.
+
+        @param[in] distances (numpy.array): Distances that are calculated by the metric.
+
+        @return (numpy.array) Distances that can be used as bounds (Euclidean distances in case of Square Euclidean metric).
+
+        """
+        if self.__metric.get_type() == type_metric.EUCLIDEAN_SQUARE:
+            return numpy.sqrt(distances)
+
+        return numpy.array(distances, dtype=numpy.float64)
+
+
+    def __initialize_bounds(self):
+        """!
+        @brief Calculates distances between each point and each center, assigns points to the nearest centers and
+                initializes bounds that are used by Elkan's algorithm.
+
+        """
+        dataset_differences = self.__calculate_dataset_difference(len(self.__centers))
+
+        self.__assignment = numpy.argmin(dataset_differences, axis=0)
+        self.__nearest_distances = dataset_differences[self.__assignment, numpy.arange(len(self.__pointer_data))]
+        self.__upper_bounds = self.__calculate_bound(self.__nearest_distances)
+        self.__lower_bounds = self.__calculate_bound(dataset_differences.T)
+        self.__tight_bounds = numpy.ones(len(self.__pointer_data), dtype=bool)
+
+
+    def __update_assignment(self):
+        """!
+        @brief Reassigns points to the nearest centers using Elkan's algorithm.
+        @details Center is skipped for a point if lower bound of distance to the center or half of distance between the
+                  center and the current center of the point is greater than upper bound of distance to the current
+                  center. Ties are resolved in favour of center with smaller index as it is done by Lloyd's algorithm.
+
+        """
+        amount_centers = len(self.__centers)
+
+        center_distances = numpy.zeros((amount_centers, amount_centers))
+        for index_center in range(amount_centers):
+            center_distances[index_center] = self.__calculate_bound(self.__numpy_metric(self.__centers, self.__centers[index_center]))
+
+        half_center_distances = 0.5 * center_distances
+        separation = numpy.copy(half_center_distances)
+        numpy.fill_diagonal(separation, float('inf'))
+        separation = numpy.min(separation, axis=1)
+
+        upper_bounds = kmeans.__add_margin(self.__upper_bounds)
+        candidates = numpy.nonzero(upper_bounds >= separation[self.__assignment])[0]
+
+        for index_center in range(amount_centers):
+            if len(candidates) == 0:
+                break
+
+            points = self.__filter_candidates(candidates, index_center, half_center_distances)
+
+            loose_points = points[~self.__tight_bounds[points]]
+            if len(loose_points) > 0:
+                assigned_centers = self.__centers[self.__assignment[loose_points]]
+                distances = self.__numpy_metric(self.__pointer_data[loose_points], assigned_centers)
+
+                self.__nearest_distances[loose_points] = distances
+                self.__upper_bounds[loose_points] = self.__calculate_bound(distances)
+                self.__lower_bounds[loose_points, self.__assignment[loose_points]] = self.__upper_bounds[loose_points]
+                self.__tight_bounds[loose_points] = True
+
+                points = self.__filter_candidates(points, index_center, half_center_distances)
+
+            if len(points) == 0:
+                continue
+
+            distances = self.__numpy_metric(self.__pointer_data[points], self.__centers[index_center])
+            self.__lower_bounds[points, index_center] = self.__calculate_bound(distances)
+
+            nearest_distances = self.__nearest_distances[points]
+            closer = (distances < nearest_distances) | ((distances == nearest_distances) & (index_center < self.__assignment[points]))
+
+            closer_points = points[closer]
+            self.__assignment[closer_points] = index_center
+            self.__nearest_distances[closer_points] = distances[closer]
+            self.__upper_bounds[closer_points] = self.__lower_bounds[closer_points, index_center]
+
+
+    def __filter_candidates(self, points, index_center, half_center_distances):
+        """!
+        @brief Returns points whose distance to the specified center should be calculated to find out the nearest center.
+
+        @param[in] points (numpy.array): Indexes of points that are checked.
+        @param[in] index_center (uint): Index of center that is checked.
+        @param[in] half_center_distances (numpy.array): Halves of distances between centers.
+
+        @return (numpy.array) Indexes of points that cannot be skipped.
+
+        """
+        assignment = self.__assignment[points]
+        upper_bounds = kmeans.__add_margin(self.__upper_bounds[points])
+
+        required = (assignment != index_center) & \
+                   (upper_bounds >= self.__lower_bounds[points, index_center]) & \
+                   (upper_bounds >= half_center_distances[assignment, index_center])
+
+        return points[required]
+
+
+    @staticmethod
+    def __add_margin(upper_bounds):
+        """!
+        @brief Adds margin to upper bounds to make comparison with other bounds robust to rounding errors.
+
+        @param[in] upper_bounds (numpy.array): Upper bounds of distances between points and their centers.
+
+        @return (numpy.array) Upper bounds with margin.
+
+        """
+        return upper_bounds * (1.0 + kmeans.__BOUND_RELATIVE_MARGIN) + kmeans.__BOUND_ABSOLUTE_MARGIN
+
+
+    def __extract_clusters(self):
+        """!
+        @brief Forms clusters in line with the current assignment, empty clusters are removed as it is done by
+                Lloyd's algorithm and bounds are adjusted to the remaining clusters.
+
+        @return (list) Clusters as list of clusters. Each cluster contains indexes of objects from data.
+
+        """
+        sizes = numpy.bincount(self.__assignment, minlength=len(self.__centers))
+        self.__surviving_clusters = numpy.nonzero(sizes)[0]
+
+        if len(self.__surviving_clusters) != len(self.__centers):
+            index_map = numpy.full(len(self.__centers), -1, dtype=self.__assignment.dtype)
+            index_map[self.__surviving_clusters] = numpy.arange(len(self.__surviving_clusters))
+
+            self.__assignment = index_map[self.__assignment]
+            self.__lower_bounds = self.__lower_bounds[:, self.__surviving_clusters]
+
+        order = numpy.argsort(self.__assignment, kind='stable')
+        borders = numpy.cumsum(sizes[self.__surviving_clusters])[:-1]
+
+        return [cluster.tolist() for cluster in numpy.split(order, borders)]
+
+
+    def __shift_bounds(self, updated_centers):
+        """!
+        @brief Updates bounds in line with movement of centers.
+
+        @param[in] updated_centers (numpy.array): New cluster centers.
+
+        """
+        previous_centers = self.__centers[self.__surviving_clusters]
+        movements = self.__calculate_bound(self.__numpy_metric(previous_centers, updated_centers))
+
+        self.__lower_bounds = numpy.maximum(self.__lower_bounds - movements, 0.0)
+        self.__upper_bounds = self.__upper_bounds + movements[self.__assignment]
+        self.__tight_bounds[:] = False
+
+
     def __calculate_changes(self, updated_centers):
         """!
         @brief Calculates changes estimation between previous and current iteration using centers for that purpose.
@@ -580,4 +1166,18 @@ class kmeans:
             changes = self.__metric(self.__centers, updated_centers)
             maximum_change = numpy.max(changes)
 
-        return maximum_change
\ No newline at end of file
+        return maximum_change
+
+
+    ## Metrics that satisfy triangle inequality (directly or, in case of Square Euclidean, via square root).
+    __TRIANGLE_METRICS = { type_metric.EUCLIDEAN, type_metric.EUCLIDEAN_SQUARE, type_metric.MANHATTAN,
+                           type_metric.CHEBYSHEV, type_metric.CANBERRA }
+
+    ## Metrics whose nearest centers can be found by filtering algorithm.
+    __FILTERING_METRICS = { type_metric.EUCLIDEAN_SQUARE }
+
+    ## Relative margin that is used to compare bounds of Elkan's and filtering algorithms.
+    __BOUND_RELATIVE_MARGIN = 1e-10
+
+    ## Absolute margin that is used to compare bounds of Elkan's and filtering algorithms.
+    __BOUND_ABSOLUTE_MARGIN = 1e-12
@@ -0,0 +1,343 @@
+"""!
+
+@brief Multi-restart K-Means: K-Means is run from several K-Means++ initializations and the best result is kept.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import os
+import random
+
+import numpy
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pyclustering.core.wrapper import ccore_library
+from pyclustering.core.pyclustering_package import ccore_dataset
+
+from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+from pyclustering.cluster.encoder import type_encoding
+from pyclustering.cluster.kmeans import kmeans, kmeans_algorithm
+
+from pyclustering.utils.metric import distance_metric, type_metric
+from pyclustering.utils.shared_dataset import shared_dataset
+
+
+def _process_restart_in_worker(seed, amount_clusters, parameters):
+    """!
+    @brief Performs one restart of K-Means in worker process using dataset from shared memory.
+
+    @param[in] seed (uint): Seed for K-Means++ initialization.
+    @param[in] amount_clusters (uint): Amount of clusters that should be allocated.
+    @param[in] parameters (dict): Parameters of K-Means and K-Means++ algorithms.
+
+    @return (tuple) Total WCE, clusters, centers and initial centers.
+
+    """
+    return _process_restart(shared_dataset.get_worker_dataset(), seed, amount_clusters, parameters, False)
+
+
+def _initialize_centers(data, seed, amount_clusters, amount_candidates):
+    """!
+    @brief Calculates initial centers using K-Means++ with specified seed, state of random generator is restored.
+
+    """
+    state = random.getstate()
+    random.seed(seed)
+
+    try:
+        return kmeans_plusplus_initializer(data, amount_clusters, amount_candidates).initialize()
+    finally:
+        random.setstate(state)
+
+
+def _process_restart(data, seed, amount_clusters, parameters, ccore, initial_centers=None):
+    """!
+    @brief Performs one restart of K-Means algorithm.
+
+    @return (tuple) Total WCE, clusters, centers and initial centers.
+
+    """
+    if initial_centers is None:
+        initial_centers = _initialize_centers(data, seed, amount_clusters, parameters['amount_candidates'])
+
+    metric = distance_metric(parameters['metric_type'], **parameters['metric_arguments'])
+    kmeans_instance = kmeans(data, initial_centers, parameters['tolerance'], ccore, metric=metric,
+                             maxiter=parameters['itermax'], algorithm=parameters['algorithm'])
+    kmeans_instance.process()
+
+    return float(kmeans_instance.get_total_wce()), kmeans_instance.get_clusters(), kmeans_instance.get_centers(), \
+           numpy.asarray(initial_centers).tolist()
+
+
+class kmeans_restarts:
+    """!
+    @brief Runs K-Means algorithm several times from different K-Means++ initializations and keeps the result with
+            the lowest total WCE (within cluster error).
+    @details Restarts are independent, therefore they are processed in parallel:
+              - Python implementation: restarts are processed by pool of processes, dataset is placed to shared memory
+                once and worker processes use it without copying (dataset is not pickled for each restart);
+              - CCORE implementation: restarts are processed by pool of threads, each of them calls C++ implementation
+                that does not hold Python GIL, dataset is packed for C++ once (see ccore_dataset) and shared by all calls.
+
+    Each restart uses its own seed for K-Means++ initialization, seeds are generated using 'random_state', therefore
+    results are reproducible and do not depend on amount of workers.
+
+    Example:
+    @code
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+
+        # run K-Means 20 times from different initial centers using 4 workers
+        restarts_instance = kmeans_restarts(sample, 3, 20, random_state=1000, pool_size=4)
+        restarts_instance.process()
+
+        # the best result
+        clusters = restarts_instance.get_clusters()
+        centers = restarts_instance.get_centers()
+
+        # total WCE of each restart
+        print(restarts_instance.get_restarts_wce())
+    @endcode
+
+    @see kmeans
+    @see kmeans_plusplus_initializer
+
+    """
+
+    def __init__(self, data, amount_clusters, restarts=10, ccore=True, **kwargs):
+        """!
+        @brief Creates multi-restart K-Means algorithm.
+
+        @param[in] data (array_like): Input data that is presented as array of points (objects), each point should be represented by array_like data structure.
+        @param[in] amount_clusters (uint): Amount of clusters that should be allocated.
+        @param[in] restarts (uint): Amount of K-Means restarts from different initial centers.
+        @param[in] ccore (bool): Defines should be CCORE library (C++ pyclustering library) used instead of Python code or not.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'tolerance', 'metric', 'itermax',
+                    'algorithm', 'amount_candidates', 'random_state', 'pool_size').
+
+        <b>Keyword Args:</b><br>
+            - tolerance (double): Stop condition of K-Means for each restart (by default: 0.001).
+            - metric (distance_metric): Metric that is used for distance calculation between two points (by default euclidean square distance).
+                       User-defined function of the metric should be picklable in case of Python implementation.
+            - itermax (uint): Maximum number of iterations of K-Means for each restart (by default: 200).
+            - algorithm (kmeans_algorithm): Algorithm that is used by Python implementation of K-Means (by default: kmeans_algorithm.LLOYD).
+            - amount_candidates (uint): Amount of candidates that is considered by K-Means++ (by default: 1).
+            - random_state (uint): Seed that is used to generate seeds of restarts (by default: None).
+            - pool_size (uint): Amount of workers (processes or threads) that process restarts (by default: amount of CPUs).
+
+        """
+        self.__data = data
+        self.__amount_clusters = amount_clusters
+        self.__restarts = restarts
+
+        self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        self.__parameters = { 'tolerance': kwargs.get('tolerance', 0.001),
+                              'itermax': kwargs.get('itermax', 200),
+                              'algorithm': kwargs.get('algorithm', kmeans_algorithm.LLOYD),
+                              'amount_candidates': kwargs.get('amount_candidates', 1),
+                              'metric_type': self.__metric.get_type(),
+                              'metric_arguments': self.__metric.get_arguments() }
+
+        self.__random_state = kwargs.get('random_state', None)
+        self.__pool_size = kwargs.get('pool_size', None) or os.cpu_count() or 1
+
+        self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED
+        if self.__ccore is True:
+            self.__ccore = ccore_library.workable()
+
+        self.__clusters = []
+        self.__centers = []
+        self.__initial_centers = []
+        self.__total_wce = float('inf')
+        self.__restarts_wce = []
+        self.__best_restart = -1
+
+        self.__verify_arguments()
+
+
+    def process(self):
+        """!
+        @brief Performs K-Means restarts and keeps the result with the lowest total WCE.
+
+        @return (kmeans_restarts) Returns itself (multi-restart K-Means instance).
+
+        @see get_clusters()
+        @see get_centers()
+        @see get_restarts_wce()
+
+        """
+        seeds = numpy.random.RandomState(self.__random_state).randint(0, 2 ** 31 - 1, self.__restarts).tolist()
+
+        if self.__ccore is True:
+            results = self.__process_by_ccore(seeds)
+        else:
+            results = self.__process_by_python(seeds)
+
+        self.__restarts_wce = [result[0] for result in results]
+        self.__best_restart = int(numpy.argmin(self.__restarts_wce))
+
+        self.__total_wce, self.__clusters, self.__centers, self.__initial_centers = results[self.__best_restart]
+        return self
+
+
+    def get_clusters(self):
+        """!
+        @brief Returns list of clusters of the best restart, each cluster contains indexes of objects in list of data.
+
+        @see process()
+        @see get_centers()
+
+        """
+        return self.__clusters
+
+
+    def get_centers(self):
+        """!
+        @brief Returns list of centers of clusters of the best restart.
+
+        @see process()
+        @see get_clusters()
+
+        """
+        return self.__centers
+
+
+    def get_initial_centers(self):
+        """!
+        @brief Returns initial centers of the best restart, they can be used to reproduce the result by K-Means.
+
+        @see process()
+
+        """
+        return self.__initial_centers
+
+
+    def get_total_wce(self):
+        """!
+        @brief Returns total WCE (within cluster error) of the best restart.
+
+        @see process()
+        @see get_restarts_wce()
+
+        """
+        return self.__total_wce
+
+
+    def get_restarts_wce(self):
+        """!
+        @brief Returns total WCE (within cluster error) of each restart in order of restarts.
+
+        @see process()
+        @see get_best_restart()
+
+        """
+        return self.__restarts_wce
+
+
+    def get_best_restart(self):
+        """!
+        @brief Returns index of restart whose result has the lowest total WCE.
+
+        @see process()
+        @see get_restarts_wce()
+
+        """
+        return self.__best_restart
+
+
+    def get_cluster_encoding(self):
+        """!
+        @brief Returns clustering result representation type that indicate how clusters are encoded.
+
+        @return (type_encoding) Clustering result representation.
+
+        @see get_clusters()
+
+        """
+        return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
+
+
+    def __process_by_ccore(self, seeds):
+        """!
+        @brief Performs restarts using CCORE library in pool of threads.
+
+        @param[in] seeds (list): Seeds of K-Means++ initialization for each restart.
+
+        @return (list) Results of restarts.
+
+        """
+        dataset = self.__data if isinstance(self.__data, ccore_dataset) else ccore_dataset(self.__data)
+        data = dataset.get_data()
+
+        # Initialization uses global random generator of Python, therefore it is performed in the current thread.
+        initial_centers = [_initialize_centers(data, seed, self.__amount_clusters, self.__parameters['amount_candidates'])
+                           for seed in seeds]
+
+        if (self.__pool_size == 1) or (self.__restarts == 1):
+            return [_process_restart(dataset, seed, self.__amount_clusters, self.__parameters, True, centers)
+                    for seed, centers in zip(seeds, initial_centers)]
+
+        with ThreadPoolExecutor(max_workers=self.__pool_size) as executor:
+            futures = [executor.submit(_process_restart, dataset, seed, self.__amount_clusters, self.__parameters, True, centers)
+                       for seed, centers in zip(seeds, initial_centers)]
+
+            return [future.result() for future in futures]
+
+
+    def __process_by_python(self, seeds):
+        """!
+        @brief Performs restarts using Python implementation in pool of processes, dataset is shared using shared memory.
+
+        @param[in] seeds (list): Seeds of K-Means++ initialization for each restart.
+
+        @return (list) Results of restarts.
+
+        """
+        data = numpy.ascontiguousarray(self.__data, dtype=numpy.float64)
+
+        if (self.__pool_size == 1) or (self.__restarts == 1):
+            return [_process_restart(data, seed, self.__amount_clusters, self.__parameters, False) for seed in seeds]
+
+        with shared_dataset(data) as dataset, dataset.create_executor(min(self.__pool_size, self.__restarts)) as executor:
+            futures = [executor.submit(_process_restart_in_worker, seed, self.__amount_clusters, self.__parameters)
+                       for seed in seeds]
+
+            return [future.result() for future in futures]
+
+
+    def __verify_arguments(self):
+        """!
+        @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
+
+        """
+        if len(self.__data) == 0:
+            raise ValueError("Input data is empty (size: '%d')." % len(self.__data))
+
+        if (self.__amount_clusters <= 0) or (self.__amount_clusters > len(self.__data)):
+            raise ValueError("Amount of clusters (current value: '%d') should be greater than 0 and less or equal "
+                             "to amount of points in data." % self.__amount_clusters)
+
+        if self.__restarts <= 0:
+            raise ValueError("Amount of restarts should be greater than 0 (current value: '%d')." % self.__restarts)
+
+        if self.__pool_size <= 0:
+            raise ValueError("Pool size should be greater than 0 (current value: '%d')." % self.__pool_size)
@@ -25,11 +25,12 @@
 """
 
 
-import math
+import numpy
 
 from pyclustering.cluster.encoder import type_encoding
 
 from pyclustering.utils.metric import distance_metric, type_metric
+from pyclustering.utils.blockwise_distance import blockwise_distance
 
 import pyclustering.core.kmedians_wrapper as wrapper
 
@@ -56,6 +57,14 @@ class kmedians:
         kmedians_instance.process();
         kmedians_instance.get_clusters();
     @endcode
+
+    Python implementation calculates medians by selection (partition) of coordinates of each cluster. Medians of huge
+    clusters can be approximated by streaming histograms that process the dataset by chunks without copying of clusters:
+    @code
+        # medians of clusters with more than one million points are approximated
+        kmedians_instance = kmedians(sample, initial_medians, ccore=False, approximate_threshold=1000000)
+        kmedians_instance.process()
+    @endcode
     
     """
     
@@ -67,10 +76,17 @@ class kmedians:
         @param[in] initial_centers (list): Initial coordinates of medians of clusters that are represented by list: [center1, center2, ...].
         @param[in] tolerance (double): Stop condition: if maximum value of change of centers of clusters is less than tolerance than algorithm will stop processing
         @param[in] ccore (bool): Defines should be CCORE library (C++ pyclustering library) used instead of Python code or not.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric', 'memory_limit', 'distance_calculator',
+                    'approximate_threshold').
 
         <b>Keyword Args:</b><br>
             - metric (distance_metric): Metric that is used for distance calculation between two points.
+            - memory_limit (uint): Amount of memory in bytes that is used by Python implementation for one tile of distance
+               matrix between points and medians (by default: blockwise_distance.DEFAULT_MEMORY_LIMIT).
+            - distance_calculator (blockwise_distance): Calculator of distances that has been created for the input data
+               (by default it is created by K-Medians instance).
+            - approximate_threshold (uint): Median of cluster that contains more points than the threshold is approximated
+               by streaming histograms in Python implementation, exact medians are calculated if it is None (by default: None).
         
         """
         self.__pointer_data = data
@@ -82,6 +98,10 @@ class kmedians:
         if self.__metric is None:
             self.__metric = distance_metric(type_metric.EUCLIDEAN_SQUARE)
 
+        self.__memory_limit = kwargs.get('memory_limit', blockwise_distance.DEFAULT_MEMORY_LIMIT)
+        self.__distance_calculator = kwargs.get('distance_calculator', None)
+        self.__approximate_threshold = kwargs.get('approximate_threshold', None)
+
         self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED
         if self.__ccore:
             self.__ccore = ccore_library.workable()
@@ -110,6 +130,9 @@ class kmedians:
             # Check for dimension
             if len(self.__pointer_data[0]) != len(self.__medians[0]):
                 raise NameError('Dimension of the input data and dimension of the initial medians must be equal.')
+
+            if self.__distance_calculator is None:
+                self.__distance_calculator = blockwise_distance(self.__pointer_data, self.__memory_limit)
              
             while changes > self.__tolerance:
                 self.__clusters = self.__update_clusters()
@@ -168,51 +191,110 @@ class kmedians:
         
         """
         
-        clusters = [[] for i in range(len(self.__medians))]
-        for index_point in range(len(self.__pointer_data)):
-            index_optim = -1
-            dist_optim = 0.0
-             
-            for index in range(len(self.__medians)):
-                dist = self.__metric(self.__pointer_data[index_point], self.__medians[index])
-                 
-                if (dist < dist_optim) or (index is 0):
-                    index_optim = index
-                    dist_optim = dist
-             
-            clusters[index_optim].append(index_point)
-            
+        labels, _ = self.__distance_calculator.nearest(self.__medians, self.__metric)
+
         # If cluster is not able to capture object it should be removed
-        clusters = [cluster for cluster in clusters if len(cluster) > 0]
-        
-        return clusters
+        sizes = numpy.bincount(labels, minlength=len(self.__medians))
+        order = numpy.argsort(labels, kind='stable')
+        borders = numpy.cumsum(sizes[sizes > 0])[:-1]
+
+        return [cluster.tolist() for cluster in numpy.split(order, borders)]
     
     
     def __update_medians(self):
         """!
         @brief Calculate medians of clusters in line with contained objects.
+        @details Coordinates of each cluster are copied once and partially sorted (selection of the middle elements)
+                  for all dimensions at once. Medians of clusters that are bigger than approximation threshold are
+                  estimated by streaming histograms.
         
         @return (list) list of medians for current number of clusters.
         
         """
-         
-        medians = [[] for i in range(len(self.__clusters))]
-         
-        for index in range(len(self.__clusters)):
-            medians[index] = [ 0.0 for i in range(len(self.__pointer_data[0]))]
-            length_cluster = len(self.__clusters[index])
-            
-            for index_dimension in range(len(self.__pointer_data[0])):
-                sorted_cluster = sorted(self.__clusters[index], key=lambda x: self.__pointer_data[x][index_dimension])
-                
-                relative_index_median = int(math.floor((length_cluster - 1) / 2))
-                index_median = sorted_cluster[relative_index_median]
-                
-                if (length_cluster % 2) == 0:
-                    index_median_second = sorted_cluster[relative_index_median + 1]
-                    medians[index][index_dimension] = (self.__pointer_data[index_median][index_dimension] + self.__pointer_data[index_median_second][index_dimension]) / 2.0
-                    
-                else:
-                    medians[index][index_dimension] = self.__pointer_data[index_median][index_dimension]
-             
-        return medians
+
+        data = self.__distance_calculator.get_data()
+        sizes = numpy.array([len(cluster) for cluster in self.__clusters])
+
+        approximate = numpy.zeros(len(self.__clusters), dtype=bool)
+        if self.__approximate_threshold is not None:
+            approximate = sizes > self.__approximate_threshold
+
+        medians = numpy.empty((len(self.__clusters), len(self.__pointer_data[0])))
+        for index in numpy.flatnonzero(~approximate):
+            points = numpy.array(data[self.__clusters[index]], dtype=numpy.float64)
+
+            length_cluster = len(points)
+            middles = [(length_cluster - 1) // 2, length_cluster // 2]
+
+            points.partition(middles, axis=0)
+            medians[index] = (points[middles[0]] + points[middles[1]]) / 2.0
+
+        if numpy.any(approximate):
+            medians[approximate] = self.__estimate_medians(data, numpy.flatnonzero(approximate), sizes[approximate])
+
+        return medians.tolist()
+
+
+    def __estimate_medians(self, data, cluster_indexes, sizes):
+        """!
+        @brief Estimates medians of specified clusters by streaming histograms.
+        @details Each pass over the dataset builds histogram of each coordinate of each cluster and finds bin that
+                  contains median, the next pass splits this bin into the same amount of bins. Dataset is processed
+                  by chunks, therefore clusters are not copied. Error of approximation does not exceed
+                  range of coordinate divided by amount of bins in power of amount of passes.
+
+        @param[in] data (numpy.array): Input dataset.
+        @param[in] cluster_indexes (array_like): Indexes of clusters whose medians are estimated.
+        @param[in] sizes (array_like): Amount of points in each of these clusters.
+
+        @return (numpy.array) Estimated medians (lower medians in case of even amount of points).
+
+        """
+
+        amount_bins = kmedians.__HISTOGRAM_BINS
+        amount_clusters, dimension = len(cluster_indexes), data.shape[1]
+
+        labels = numpy.full(len(data), -1, dtype=numpy.int64)
+        for index_selected, index_cluster in enumerate(cluster_indexes):
+            labels[self.__clusters[index_cluster]] = index_selected
+
+        ranks = (numpy.asarray(sizes) - 1) // 2
+
+        minimum, maximum = numpy.min(data, axis=0), numpy.max(data, axis=0)
+        constant = maximum == minimum
+
+        lows = numpy.tile(numpy.asarray(minimum, dtype=numpy.float64), (amount_clusters, 1))
+        widths = numpy.tile(numpy.where(constant, 1.0, (maximum - minimum) / amount_bins), (amount_clusters, 1))
+
+        coordinates = numpy.arange(dimension)
+        chunk_size = max(1, self.__memory_limit // (4 * dimension * numpy.dtype(numpy.float64).itemsize))
+
+        for index_pass in range(kmedians.__HISTOGRAM_PASSES):
+            counts = numpy.zeros(amount_clusters * dimension * (amount_bins + 2), dtype=numpy.int64)
+            last_bin = amount_bins if index_pass == 0 else amount_bins + 1  # maximum belongs to the last bin
+
+            for begin in range(0, len(data), chunk_size):
+                owners = labels[begin:begin + chunk_size]
+                mask = owners >= 0
+                owners = owners[mask]
+
+                bins = numpy.floor((data[begin:begin + chunk_size][mask] - lows[owners]) / widths[owners]) + 1
+                numpy.clip(bins, 0, last_bin, out=bins)
+
+                positions = (owners[:, None] * dimension + coordinates) * (amount_bins + 2) + bins.astype(numpy.int64)
+                counts += numpy.bincount(positions.ravel(), minlength=len(counts))
+
+            cumulative = numpy.cumsum(counts.reshape(amount_clusters, dimension, amount_bins + 2), axis=2)
+            median_bins = numpy.argmax(cumulative > ranks[:, None, None], axis=2)
+
+            lows += (median_bins - 1) * widths
+            widths /= amount_bins
+
+        return numpy.where(constant, lows, lows + widths * amount_bins / 2.0)
+
+
+    ## Amount of bins of histograms that are used to estimate medians.
+    __HISTOGRAM_BINS = 1024
+
+    ## Amount of passes over the dataset to estimate medians, each pass refines the bin that contains median.
+    __HISTOGRAM_PASSES = 3
@@ -27,10 +27,12 @@
 
 import numpy
 
+from enum import IntEnum
+
 from pyclustering.cluster.encoder import type_encoding
 
-from pyclustering.utils import median
 from pyclustering.utils.metric import distance_metric, type_metric
+from pyclustering.utils.blockwise_distance import blockwise_distance
 
 import pyclustering.core.kmedoids_wrapper as wrapper
 
@@ -38,6 +40,116 @@ from pyclustering.core.wrapper import ccore_library
 from pyclustering.core.metric_wrapper import metric_wrapper
 
 
+class kmedoids_algorithm(IntEnum):
+    """!
+    @brief Enumeration of algorithms that can be used by Python implementation of K-Medoids to allocate clusters.
+
+    @see kmedoids
+
+    """
+
+    ## Alternate algorithm: objects are assigned to the nearest medoids and then medoid of each cluster is updated by
+    ## object that has the smallest total distance to other objects of the cluster, steps are repeated while medoids
+    ## are changed.
+    ALTERNATE = 0
+
+    ## FastPAM algorithm: SWAP phase of PAM where distances from each object to its nearest and second nearest medoids
+    ## are cached, so cost changes of swaps of one candidate object with all medoids are calculated by one pass over the
+    ## objects. Candidates are processed by blocks, the best swap of a block is performed immediately if it decreases
+    ## total deviation, the algorithm stops when there is no such swap for any candidate.
+    FASTPAM = 1
+
+
+class kmedoids_distance_calculator:
+    """!
+    @brief Calculator of distances between objects that is used by Python implementation of K-Medoids and by PAM BUILD
+            initializer.
+    @details Distances are calculated by rows: each row contains distances from one object to all objects (or to
+              specified objects), therefore it is not required to keep the whole distance matrix in memory in case of
+              points. Distances between points are calculated by blockwise distance calculator, distance matrix is
+              accessed directly. Size of blocks of rows is defined by memory limit.
+
+    @see kmedoids
+    @see pam_build_initializer
+
+    """
+
+    def __init__(self, data, metric=None, data_type='points', memory_limit=blockwise_distance.DEFAULT_MEMORY_LIMIT):
+        """!
+        @brief Creates distance calculator for the specified input data.
+
+        @param[in] data (array_like): Input data that is presented as list of points or as distance matrix.
+        @param[in] metric (distance_metric): Metric that is used for distance calculation between points (by default Square Euclidean).
+        @param[in] data_type (string): Data type of input data ('points', 'distance_matrix').
+        @param[in] memory_limit (uint): Amount of memory in bytes that is used for one block of rows.
+
+        """
+        if data_type not in ('points', 'distance_matrix'):
+            raise TypeError("Unknown type of data is specified '%s'" % data_type)
+
+        self.__data = numpy.asarray(data, dtype=numpy.float64)
+        self.__metric = metric if metric is not None else distance_metric(type_metric.EUCLIDEAN_SQUARE)
+        self.__data_type = data_type
+        self.__memory_limit = memory_limit
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of objects.
+
+        """
+        return len(self.__data)
+
+
+    def get_block_size(self, amount_columns, amount_buffers=1):
+        """!
+        @brief Returns amount of rows that can be calculated at once without exceeding the memory limit.
+        @details Block is also limited by 8MB even if memory limit is greater, elementwise operations over blocks
+                  that fit into cache are faster.
+
+        @param[in] amount_columns (uint): Amount of columns in each row.
+        @param[in] amount_buffers (uint): Amount of buffers of the same size that are used to process block of rows.
+
+        @return (uint) Amount of rows in one block.
+
+        """
+        row_size = max(1, amount_columns) * amount_buffers * numpy.dtype(numpy.float64).itemsize
+        block_memory = min(self.__memory_limit, kmedoids_distance_calculator.__MAXIMUM_BLOCK_MEMORY)
+        return max(1, min(len(self.__data), block_memory // row_size))
+
+
+    def calculate(self, rows, columns=None):
+        """!
+        @brief Calculates distances between specified objects.
+
+        @param[in] rows (array_like): Indexes of objects from which distances are calculated.
+        @param[in] columns (array_like): Indexes of objects to which distances are calculated, if 'None' then
+                    distances to all objects are calculated.
+
+        @return (numpy.array) Matrix where rows correspond to 'rows' objects and columns correspond to 'columns' objects.
+
+        @see get_block_size()
+
+        """
+        rows = numpy.asarray(rows, dtype=numpy.int64)
+
+        if self.__data_type == 'distance_matrix':
+            if columns is None:
+                return self.__data[rows]
+
+            return self.__data[numpy.ix_(rows, numpy.asarray(columns, dtype=numpy.int64))]
+
+        objects = self.__data
+        if columns is not None:
+            objects = self.__data[numpy.asarray(columns, dtype=numpy.int64)]
+
+        return blockwise_distance(self.__data[rows]).matrix(objects, self.__metric)
+
+
+    ## Maximum amount of memory in bytes that is used by one block of rows.
+    __MAXIMUM_BLOCK_MEMORY = 8 * 1024 * 1024
+
+
 class kmedoids:
     """!
     @brief Class represents clustering algorithm K-Medoids (another one title is PAM - Partitioning Around Medoids).
@@ -95,6 +207,19 @@ class kmedoids:
         medoids = kmedoids_instance.get_medoids()
     @endcode
 
+    FastPAM algorithm with initial medoids that are chosen by BUILD phase of PAM can be used to process large amount of objects:
+    @code
+        # choose initial medoids using BUILD phase of PAM
+        initial_medoids = pam_build_initializer(sample, 3).initialize(return_index=True)
+
+        # create K-Medoids algorithm that uses FastPAM algorithm (Python implementation)
+        kmedoids_instance = kmedoids(sample, initial_medoids, ccore=False, algorithm=kmedoids_algorithm.FASTPAM)
+
+        # run cluster analysis and obtain results
+        kmedoids_instance.process()
+        clusters = kmedoids_instance.get_clusters()
+    @endcode
+
     """
     
     
@@ -105,12 +230,18 @@ class kmedoids:
         @param[in] data (list): Input data that is presented as list of points (objects), each point should be represented by list or tuple.
         @param[in] initial_index_medoids (list): Indexes of intial medoids (indexes of points in input data).
         @param[in] tolerance (double): Stop condition: if maximum value of distance change of medoids of clusters is less than tolerance than algorithm will stop processing.
+                    In case of FastPAM algorithm swap is performed only if it decreases total deviation more than tolerance.
         @param[in] ccore (bool): If specified than CCORE library (C++ pyclustering library) is used for clustering instead of Python code.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric', 'data_type').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric', 'data_type', 'algorithm', 'itermax',
+                    'memory_limit').
 
         <b>Keyword Args:</b><br>
             - metric (distance_metric): Metric that is used for distance calculation between two points.
             - data_type (string): Data type of input sample 'data' that is processed by the algorithm ('points', 'distance_matrix').
+            - algorithm (kmedoids_algorithm): Algorithm that is used by Python implementation to allocate clusters (by default: kmedoids_algorithm.ALTERNATE).
+            - itermax (uint): Maximum amount of iterations of alternate algorithm or maximum amount of swaps of FastPAM algorithm (by default: 200).
+            - memory_limit (uint): Amount of memory in bytes that is used by Python implementation for one block of
+               distances between objects (by default: blockwise_distance.DEFAULT_MEMORY_LIMIT).
 
         """
         self.__pointer_data = data
@@ -120,7 +251,11 @@ class kmedoids:
 
         self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
         self.__data_type = kwargs.get('data_type', 'points')
+        self.__algorithm = kwargs.get('algorithm', kmedoids_algorithm.ALTERNATE)
+        self.__itermax = kwargs.get('itermax', 200)
+        self.__memory_limit = kwargs.get('memory_limit', blockwise_distance.DEFAULT_MEMORY_LIMIT)
         self.__distance_calculator = self.__create_distance_calculator()
+        self.__calculator = None
 
         self.__ccore = ccore and self.__metric.get_type() != type_metric.USER_DEFINED
         if self.__ccore:
@@ -145,17 +280,7 @@ class kmedoids:
             self.__clusters, self.__medoid_indexes = wrapper.kmedoids(self.__pointer_data, self.__medoid_indexes, self.__tolerance, ccore_metric.get_pointer(), self.__data_type)
         
         else:
-            changes = float('inf')
-             
-            stop_condition = self.__tolerance
-             
-            while changes > stop_condition:
-                self.__clusters = self.__update_clusters()
-                update_medoid_indexes = self.__update_medoids()
-
-                changes = max([self.__distance_calculator(self.__medoid_indexes[index], update_medoid_indexes[index]) for index in range(len(update_medoid_indexes))])
-
-                self.__medoid_indexes = update_medoid_indexes
+            self.__process_by_python()
 
         return self
 
@@ -197,6 +322,184 @@ class kmedoids:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
+    def __process_by_python(self):
+        """!
+        @brief Performs cluster analysis using Python code.
+
+        """
+        self.__calculator = kmedoids_distance_calculator(self.__pointer_data, self.__metric, self.__data_type, self.__memory_limit)
+
+        if self.__algorithm == kmedoids_algorithm.FASTPAM:
+            self.__process_by_python_fastpam()
+            return
+
+        changes = float('inf')
+        iteration = 0
+
+        while changes > self.__tolerance and iteration < self.__itermax:
+            self.__clusters = self.__update_clusters()
+            update_medoid_indexes = self.__update_medoids()
+
+            changes = max([self.__distance_calculator(self.__medoid_indexes[index], update_medoid_indexes[index]) for index in range(len(update_medoid_indexes))])
+
+            self.__medoid_indexes = update_medoid_indexes
+            iteration += 1
+
+
+    def __process_by_python_fastpam(self):
+        r"""!
+        @brief Performs cluster analysis using FastPAM algorithm (SWAP phase of PAM with cached nearest and second
+                nearest medoids).
+        @details Swap of candidate object 'c' with medoid 'i' changes total deviation by
+                  \f[\Delta TD_{c,i}=\sum_{o}\min(d(o,c)-d_{n}(o),0)+\sum_{o:n(o)=i}(\mathrm{clip}(d(o,c),d_{n}(o),d_{s}(o))-d_{n}(o))\f]
+                  where \f$n(o)\f$ is the nearest medoid of object \f$o\f$, \f$d_{n}(o)\f$ and \f$d_{s}(o)\f$ are
+                  distances to the nearest and the second nearest medoids. Therefore one row of distances from the
+                  candidate to all objects is enough to evaluate its swaps with all medoids.
+
+        """
+        amount_objects = len(self.__calculator)
+        amount_medoids = len(self.__medoid_indexes)
+
+        medoids = numpy.array(self.__medoid_indexes, dtype=numpy.int64)
+        medoid_distances = numpy.ascontiguousarray(self.__calculator.calculate(medoids).T)
+        labels, nearest_distances, second_distances = self.__find_nearest_medoids(medoid_distances, medoids)
+
+        is_medoid = numpy.zeros(amount_objects, dtype=bool)
+        is_medoid[medoids] = True
+
+        block_size = self.__calculator.get_block_size(amount_objects, 2)
+        order, begins = self.__group_by_medoids(labels, amount_medoids)
+
+        position, unchanged, swaps = 0, 0, 0
+        while unchanged < amount_objects and swaps < self.__itermax:
+            candidates = numpy.arange(position, min(position + block_size, amount_objects))
+            distances = self.__calculator.calculate(candidates, order)
+
+            deltas = self.__calculate_swap_deltas(distances, nearest_distances[order], second_distances[order], begins)
+            deltas[is_medoid[candidates]] = float('inf')
+
+            index_candidate, index_medoid = numpy.unravel_index(numpy.argmin(deltas), deltas.shape)
+            if deltas[index_candidate, index_medoid] < -self.__tolerance:
+                is_medoid[medoids[index_medoid]] = False
+                medoids[index_medoid] = candidates[index_candidate]
+                is_medoid[medoids[index_medoid]] = True
+
+                medoid_distances[order, index_medoid] = distances[index_candidate]
+                labels, nearest_distances, second_distances = self.__find_nearest_medoids(medoid_distances, medoids)
+                order, begins = self.__group_by_medoids(labels, amount_medoids)
+
+                unchanged = 0
+                swaps += 1
+            else:
+                unchanged += len(candidates)
+
+            position = candidates[-1] + 1
+            if position >= amount_objects:
+                position = 0
+
+        self.__medoid_indexes = medoids.tolist()
+        self.__clusters = self.__create_clusters(labels, medoids)
+
+
+    @staticmethod
+    def __calculate_swap_deltas(distances, nearest_distances, second_distances, begins):
+        """!
+        @brief Calculates changes of total deviation for swaps of each candidate with each medoid.
+        @details Objects (columns of distances) should be sorted by their nearest medoids.
+
+        @param[in] distances (numpy.array): Distances from each candidate to all objects.
+        @param[in] nearest_distances (numpy.array): Distance from each object to its nearest medoid.
+        @param[in] second_distances (numpy.array): Distance from each object to its second nearest medoid.
+        @param[in] begins (numpy.array): Position where objects of each medoid begin.
+
+        @return (numpy.array) Matrix of changes where rows correspond to candidates and columns correspond to medoids.
+
+        """
+        ends = numpy.append(begins[1:], len(nearest_distances))
+        non_empty = ends > begins
+
+        cumulative_nearest = numpy.concatenate(([0.0], numpy.cumsum(nearest_distances)))
+        cluster_deviations = cumulative_nearest[ends] - cumulative_nearest[begins]
+
+        buffer = numpy.minimum(distances, nearest_distances)
+        shared = numpy.sum(buffer, axis=1) - cumulative_nearest[-1]
+
+        numpy.minimum(distances, second_distances, out=buffer)
+        numpy.maximum(buffer, nearest_distances, out=buffer)
+
+        deltas = numpy.zeros((len(distances), len(begins)))
+        deltas[:, non_empty] = numpy.add.reduceat(buffer, begins[non_empty], axis=1)
+
+        deltas += shared[:, None] - cluster_deviations
+        return deltas
+
+
+    @staticmethod
+    def __find_nearest_medoids(medoid_distances, medoids):
+        """!
+        @brief Finds the nearest medoid of each object and distances to the nearest and the second nearest medoids.
+        @details Each medoid is considered as the nearest medoid for itself.
+
+        @param[in] medoid_distances (numpy.array): Distances from each object to each medoid.
+        @param[in] medoids (numpy.array): Indexes of medoids.
+
+        @return (tuple) Index of the nearest medoid of each object, distance to it and distance to the second nearest medoid.
+
+        """
+        amount_objects, amount_medoids = medoid_distances.shape
+        objects = numpy.arange(amount_objects)
+
+        labels = numpy.argmin(medoid_distances, axis=1)
+        labels[medoids] = numpy.arange(amount_medoids)
+        nearest_distances = medoid_distances[objects, labels]
+
+        if amount_medoids == 1:
+            return labels, nearest_distances, numpy.full(amount_objects, float('inf'))
+
+        other_distances = medoid_distances.copy()
+        other_distances[objects, labels] = float('inf')
+
+        return labels, nearest_distances, numpy.min(other_distances, axis=1)
+
+
+    @staticmethod
+    def __group_by_medoids(labels, amount_medoids):
+        """!
+        @brief Sorts objects by their nearest medoids.
+
+        @param[in] labels (numpy.array): Index of the nearest medoid of each object.
+        @param[in] amount_medoids (uint): Amount of medoids.
+
+        @return (tuple) Sorted objects and position where objects of each medoid begin.
+
+        """
+        order = numpy.argsort(labels, kind='stable')
+        begins = numpy.searchsorted(labels[order], numpy.arange(amount_medoids))
+        return order, begins
+
+
+    @staticmethod
+    def __create_clusters(labels, medoids):
+        """!
+        @brief Creates clusters where the first object of each cluster is its medoid.
+
+        @param[in] labels (numpy.array): Index of medoid of each object.
+        @param[in] medoids (array_like): Indexes of medoids.
+
+        @return (list) Clusters where each cluster contains indexes of objects from data.
+
+        """
+        order, begins = kmedoids.__group_by_medoids(labels, len(medoids))
+        ends = numpy.append(begins[1:], len(order))
+
+        clusters = []
+        for index_medoid, medoid in enumerate(medoids):
+            cluster = order[begins[index_medoid]:ends[index_medoid]]
+            clusters.append([int(medoid)] + cluster[cluster != medoid].tolist())
+
+        return clusters
+
+
     def __create_distance_calculator(self):
         """!
         @brief Creates distance calculator in line with algorithms parameters.
@@ -225,30 +528,32 @@ class kmedoids:
         @return (list) updated clusters as list of clusters where each cluster contains indexes of objects from data.
         
         """
-        
-        clusters = [[self.__medoid_indexes[i]] for i in range(len(self.__medoid_indexes))]
-        for index_point in range(len(self.__pointer_data)):
-            if index_point in self.__medoid_indexes:
-                continue
-
-            index_optim = -1
-            dist_optim = float('Inf')
-            
-            for index in range(len(self.__medoid_indexes)):
-                dist = self.__distance_calculator(index_point, self.__medoid_indexes[index])
-                
-                if dist < dist_optim:
-                    index_optim = index
-                    dist_optim = dist
-            
-            clusters[index_optim].append(index_point)
-        
-        return clusters
+
+        medoids = numpy.array(self.__medoid_indexes, dtype=numpy.int64)
+        labels = numpy.empty(len(self.__calculator), dtype=numpy.int64)
+
+        block_size = self.__calculator.get_block_size(len(self.__calculator))
+        for begin in range(0, len(medoids), block_size):
+            end = min(begin + block_size, len(medoids))
+            distances = self.__calculator.calculate(medoids[begin:end])
+
+            if begin == 0:
+                nearest_distances = numpy.min(distances, axis=0)
+                labels[:] = numpy.argmin(distances, axis=0)
+            else:
+                block_distances = numpy.min(distances, axis=0)
+                improved = block_distances < nearest_distances
+                labels[improved] = numpy.argmin(distances, axis=0)[improved] + begin
+                nearest_distances[improved] = block_distances[improved]
+
+        labels[medoids] = numpy.arange(len(medoids))
+        return self.__create_clusters(labels, medoids)
     
     
     def __update_medoids(self):
         """!
         @brief Find medoids of clusters in line with contained objects.
+        @details Medoid of a cluster is its object with the smallest total distance to other objects of the cluster.
         
         @return (list) list of medoids for current number of clusters.
         
@@ -256,8 +561,14 @@ class kmedoids:
 
         medoid_indexes = [-1] * len(self.__clusters)
         
-        for index in range(len(self.__clusters)):
-            medoid_index = median(self.__pointer_data, self.__clusters[index], metric=self.__metric, data_type=self.__data_type)
-            medoid_indexes[index] = medoid_index
+        for index, cluster in enumerate(self.__clusters):
+            block_size = self.__calculator.get_block_size(len(cluster))
+            total_distances = numpy.empty(len(cluster))
+
+            for begin in range(0, len(cluster), block_size):
+                end = min(begin + block_size, len(cluster))
+                total_distances[begin:end] = numpy.sum(self.__calculator.calculate(cluster[begin:end], cluster), axis=1)
+
+            medoid_indexes[index] = cluster[int(numpy.argmin(total_distances))]
              
         return medoid_indexes
@@ -0,0 +1,405 @@
+"""!
+
+@brief Cluster analysis algorithm: Mini-Batch K-Means
+@details Implementation based on paper @cite inproceedings::minibatch_kmeans::1.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+from pyclustering.cluster.encoder import type_encoding
+
+from pyclustering.utils.blockwise_distance import blockwise_distance
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class minibatch_kmeans:
+    """!
+    @brief Class represents Mini-Batch K-Means clustering algorithm.
+    @details Mini-Batch K-Means updates centers using small random batches of points instead of the whole dataset on
+              each iteration, therefore it is able to process datasets that do not fit the memory. Each center has its
+              own learning rate that is inverse to amount of points that have been assigned to it. When centers are
+              trained, final streaming pass over the data assigns each point to the nearest center to form clusters.
+
+    Input data can be represented by:
+    - array_like object or numpy.memmap - batches are sampled randomly, memory-mapped array is read only by batches;
+    - iterable object that returns new iterator over points (or blocks of points) each time when 'iter()' is called;
+    - callable object (for example, generator function) that returns iterator over points (or blocks of points).
+
+    In case of iterable and callable objects batches are formed from consecutive points of the stream, the stream is
+    started again when it is exhausted. One-shot iterators cannot be used because the final assignment pass requires
+    the data again.
+
+    Example #1 - Clustering of memory-mapped array:
+    @code
+        from pyclustering.cluster.minibatch_kmeans import minibatch_kmeans
+
+        # open large dataset without loading it to the memory
+        sample = numpy.load('embeddings.npy', mmap_mode='r')
+
+        # prepare initial centers using subset of the dataset
+        initial_centers = kmeans_plusplus_initializer(sample[:100000], 50).initialize()
+
+        # create instance of Mini-Batch K-Means and run cluster analysis
+        minibatch_instance = minibatch_kmeans(sample, initial_centers, batch_size=4096, random_state=1000)
+        minibatch_instance.process()
+
+        clusters = minibatch_instance.get_clusters()
+        centers = minibatch_instance.get_centers()
+    @endcode
+
+    Example #2 - Clustering of data that is read by blocks from a file:
+    @code
+        def read_blocks():
+            for block in pandas.read_csv('telemetry.csv', chunksize=100000):
+                yield block.values
+
+        minibatch_instance = minibatch_kmeans(read_blocks, initial_centers, batch_size=4096)
+        minibatch_instance.process()
+    @endcode
+
+    @see kmeans
+
+    """
+
+    def __init__(self, data, initial_centers, tolerance=0.001, batch_size=1024, **kwargs):
+        """!
+        @brief Constructor of clustering algorithm Mini-Batch K-Means.
+
+        @param[in] data (array_like|iterable|callable): Input data that is presented as array of points (objects), as
+                    iterable object or as callable object that returns iterator over points or blocks of points.
+        @param[in] initial_centers (array_like): Initial coordinates of centers of clusters that are represented by array_like data structure: [center1, center2, ...].
+        @param[in] tolerance (double): Stop condition: if maximum value of change of centers of clusters is less than tolerance then algorithm stops processing.
+        @param[in] batch_size (uint): Amount of points in each batch.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'metric', 'itermax', 'random_state').
+
+        <b>Keyword Args:</b><br>
+            - metric (distance_metric): Metric that is used for distance calculation between two points (by default euclidean square distance).
+            - itermax (uint): Maximum number of batches that are used to train centers (by default: 100).
+            - random_state (uint): Seed for random generator that is used to sample batches (by default: None).
+
+        """
+        self.__data = data
+        self.__centers = numpy.array(initial_centers, dtype=numpy.float64)
+        self.__tolerance = tolerance
+        self.__batch_size = batch_size
+        self.__clusters = []
+        self.__total_wce = 0.0
+
+        self.__metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        self.__itermax = kwargs.get('itermax', 100)
+        self.__random = numpy.random.RandomState(kwargs.get('random_state', None))
+
+        self.__numpy_metric = blockwise_distance.create_numpy_metric(self.__metric)
+
+        self.__verify_arguments()
+
+
+    def process(self):
+        """!
+        @brief Performs cluster analysis in line with rules of Mini-Batch K-Means algorithm.
+
+        @return (minibatch_kmeans) Returns itself (Mini-Batch K-Means instance).
+
+        @remark Results of clustering can be obtained using corresponding get methods.
+
+        @see get_clusters()
+        @see get_centers()
+
+        """
+        counters = numpy.zeros(len(self.__centers))
+        batches = self.__generate_batches()
+
+        stop_condition = self.__tolerance * self.__tolerance
+        maximum_change = float('inf')
+        iteration = 0
+
+        while maximum_change > stop_condition and iteration < self.__itermax:
+            batch = next(batches)
+            self.__check_dimension(batch)
+
+            updated_centers = self.__update_centers(batch, counters)
+            maximum_change = numpy.max(self.__calculate_changes(updated_centers))
+
+            self.__centers = updated_centers
+            iteration += 1
+
+        self.__assign_points()
+        return self
+
+
+    def get_clusters(self):
+        """!
+        @brief Returns list of allocated clusters, each cluster contains indexes of objects in the data.
+
+        @see process()
+        @see get_centers()
+
+        """
+        return self.__clusters
+
+
+    def get_centers(self):
+        """!
+        @brief Returns list of centers of allocated clusters.
+
+        @see process()
+        @see get_clusters()
+
+        """
+        return self.__centers.tolist()
+
+
+    def get_total_wce(self):
+        """!
+        @brief Returns sum of metric errors that depends on metric that was used for clustering (by default SSE - Sum of Squared Errors).
+        @details Sum of metric errors is calculated during final assignment pass using distance between point and its center:
+                 \f[error=\sum_{i=0}^{N}distance(x_{i}-center(x_{i}))\f]
+
+        @see process()
+        @see get_clusters()
+
+        """
+        return self.__total_wce
+
+
+    def get_cluster_encoding(self):
+        """!
+        @brief Returns clustering result representation type that indicate how clusters are encoded.
+
+        @return (type_encoding) Clustering result representation.
+
+        @see get_clusters()
+
+        """
+        return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
+
+
+    def __update_centers(self, batch, counters):
+        """!
+        @brief Moves centers towards points of the batch that are assigned to them.
+        @details Each point moves its center with learning rate \f$\eta = 1 / v\f$, where \f$v\f$ is amount of
+                  points that have been assigned to the center, sequential updates by points of the batch are
+                  equivalent to the weighted mean of the center and the points.
+
+        @param[in] batch (numpy.array): Points of the batch.
+        @param[in] counters (numpy.array): Amount of points that have been assigned to each center, it is updated.
+
+        @return (numpy.array) Updated centers.
+
+        """
+        labels, _ = self.__find_nearest_centers(batch)
+
+        amounts = numpy.bincount(labels, minlength=len(self.__centers))
+        sums = numpy.zeros(self.__centers.shape)
+        numpy.add.at(sums, labels, batch)
+
+        updated_counters = counters + amounts
+        updated_centers = numpy.copy(self.__centers)
+
+        moved = amounts > 0
+        updated_centers[moved] = (self.__centers[moved] * counters[moved, None] + sums[moved]) / updated_counters[moved, None]
+
+        counters[:] = updated_counters
+        return updated_centers
+
+
+    def __assign_points(self):
+        """!
+        @brief Assigns each point of the data to the nearest center, forms clusters and calculates total WCE.
+        @details Centers that do not have points are removed.
+
+        """
+        clusters = [[] for _ in range(len(self.__centers))]
+        self.__total_wce = 0.0
+
+        index_offset = 0
+        for block in self.__generate_blocks():
+            self.__check_dimension(block)
+
+            labels, distances = self.__find_nearest_centers(block)
+            self.__total_wce += float(numpy.sum(distances))
+
+            order = numpy.argsort(labels, kind='stable')
+            borders = numpy.cumsum(numpy.bincount(labels, minlength=len(self.__centers)))[:-1]
+            for index_cluster, indexes in enumerate(numpy.split(order, borders)):
+                clusters[index_cluster].extend((indexes + index_offset).tolist())
+
+            index_offset += len(block)
+
+        if index_offset == 0:
+            raise ValueError("Input data is empty.")
+
+        not_empty = [index for index in range(len(clusters)) if len(clusters[index]) > 0]
+        self.__clusters = [clusters[index] for index in not_empty]
+        self.__centers = self.__centers[not_empty]
+
+
+    def __find_nearest_centers(self, points):
+        """!
+        @brief Finds the nearest center for each point.
+
+        @param[in] points (numpy.array): Points whose nearest centers should be found.
+
+        @return (tuple) Indexes of the nearest centers and distances to them.
+
+        """
+        return blockwise_distance(points).nearest(self.__centers, self.__metric)
+
+
+    def __calculate_changes(self, updated_centers):
+        """!
+        @brief Calculates distances between current and updated centers.
+
+        @param[in] updated_centers (numpy.array): Updated centers.
+
+        @return (numpy.array) Distance between each current center and its updated version.
+
+        """
+        if self.__numpy_metric is not None:
+            return self.__numpy_metric(self.__centers, updated_centers)
+
+        return numpy.array([self.__metric(center, updated_center)
+                            for center, updated_center in zip(self.__centers, updated_centers)])
+
+
+    def __generate_batches(self):
+        """!
+        @brief Returns infinite generator of batches that are used to train centers.
+
+        """
+        if self.__is_array():
+            data = self.__get_array()
+            while True:
+                # Indexes are sorted to read memory-mapped arrays sequentially.
+                indexes = numpy.sort(self.__random.randint(0, len(data), self.__batch_size))
+                yield numpy.asarray(data[indexes], dtype=numpy.float64)
+
+        else:
+            while True:
+                exhausted = True
+                for batch in self.__generate_stream_blocks(self.__batch_size):
+                    exhausted = False
+                    yield batch
+
+                if exhausted is True:
+                    raise ValueError("Input data is empty.")
+
+
+    def __generate_blocks(self):
+        """!
+        @brief Returns generator of consecutive blocks of points that cover the data once.
+
+        """
+        if self.__is_array():
+            data = self.__get_array()
+            for index_begin in range(0, len(data), self.__batch_size):
+                yield numpy.asarray(data[index_begin:index_begin + self.__batch_size], dtype=numpy.float64)
+
+        else:
+            for block in self.__generate_stream_blocks(self.__batch_size):
+                yield block
+
+
+    def __generate_stream_blocks(self, size):
+        """!
+        @brief Reads points from the stream and combines them into blocks of the specified size (the last one can be smaller).
+
+        @param[in] size (uint): Amount of points in each block.
+
+        """
+        stream = self.__data() if callable(self.__data) else iter(self.__data)
+
+        points = []
+        amount_points = 0
+        for item in stream:
+            item = numpy.asarray(item, dtype=numpy.float64)
+            item = item.reshape(1, -1) if item.ndim == 1 else item
+
+            points.append(item)
+            amount_points += len(item)
+
+            if amount_points >= size:
+                block = numpy.concatenate(points)
+
+                index_begin = 0
+                while len(block) - index_begin >= size:
+                    yield block[index_begin:index_begin + size]
+                    index_begin += size
+
+                points = [block[index_begin:]]
+                amount_points = len(block) - index_begin
+
+        if amount_points > 0:
+            yield numpy.concatenate(points)
+
+
+    def __is_array(self):
+        """!
+        @brief Returns True if the data supports random access to points (list, numpy array, memory-mapped array).
+
+        """
+        return hasattr(self.__data, '__len__') and hasattr(self.__data, '__getitem__')
+
+
+    def __get_array(self):
+        """!
+        @brief Returns the data as numpy array, numpy arrays (including memory-mapped) are not copied.
+
+        """
+        if isinstance(self.__data, numpy.ndarray):
+            return self.__data
+
+        self.__data = numpy.asarray(self.__data, dtype=numpy.float64)
+        return self.__data
+
+
+    def __check_dimension(self, points):
+        """!
+        @brief Checks that dimension of points is the same as dimension of centers.
+
+        @param[in] points (numpy.array): Points that are checked.
+
+        """
+        if (points.ndim != 2) or (points.shape[1] != self.__centers.shape[1]):
+            raise ValueError("Dimension of the input data and dimension of the initial cluster centers must be equal.")
+
+
+    def __verify_arguments(self):
+        """!
+        @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
+
+        """
+        if self.__centers.ndim != 2 or len(self.__centers) == 0:
+            raise ValueError("Initial centers should be represented by non-empty list of points.")
+
+        if self.__batch_size <= 0:
+            raise ValueError("Batch size should be greater than 0 (current value: '%d')." % self.__batch_size)
+
+        if self.__itermax <= 0:
+            raise ValueError("Maximum amount of iterations should be greater than 0 (current value: '%d')." % self.__itermax)
+
+        if (self.__is_array() is False) and (callable(self.__data) is False):
+            if iter(self.__data) is self.__data:
+                raise ValueError("One-shot iterator cannot be used as input data because final assignment requires "
+                                 "the data again, use iterable or callable object instead.")
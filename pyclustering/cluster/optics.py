@@ -25,20 +25,21 @@
 """
 
 
-import math
-import warnings
+import heapq
 
-try:
-    import matplotlib.pyplot as plt
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+import numpy
 
-from pyclustering.container.kdtree import kdtree
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot')
+
+from pyclustering.container.kdtree import kdtree, kdtree_balanced
+from pyclustering.container.neighbor_graph import neighbor_graph
 
 from pyclustering.cluster.encoder import type_encoding
 
 from pyclustering.utils.color import color as color_list
+from pyclustering.utils.metric import type_metric
 
 from pyclustering.core.wrapper import ccore_library
 
@@ -244,6 +245,287 @@ class ordering_analyser:
         return amount_clusters, cluster_borders
 
 
+class optics_ordering:
+    """!
+    @brief Persistable result of OPTICS algorithm - cluster ordering of objects with their core and reachability distances.
+    @details Cluster ordering that is built for connectivity radius 'eps' contains clustering results for each radius
+              that is not greater than 'eps'. Amount of clusters as a function of radius is piecewise constant: object
+              starts new cluster for radius from [core distance, reachability distance), therefore it is calculated once
+              by one sorted pass over these bounds. Using it, radius for required amount of clusters is obtained by one scan
+              and clusters are extracted for any radius for O(n) without running of OPTICS algorithm again.
+
+    Example:
+    @code
+        from pyclustering.cluster.optics import optics, optics_ordering
+        from pyclustering.samples.definitions import FCPS_SAMPLES
+        from pyclustering.utils import read_sample
+
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+
+        optics_instance = optics(sample, 1.0, 3)
+        optics_instance.process()
+
+        # Save cluster ordering to use it later.
+        optics_instance.get_optics_ordering().save('lsun_ordering.npz')
+
+        # Load cluster ordering and extract three clusters without cluster analysis.
+        ordering = optics_ordering.load('lsun_ordering.npz')
+        radius = ordering.calculate_radius(3)
+        clusters, noise = ordering.extract_clusters(radius)
+    @endcode
+
+    @see optics
+
+    """
+
+    def __init__(self, indexes, core_distances, reachability_distances, eps, minpts):
+        """!
+        @brief Constructor of cluster ordering.
+
+        @param[in] indexes (array_like): Indexes of objects in order of their traverse by OPTICS algorithm.
+        @param[in] core_distances (array_like): Core distances of objects in order of traverse, 'None' or infinity if object is not core.
+        @param[in] reachability_distances (array_like): Reachability distances of objects in order of traverse, 'None' or
+                    infinity if object is not reachable.
+        @param[in] eps (double): Connectivity radius that has been used to build cluster ordering.
+        @param[in] minpts (uint): Minimum number of neighbors that has been used to build cluster ordering.
+
+        """
+
+        self.__indexes = numpy.array(indexes, dtype=numpy.int64).reshape(-1)
+        self.__core_distances = optics_ordering.__to_distances(core_distances)
+        self.__reachability_distances = optics_ordering.__to_distances(reachability_distances)
+        self.__eps = float(eps)
+        self.__minpts = int(minpts)
+
+        if not (len(self.__indexes) == len(self.__core_distances) == len(self.__reachability_distances)):
+            raise ValueError("Indexes, core and reachability distances should have the same length.")
+
+        self.__radiuses, self.__amounts = self.__calculate_amounts()
+
+
+    @staticmethod
+    def load(file):
+        """!
+        @brief Loads cluster ordering that has been saved by method save().
+
+        @param[in] file (string|file): Name of the file or file object.
+
+        @return (optics_ordering) Loaded cluster ordering.
+
+        @see save()
+
+        """
+
+        with numpy.load(file) as content:
+            return optics_ordering(content['indexes'], content['core_distances'], content['reachability_distances'],
+                                   content['eps'], content['minpts'])
+
+
+    def save(self, file):
+        """!
+        @brief Saves cluster ordering to file in NumPy '.npz' format.
+
+        @param[in] file (string|file): Name of the file or file object.
+
+        @see load()
+
+        """
+
+        numpy.savez_compressed(file, indexes=self.__indexes, core_distances=self.__core_distances,
+                               reachability_distances=self.__reachability_distances,
+                               eps=numpy.float64(self.__eps), minpts=numpy.int64(self.__minpts))
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of objects in the cluster ordering.
+
+        """
+
+        return len(self.__indexes)
+
+
+    def get_eps(self):
+        """!
+        @brief Returns connectivity radius that has been used to build the cluster ordering.
+
+        """
+
+        return self.__eps
+
+
+    def get_minpts(self):
+        """!
+        @brief Returns minimum number of neighbors that has been used to build the cluster ordering.
+
+        """
+
+        return self.__minpts
+
+
+    def get_indexes(self):
+        """!
+        @brief Returns indexes of objects in order of their traverse (numpy.ndarray).
+
+        """
+
+        return self.__indexes
+
+
+    def get_core_distances(self):
+        """!
+        @brief Returns core distances in order of traverse (numpy.ndarray), infinity is used for objects that are not core.
+
+        """
+
+        return self.__core_distances
+
+
+    def get_reachability_distances(self):
+        """!
+        @brief Returns reachability distances in order of traverse (numpy.ndarray), infinity is used for objects that are not reachable.
+
+        """
+
+        return self.__reachability_distances
+
+
+    def get_ordering(self):
+        """!
+        @brief Returns cluster ordering diagram - reachability distances of reachable objects, it can be used by ordering_analyser.
+
+        @return (list) Values of cluster ordering diagram.
+
+        @see ordering_analyser
+
+        """
+
+        return self.__reachability_distances[numpy.isfinite(self.__reachability_distances)].tolist()
+
+
+    def get_cluster_amount(self, radius):
+        """!
+        @brief Returns amount of clusters that is allocated by the specified connectivity radius, complexity is O(log(n)).
+
+        @param[in] radius (double): Connectivity radius that is not greater than 'eps' of the cluster ordering.
+
+        @return (uint) Amount of clusters.
+
+        """
+
+        self.__verify_radius(radius)
+
+        position = numpy.searchsorted(self.__radiuses, radius, side='right') - 1
+        if position < 0:
+            return 0
+
+        return int(self.__amounts[position])
+
+
+    def calculate_radius(self, amount_clusters):
+        """!
+        @brief Calculates connectivity radius that allocates specified amount of clusters.
+        @details Amount of clusters may be allocated by several intervals of radius, lower bound of the interval that is the
+                  closest to 'eps' is returned as the radius with the smallest noise.
+
+        @param[in] amount_clusters (uint): Amount of clusters that should be allocated.
+
+        @return (double) Connectivity radius or 'None' if the amount of clusters cannot be allocated by any radius that is not greater than 'eps'.
+
+        """
+
+        positions = numpy.flatnonzero(self.__amounts == amount_clusters)
+        if len(positions) == 0:
+            return None
+
+        return float(self.__radiuses[positions[-1]])
+
+
+    def extract_clusters(self, radius):
+        """!
+        @brief Extracts clusters and noise for the specified connectivity radius, complexity is O(n).
+        @details Results are the same as results of OPTICS algorithm that is performed with the radius (in case of the same
+                  cluster ordering): each cluster and noise are listed in order of traverse.
+
+        @param[in] radius (double): Connectivity radius that is not greater than 'eps' of the cluster ordering.
+
+        @return (list, list) Allocated clusters and noise (clusters, noise).
+
+        """
+
+        self.__verify_radius(radius)
+
+        starts = self.__reachability_distances > radius
+        cores = self.__core_distances <= radius
+
+        noise = starts & ~cores
+        members = ~noise
+
+        amount_clusters = numpy.count_nonzero(starts & cores)
+        if amount_clusters == 0:
+            return [], self.__indexes[noise].tolist()
+
+        labels = numpy.cumsum(starts & cores)[members] - 1
+        order = numpy.argsort(labels, kind='stable')
+        borders = numpy.cumsum(numpy.bincount(labels, minlength=amount_clusters))[:-1]
+
+        clusters = [cluster.tolist() for cluster in numpy.split(self.__indexes[members][order], borders)]
+
+        return clusters, self.__indexes[noise].tolist()
+
+
+    def __calculate_amounts(self):
+        """!
+        @brief Calculates piecewise constant function of amount of clusters for connectivity radius.
+        @details Object starts a cluster for radius from [core distance, reachability distance), therefore amount of
+                  clusters is changed only at these bounds.
+
+        @return (numpy.ndarray, numpy.ndarray) Radiuses where amount of clusters is changed and amounts of clusters from
+                 each radius until the next one (radiuses, amounts).
+
+        """
+
+        starts = numpy.isfinite(self.__core_distances) & (self.__core_distances < self.__reachability_distances)
+        ends = starts & numpy.isfinite(self.__reachability_distances)
+
+        bounds = numpy.concatenate((self.__core_distances[starts], self.__reachability_distances[ends]))
+        changes = numpy.concatenate((numpy.ones(numpy.count_nonzero(starts), dtype=numpy.int64),
+                                     -numpy.ones(numpy.count_nonzero(ends), dtype=numpy.int64)))
+
+        order = numpy.argsort(bounds, kind='stable')
+        bounds, amounts = bounds[order], numpy.cumsum(changes[order])
+
+        if len(bounds) == 0:
+            return bounds, amounts
+
+        # only the last change for each radius defines amount of clusters
+        last_changes = numpy.append(bounds[1:] != bounds[:-1], True)
+        return bounds[last_changes], amounts[last_changes]
+
+
+    def __verify_radius(self, radius):
+        """!
+        @brief Verifies that clustering results may be obtained from the cluster ordering for the specified radius.
+
+        @param[in] radius (double): Connectivity radius.
+
+        """
+
+        if (radius < 0.0) or (radius > self.__eps):
+            raise ValueError("Connectivity radius '%s' should be in range [0, %s] of the cluster ordering." % (radius, self.__eps))
+
+
+    @staticmethod
+    def __to_distances(distances):
+        """!
+        @brief Converts distances to array where infinity is used instead of undefined distances ('None').
+
+        """
+
+        distances = numpy.array(distances, dtype=float).reshape(-1)
+        return numpy.where(numpy.isnan(distances), numpy.inf, distances)
+
+
 class optics_descriptor:
     """!
     @brief Object description that used by OPTICS algorithm for cluster analysis.
@@ -288,6 +570,9 @@ class optics:
              Clustering-ordering information contains information about internal structures of data set in terms of density and proper connectivity radius can be obtained
              for allocation required amount of clusters using this diagram. In case of usage additional input parameter 'amount of clusters' connectivity radius should be
              bigger than real - because it will be calculated by the algorithms if requested amount of clusters is not allocated.
+
+             Distance between points can be measured by any metric that satisfies triangle inequality, in this case
+             neighbors of all points are found by ball-tree (container.balltree) and stored as neighbor graph.
              
              CCORE option can be used to use the pyclustering core - C/C++ shared library for processing that significantly increases performance.
 
@@ -349,11 +634,16 @@ class optics:
         @param[in] amount_clusters (uint): Optional parameter where amount of clusters that should be allocated is specified.
                     In case of usage 'amount_clusters' connectivity radius can be greater than real, in other words, there is place for mistake
                     in connectivity radius usage.
-        @param[in] ccore (bool): if True than DLL CCORE (C++ solution) will be used for solving the problem.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'data_type').
+        @param[in] ccore (bool): if True than DLL CCORE (C++ solution) will be used for solving the problem, it is not used in case of
+                    neighbor graph or non-Euclidean metric.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'data_type', 'metric').
 
         <b>Keyword Args:</b><br>
-            - data_type (string): Data type of input sample 'data' that is processed by the algorithm ('points', 'distance_matrix').
+            - data_type (string): Data type of input sample 'data' that is processed by the algorithm ('points', 'distance_matrix',
+               'neighbor_graph'). In case of 'neighbor_graph' sample is neighbor graph (container.neighbor_graph) whose maximum
+               radius is greater or equal to 'eps', neighbors are obtained by truncation of its rows.
+            - metric (distance_metric): Metric that is used for distance calculation between points (by default Euclidean),
+               it should satisfy triangle inequality.
 
         """
         
@@ -366,11 +656,16 @@ class optics:
         self.__clusters = None
         self.__noise = None
         self.__optics_objects = None
+        self.__ordered_database = None
 
         self.__data_type = kwargs.get('data_type', 'points')
+        self.__metric = kwargs.get('metric', None)
+        self.__euclidean = (self.__metric is None) or (self.__metric.get_type() == type_metric.EUCLIDEAN)
         
         self.__kdtree = None
-        self.__ccore = ccore
+        self.__search_order = None
+        self.__neighbor_graph = sample if self.__data_type == 'neighbor_graph' else None
+        self.__ccore = ccore and (self.__data_type != 'neighbor_graph') and (self.__euclidean or self.__data_type != 'points')
 
         self.__neighbor_searcher = self.__create_neighbor_searcher(self.__data_type)
 
@@ -420,6 +715,12 @@ class optics:
 
             self.__optics_objects.append(optics_object)
 
+        # each traverse is started from the smallest unprocessed index and forms one cluster or one noise object
+        traverses = self.__clusters + [[index_object] for index_object in self.__noise]
+        traverses.sort(key=lambda traverse: traverse[0])
+
+        self.__ordered_database = [self.__optics_objects[index_object] for traverse in traverses for index_object in traverse]
+
 
     def __process_by_python(self):
         """!
@@ -427,8 +728,12 @@ class optics:
 
         """
 
-        if self.__data_type == 'points':
-            self.__kdtree = kdtree(self.__sample_pointer, range(len(self.__sample_pointer)))
+        if (self.__data_type == 'points') and self.__euclidean:
+            self.__kdtree = kdtree_balanced(self.__sample_pointer, range(len(self.__sample_pointer)))
+            self.__search_order = kdtree.search_order(self.__sample_pointer)
+
+        elif self.__data_type == 'points':
+            self.__neighbor_graph = neighbor_graph.create(self.__sample_pointer, self.__eps, 'points', self.__metric)
 
         self.__allocate_clusters()
 
@@ -450,6 +755,9 @@ class optics:
         self.__optics_objects = [optics_descriptor(i) for i in range(len(sample))]      # List of OPTICS objects that corresponds to objects from input sample.
         self.__ordered_database = []        # List of OPTICS objects in traverse order.
         
+        self.__seed_tickets = [None] * len(sample)      # Ticket of the actual entry of each object in order seed.
+        self.__seed_counter = 0                         # Counter of entries that have been pushed to order seed.
+        
         self.__clusters = None      # Result of clustering (list of clusters where each cluster contains indexes of objects from input data).
         self.__noise = None         # Result of clustering (noise).
 
@@ -544,6 +852,25 @@ class optics:
 
         return self.__optics_objects
 
+
+    def get_optics_ordering(self):
+        """!
+        @brief Returns cluster ordering with core and reachability distances of objects that can be saved and used to
+                extract clusters for any connectivity radius that is not greater than the radius of the algorithm.
+
+        @return (optics_ordering) Cluster ordering.
+
+        @see get_ordering()
+        @see get_optics_objects()
+        @see optics_ordering
+
+        """
+
+        return optics_ordering([optics_object.index_object for optics_object in self.__ordered_database],
+                               [optics_object.core_distance for optics_object in self.__ordered_database],
+                               [optics_object.reachability_distance for optics_object in self.__ordered_database],
+                               self.__eps, self.__minpts)
+
     
     def get_radius(self):
         """!
@@ -579,13 +906,15 @@ class optics:
         """!
         @brief Returns neighbor searcher in line with data type.
 
-        @param[in] data_type (string): Data type (points or distance matrix).
+        @param[in] data_type (string): Data type (points, distance matrix or neighbor graph).
 
         """
         if data_type == 'points':
-            return self.__neighbor_indexes_points
+            return self.__neighbor_indexes_points if self.__euclidean else self.__neighbor_indexes_graph
         elif data_type == 'distance_matrix':
             return self.__neighbor_indexes_distance_matrix
+        elif data_type == 'neighbor_graph':
+            return self.__neighbor_indexes_graph
         else:
             raise TypeError("Unknown type of data is specified '%s'" % data_type)
 
@@ -616,9 +945,10 @@ class optics:
             order_seed = list()
             self.__update_order_seed(optics_object, neighbors_descriptor, order_seed)
             
-            while len(order_seed) > 0:
-                optic_descriptor = order_seed[0]
-                order_seed.remove(optic_descriptor)
+            while True:
+                optic_descriptor = self.__pop_order_seed(order_seed)
+                if optic_descriptor is None:
+                    break
                 
                 neighbors_descriptor = self.__neighbor_searcher(optic_descriptor)
                 optic_descriptor.processed = True
@@ -660,11 +990,15 @@ class optics:
 
     def __update_order_seed(self, optic_descriptor, neighbors_descriptors, order_seed):
         """!
-        @brief Update sorted list of reachable objects (from core-object) that should be processed using neighbors of core-object.
+        @brief Update order seed (binary heap) of reachable objects (from core-object) that should be processed using neighbors of core-object.
+        @details Each insertion and each decrease of reachability distance pushes new entry with new ticket to the heap,
+                  entry whose ticket is not actual anymore is skipped when it is popped. Objects with the same reachability
+                  distance are popped in order of tickets, i.e. object whose distance has been decreased is placed after
+                  objects with the same distance, like in case of stable sorting of list.
         
         @param[in] optic_descriptor (optics_descriptor): Core-object whose neighbors should be analysed.
         @param[in] neighbors_descriptors (list): List of neighbors of core-object.
-        @param[in|out] order_seed (list): List of sorted object in line with reachable distance.
+        @param[in|out] order_seed (list): Binary heap of entries (reachability distance, ticket, index of object).
         
         """
         
@@ -672,38 +1006,54 @@ class optics:
             index_neighbor = neighbor_descriptor[0]
             current_reachable_distance = neighbor_descriptor[1]
             
-            if self.__optics_objects[index_neighbor].processed is not True:
+            neighbor_object = self.__optics_objects[index_neighbor]
+            if neighbor_object.processed is not True:
                 reachable_distance = max(current_reachable_distance, optic_descriptor.core_distance)
-                if self.__optics_objects[index_neighbor].reachability_distance is None:
-                    self.__optics_objects[index_neighbor].reachability_distance = reachable_distance
-                    
-                    # insert element in queue O(n) - worst case.
-                    index_insertion = len(order_seed)
-                    for index_seed in range(0, len(order_seed)):
-                        if reachable_distance < order_seed[index_seed].reachability_distance:
-                            index_insertion = index_seed
-                            break
+                if (neighbor_object.reachability_distance is None) or (reachable_distance < neighbor_object.reachability_distance):
+                    neighbor_object.reachability_distance = reachable_distance
                     
-                    order_seed.insert(index_insertion, self.__optics_objects[index_neighbor])
+                    # insert element or decrease its key in queue O(log(n))
+                    self.__seed_tickets[index_neighbor] = self.__seed_counter
+                    heapq.heappush(order_seed, (reachable_distance, self.__seed_counter, index_neighbor))
+                    self.__seed_counter += 1
 
-                else:
-                    if reachable_distance < self.__optics_objects[index_neighbor].reachability_distance:
-                        self.__optics_objects[index_neighbor].reachability_distance = reachable_distance
-                        order_seed.sort(key = lambda obj: obj.reachability_distance)
+
+    def __pop_order_seed(self, order_seed):
+        """!
+        @brief Extracts object with the smallest reachability distance from order seed, entries that are not actual are skipped.
+        
+        @param[in|out] order_seed (list): Binary heap of entries (reachability distance, ticket, index of object).
+        
+        @return (optics_descriptor) Object with the smallest reachability distance or None if order seed is empty.
+        
+        """
+        
+        while len(order_seed) > 0:
+            _, ticket, index_object = heapq.heappop(order_seed)
+            if ticket == self.__seed_tickets[index_object]:
+                return self.__optics_objects[index_object]
+        
+        return None
 
 
     def __neighbor_indexes_points(self, optic_object):
         """!
         @brief Return neighbors of the specified object in case of sequence of points.
+        @details Neighbors are returned in the same order as they are found by kd-tree (kdtree) that is filled by points,
+                  so objects with the same reachability distance are placed to the order seed in the same order.
 
         @param[in] optic_object (optics_descriptor): Object for which neighbors should be returned in line with connectivity radius.
 
         @return (list) List of indexes of neighbors in line the connectivity radius.
 
         """
-        kdnodes = self.__kdtree.find_nearest_dist_nodes(self.__sample_pointer[optic_object.index_object], self.__eps)
-        return [[node_tuple[1].payload, math.sqrt(node_tuple[0])] for node_tuple in kdnodes if
-                node_tuple[1].payload != optic_object.index_object]
+        payloads, distances = self.__kdtree.find_nearest_dist_payloads(self.__sample_pointer[optic_object.index_object], self.__eps)
+
+        indexes = numpy.array(payloads, dtype=numpy.int64)
+        order = numpy.argsort(self.__search_order[indexes])
+
+        return [[index_neighbor, distance] for index_neighbor, distance in zip(indexes[order].tolist(), numpy.sqrt(distances[order]).tolist())
+                if index_neighbor != optic_object.index_object]
 
 
     def __neighbor_indexes_distance_matrix(self, optic_object):
@@ -717,4 +1067,18 @@ class optics:
         """
         distances = self.__sample_pointer[optic_object.index_object]
         return [[index_neighbor, distances[index_neighbor]] for index_neighbor in range(len(distances))
-                if ((distances[index_neighbor] <= self.__eps) and (index_neighbor != optic_object.index_object))]
\ No newline at end of file
+                if ((distances[index_neighbor] <= self.__eps) and (index_neighbor != optic_object.index_object))]
+
+
+    def __neighbor_indexes_graph(self, optic_object):
+        """!
+        @brief Return neighbors of the specified object in case of neighbor graph (it is built for points in case of
+                non-Euclidean metric).
+
+        @param[in] optic_object (optics_descriptor): Object for which neighbors should be returned in line with connectivity radius.
+
+        @return (list) List of indexes of neighbors in line the connectivity radius.
+
+        """
+        indexes, distances = self.__neighbor_graph.neighbors(optic_object.index_object, self.__eps)
+        return [[index_neighbor, distance] for index_neighbor, distance in zip(indexes.tolist(), distances.tolist())]
@@ -0,0 +1,352 @@
+"""!
+
+@brief Cluster analysis algorithm: Partitioned DBSCAN that processes partitions of data space by pool of processes.
+@details Implementation based on paper @cite inproceedings::dbscan::1.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import os
+
+import numpy
+
+from pyclustering.cluster.encoder import type_encoding
+
+from pyclustering.utils.shared_dataset import shared_dataset
+
+
+def _process_partition_in_worker(begin, end, axis, eps, neighbors):
+    """!
+    @brief Processes partition in worker process using dataset from shared memory.
+
+    @param[in] begin (uint): Index of the first point of the partition in the sorted dataset.
+    @param[in] end (uint): Index of the point after the last point of the partition in the sorted dataset.
+    @param[in] axis (uint): Coordinate that is used to split data space.
+    @param[in] eps (double): Connectivity radius.
+    @param[in] neighbors (uint): Minimum number of neighbors of core point.
+
+    @return (tuple) Result of the partition, see '_process_partition'.
+
+    """
+    return _process_partition(shared_dataset.get_worker_dataset(), begin, end, axis, eps, neighbors)
+
+
+def _expand_range(coordinates, begin, end, eps):
+    """!
+    @brief Returns range of sorted points whose split coordinate is within connectivity radius from the specified range.
+
+    @param[in] coordinates (numpy.array): Sorted split coordinates of points.
+    @param[in] begin (uint): Index of the first point of the range.
+    @param[in] end (uint): Index of the point after the last point of the range.
+    @param[in] eps (double): Connectivity radius.
+
+    @return (tuple) Begin and end of the expanded range.
+
+    """
+    return (int(numpy.searchsorted(coordinates, coordinates[begin] - eps, side='left')),
+            int(numpy.searchsorted(coordinates, coordinates[end - 1] + eps, side='right')))
+
+
+def _process_partition(data, begin, end, axis, eps, neighbors):
+    """!
+    @brief Finds core points of the partition and connected components of core points around it.
+    @details Partition owns points in range [begin, end) of the dataset that is sorted by the split coordinate. Core
+              points are searched among owned points and halo points (within connectivity radius from the partition),
+              each of them has all its neighbors in the second halo, therefore neighbors are counted exactly. Each link
+              between two core points is found by partition that owns one of them, therefore merged components of all
+              partitions are the same as components of the whole dataset.
+
+    @param[in] data (numpy.array): Points sorted by the split coordinate.
+    @param[in] begin (uint): Index of the first point of the partition.
+    @param[in] end (uint): Index of the point after the last point of the partition.
+    @param[in] axis (uint): Coordinate that is used to split data space.
+    @param[in] eps (double): Connectivity radius.
+    @param[in] neighbors (uint): Minimum number of neighbors of core point.
+
+    @return (tuple) Core flags of owned points, core points of the partition with halo and their local components,
+             owned border points and local components of their core neighbors.
+
+    """
+    # SciPy is imported only when data is processed, import of the module does not depend on it.
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    from scipy.spatial import cKDTree
+
+    coordinates = data[:, axis]
+    halo_begin, halo_end = _expand_range(coordinates, begin, end, eps)
+    outer_begin, outer_end = _expand_range(coordinates, halo_begin, halo_end, eps)
+
+    amount_points = outer_end - outer_begin
+    pairs = cKDTree(data[outer_begin:outer_end]).query_pairs(eps, output_type='ndarray')
+    rows, columns = numpy.concatenate((pairs[:, 0], pairs[:, 1])), numpy.concatenate((pairs[:, 1], pairs[:, 0]))
+
+    # core flags are exact for points of the partition with the first halo
+    local_indexes = numpy.arange(amount_points)
+    halo = (local_indexes >= halo_begin - outer_begin) & (local_indexes < halo_end - outer_begin)
+    core = (numpy.bincount(rows, minlength=amount_points) >= neighbors) & halo
+
+    links = core[rows] & core[columns]
+    graph = coo_matrix((numpy.ones(numpy.count_nonzero(links), dtype=numpy.int8), (rows[links], columns[links])),
+                       shape=(amount_points, amount_points))
+    _, components = connected_components(graph, directed=False)
+
+    core_points = numpy.flatnonzero(core)
+    _, core_components = numpy.unique(components[core_points], return_inverse=True)
+
+    # border points that are owned by the partition and components of their core neighbors
+    owned = (local_indexes >= begin - outer_begin) & (local_indexes < end - outer_begin)
+    borders = owned[rows] & ~core[rows] & core[columns]
+    border_links = numpy.unique(numpy.stack((rows[borders], components[columns[borders]])), axis=1)
+
+    component_map = numpy.full(amount_points, -1, dtype=numpy.int64)
+    component_map[components[core_points]] = core_components
+
+    return (core[begin - outer_begin:end - outer_begin], core_points + outer_begin, core_components.astype(numpy.int64),
+            border_links[0] + outer_begin, component_map[border_links[1]])
+
+
+class partitioned_dbscan:
+    """!
+    @brief Class represents DBSCAN algorithm that splits data space into slabs and processes them by pool of processes.
+    @details Points are sorted by coordinate with the biggest range and split into slabs with equal amount of points.
+              Each slab is processed with two halos whose width is connectivity radius: core points are found for the
+              slab and the first halo, and connected components of core points are found by KD-tree pair search. Core
+              points of halos are shared by neighbor slabs, therefore components that share them are merged by search of
+              connected components of the graph of local components.
+
+              Clusters are ordered by their smallest core point and border point belongs to the first cluster that
+              reaches it, therefore clusters and noise are the same as in case of DBSCAN (pyclustering.cluster.dbscan),
+              points of each cluster are sorted by index. Dataset is placed to shared memory once and worker processes
+              use it without copying.
+
+    Example:
+    @code
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+
+        # split data space into 8 slabs that are processed by 4 processes
+        dbscan_instance = partitioned_dbscan(sample, 0.5, 3, partitions=8, pool_size=4)
+        dbscan_instance.process()
+
+        clusters = dbscan_instance.get_clusters()
+        noise = dbscan_instance.get_noise()
+    @endcode
+
+    @see dbscan
+
+    """
+
+    def __init__(self, data, eps, neighbors, **kwargs):
+        """!
+        @brief Constructor of partitioned DBSCAN algorithm.
+
+        @param[in] data (array_like): Input data that is presented as array of points (objects), each point should be represented by array_like data structure.
+        @param[in] eps (double): Connectivity radius between points, points may be connected if distance between them less or equal to the radius.
+        @param[in] neighbors (uint): Minimum number of neighbors that is required for point to be a core point.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'partitions', 'pool_size').
+
+        <b>Keyword Args:</b><br>
+            - partitions (uint): Amount of slabs of data space (by default: 'pool_size').
+            - pool_size (uint): Amount of processes that process slabs (by default: amount of CPUs).
+
+        """
+
+        self.__pointer_data = data
+        self.__eps = eps
+        self.__neighbors = neighbors
+
+        self.__pool_size = kwargs.get('pool_size', None) or os.cpu_count() or 1
+        self.__partitions = kwargs.get('partitions', None) or self.__pool_size
+
+        self.__clusters = []
+        self.__noise = []
+
+        self.__verify_arguments()
+
+
+    def process(self):
+        """!
+        @brief Performs cluster analysis in line with rules of DBSCAN algorithm.
+
+        @return (partitioned_dbscan) Returns itself (partitioned DBSCAN instance).
+
+        @see get_clusters()
+        @see get_noise()
+
+        """
+
+        if len(self.__pointer_data) == 0:
+            self.__clusters, self.__noise = [], []
+            return self
+
+        data = numpy.asarray(self.__pointer_data, dtype=numpy.float64).reshape(len(self.__pointer_data), -1)
+
+        axis = int(numpy.argmax(numpy.ptp(data, axis=0)))
+        order = numpy.argsort(data[:, axis], kind='stable')
+        data = numpy.ascontiguousarray(data[order])
+
+        partitions = min(self.__partitions, len(data))
+        bounds = numpy.linspace(0, len(data), partitions + 1).astype(numpy.int64)
+        tasks = [(int(bounds[index]), int(bounds[index + 1]), axis) for index in range(partitions)]
+
+        if (self.__pool_size == 1) or (partitions == 1):
+            results = [_process_partition(data, begin, end, axis, self.__eps, self.__neighbors) for begin, end, axis in tasks]
+        else:
+            results = self.__process_in_pool(data, tasks)
+
+        self.__merge_partitions(results, order)
+        return self
+
+
+    def get_clusters(self):
+        """!
+        @brief Returns allocated clusters.
+
+        @remark Allocated clusters can be returned only after data processing (use method process()). Otherwise empty list is returned.
+
+        @return (list) List of allocated clusters, each cluster contains sorted indexes of objects in list of data.
+
+        @see process()
+        @see get_noise()
+
+        """
+
+        return self.__clusters
+
+
+    def get_noise(self):
+        """!
+        @brief Returns allocated noise.
+
+        @remark Allocated noise can be returned only after data processing (use method process() before). Otherwise empty list is returned.
+
+        @return (list) List of indexes that are marked as a noise.
+
+        @see process()
+        @see get_clusters()
+
+        """
+
+        return self.__noise
+
+
+    def get_cluster_encoding(self):
+        """!
+        @brief Returns clustering result representation type that indicate how clusters are encoded.
+
+        @return (type_encoding) Clustering result representation.
+
+        @see get_clusters()
+
+        """
+
+        return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
+
+
+    def __process_in_pool(self, data, tasks):
+        """!
+        @brief Processes partitions in pool of processes, dataset is shared using shared memory.
+
+        @param[in] data (numpy.array): Points sorted by the split coordinate.
+        @param[in] tasks (list): Ranges of partitions and split coordinate.
+
+        @return (list) Results of partitions.
+
+        """
+
+        with shared_dataset(data) as dataset, dataset.create_executor(min(self.__pool_size, len(tasks))) as executor:
+            futures = [executor.submit(_process_partition_in_worker, begin, end, axis, self.__eps, self.__neighbors)
+                       for begin, end, axis in tasks]
+
+            return [future.result() for future in futures]
+
+
+    def __merge_partitions(self, results, order):
+        """!
+        @brief Merges local components of partitions that share core points and allocates clusters and noise.
+
+        @param[in] results (list): Results of partitions.
+        @param[in] order (numpy.array): Original indexes of sorted points.
+
+        """
+
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+
+        amount_points = len(order)
+        core = numpy.concatenate([result[0] for result in results])
+
+        # each local component of each partition is a node of the graph
+        offsets = numpy.cumsum([0] + [(numpy.max(result[2]) + 1) if len(result[2]) > 0 else 0 for result in results])
+        core_points = numpy.concatenate([result[1] for result in results])
+        core_nodes = numpy.concatenate([result[2] + offsets[index] for index, result in enumerate(results)])
+
+        # nodes that contain the same core point are linked
+        sorting = numpy.argsort(core_points, kind='stable')
+        core_points, core_nodes = core_points[sorting], core_nodes[sorting]
+        shared = core_points[1:] == core_points[:-1]
+
+        amount_nodes = int(offsets[-1])
+        graph = coo_matrix((numpy.ones(numpy.count_nonzero(shared), dtype=numpy.int8),
+                            (core_nodes[1:][shared], core_nodes[:-1][shared])), shape=(amount_nodes, amount_nodes))
+        _, node_components = connected_components(graph, directed=False)
+
+        # clusters are ordered by their smallest core point like in case of DBSCAN
+        point_components = numpy.full(amount_points, -1, dtype=numpy.int64)
+        point_components[core_points] = node_components[core_nodes]
+
+        first_points = numpy.full(node_components.max() + 1 if amount_nodes > 0 else 0, amount_points, dtype=numpy.int64)
+        numpy.minimum.at(first_points, point_components[core], order[core])
+        ranks = numpy.empty(len(first_points), dtype=numpy.int64)
+        ranks[numpy.argsort(first_points, kind='stable')] = numpy.arange(len(first_points))
+
+        labels = numpy.full(amount_points, len(first_points), dtype=numpy.int64)
+        labels[core] = ranks[point_components[core]]
+
+        # border point belongs to the first cluster that reaches it
+        border_points = numpy.concatenate([result[3] for result in results])
+        border_nodes = numpy.concatenate([result[4] + offsets[index] for index, result in enumerate(results)])
+        numpy.minimum.at(labels, border_points, ranks[node_components[border_nodes]])
+
+        original_labels = numpy.empty(amount_points, dtype=numpy.int64)
+        original_labels[order] = labels
+
+        indexes = numpy.argsort(original_labels, kind='stable')
+        bounds = numpy.searchsorted(original_labels[indexes], numpy.arange(len(first_points) + 1))
+
+        self.__clusters = [indexes[bounds[index]:bounds[index + 1]].tolist() for index in range(len(first_points))]
+        self.__noise = indexes[bounds[-1]:].tolist()
+
+
+    def __verify_arguments(self):
+        """!
+        @brief Verify input parameters for the algorithm and throw exception in case of incorrectness.
+
+        """
+
+        if self.__eps < 0:
+            raise ValueError("Connectivity radius should be non-negative (current value: '%s')." % str(self.__eps))
+
+        if self.__pool_size <= 0:
+            raise ValueError("Pool size should be greater than 0 (current value: '%d')." % self.__pool_size)
+
+        if self.__partitions <= 0:
+            raise ValueError("Amount of partitions should be greater than 0 (current value: '%d')." % self.__partitions)
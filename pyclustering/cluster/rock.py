@@ -25,6 +25,8 @@
 """
 
 
+import numpy;
+
 from pyclustering.cluster.encoder import type_encoding;
 
 from pyclustering.utils import euclidean_distance;
@@ -57,7 +59,7 @@ class rock:
        
     """
     
-    def __init__(self, data, eps, number_clusters, threshold = 0.5, ccore = True):
+    def __init__(self, data, eps, number_clusters, threshold = 0.5, ccore = True, **kwargs):
         """!
         @brief Constructor of clustering algorithm ROCK.
         
@@ -65,18 +67,25 @@ class rock:
         @param[in] eps (double): Connectivity radius (similarity threshold), points are neighbors if distance between them is less than connectivity radius.
         @param[in] number_clusters (uint): Defines number of clusters that should be allocated from the input data set.
         @param[in] threshold (double): Value that defines degree of normalization that influences on choice of clusters for merging during processing.
-        @param[in] ccore (bool): Defines should be CCORE (C++ pyclustering library) used instead of Python code or not.
+        @param[in] ccore (bool): Defines should be CCORE (C++ pyclustering library) used instead of Python code or not, it is not used in case of neighbor graph.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'data_type').
+
+        <b>Keyword Args:</b><br>
+            - data_type (string): Data type of input sample 'data' that is processed by the algorithm ('points', 'neighbor_graph').
+               In case of 'neighbor_graph' data is neighbor graph (container.neighbor_graph) whose maximum radius is greater
+               or equal to 'eps', links between points are obtained by truncation of its rows.
         
         """
         
         self.__pointer_data = data;
+        self.__data_type = kwargs.get('data_type', 'points');
         self.__eps = eps;
         self.__number_clusters = number_clusters;
         self.__threshold = threshold;
         
         self.__clusters = None;
         
-        self.__ccore = ccore;
+        self.__ccore = ccore and (self.__data_type != 'neighbor_graph');
         if (self.__ccore):
             self.__ccore = ccore_library.workable();
         
@@ -195,6 +204,13 @@ class rock:
         
         size_data = len(self.__pointer_data);
         
+        if (self.__data_type == 'neighbor_graph'):
+            self.__create_adjacency_matrix_graph(size_data);
+            return;
+        
+        elif (self.__data_type != 'points'):
+            raise TypeError("Unknown type of data is specified '%s'" % self.__data_type);
+        
         self.__adjacency_matrix = [ [ 0 for i in range(size_data) ] for j in range(size_data) ];
         for i in range(0, size_data):
             for j in range(i + 1, size_data):
@@ -202,9 +218,25 @@ class rock:
                 if (distance <= self.__eps):
                     self.__adjacency_matrix[i][j] = 1;
                     self.__adjacency_matrix[j][i] = 1;
+    
+    
+    def __create_adjacency_matrix_graph(self, size_data):
+        """!
+        @brief Creates 2D adjacency matrix (list of lists) using rows of neighbor graph that are truncated by connectivity radius.
         
+        @param[in] size_data (uint): Amount of points in the neighbor graph.
+        
+        """
+        
+        indptr, indices, _ = self.__pointer_data.csr(self.__eps);
+        
+        adjacency_matrix = numpy.zeros((size_data, size_data), dtype=numpy.int64);
+        adjacency_matrix[numpy.repeat(numpy.arange(size_data), numpy.diff(indptr)), indices] = 1;
+        
+        self.__adjacency_matrix = adjacency_matrix.tolist();
     
 
+
     def __calculate_goodness(self, cluster1, cluster2):
         """!
         @brief Calculates coefficient 'goodness measurement' between two clusters. The coefficient defines level of suitability of clusters for merging.
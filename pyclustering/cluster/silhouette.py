@@ -34,7 +34,10 @@ from pyclustering.cluster.kmedians import kmedians
 from pyclustering.cluster.kmedoids import kmedoids
 from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
 
+from pyclustering.core.wrapper import ccore_library
+
 from pyclustering.utils.metric import distance_metric, type_metric
+from pyclustering.utils.blockwise_distance import blockwise_distance
 
 
 class silhouette:
@@ -319,11 +322,15 @@ class silhouette_ksearch:
         @param[in] kmin (uint): Amount of clusters from which search is performed. Should be equal or greater than 2.
         @param[in] kmax (uint): Amount of clusters to which search is performed. Should be equal or less than amount of
                     points in input data.
-        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'algorithm').
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'algorithm', 'ccore', 'memory_limit').
 
         <b>Keyword Args:</b><br>
             - algorithm (silhouette_ksearch_type): Defines algorithm that is used for searching optimal number of
                clusters (by default K-Means).
+            - ccore (bool): If True then CCORE (C++ implementation of pyclustering library) is used by the algorithm
+               (by default True).
+            - memory_limit (uint): Amount of memory in bytes that is used by Python implementation of the algorithm
+               for one tile of distance matrix (by default: blockwise_distance.DEFAULT_MEMORY_LIMIT).
 
         """
         self.__data = data
@@ -332,6 +339,11 @@ class silhouette_ksearch:
 
         self.__algorithm = kwargs.get('algorithm', silhouette_ksearch_type.KMEANS)
         self.__return_index = self.__algorithm == silhouette_ksearch_type.KMEDOIDS
+        self.__ccore = kwargs.get('ccore', True)
+        if self.__ccore:
+            self.__ccore = ccore_library.workable()
+
+        self.__memory_limit = kwargs.get('memory_limit', blockwise_distance.DEFAULT_MEMORY_LIMIT)
 
         self.__amount = -1
         self.__score = float('-Inf')
@@ -351,8 +363,12 @@ class silhouette_ksearch:
         """
         self.__scores = {}
 
+        distance_calculator = None
+        if not self.__ccore and not self.__return_index:
+            distance_calculator = blockwise_distance(self.__data, self.__memory_limit)
+
         for k in range(self.__kmin, self.__kmax):
-            clusters = self.__calculate_clusters(k)
+            clusters = self.__calculate_clusters(k, distance_calculator)
             if len(clusters) != k:
                 self.__scores[k] = float('nan')
                 continue
@@ -404,18 +420,26 @@ class silhouette_ksearch:
         return self.__scores
 
 
-    def __calculate_clusters(self, k):
+    def __calculate_clusters(self, k, distance_calculator):
         """!
         @brief Performs cluster analysis using specified K value.
 
         @param[in] k (uint): Amount of clusters that should be allocated.
+        @param[in] distance_calculator (blockwise_distance): Distance calculator that is shared between K values by
+                    Python implementation of K-Means and K-Medians, otherwise None.
 
         @return (array_like) Allocated clusters.
 
         """
         initial_values = kmeans_plusplus_initializer(self.__data, k).initialize(return_index=self.__return_index)
         algorithm_type = self.__algorithm.get_type()
-        return algorithm_type(self.__data, initial_values).process().get_clusters()
+
+        if distance_calculator is not None:
+            instance = algorithm_type(self.__data, initial_values, ccore=False, distance_calculator=distance_calculator)
+        else:
+            instance = algorithm_type(self.__data, initial_values, ccore=self.__ccore, memory_limit=self.__memory_limit)
+
+        return instance.process().get_clusters()
 
 
     def __verify_arguments(self):
@@ -25,14 +25,11 @@
 """
 
 import math
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot', ['mpl_toolkits.mplot3d'])
+animation = lazy_module('matplotlib.animation')
 
 from pyclustering.cluster.encoder import type_encoding
 from pyclustering.cluster import cluster_visualizer
@@ -44,6 +41,8 @@ from pyclustering.core.wrapper import ccore_library
 from pyclustering.nnet.sync import sync_dynamic, sync_network, sync_visualizer
 from pyclustering.nnet import conn_represent, initial_type, conn_type, solve_type
 
+from pyclustering.container.kdtree import kdtree_balanced
+
 from pyclustering.utils import euclidean_distance
 
 
@@ -247,8 +246,17 @@ class syncnet(sync_network):
         
         """
         
-        if (self._ena_conn_weight is True):
-            self._conn_weight = [[0] * self._num_osc for _ in range(0, self._num_osc, 1)];
+        if (self._ena_conn_weight is not True):
+            # only neighbors in the radius are required, they are found by KD-tree instead of checking all pairs
+            indptr, indices, _ = kdtree_balanced(self._osc_loc).query_radius(self._osc_loc, radius);
+            for i in range(0, self._num_osc, 1):
+                for j in indices[indptr[i]:indptr[i + 1]].tolist():
+                    if (j > i):
+                        self.set_connection(i, j);
+            
+            return;
+        
+        self._conn_weight = [[0] * self._num_osc for _ in range(0, self._num_osc, 1)];
         
         maximum_distance = 0;
         minimum_distance = float('inf');
@@ -0,0 +1,83 @@
+"""!
+
+@brief Test templates for CLARA clustering module.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.cluster.clara import clara
+
+from pyclustering.utils import read_sample
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class ClaraTestTemplates:
+    @staticmethod
+    def templateClusterAllocation(path_to_file, amount_clusters, samples, expected_cluster_length, **kwargs):
+        sample = read_sample(path_to_file)
+
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        sample_size = kwargs.get('sample_size', 40 + 2 * amount_clusters)
+        pool_size = kwargs.get('pool_size', 2)
+
+        clara_instance = clara(sample, amount_clusters, samples, sample_size=sample_size, metric=metric,
+                               random_state=1000, pool_size=pool_size)
+        clara_instance.process()
+
+        clusters = clara_instance.get_clusters()
+        medoids = clara_instance.get_medoids()
+
+        assertion.eq(amount_clusters, len(clusters))
+        assertion.eq(amount_clusters, len(set(medoids)))
+        assertion.eq(medoids, [cluster[0] for cluster in clusters])
+        assertion.eq(list(range(len(sample))), sorted([index for cluster in clusters for index in cluster]))
+
+        if expected_cluster_length is not None:
+            assertion.eq(sorted(expected_cluster_length), sorted([len(cluster) for cluster in clusters]))
+
+        # the best medoids are kept and total deviation is calculated using the full dataset
+        samples_deviation = clara_instance.get_samples_deviation()
+        assertion.eq(samples, len(samples_deviation))
+        assertion.eq(min(samples_deviation), clara_instance.get_total_deviation())
+        assertion.eq(samples_deviation[clara_instance.get_best_sample()], clara_instance.get_total_deviation())
+
+        deviation = sum([metric(sample[index], sample[cluster[0]]) for cluster in clusters for index in cluster])
+        assertion.true(numpy.isclose(deviation, clara_instance.get_total_deviation()))
+
+
+    @staticmethod
+    def templateReproducibility(path_to_file, amount_clusters, samples):
+        sample = read_sample(path_to_file)
+
+        results = []
+        for pool_size in [1, 2, 1]:
+            clara_instance = clara(sample, amount_clusters, samples, random_state=1000, pool_size=pool_size)
+            clara_instance.process()
+
+            results.append((clara_instance.get_samples_deviation(), clara_instance.get_clusters()))
+
+        assertion.eq(results[0], results[1])
+        assertion.eq(results[0], results[2])
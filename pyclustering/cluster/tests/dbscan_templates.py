@@ -24,11 +24,13 @@
 """
 
 
-from random import random, shuffle
+from random import random, shuffle, Random
 
 from pyclustering.utils import read_sample, calculate_distance_matrix
 from pyclustering.cluster.dbscan import dbscan
 
+from pyclustering.container.neighbor_graph import neighbor_graph
+
 from pyclustering.tests.assertion import assertion
 
 from pyclustering.samples import answer_reader
@@ -178,4 +180,88 @@ class DbscanTestTemplates:
 
         assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]) + len(noise))
         assertion.eq(sum(expected_length_clusters), sum([len(cluster) for cluster in clusters]))
-        assertion.eq(expected_length_clusters, sorted([len(cluster) for cluster in clusters]))
\ No newline at end of file
+        assertion.eq(expected_length_clusters, sorted([len(cluster) for cluster in clusters]))
+
+
+    @staticmethod
+    def templateClusteringTheSameAsReference(seed, amount_points, dimension, radius, neighbors, data_type):
+        generator = Random(seed)
+
+        # coordinates are rounded to obtain points on the border of the connectivity radius
+        sample = [[round(generator.random() * 3.0, 1) for _ in range(dimension)] for _ in range(amount_points)]
+        distance_matrix = calculate_distance_matrix(sample)
+        input_data = distance_matrix if data_type == 'distance_matrix' else sample
+
+        dbscan_instance = dbscan(input_data, radius, neighbors, False, data_type=data_type)
+        dbscan_instance.process()
+
+        # reference expansion point by point: border point belongs to the first cluster that reaches it
+        def region(index_point):
+            return [index for index in range(amount_points) if (index != index_point) and
+                    (distance_matrix[index_point][index] ** 2 <= radius ** 2)]
+
+        visited, belong = [False] * amount_points, [False] * amount_points
+        expected_clusters = []
+        for index_point in range(amount_points):
+            if visited[index_point] is False:
+                visited[index_point] = True
+                seeds = region(index_point)
+                if len(seeds) >= neighbors:
+                    cluster, belong[index_point] = [index_point], True
+                    for index_neighbor in seeds:
+                        if visited[index_neighbor] is False:
+                            visited[index_neighbor] = True
+                            next_seeds = region(index_neighbor)
+                            if len(next_seeds) >= neighbors:
+                                seeds += [index for index in next_seeds if (index not in seeds) and (index != index_point)]
+
+                        if belong[index_neighbor] is False:
+                            cluster.append(index_neighbor)
+                            belong[index_neighbor] = True
+
+                    expected_clusters.append(sorted(cluster))
+
+        expected_noise = [index for index in range(amount_points) if belong[index] is False]
+
+        assertion.eq(expected_clusters, [sorted(cluster) for cluster in dbscan_instance.get_clusters()])
+        assertion.eq(expected_noise, dbscan_instance.get_noise())
+
+
+    @staticmethod
+    def templateClusteringNeighborGraph(path, radiuses, neighbors, data_type):
+        sample = read_sample(path)
+        input_data = calculate_distance_matrix(sample) if data_type == 'distance_matrix' else sample
+
+        # graph is built once for the maximum radius and it is used for each radius
+        graph = neighbor_graph.create(input_data, max(radiuses), data_type)
+        for radius in radiuses:
+            expected_instance = dbscan(input_data, radius, neighbors, False, data_type=data_type)
+            expected_instance.process()
+
+            dbscan_instance = dbscan(graph, radius, neighbors, True, data_type='neighbor_graph')
+            dbscan_instance.process()
+
+            if data_type == 'distance_matrix':
+                assertion.eq(expected_instance.get_clusters(), dbscan_instance.get_clusters())
+            else:
+                # neighbors are ordered by indexes in case of graph and in order of kd-tree search in case of points
+                assertion.eq([sorted(cluster) for cluster in expected_instance.get_clusters()],
+                             [sorted(cluster) for cluster in dbscan_instance.get_clusters()])
+
+            assertion.eq(expected_instance.get_noise(), dbscan_instance.get_noise())
+
+
+    @staticmethod
+    def templateClusteringMetric(path, radius, neighbors, metric, ccore):
+        sample = read_sample(path)
+        matrix = [[metric(point1, point2) for point2 in sample] for point1 in sample]
+
+        expected_instance = dbscan(matrix, radius, neighbors, False, data_type='distance_matrix')
+        expected_instance.process()
+
+        dbscan_instance = dbscan(sample, radius, neighbors, ccore, metric=metric)
+        dbscan_instance.process()
+
+        assertion.eq(sorted(sorted(cluster) for cluster in expected_instance.get_clusters()),
+                     sorted(sorted(cluster) for cluster in dbscan_instance.get_clusters()))
+        assertion.eq(sorted(expected_instance.get_noise()), sorted(dbscan_instance.get_noise()))
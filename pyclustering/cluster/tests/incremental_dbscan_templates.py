@@ -0,0 +1,101 @@
+"""!
+
+@brief Test templates for Incremental DBSCAN algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+from random import Random
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.cluster.dbscan import dbscan
+from pyclustering.cluster.incremental_dbscan import incremental_dbscan
+
+from pyclustering.utils import read_sample, euclidean_distance_square
+
+
+class IncrementalDbscanTestTemplates:
+    @staticmethod
+    def templateClusteringResults(path, radius, neighbors, expected_length_clusters, **kwargs):
+        sample = read_sample(path)
+
+        numpy_usage = kwargs.get('numpy_usage', False)
+        if numpy_usage is True:
+            sample = numpy.array(sample)
+
+        dbscan_instance = incremental_dbscan(radius, neighbors, sample)
+
+        clusters = dbscan_instance.get_clusters()
+        noise = dbscan_instance.get_noise()
+
+        assertion.eq(len(sample), len(dbscan_instance))
+        assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]) + len(noise))
+        assertion.eq(expected_length_clusters, sorted([len(cluster) for cluster in clusters]))
+
+
+    @staticmethod
+    def templateTheSameAsDbscan(seed, steps, dimension, radius, neighbors, remove_probability):
+        generator = Random(seed)
+
+        dbscan_instance = incremental_dbscan(radius, neighbors)
+        points = {}
+
+        for _ in range(steps):
+            if (len(points) > 0) and (generator.random() < remove_probability):
+                index_point = generator.choice(sorted(points))
+                dbscan_instance.remove(index_point)
+                points.pop(index_point)
+            else:
+                # coordinates are rounded to obtain points on the border of the connectivity radius and duplicates
+                point = [round(generator.random() * 2.0, 1) for _ in range(dimension)]
+                points[dbscan_instance.insert(point)] = point
+
+            IncrementalDbscanTestTemplates.assertTheSameAsDbscan(dbscan_instance, points, radius, neighbors)
+
+
+    @staticmethod
+    def assertTheSameAsDbscan(dbscan_instance, points, radius, neighbors):
+        indexes = sorted(points)
+
+        reference = dbscan([points[index] for index in indexes], radius, neighbors, False)
+        reference.process()
+
+        adjacency = {index: [other for other in indexes if (other != index) and
+                             (euclidean_distance_square(points[index], points[other]) <= radius ** 2)] for index in indexes}
+        cores = set(index for index in indexes if len(adjacency[index]) >= neighbors)
+
+        expected_clusters = [set(indexes[position] for position in cluster) for cluster in reference.get_clusters()]
+        clusters = [set(cluster) for cluster in dbscan_instance.get_clusters()]
+
+        # core points and noise are defined uniquely, border point should be a neighbor of a core point of its cluster
+        assertion.eq(sorted(indexes[position] for position in reference.get_noise()), dbscan_instance.get_noise())
+        assertion.eq(sorted(sorted(cluster & cores) for cluster in expected_clusters),
+                     sorted(sorted(cluster & cores) for cluster in clusters))
+
+        for cluster in clusters:
+            for index_border in cluster - cores:
+                assertion.true(any((index in cluster) for index in adjacency[index_border] if index in cores))
+
+        assertion.eq(len(indexes), sum([len(cluster) for cluster in clusters]) + len(dbscan_instance.get_noise()))
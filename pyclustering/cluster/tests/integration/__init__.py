@@ -39,6 +39,7 @@ from pyclustering.cluster.tests.integration               import it_dbscan
 from pyclustering.cluster.tests.integration               import it_elbow         as cluster_elbow_integration_tests
 from pyclustering.cluster.tests.integration               import it_hsyncnet      as cluster_hsyncnet_integration_tests
 from pyclustering.cluster.tests.integration               import it_kmeans        as cluster_kmeans_integration_tests
+from pyclustering.cluster.tests.integration               import it_kmeans_restarts as cluster_kmeans_restarts_integration_tests
 from pyclustering.cluster.tests.integration               import it_kmedians      as cluster_kmedians_integration_tests
 from pyclustering.cluster.tests.integration               import it_kmedoids      as cluster_kmedoids_integration_tests
 from pyclustering.cluster.tests.integration               import it_mbsas         as cluster_mbsas_integration_tests
@@ -65,6 +66,7 @@ class clustering_integration_tests(suite_holder):
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_elbow_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_hsyncnet_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmeans_integration_tests))
+        integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmeans_restarts_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmedians_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmedoids_integration_tests))
         integration_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_mbsas_integration_tests))
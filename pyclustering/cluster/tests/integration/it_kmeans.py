@@ -29,17 +29,25 @@ import unittest
 import matplotlib
 matplotlib.use('Agg')
 
+import numpy
+
 from pyclustering.cluster.tests.kmeans_templates import KmeansTestTemplates
 from pyclustering.cluster.kmeans import kmeans
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES
 
 from pyclustering.core.tests import remove_library
+from pyclustering.core.pyclustering_package import package_extractor
+
+from pyclustering.utils import read_sample
 
 from pyclustering.utils.metric import distance_metric, type_metric
 
 
 class KmeansIntegrationTest(unittest.TestCase):
+    def testCcoreDatasetSampleSimple1ByCore(self):
+        KmeansTestTemplates.templateCcoreDataset(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], True)
+
     def testClusterAllocationSampleSimple1ByCore(self):
         KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], True)
 
@@ -181,6 +189,28 @@ class KmeansIntegrationTest(unittest.TestCase):
         KmeansTestTemplates.templateAnimateClusteringResultNoFailure(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, [[1.0, 0.6, 0.8], [4.1, 4.2, 4.3]], True)
 
 
+    def testNumpyOutputEqualSizeClustersByCore(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1)
+
+        package_extractor.set_numpy_output(True)
+        try:
+            kmeans_instance = kmeans(sample, [[3.7, 5.5], [6.7, 7.5]], ccore=True).process()
+        finally:
+            package_extractor.set_numpy_output(False)
+
+        clusters = kmeans_instance.get_clusters()
+        centers = kmeans_instance.get_centers()
+
+        self.assertIsInstance(clusters, list)
+        self.assertEqual([5, 5], [len(cluster) for cluster in clusters])
+        for cluster in clusters:
+            self.assertIsInstance(cluster, numpy.ndarray)
+            self.assertEqual(1, cluster.ndim)
+
+        self.assertEqual(list(range(len(sample))), sorted(numpy.concatenate(clusters).tolist()))
+        self.assertEqual((2, 2), numpy.shape(centers))
+
+
 
     @remove_library
     def testProcessingWhenLibraryCoreCorrupted(self):
@@ -0,0 +1,67 @@
+"""!
+
+@brief Integration-tests for multi-restart K-Means algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.tests.kmeans_restarts_templates import KmeansRestartsTestTemplates
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.core.tests import remove_library
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class KmeansRestartsIntegrationTest(unittest.TestCase):
+    def testBestRestartSampleSimple1ByCore(self):
+        KmeansRestartsTestTemplates.templateBestRestart(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 5, True)
+
+    def testBestRestartSampleSimple3ByCore(self):
+        KmeansRestartsTestTemplates.templateBestRestart(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 10, True)
+
+    def testBestRestartSampleSimple3ManhattanByCore(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmeansRestartsTestTemplates.templateBestRestart(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 10, True, metric=metric)
+
+    def testBestRestartSampleLsunByCore(self):
+        KmeansRestartsTestTemplates.templateBestRestart(FCPS_SAMPLES.SAMPLE_LSUN, 3, 6, True)
+
+    def testReproducibilitySampleSimple3ByCore(self):
+        KmeansRestartsTestTemplates.templateReproducibility(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 6, True)
+
+    def testCcoreDatasetSampleSimple3ByCore(self):
+        KmeansRestartsTestTemplates.templateCcoreDataset(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 4, True)
+
+    @remove_library
+    def testProcessingWhenLibraryCoreCorrupted(self):
+        KmeansRestartsTestTemplates.templateBestRestart(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 4, True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -105,5 +105,12 @@ class OpticsIntegrationTest(unittest.TestCase):
         OpticsTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 0.4, 2, None, [5, 5], True)
 
 
+    def testOrderingExtractionSampleSimple3ByCore(self):
+        OpticsTestTemplates.templateOrderingExtraction(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, None, True)
+
+    def testOrderingExtractionLsunAmountClustersByCore(self):
+        OpticsTestTemplates.templateOrderingExtraction(FCPS_SAMPLES.SAMPLE_LSUN, 1.0, 3, 3, True)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""!
+
+@brief Test templates for multi-restart K-Means clustering module.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.cluster.kmeans import kmeans
+from pyclustering.cluster.kmeans_restarts import kmeans_restarts
+
+from pyclustering.core.pyclustering_package import ccore_dataset
+
+from pyclustering.utils import read_sample
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class KmeansRestartsTestTemplates:
+    @staticmethod
+    def templateBestRestart(path_to_file, amount_clusters, restarts, ccore, **kwargs):
+        sample = read_sample(path_to_file)
+
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        pool_size = kwargs.get('pool_size', 2)
+
+        restarts_instance = kmeans_restarts(sample, amount_clusters, restarts, ccore, metric=metric, random_state=1000,
+                                            pool_size=pool_size)
+        restarts_instance.process()
+
+        restarts_wce = restarts_instance.get_restarts_wce()
+        assertion.eq(restarts, len(restarts_wce))
+        assertion.eq(min(restarts_wce), restarts_instance.get_total_wce())
+        assertion.eq(restarts_wce[restarts_instance.get_best_restart()], restarts_instance.get_total_wce())
+
+        clusters = restarts_instance.get_clusters()
+        assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]))
+        assertion.eq(len(clusters), len(restarts_instance.get_centers()))
+        assertion.eq(amount_clusters, len(restarts_instance.get_initial_centers()))
+
+        # the best result is reproduced by K-Means from initial centers of the best restart
+        kmeans_instance = kmeans(sample, restarts_instance.get_initial_centers(), ccore=ccore, metric=metric)
+        kmeans_instance.process()
+
+        assertion.eq(kmeans_instance.get_clusters(), clusters)
+
+
+    @staticmethod
+    def templateReproducibility(path_to_file, amount_clusters, restarts, ccore):
+        sample = read_sample(path_to_file)
+
+        results = []
+        for pool_size in [1, 2, 1]:
+            restarts_instance = kmeans_restarts(sample, amount_clusters, restarts, ccore, random_state=1000, pool_size=pool_size)
+            restarts_instance.process()
+
+            results.append((restarts_instance.get_restarts_wce(), restarts_instance.get_clusters()))
+
+        assertion.eq(results[0], results[1])
+        assertion.eq(results[0], results[2])
+
+
+    @staticmethod
+    def templateCcoreDataset(path_to_file, amount_clusters, restarts, ccore):
+        sample = read_sample(path_to_file)
+
+        expected = kmeans_restarts(sample, amount_clusters, restarts, ccore, random_state=1000).process()
+        actual = kmeans_restarts(ccore_dataset(sample), amount_clusters, restarts, ccore, random_state=1000).process()
+
+        assertion.eq(expected.get_restarts_wce(), actual.get_restarts_wce())
+        assertion.eq(expected.get_clusters(), actual.get_clusters())
@@ -24,10 +24,14 @@
 """
 
 
+import numpy
+
 from pyclustering.tests.assertion import assertion
 
 from pyclustering.cluster.encoder import type_encoding, cluster_encoder
-from pyclustering.cluster.kmeans import kmeans, kmeans_observer, kmeans_visualizer
+from pyclustering.cluster.kmeans import kmeans, kmeans_observer, kmeans_visualizer, kmeans_algorithm
+
+from pyclustering.core.pyclustering_package import ccore_dataset
 
 from pyclustering.utils import read_sample
 from pyclustering.utils.metric import distance_metric, type_metric
@@ -61,6 +65,57 @@ class KmeansTestTemplates:
             assertion.eq(obtained_cluster_sizes, expected_cluster_length)
 
 
+    @staticmethod
+    def templateCcoreDataset(path_to_file, start_centers, ccore):
+        sample = read_sample(path_to_file)
+        dataset = ccore_dataset(sample)
+
+        expected_clusters = kmeans(sample, start_centers, 0.025, ccore).process().get_clusters()
+
+        for _ in range(2):
+            kmeans_instance = kmeans(dataset, start_centers, 0.025, ccore).process()
+            assertion.eq(expected_clusters, kmeans_instance.get_clusters())
+            assertion.eq(len(start_centers), len(kmeans_instance.get_centers()))
+
+
+    @staticmethod
+    def templateElkanAlgorithm(data, start_centers, **kwargs):
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+
+        results = []
+        for algorithm in [kmeans_algorithm.LLOYD, kmeans_algorithm.ELKAN]:
+            observer = kmeans_observer()
+            kmeans_instance = kmeans(data, start_centers, 0.001, False, metric=metric, observer=observer, algorithm=algorithm)
+            kmeans_instance.process()
+
+            evolution = [(observer.get_clusters(i), observer.get_centers(i)) for i in range(len(observer))]
+            results.append((kmeans_instance.get_clusters(), kmeans_instance.get_centers(), kmeans_instance.get_total_wce(), evolution))
+
+        assertion.eq(results[0][0], results[1][0])
+        assertion.eq(results[0][1], results[1][1])
+        assertion.eq(results[0][2], results[1][2])
+        assertion.eq(results[0][3], results[1][3])
+
+
+    @staticmethod
+    def templateFilteringAlgorithm(data, start_centers, **kwargs):
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+
+        results = []
+        for algorithm in [kmeans_algorithm.LLOYD, kmeans_algorithm.FILTERING]:
+            observer = kmeans_observer()
+            kmeans_instance = kmeans(data, start_centers, 0.001, False, metric=metric, observer=observer, algorithm=algorithm)
+            kmeans_instance.process()
+
+            evolution = [observer.get_clusters(i) for i in range(len(observer))]
+            results.append((kmeans_instance.get_clusters(), kmeans_instance.get_centers(), kmeans_instance.get_total_wce(), evolution))
+
+        assertion.eq(results[0][0], results[1][0])
+        assertion.true(numpy.allclose(results[0][1], results[1][1], rtol=1e-9, atol=1e-9))
+        assertion.gt(1e-7, abs(results[0][2] - results[1][2]))
+        assertion.eq(results[0][3], results[1][3])
+
+
     @staticmethod
     def templateClusterAllocationOneDimensionData(ccore_flag):
         input_data = [ [random()] for _ in range(10) ] + [ [random() + 3] for _ in range(10) ] + [ [random() + 5] for _ in range(10) ] + [ [random() + 8] for _ in range(10) ];
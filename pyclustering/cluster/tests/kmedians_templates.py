@@ -24,9 +24,14 @@
 """
 
 
+import numpy
+
+from pyclustering.tests.assertion import assertion
+
 from pyclustering.cluster.kmedians import kmedians
 
 from pyclustering.utils import read_sample
+from pyclustering.utils.metric import distance_metric, type_metric
 
 from random import random
 
@@ -95,3 +100,60 @@ class KmediansTestTemplates:
                 allocated_number_objects += 1
              
         assert (number_objects == allocated_number_objects)    # number of allocated objects should be the same.
+
+    @staticmethod
+    def templateExactMedians(path_to_file, start_centers, **kwargs):
+        sample = read_sample(path_to_file)
+        metric = kwargs.get('metric', None)
+
+        kmedians_instance = kmedians(sample, start_centers, 0.001, False, metric=metric)
+        kmedians_instance.process()
+
+        # medians are calculated by definition using sorted coordinates of each cluster
+        for cluster, median in zip(kmedians_instance.get_clusters(), kmedians_instance.get_medians()):
+            for index_dimension in range(len(sample[0])):
+                coordinates = sorted([sample[index_point][index_dimension] for index_point in cluster])
+                expected = (coordinates[(len(cluster) - 1) // 2] + coordinates[len(cluster) // 2]) / 2.0
+                assertion.eq(expected, median[index_dimension])
+
+
+    @staticmethod
+    def templateMetricAsUserDefined(path_to_file, start_centers, metric, function):
+        sample = read_sample(path_to_file)
+
+        kmedians_instance = kmedians(sample, start_centers, 0.001, False, metric=metric)
+        kmedians_instance.process()
+
+        # user-defined metric is calculated point by point, so it is a reference for metrics calculated by tiles
+        user_metric = distance_metric(type_metric.USER_DEFINED, func=function)
+        reference_instance = kmedians(sample, start_centers, 0.001, False, metric=user_metric)
+        reference_instance.process()
+
+        assertion.eq(reference_instance.get_clusters(), kmedians_instance.get_clusters())
+        assertion.true(numpy.allclose(reference_instance.get_medians(), kmedians_instance.get_medians()))
+
+
+    @staticmethod
+    def templateApproximateMedians(path_to_file, start_centers, approximate_threshold, **kwargs):
+        sample = read_sample(path_to_file)
+        memory_limit = kwargs.get('memory_limit', 64 * 1024 * 1024)
+
+        kmedians_instance = kmedians(sample, start_centers, 0.001, False, approximate_threshold=approximate_threshold,
+                                     memory_limit=memory_limit)
+        kmedians_instance.process()
+
+        clusters = kmedians_instance.get_clusters()
+        assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]))
+
+        points = numpy.array(sample)
+        scale = numpy.max(points, axis=0) - numpy.min(points, axis=0)
+
+        for cluster, median in zip(clusters, kmedians_instance.get_medians()):
+            coordinates = numpy.sort(points[cluster], axis=0)
+
+            if len(cluster) > approximate_threshold:
+                expected = coordinates[(len(cluster) - 1) // 2]   # lower median is estimated
+                assertion.true(numpy.all(numpy.abs(expected - median) <= scale * 1e-6))
+            else:
+                expected = (coordinates[(len(cluster) - 1) // 2] + coordinates[len(cluster) // 2]) / 2.0
+                assertion.eq(expected.tolist(), median)
@@ -29,8 +29,8 @@ import numpy
 
 from pyclustering.tests.assertion import assertion
 
-from pyclustering.cluster.kmedoids import kmedoids
-from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+from pyclustering.cluster.kmedoids import kmedoids, kmedoids_algorithm
+from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer, pam_build_initializer
 
 from pyclustering.utils import read_sample, calculate_distance_matrix
 from pyclustering.utils.metric import distance_metric, type_metric
@@ -50,6 +50,7 @@ class KmedoidsTestTemplates:
         data_type = kwargs.get('data_type', 'points')
         input_type = kwargs.get('input_type', 'list')
         initialize_medoids = kwargs.get('initialize_medoids', None)
+        algorithm = kwargs.get('algorithm', kmedoids_algorithm.ALTERNATE)
 
         if metric is None:
             metric = distance_metric(type_metric.EUCLIDEAN_SQUARE)
@@ -70,7 +71,7 @@ class KmedoidsTestTemplates:
             if initialize_medoids is not None:
                 initial_medoids = kmeans_plusplus_initializer(sample, initialize_medoids).initialize(return_index=True)
 
-            kmedoids_instance = kmedoids(input_data, initial_medoids, 0.025, ccore_flag, metric=metric, data_type=data_type)
+            kmedoids_instance = kmedoids(input_data, initial_medoids, 0.025, ccore_flag, metric=metric, data_type=data_type, algorithm=algorithm)
             kmedoids_instance.process()
 
             clusters = kmedoids_instance.get_clusters()
@@ -161,4 +162,64 @@ class KmedoidsTestTemplates:
                 object_mark[index_object] = True
                 allocated_number_objects += 1
             
-        assertion.eq(number_objects, allocated_number_objects)    # number of allocated objects should be the same.
\ No newline at end of file
+        assertion.eq(number_objects, allocated_number_objects)    # number of allocated objects should be the same.
+
+    @staticmethod
+    def templateFastPamSwapOptimum(path_to_file, initial_medoids, **kwargs):
+        sample = read_sample(path_to_file)
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        data_type = kwargs.get('data_type', 'points')
+        memory_limit = kwargs.get('memory_limit', 64 * 1024 * 1024)
+
+        matrix = numpy.array([[metric(point1, point2) for point2 in sample] for point1 in sample])
+        input_data = matrix if data_type == 'distance_matrix' else sample
+
+        kmedoids_instance = kmedoids(input_data, initial_medoids, 0.0, False, metric=metric, data_type=data_type,
+                                     algorithm=kmedoids_algorithm.FASTPAM, memory_limit=memory_limit).process()
+
+        clusters = kmedoids_instance.get_clusters()
+        medoids = kmedoids_instance.get_medoids()
+
+        assertion.eq(len(initial_medoids), len(set(medoids)))
+        assertion.eq(medoids, [cluster[0] for cluster in clusters])
+        assertion.eq(list(range(len(sample))), sorted([index for cluster in clusters for index in cluster]))
+
+        deviation = numpy.sum(numpy.min(matrix[:, medoids], axis=1))
+        assertion.true(numpy.isclose(deviation, sum([numpy.sum(matrix[cluster[0], cluster]) for cluster in clusters])))
+
+        # there is no swap of a medoid with another object that decreases total deviation
+        for index_medoid in range(len(medoids)):
+            for index_object in range(len(sample)):
+                if index_object in medoids:
+                    continue
+
+                swapped_medoids = medoids[:]
+                swapped_medoids[index_medoid] = index_object
+
+                swapped_deviation = numpy.sum(numpy.min(matrix[:, swapped_medoids], axis=1))
+                assertion.le(deviation - 1e-9, swapped_deviation)
+
+
+    @staticmethod
+    def templatePamBuildInitializer(path_to_file, amount_medoids, **kwargs):
+        sample = read_sample(path_to_file)
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        memory_limit = kwargs.get('memory_limit', 64 * 1024 * 1024)
+
+        matrix = numpy.array([[metric(point1, point2) for point2 in sample] for point1 in sample])
+
+        # greedy BUILD phase is calculated directly using distance matrix
+        expected_medoids = [int(numpy.argmin(numpy.sum(matrix, axis=1)))]
+        while len(expected_medoids) < amount_medoids:
+            deviations = numpy.sum(numpy.minimum(numpy.min(matrix[:, expected_medoids], axis=1)[:, None], matrix), axis=0)
+            deviations[expected_medoids] = float('inf')
+            expected_medoids.append(int(numpy.argmin(deviations)))
+
+        medoids = pam_build_initializer(sample, amount_medoids, metric=metric, memory_limit=memory_limit).initialize(return_index=True)
+        assertion.eq(expected_medoids, medoids)
+
+        medoids = pam_build_initializer(matrix, amount_medoids, data_type='distance_matrix', memory_limit=memory_limit).initialize()
+        assertion.eq(expected_medoids, medoids)
+
+        points = pam_build_initializer(sample, amount_medoids, metric=metric).initialize()
+        assertion.eq([sample[index] for index in expected_medoids], points)
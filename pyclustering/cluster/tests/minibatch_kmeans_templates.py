@@ -0,0 +1,124 @@
+"""!
+
+@brief Test templates for Mini-Batch K-Means clustering module.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import os
+import tempfile
+
+import numpy
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.cluster.kmeans import kmeans
+from pyclustering.cluster.minibatch_kmeans import minibatch_kmeans
+
+from pyclustering.utils import read_sample
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class points_stream:
+    """!
+    @brief Iterable object that returns new iterator over blocks of points each time.
+
+    """
+    def __init__(self, data, block_size):
+        self.__data = data
+        self.__block_size = block_size
+
+    def __iter__(self):
+        for index_begin in range(0, len(self.__data), self.__block_size):
+            yield self.__data[index_begin:index_begin + self.__block_size]
+
+
+class MinibatchKmeansTestTemplates:
+    @staticmethod
+    def create_input(sample, input_type, directory):
+        if input_type == 'list':
+            return sample
+        elif input_type == 'numpy':
+            return numpy.array(sample)
+        elif input_type == 'callable':
+            return lambda: iter(sample)
+        elif input_type == 'iterable':
+            return points_stream(sample, 7)
+        elif input_type == 'memmap':
+            filename = os.path.join(directory, 'sample.npy')
+            numpy.save(filename, numpy.array(sample))
+            return numpy.load(filename, mmap_mode='r')
+
+        raise ValueError("Unknown input type '%s'." % input_type)
+
+
+    @staticmethod
+    def templateLengthProcessData(path_to_file, start_centers, expected_cluster_length, input_type, **kwargs):
+        sample = read_sample(path_to_file)
+
+        metric = kwargs.get('metric', distance_metric(type_metric.EUCLIDEAN_SQUARE))
+        batch_size = kwargs.get('batch_size', 10)
+
+        with tempfile.TemporaryDirectory() as directory:
+            data = MinibatchKmeansTestTemplates.create_input(sample, input_type, directory)
+            minibatch_instance = minibatch_kmeans(data, start_centers, 0.001, batch_size, metric=metric, random_state=1000)
+            minibatch_instance.process()
+
+        clusters = minibatch_instance.get_clusters()
+        centers = minibatch_instance.get_centers()
+
+        obtained_cluster_sizes = [len(cluster) for cluster in clusters]
+        assertion.eq(len(sample), sum(obtained_cluster_sizes))
+        assertion.eq(list(range(len(sample))), sorted([index for cluster in clusters for index in cluster]))
+
+        assertion.eq(len(clusters), len(centers))
+        for center in centers:
+            assertion.eq(len(sample[0]), len(center))
+
+        expected_wce = 0.0
+        for index_cluster in range(len(clusters)):
+            for index_point in clusters[index_cluster]:
+                point, center = numpy.array(sample[index_point]), numpy.array(centers[index_cluster])
+                expected_wce += metric(point, center)
+
+        assertion.gt(0.0000001, abs(expected_wce - minibatch_instance.get_total_wce()))
+
+        if expected_cluster_length is not None:
+            obtained_cluster_sizes.sort()
+            expected_cluster_length.sort()
+            assertion.eq(obtained_cluster_sizes, expected_cluster_length)
+
+
+    @staticmethod
+    def templateTheSameAsKmeans(path_to_file, start_centers, metric):
+        sample = read_sample(path_to_file)
+
+        kmeans_instance = kmeans(sample, start_centers, 0.0, ccore=False, metric=metric).process()
+        expected_centers = kmeans_instance.get_centers()
+
+        # the first batch is the whole stream, so centers of converged K-Means are not changed by Mini-Batch K-Means
+        data = points_stream(sample, len(sample))
+        minibatch_instance = minibatch_kmeans(data, expected_centers, 0.001, len(sample), metric=metric).process()
+
+        assertion.eq(kmeans_instance.get_clusters(), minibatch_instance.get_clusters())
+        assertion.true(numpy.allclose(expected_centers, minibatch_instance.get_centers()))
+        assertion.gt(0.0000001, abs(kmeans_instance.get_total_wce() - minibatch_instance.get_total_wce()))
@@ -24,7 +24,13 @@
 """
 
 
-from pyclustering.cluster.optics import optics, ordering_analyser
+import io
+
+import numpy
+
+from pyclustering.cluster.optics import optics, ordering_analyser, optics_ordering
+
+from pyclustering.container.neighbor_graph import neighbor_graph
 
 from pyclustering.utils import read_sample, calculate_distance_matrix
 
@@ -43,12 +49,20 @@ class OpticsTestTemplates:
         OpticsTestTemplates.templateClusteringResultsSpecificData('distance_matrix', path, radius, neighbors, amount_clusters, expected_length_clusters, ccore)
 
 
+    @staticmethod
+    def templateClusteringResultsNeighborGraph(path, radius, neighbors, amount_clusters, expected_length_clusters, ccore):
+        OpticsTestTemplates.templateClusteringResultsSpecificData('neighbor_graph', path, radius, neighbors, amount_clusters, expected_length_clusters, ccore)
+
+
     @staticmethod
     def templateClusteringResultsSpecificData(data_type, path, radius, neighbors, amount_clusters, expected_length_clusters, ccore):
         sample = read_sample(path)
 
         if data_type == 'distance_matrix':
             input_data = calculate_distance_matrix(sample)
+        elif data_type == 'neighbor_graph':
+            # graph is built for greater radius to check truncation of its rows
+            input_data = neighbor_graph.create(sample, radius * 2.0)
         else:
             input_data = sample
 
@@ -79,4 +93,52 @@ class OpticsTestTemplates:
 
             amount_clusters, borders = analyser.extract_cluster_amount(optics_instance.get_radius())
             assert amount_clusters == len(expected_length_clusters)
-            assert len(borders) == amount_clusters - 1
\ No newline at end of file
+            assert len(borders) == amount_clusters - 1
+
+
+    @staticmethod
+    def templateOrderingExtraction(path, radius, neighbors, amount_clusters, ccore):
+        sample = read_sample(path)
+
+        optics_instance = optics(sample, radius, neighbors, amount_clusters, ccore)
+        optics_instance.process()
+
+        stream = io.BytesIO()
+        optics_instance.get_optics_ordering().save(stream)
+        stream.seek(0)
+
+        ordering = optics_ordering.load(stream)
+        assertion.eq(len(sample), len(ordering))
+        assertion.eq(optics_instance.get_radius(), ordering.get_eps())
+        assertion.eq(neighbors, ordering.get_minpts())
+
+        clusters, noise = ordering.extract_clusters(optics_instance.get_radius())
+        assertion.eq(optics_instance.get_clusters(), clusters)
+        assertion.eq(optics_instance.get_noise(), noise)
+
+        for extraction_radius in numpy.linspace(0.0, ordering.get_eps(), 50):
+            clusters, noise = ordering.extract_clusters(extraction_radius)
+            assertion.eq(ordering.get_cluster_amount(extraction_radius), len(clusters))
+            assertion.eq(list(range(len(sample))), sorted([index for cluster in clusters for index in cluster] + noise))
+
+        for amount in range(1, len(optics_instance.get_clusters()) + 1):
+            extraction_radius = ordering.calculate_radius(amount)
+            if extraction_radius is not None:
+                assertion.eq(amount, len(ordering.extract_clusters(extraction_radius)[0]))
+
+
+    @staticmethod
+    def templateClusteringMetric(path, radius, neighbors, amount_clusters, metric, ccore):
+        sample = read_sample(path)
+        matrix = [[metric(point1, point2) for point2 in sample] for point1 in sample]
+
+        expected_instance = optics(matrix, radius, neighbors, amount_clusters, False, data_type='distance_matrix')
+        expected_instance.process()
+
+        optics_instance = optics(sample, radius, neighbors, amount_clusters, ccore, metric=metric)
+        optics_instance.process()
+
+        assertion.eq(sorted(sorted(cluster) for cluster in expected_instance.get_clusters()),
+                     sorted(sorted(cluster) for cluster in optics_instance.get_clusters()))
+        assertion.eq(sorted(expected_instance.get_noise()), sorted(optics_instance.get_noise()))
+        assertion.true(numpy.allclose(expected_instance.get_ordering(), optics_instance.get_ordering()))
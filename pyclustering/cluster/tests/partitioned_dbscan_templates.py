@@ -0,0 +1,70 @@
+"""!
+
+@brief Test templates for Partitioned DBSCAN algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+from random import Random
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.cluster.dbscan import dbscan
+from pyclustering.cluster.partitioned_dbscan import partitioned_dbscan
+
+from pyclustering.utils import read_sample
+
+
+class PartitionedDbscanTestTemplates:
+    @staticmethod
+    def templateClusteringResults(path, radius, neighbors, expected_length_clusters, partitions, pool_size):
+        sample = read_sample(path)
+
+        dbscan_instance = partitioned_dbscan(sample, radius, neighbors, partitions=partitions, pool_size=pool_size).process()
+
+        clusters = dbscan_instance.get_clusters()
+        noise = dbscan_instance.get_noise()
+
+        assertion.eq(len(sample), sum([len(cluster) for cluster in clusters]) + len(noise))
+        assertion.eq(expected_length_clusters, sorted([len(cluster) for cluster in clusters]))
+
+        PartitionedDbscanTestTemplates.assertTheSameAsDbscan(sample, radius, neighbors, dbscan_instance)
+
+
+    @staticmethod
+    def templateTheSameAsDbscan(seed, amount_points, dimension, radius, neighbors, partitions, pool_size):
+        generator = Random(seed)
+
+        # coordinates are rounded to obtain points on the border of the connectivity radius and on borders of partitions
+        sample = [[round(generator.random() * 3.0, 1) for _ in range(dimension)] for _ in range(amount_points)]
+
+        dbscan_instance = partitioned_dbscan(sample, radius, neighbors, partitions=partitions, pool_size=pool_size).process()
+        PartitionedDbscanTestTemplates.assertTheSameAsDbscan(sample, radius, neighbors, dbscan_instance)
+
+
+    @staticmethod
+    def assertTheSameAsDbscan(sample, radius, neighbors, dbscan_instance):
+        reference = dbscan(sample, radius, neighbors, False)
+        reference.process()
+
+        assertion.eq([sorted(cluster) for cluster in reference.get_clusters()], dbscan_instance.get_clusters())
+        assertion.eq(reference.get_noise(), dbscan_instance.get_noise())
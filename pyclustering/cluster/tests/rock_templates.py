@@ -26,6 +26,8 @@
 
 from pyclustering.cluster.rock import rock;
 
+from pyclustering.container.neighbor_graph import neighbor_graph;
+
 from pyclustering.utils import read_sample;
 
 from random import random;
@@ -33,10 +35,16 @@ from random import random;
 
 class RockTestTemplates:
     @staticmethod
-    def templateLengthProcessData(path_to_file, radius, cluster_numbers, threshold, expected_cluster_length, ccore):
+    def templateLengthProcessData(path_to_file, radius, cluster_numbers, threshold, expected_cluster_length, ccore, **kwargs):
         sample = read_sample(path_to_file);
         
-        rock_instance = rock(sample, radius, cluster_numbers, threshold, ccore);
+        data_type = kwargs.get('data_type', 'points');
+        input_data = sample;
+        if (data_type == 'neighbor_graph'):
+            # graph is built for greater radius to check truncation of its rows
+            input_data = neighbor_graph.create(sample, radius * 2.0);
+        
+        rock_instance = rock(input_data, radius, cluster_numbers, threshold, ccore, data_type=data_type);
         rock_instance.process();
         clusters = rock_instance.get_clusters();
         
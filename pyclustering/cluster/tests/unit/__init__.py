@@ -36,6 +36,7 @@ from pyclustering.cluster.tests.unit               import ut_bang
 from pyclustering.cluster.tests.unit               import ut_birch              as cluster_birch_unit_tests
 from pyclustering.cluster.tests.unit               import ut_bsas               as cluster_bsas_unit_tests
 from pyclustering.cluster.tests.unit               import ut_center_initializer as cluster_center_initializer_unit_tests
+from pyclustering.cluster.tests.unit               import ut_clara              as cluster_clara_unit_tests
 from pyclustering.cluster.tests.unit               import ut_clarans            as cluster_clarans_unit_tests
 from pyclustering.cluster.tests.unit               import ut_clique             as cluster_clique_unit_tests
 from pyclustering.cluster.tests.unit               import ut_cure               as cluster_cure_unit_tests
@@ -47,11 +48,15 @@ from pyclustering.cluster.tests.unit               import ut_ga
 from pyclustering.cluster.tests.unit               import ut_general            as cluster_general_unit_tests
 from pyclustering.cluster.tests.unit               import ut_generator          as cluster_generator_unit_tests
 from pyclustering.cluster.tests.unit               import ut_hsyncnet           as cluster_hsyncnet_unit_tests
+from pyclustering.cluster.tests.unit               import ut_incremental_dbscan as cluster_incremental_dbscan_unit_tests
 from pyclustering.cluster.tests.unit               import ut_kmeans             as cluster_kmeans_unit_tests
+from pyclustering.cluster.tests.unit               import ut_kmeans_restarts    as cluster_kmeans_restarts_unit_tests
 from pyclustering.cluster.tests.unit               import ut_kmedians           as cluster_kmedians_unit_tests
 from pyclustering.cluster.tests.unit               import ut_kmedoids           as cluster_kmedoids_unit_tests
 from pyclustering.cluster.tests.unit               import ut_mbsas              as cluster_mbsas_unit_tests
+from pyclustering.cluster.tests.unit               import ut_minibatch_kmeans   as cluster_minibatch_kmeans_unit_tests
 from pyclustering.cluster.tests.unit               import ut_optics             as cluster_optics_unit_tests
+from pyclustering.cluster.tests.unit               import ut_partitioned_dbscan as cluster_partitioned_dbscan_unit_tests
 from pyclustering.cluster.tests.unit               import ut_rock               as cluster_rock_unit_tests
 from pyclustering.cluster.tests.unit               import ut_silhouette         as cluster_silhouette_unit_tests
 from pyclustering.cluster.tests.unit               import ut_somsc              as cluster_somsc_unit_tests
@@ -74,6 +79,7 @@ class clustering_unit_tests(suite_holder):
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_birch_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_bsas_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_center_initializer_unit_tests))
+        unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_clara_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_clarans_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_clique_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_cure_unit_tests))
@@ -85,11 +91,15 @@ class clustering_unit_tests(suite_holder):
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_general_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_generator_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_hsyncnet_unit_tests))
+        unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_incremental_dbscan_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmeans_unit_tests))
+        unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmeans_restarts_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmedians_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_kmedoids_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_mbsas_unit_tests))
+        unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_minibatch_kmeans_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_optics_unit_tests))
+        unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_partitioned_dbscan_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_rock_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_silhouette_unit_tests))
         unit_cluster_suite.addTests(unittest.TestLoader().loadTestsFromModule(cluster_somsc_unit_tests))
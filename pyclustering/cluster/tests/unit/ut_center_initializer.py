@@ -35,6 +35,7 @@ from pyclustering.cluster.tests.kmedoids_templates import KmedoidsTestTemplates
 
 from pyclustering.cluster.center_initializer import random_center_initializer
 from pyclustering.cluster.center_initializer import kmeans_plusplus_initializer
+from pyclustering.cluster.center_initializer import kmeans_parallel_initializer
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES
 
@@ -226,5 +227,69 @@ class KmeansPlusPlusInitializerUnitTest(unittest.TestCase):
         self.templateKmeansPlusPlusForKmedoidsClustering(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 5, [15, 15, 15, 15, 15])
 
 
+class KmeansParallelInitializerUnitTest(unittest.TestCase):
+    def templateKmeansParallelCenterInitializer(self, data, amount, **kwargs):
+        centers = kmeans_parallel_initializer(data, amount, **kwargs).initialize()
+
+        assertion.eq(amount, len(centers))
+
+        for center in centers:
+            assertion.eq(len(data[0]), len(center))
+
+        indexes = kmeans_parallel_initializer(data, amount, **kwargs).initialize(return_index=True)
+
+        assertion.eq(amount, len(indexes))
+        assertion.eq(amount, len(set(indexes)))
+        for index in indexes:
+            assertion.gt(len(data), index)
+            assertion.le(0, index)
+
+        return indexes
+
+    def test1DimensionDataOneCenter(self):
+        self.templateKmeansParallelCenterInitializer([[0.0], [1.0], [2.0], [3.0]], 1)
+
+    def testGenerateFourCenters(self):
+        self.templateKmeansParallelCenterInitializer([[0.0], [-1.0], [-2.0], [-3.0]], 4)
+
+    def testGenerateTwoCentersIntData(self):
+        self.templateKmeansParallelCenterInitializer([[0], [-1], [-2], [-3]], 2)
+
+    def testGenerateCentersIdenticalData(self):
+        self.templateKmeansParallelCenterInitializer([[1.2], [1.2], [1.2], [1.2]], 3)
+
+    def testGenerateCentersThreeDimensionalData(self):
+        self.templateKmeansParallelCenterInitializer([[1.2, 1.3, 1.4], [1.2, 1.3, 1.4], [2.3, 2.3, 2.4], [2.1, 4.2, 1.1]], 3)
+
+    def testGenerateCentersOnePoint(self):
+        self.templateKmeansParallelCenterInitializer([[1.2, 1.3, 1.4]], 1)
+
+    def testGenerateCentersNoRounds(self):
+        self.templateKmeansParallelCenterInitializer(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 4, rounds=0)
+
+    def testGenerateCentersSeveralThreads(self):
+        self.templateKmeansParallelCenterInitializer(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 4, pool_size=3, memory_limit=256)
+
+    def testRandomState(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        expected = self.templateKmeansParallelCenterInitializer(sample, 4, random_state=1000, pool_size=1)
+        actual = self.templateKmeansParallelCenterInitializer(sample, 4, random_state=1000, pool_size=4)
+
+        assertion.eq(expected, actual)
+
+    def testIncorrectArguments(self):
+        sample = [[0.0], [1.0], [2.0]]
+
+        self.assertRaises(AttributeError, kmeans_parallel_initializer, sample, 0)
+        self.assertRaises(AttributeError, kmeans_parallel_initializer, sample, 4)
+        self.assertRaises(AttributeError, kmeans_parallel_initializer, sample, 2, oversampling=0)
+        self.assertRaises(AttributeError, kmeans_parallel_initializer, sample, 2, rounds=-1)
+
+    def testInitializerForKmeansSampleSimple03(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        start_centers = kmeans_parallel_initializer(sample, 4, oversampling=8, rounds=5, random_state=1000).initialize()
+        KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, start_centers, [10, 10, 10, 30], False)
+
+
 if __name__ == "__main__":
     unittest.main()
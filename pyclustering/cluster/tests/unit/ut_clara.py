@@ -0,0 +1,98 @@
+"""!
+
+@brief Unit-tests for CLARA algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.tests.clara_templates import ClaraTestTemplates
+
+from pyclustering.cluster.clara import clara
+from pyclustering.cluster.encoder import type_encoding
+from pyclustering.cluster.kmedoids import kmedoids_algorithm
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class ClaraUnitTest(unittest.TestCase):
+    def testClusterAllocationSampleSimple1(self):
+        ClaraTestTemplates.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 3, [5, 5])
+
+    def testClusterAllocationSampleSimple3(self):
+        ClaraTestTemplates.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, [10, 10, 10, 30], sample_size=30)
+
+    def testClusterAllocationSampleSimple3OneWorker(self):
+        ClaraTestTemplates.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, [10, 10, 10, 30], sample_size=30, pool_size=1)
+
+    def testClusterAllocationSampleSimple3Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        ClaraTestTemplates.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, [10, 10, 10, 30], sample_size=30, metric=metric)
+
+    def testClusterAllocationSampleLsun(self):
+        ClaraTestTemplates.templateClusterAllocation(FCPS_SAMPLES.SAMPLE_LSUN, 3, 4, None, sample_size=80)
+
+    def testClusterAllocationSampleLsunEuclidean(self):
+        metric = distance_metric(type_metric.EUCLIDEAN)
+        ClaraTestTemplates.templateClusterAllocation(FCPS_SAMPLES.SAMPLE_LSUN, 3, 4, None, sample_size=80, metric=metric, pool_size=1)
+
+    def testSampleSizeGreaterThanData(self):
+        ClaraTestTemplates.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 3, 2, [10, 5, 8], sample_size=100)
+
+    def testReproducibilitySampleSimple3(self):
+        ClaraTestTemplates.templateReproducibility(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 4)
+
+    def testAlternateAlgorithm(self):
+        clara_instance = clara([[0.0], [0.1], [5.0], [5.1]], 2, 2, algorithm=kmedoids_algorithm.ALTERNATE, pool_size=1)
+        clusters = clara_instance.process().get_clusters()
+
+        self.assertEqual([[0, 1], [2, 3]], sorted([sorted(cluster) for cluster in clusters]))
+
+    def testIncorrectAmountClusters(self):
+        self.assertRaises(ValueError, clara, [[0.0], [1.0]], 0)
+        self.assertRaises(ValueError, clara, [[0.0], [1.0]], 3)
+
+    def testIncorrectAmountSamples(self):
+        self.assertRaises(ValueError, clara, [[0.0], [1.0]], 1, 0)
+
+    def testIncorrectSampleSize(self):
+        self.assertRaises(ValueError, clara, [[0.0], [1.0], [2.0]], 2, 1, sample_size=1)
+
+    def testIncorrectPoolSize(self):
+        self.assertRaises(ValueError, clara, [[0.0], [1.0]], 1, 2, pool_size=-1)
+
+    def testEmptyData(self):
+        self.assertRaises(ValueError, clara, [], 1)
+
+    def testClusterEncoding(self):
+        self.assertEqual(type_encoding.CLUSTER_INDEX_LIST_SEPARATION, clara([[0.0], [1.0]], 1).get_cluster_encoding())
+
+
+if __name__ == "__main__":
+    unittest.main()
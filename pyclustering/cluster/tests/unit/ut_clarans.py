@@ -31,7 +31,7 @@ matplotlib.use('Agg');
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES;
 
-from pyclustering.utils import read_sample;
+from pyclustering.utils import read_sample, euclidean_distance_square;
 
 from pyclustering.cluster.clarans import clarans;
 
@@ -91,5 +91,70 @@ class ClaransUnitTest(unittest.TestCase):
         self.templateClusterAllocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, [5, 10], 2, 15, 5);
 
 
+    def templateReproducibility(self, path, number_clusters, numlocal, maxneighbor, pool_size):
+        sample = read_sample(path);
+
+        expected = clarans(sample, number_clusters, numlocal, maxneighbor, random_state=1000, pool_size=1).process();
+        actual = clarans(sample, number_clusters, numlocal, maxneighbor, random_state=1000, pool_size=pool_size).process();
+
+        self.assertEqual(expected.get_medoids(), actual.get_medoids());
+        self.assertEqual(expected.get_clusters(), actual.get_clusters());
+
+    def testReproducibilitySampleSimple3(self):
+        self.templateReproducibility(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, 5, 1);
+
+    def testPoolSampleSimple3(self):
+        self.templateReproducibility(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 5, 5, 2);
+
+    def testPoolSampleSimple8(self):
+        self.templateReproducibility(SIMPLE_SAMPLES.SAMPLE_SIMPLE8, 4, 4, 5, 3);
+
+
+    def testLocalMinimumSampleSimple3(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3);
+
+        clarans_instance = clarans(sample, 4, 3, len(sample) * 40, random_state=1000, pool_size=1).process();
+        medoids = clarans_instance.get_medoids();
+
+        def estimation(medoids):
+            return sum(min(euclidean_distance_square(point, sample[medoid]) for medoid in medoids) for point in sample);
+
+        # swap of any medoid with any other point should not decrease total deviation
+        optimal_estimation = estimation(medoids);
+        for index_cluster in range(len(medoids)):
+            for index_point in range(len(sample)):
+                if index_point not in medoids:
+                    candidate_medoids = medoids[:];
+                    candidate_medoids[index_cluster] = index_point;
+                    self.assertGreaterEqual(estimation(candidate_medoids) + 1e-9, optimal_estimation);
+
+        self.assertEqual(len(sample), sum(len(cluster) for cluster in clarans_instance.get_clusters()));
+
+
+    def testOneCluster(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1);
+
+        clarans_instance = clarans(sample, 1, 2, 5, random_state=1000, pool_size=1).process();
+        self.assertEqual(1, len(clarans_instance.get_medoids()));
+        self.assertEqual(list(range(len(sample))), clarans_instance.get_clusters()[0]);
+
+
+    def testAllPointsAreMedoids(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1);
+
+        clarans_instance = clarans(sample, len(sample), 2, 5, random_state=1000, pool_size=1).process();
+        self.assertEqual(sorted(range(len(sample))), sorted(clarans_instance.get_medoids()));
+
+
+    def testIncorrectArguments(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1);
+
+        self.assertRaises(ValueError, clarans, [], 1, 2, 5);
+        self.assertRaises(ValueError, clarans, sample, 0, 2, 5);
+        self.assertRaises(ValueError, clarans, sample, len(sample) + 1, 2, 5);
+        self.assertRaises(ValueError, clarans, sample, 2, 0, 5);
+        self.assertRaises(ValueError, clarans, sample, 2, 2, 5, pool_size=-1);
+
+
 if __name__ == "__main__":
     unittest.main();
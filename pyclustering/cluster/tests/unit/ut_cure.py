@@ -34,6 +34,8 @@ from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
 from pyclustering.cluster.tests.cure_templates import CureTestTemplates
 
+from pyclustering.cluster.cure import cure
+
 
 class CureUnitTest(unittest.TestCase):
     def testClusterAllocationSampleSimple1(self):
@@ -108,6 +110,22 @@ class CureUnitTest(unittest.TestCase):
         CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, [5, 5, 5], 3, 5, 0.3)
         CureTestTemplates.template_cluster_allocation(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, [5, 10], 2, 5, 0.3)
 
+    def testClusterAllocationDuplicatePoints(self):
+        # equal distances between clusters are resolved in order of search of kd-tree
+        sample = [[3, 2], [2, 1], [3, 1], [2, 2], [0, 0], [3, 3], [2, 1], [2, 0], [0, 0], [1, 2], [2, 1], [1, 2], [0, 0], [2, 0]]
+
+        cure_instance = cure(sample, 3, ccore=False)
+        cure_instance.process()
+
+        self.assertEqual([[3, 1, 6, 10, 0, 2, 7, 13, 9, 11], [5], [4, 8, 12]], cure_instance.get_clusters())
+
+        sample = [[2, 3], [3, 0], [1, 3], [0, 1], [2, 2], [2, 2], [3, 3], [1, 2], [0, 2], [2, 2], [1, 1], [3, 1]]
+
+        cure_instance = cure(sample, 2, ccore=False)
+        cure_instance.process()
+
+        self.assertEqual([[4, 5, 9, 0, 2, 6, 7, 10, 3, 8], [1, 11]], cure_instance.get_clusters())
+
 
     def testEncoderProcedure(self):
         CureTestTemplates.templateEncoderProcedures(False)
@@ -30,10 +30,16 @@ import matplotlib
 matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.dbscan_templates import DbscanTestTemplates
+from pyclustering.cluster.dbscan import dbscan
+
+from pyclustering.container.neighbor_graph import neighbor_graph
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, SIMPLE_ANSWERS
 from pyclustering.samples.definitions import FCPS_SAMPLES
 
+from pyclustering.utils import calculate_distance_matrix
+from pyclustering.utils.metric import distance_metric, type_metric
+
 
 class DbscsanUnitTest(unittest.TestCase):
     def testClusteringSampleSimple1(self):
@@ -159,5 +165,84 @@ class DbscsanUnitTest(unittest.TestCase):
         DbscanTestTemplates.templateClusterAllocationOneDimensionDistanceMatrix(False)
 
 
+    def testTheSameAsReferenceOneDimension(self):
+        for seed in range(20):
+            DbscanTestTemplates.templateClusteringTheSameAsReference(seed, 40, 1, 0.1, 2, 'points')
+
+    def testTheSameAsReferenceTwoDimensions(self):
+        for seed in range(20):
+            DbscanTestTemplates.templateClusteringTheSameAsReference(seed, 60, 2, 0.3, 3, 'points')
+
+    def testTheSameAsReferenceThreeDimensions(self):
+        for seed in range(20):
+            DbscanTestTemplates.templateClusteringTheSameAsReference(seed, 60, 3, 0.5, 4, 'points')
+
+    def testTheSameAsReferenceDistanceMatrix(self):
+        for seed in range(20):
+            DbscanTestTemplates.templateClusteringTheSameAsReference(seed, 60, 2, 0.3, 3, 'distance_matrix')
+
+    def testTheSameAsReferenceWithoutNeighbors(self):
+        DbscanTestTemplates.templateClusteringTheSameAsReference(1, 30, 2, 0.2, 0, 'points')
+        DbscanTestTemplates.templateClusteringTheSameAsReference(1, 30, 2, 0.2, 0, 'distance_matrix')
+
+    def testTheSameAsReferenceSinglePoint(self):
+        DbscanTestTemplates.templateClusteringTheSameAsReference(1, 1, 2, 0.2, 0, 'points')
+        DbscanTestTemplates.templateClusteringTheSameAsReference(1, 1, 2, 0.2, 1, 'distance_matrix')
+
+    def testNeighborGraphSampleSimple3(self):
+        DbscanTestTemplates.templateClusteringNeighborGraph(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [0.1, 0.3, 0.5, 0.7, 1.0, 2.0], 3, 'points')
+
+    def testNeighborGraphSampleLsun(self):
+        DbscanTestTemplates.templateClusteringNeighborGraph(FCPS_SAMPLES.SAMPLE_LSUN, [0.2, 0.3, 0.5], 3, 'points')
+
+    def testNeighborGraphDistanceMatrix(self):
+        DbscanTestTemplates.templateClusteringNeighborGraph(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [0.5, 1.0, 2.0, 5.0], 2, 'distance_matrix')
+
+    def testNeighborGraphGreaterRadius(self):
+        graph = neighbor_graph.create([[0.0], [1.0], [2.0]], 1.0)
+        dbscan_instance = dbscan(graph, 2.0, 1, False, data_type='neighbor_graph')
+        self.assertRaises(ValueError, dbscan_instance.process)
+
+
+    def testMetricManhattanSampleSimple3(self):
+        DbscanTestTemplates.templateClusteringMetric(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, distance_metric(type_metric.MANHATTAN), False)
+
+    def testMetricChebyshevSampleLsun(self):
+        DbscanTestTemplates.templateClusteringMetric(FCPS_SAMPLES.SAMPLE_LSUN, 0.4, 3, distance_metric(type_metric.CHEBYSHEV), True)
+
+    def testMetricCanberraSampleSimple1(self):
+        DbscanTestTemplates.templateClusteringMetric(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 0.2, 2, distance_metric(type_metric.CANBERRA), False)
+
+
+    def testDenseClusterIsLinear(self):
+        sample = [[index * 0.001, 0.0] for index in range(20000)]
+        dbscan_instance = dbscan(sample, 0.0015, 2, False)
+        dbscan_instance.process()
+
+        self.assertEqual(1, len(dbscan_instance.get_clusters()))
+        self.assertEqual(list(range(len(sample))), sorted(dbscan_instance.get_clusters()[0]))
+        self.assertEqual([], dbscan_instance.get_noise())
+
+    def testOrderOfExpansionDuplicatePoints(self):
+        # points of each cluster are placed in order of expansion, neighbors are found in order of kd-tree search
+        sample = [[0, 1], [0, 1], [1, 0], [1, 1], [1, 2], [1, 0], [0, 2], [1, 0], [4, 4], [4, 5], [5, 4], [4, 4], [9, 9]]
+
+        dbscan_instance = dbscan(sample, 1.0, 2, False)
+        dbscan_instance.process()
+
+        self.assertEqual([[0, 6, 3, 1, 4, 7, 5, 2], [8, 11, 10, 9]], dbscan_instance.get_clusters())
+        self.assertEqual([12], dbscan_instance.get_noise())
+
+    def testOrderOfExpansionDuplicatePointsDistanceMatrix(self):
+        # neighbors are found in order of indexes in case of distance matrix
+        sample = [[0, 1], [0, 1], [1, 0], [1, 1], [1, 2], [1, 0], [0, 2], [1, 0], [4, 4], [4, 5], [5, 4], [4, 4], [9, 9]]
+
+        dbscan_instance = dbscan(calculate_distance_matrix(sample), 1.0, 2, False, data_type='distance_matrix')
+        dbscan_instance.process()
+
+        self.assertEqual([[0, 1, 3, 6, 2, 4, 5, 7], [8, 9, 10, 11]], dbscan_instance.get_clusters())
+        self.assertEqual([12], dbscan_instance.get_noise())
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
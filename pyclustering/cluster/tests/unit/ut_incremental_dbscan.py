@@ -0,0 +1,120 @@
+"""!
+
+@brief Unit-tests for Incremental DBSCAN algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.tests.incremental_dbscan_templates import IncrementalDbscanTestTemplates
+
+from pyclustering.cluster.incremental_dbscan import incremental_dbscan
+from pyclustering.cluster.encoder import type_encoding
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES
+
+
+class IncrementalDbscanUnitTest(unittest.TestCase):
+    def testClusteringSampleSimple1(self):
+        IncrementalDbscanTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 0.4, 2, [5, 5])
+        IncrementalDbscanTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 10, 2, [10])
+
+    def testClusteringSampleSimple2(self):
+        IncrementalDbscanTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 1, 2, [5, 8, 10])
+
+    def testClusteringSampleSimple3(self):
+        IncrementalDbscanTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, [10, 10, 10, 30])
+
+    def testClusteringSampleSimple3NumpyInput(self):
+        IncrementalDbscanTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, [10, 10, 10, 30], numpy_usage=True)
+
+    def testClusteringTheSameData(self):
+        IncrementalDbscanTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE9, 0.5, 3, [10, 20])
+
+
+    def testInsertionOnlyTheSameAsDbscan(self):
+        for seed in range(10):
+            IncrementalDbscanTestTemplates.templateTheSameAsDbscan(seed, 60, 2, 0.3, 3, 0.0)
+
+    def testInsertionRemovalTheSameAsDbscanOneDimension(self):
+        for seed in range(10):
+            IncrementalDbscanTestTemplates.templateTheSameAsDbscan(seed, 80, 1, 0.2, 2, 0.4)
+
+    def testInsertionRemovalTheSameAsDbscanTwoDimensions(self):
+        for seed in range(10):
+            IncrementalDbscanTestTemplates.templateTheSameAsDbscan(seed, 80, 2, 0.3, 3, 0.4)
+
+    def testInsertionRemovalWithoutNeighbors(self):
+        IncrementalDbscanTestTemplates.templateTheSameAsDbscan(1, 40, 2, 0.3, 0, 0.4)
+
+    def testRemovalSplitsCluster(self):
+        dbscan_instance = incremental_dbscan(1.0, 1, [[0.0], [1.0], [2.0], [3.0], [4.0]])
+        self.assertEqual([[0, 1, 2, 3, 4]], dbscan_instance.get_clusters())
+
+        dbscan_instance.remove(2)
+        self.assertEqual([[0, 1], [3, 4]], sorted(dbscan_instance.get_clusters()))
+        self.assertEqual([], dbscan_instance.get_noise())
+
+        # removed point does not break connection between points anymore
+        index_point = dbscan_instance.insert([2.0])
+        self.assertEqual(5, index_point)
+        self.assertEqual([[0, 1, 3, 4, 5]], dbscan_instance.get_clusters())
+
+    def testRemovalMakesNoise(self):
+        dbscan_instance = incremental_dbscan(1.0, 2, [[0.0], [1.0], [2.0], [10.0]])
+        self.assertEqual([[0, 1, 2]], dbscan_instance.get_clusters())
+        self.assertEqual([3], dbscan_instance.get_noise())
+
+        dbscan_instance.remove(1)
+        self.assertEqual([], dbscan_instance.get_clusters())
+        self.assertEqual([0, 2, 3], dbscan_instance.get_noise())
+
+    def testRemoveAllPoints(self):
+        dbscan_instance = incremental_dbscan(1.0, 1, [[0.0, 0.0], [0.5, 0.5], [0.5, 0.5]])
+        for index_point in range(3):
+            dbscan_instance.remove(index_point)
+
+        self.assertEqual(0, len(dbscan_instance))
+        self.assertEqual([], dbscan_instance.get_clusters())
+        self.assertEqual([], dbscan_instance.get_noise())
+
+    def testRemoveUnknownPoint(self):
+        dbscan_instance = incremental_dbscan(1.0, 1, [[0.0, 0.0]])
+        self.assertRaises(KeyError, dbscan_instance.remove, 1)
+
+        dbscan_instance.remove(0)
+        self.assertRaises(KeyError, dbscan_instance.remove, 0)
+
+    def testIncorrectRadius(self):
+        self.assertRaises(ValueError, incremental_dbscan, -1.0, 2)
+
+    def testClusterEncoding(self):
+        self.assertEqual(type_encoding.CLUSTER_INDEX_LIST_SEPARATION, incremental_dbscan(1.0, 2).get_cluster_encoding())
+
+
+if __name__ == "__main__":
+    unittest.main()
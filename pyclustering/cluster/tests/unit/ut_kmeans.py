@@ -25,6 +25,7 @@
 
 
 import unittest
+import numpy
 
 # Generate images without having a window appear.
 import matplotlib
@@ -32,14 +33,21 @@ matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.kmeans_templates import KmeansTestTemplates
 
-from pyclustering.cluster.kmeans import kmeans
+from pyclustering.tests.assertion import assertion
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES
+from pyclustering.cluster.kmeans import kmeans, kmeans_filtering_tree
+
+from pyclustering.utils import read_sample
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
 from pyclustering.utils.metric import distance_metric, type_metric
 
 
 class KmeansUnitTest(unittest.TestCase):
+    def testCcoreDatasetSampleSimple1(self):
+        KmeansTestTemplates.templateCcoreDataset(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], False)
+
     def testClusterAllocationSampleSimple1(self):
         KmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], False)
 
@@ -187,6 +195,115 @@ class KmeansUnitTest(unittest.TestCase):
         self.assertRaises(ValueError, kmeans_instance.process)
 
 
+    def testElkanSampleSimple1(self):
+        KmeansTestTemplates.templateElkanAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), [[3.7, 5.5], [6.7, 7.5]])
+
+    def testElkanSampleSimple3(self):
+        KmeansTestTemplates.templateElkanAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]])
+
+    def testElkanSampleSimple3Euclidean(self):
+        metric = distance_metric(type_metric.EUCLIDEAN)
+        KmeansTestTemplates.templateElkanAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], metric=metric)
+
+    def testElkanSampleSimple3Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmeansTestTemplates.templateElkanAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], metric=metric)
+
+    def testElkanSampleSimple3Chebyshev(self):
+        metric = distance_metric(type_metric.CHEBYSHEV)
+        KmeansTestTemplates.templateElkanAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], metric=metric)
+
+    def testElkanSampleSimple3Canberra(self):
+        metric = distance_metric(type_metric.CANBERRA)
+        KmeansTestTemplates.templateElkanAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], metric=metric)
+
+    def testElkanSampleSimple3ChiSquare(self):
+        metric = distance_metric(type_metric.CHI_SQUARE)
+        KmeansTestTemplates.templateElkanAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], metric=metric)
+
+    def testElkanSampleLsunManyClusters(self):
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+        KmeansTestTemplates.templateElkanAlgorithm(sample, sample[::10])
+
+    def testElkanEmptyClusters(self):
+        KmeansTestTemplates.templateElkanAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), [[3.7, 5.5], [6.7, 7.5], [100.0, 100.0]])
+
+    def testElkanTheSameCenters(self):
+        KmeansTestTemplates.templateElkanAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), [[3.7, 5.5], [3.7, 5.5], [6.7, 7.5]])
+
+    def testElkanTiesRandomData(self):
+        data = numpy.round(numpy.random.RandomState(1000).rand(300, 2) * 4.0) / 4.0
+        KmeansTestTemplates.templateElkanAlgorithm(data, data[:15])
+
+    def testElkanTiesIntegerData(self):
+        data = numpy.random.RandomState(1000).randint(0, 6, (200, 3)).astype(float)
+        KmeansTestTemplates.templateElkanAlgorithm(data, data[:25] + 0.1)
+
+    def testElkanOneDimensionalData(self):
+        KmeansTestTemplates.templateElkanAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE7), [[-2.0], [4.0]])
+
+
+    def testFilteringSampleSimple1(self):
+        KmeansTestTemplates.templateFilteringAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), [[3.7, 5.5], [6.7, 7.5]])
+
+    def testFilteringSampleSimple3(self):
+        KmeansTestTemplates.templateFilteringAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]])
+
+    def testFilteringSampleSimple3Euclidean(self):
+        metric = distance_metric(type_metric.EUCLIDEAN)
+        KmeansTestTemplates.templateFilteringAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], metric=metric)
+
+    def testFilteringSampleSimple3Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmeansTestTemplates.templateFilteringAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], metric=metric)
+
+    def testFilteringTiesIntegerData(self):
+        data = numpy.random.RandomState(1000).randint(0, 6, (200, 3)).astype(float)
+        KmeansTestTemplates.templateFilteringAlgorithm(data, data[:25] + 0.1)
+
+    def testFilteringSampleLsunManyClusters(self):
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+        KmeansTestTemplates.templateFilteringAlgorithm(sample, sample[::10])
+
+    def testFilteringSampleHepta(self):
+        KmeansTestTemplates.templateFilteringAlgorithm(read_sample(FCPS_SAMPLES.SAMPLE_HEPTA), [[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [-3.0, 0.0, 0.0], [0.0, 3.0, 0.0], [0.0, -3.0, 0.0], [0.0, 0.0, 3.0], [0.0, 0.0, -3.0]])
+
+    def testFilteringEmptyClusters(self):
+        KmeansTestTemplates.templateFilteringAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), [[3.7, 5.5], [6.7, 7.5], [100.0, 100.0]])
+
+    def testFilteringTheSameCenters(self):
+        KmeansTestTemplates.templateFilteringAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), [[3.7, 5.5], [3.7, 5.5], [6.7, 7.5]])
+
+    def testFilteringTiesRandomData(self):
+        data = numpy.round(numpy.random.RandomState(1000).rand(300, 2) * 4.0) / 4.0
+        KmeansTestTemplates.templateFilteringAlgorithm(data, data[:15])
+
+    def testFilteringOneDimensionalData(self):
+        KmeansTestTemplates.templateFilteringAlgorithm(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE7), [[-2.0], [4.0]])
+
+    def testFilteringTreeCells(self):
+        data = numpy.random.RandomState(1000).rand(1000, 3)
+        tree = kmeans_filtering_tree(data, 16)
+
+        begins, ends, lefts, rights, lowers, uppers, sums = tree.get_cells()
+
+        assertion.eq(list(range(len(data))), sorted(tree.get_indexes().tolist()))
+        for index_cell in range(len(tree)):
+            points = data[tree.get_indexes()[begins[index_cell]:ends[index_cell]]]
+
+            assertion.true(numpy.allclose(numpy.sum(points, axis=0), sums[index_cell]))
+            assertion.true(numpy.all(points >= lowers[index_cell]) and numpy.all(points <= uppers[index_cell]))
+            if lefts[index_cell] == -1:
+                assertion.ge(16, len(points))
+            else:
+                assertion.eq(begins[index_cell], begins[lefts[index_cell]])
+                assertion.eq(ends[lefts[index_cell]], begins[rights[index_cell]])
+                assertion.eq(ends[index_cell], ends[rights[index_cell]])
+
+    def testFilteringTreeIncorrectLeafSize(self):
+        self.assertRaises(ValueError, kmeans_filtering_tree, [[0.0]], 0)
+
+
     def testClusterAllocationOneDimensionData(self):
         KmeansTestTemplates.templateClusterAllocationOneDimensionData(False)
 
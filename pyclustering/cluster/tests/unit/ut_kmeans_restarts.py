@@ -0,0 +1,87 @@
+"""!
+
+@brief Unit-tests for multi-restart K-Means algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.tests.kmeans_restarts_templates import KmeansRestartsTestTemplates
+
+from pyclustering.cluster.encoder import type_encoding
+from pyclustering.cluster.kmeans_restarts import kmeans_restarts
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class KmeansRestartsUnitTest(unittest.TestCase):
+    def testBestRestartSampleSimple1(self):
+        KmeansRestartsTestTemplates.templateBestRestart(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 2, 5, False)
+
+    def testBestRestartSampleSimple3(self):
+        KmeansRestartsTestTemplates.templateBestRestart(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 10, False)
+
+    def testBestRestartSampleSimple3OneWorker(self):
+        KmeansRestartsTestTemplates.templateBestRestart(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 10, False, pool_size=1)
+
+    def testBestRestartSampleSimple3Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmeansRestartsTestTemplates.templateBestRestart(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 10, False, metric=metric)
+
+    def testBestRestartSampleLsun(self):
+        KmeansRestartsTestTemplates.templateBestRestart(FCPS_SAMPLES.SAMPLE_LSUN, 3, 6, False)
+
+    def testOneRestartSampleSimple2(self):
+        KmeansRestartsTestTemplates.templateBestRestart(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 3, 1, False)
+
+    def testReproducibilitySampleSimple3(self):
+        KmeansRestartsTestTemplates.templateReproducibility(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 6, False)
+
+    def testCcoreDatasetSampleSimple3(self):
+        KmeansRestartsTestTemplates.templateCcoreDataset(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, 4, False)
+
+    def testIncorrectAmountClusters(self):
+        self.assertRaises(ValueError, kmeans_restarts, [[0.0], [1.0]], 0)
+        self.assertRaises(ValueError, kmeans_restarts, [[0.0], [1.0]], 3)
+
+    def testIncorrectAmountRestarts(self):
+        self.assertRaises(ValueError, kmeans_restarts, [[0.0], [1.0]], 1, 0)
+
+    def testIncorrectPoolSize(self):
+        self.assertRaises(ValueError, kmeans_restarts, [[0.0], [1.0]], 1, 2, pool_size=-1)
+
+    def testEmptyData(self):
+        self.assertRaises(ValueError, kmeans_restarts, [], 1)
+
+    def testClusterEncoding(self):
+        self.assertEqual(type_encoding.CLUSTER_INDEX_LIST_SEPARATION, kmeans_restarts([[0.0], [1.0]], 1).get_cluster_encoding())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,11 +31,13 @@ import random
 import matplotlib
 matplotlib.use('Agg')
 
+import numpy
+
 from pyclustering.cluster.tests.kmedians_templates import KmediansTestTemplates
 
 from pyclustering.cluster.kmedians import kmedians
 
-from pyclustering.samples.definitions import SIMPLE_SAMPLES
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
 from pyclustering.utils.metric import type_metric, distance_metric
 
@@ -132,6 +134,42 @@ class KmediansUnitTest(unittest.TestCase):
         initial_medians = [[0.0772944481804071, 0.05224990900863469], [1.6021689021213712, 1.0347579135245601], [2.3341008076636096, 1.280022869739064]]
         KmediansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE10, initial_medians, None, False)
 
+    def testExactMediansSampleSimple3(self):
+        KmediansTestTemplates.templateExactMedians(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]])
+
+    def testExactMediansSampleLsunManhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmediansTestTemplates.templateExactMedians(FCPS_SAMPLES.SAMPLE_LSUN, [[0.5, 0.5], [2.5, 2.5], [3.5, 0.5]], metric=metric)
+
+    def testEuclideanAsUserDefinedSampleLsun(self):
+        metric = distance_metric(type_metric.EUCLIDEAN)
+        function = lambda point1, point2: numpy.sqrt(numpy.sum(numpy.square(numpy.subtract(point1, point2))))
+        KmediansTestTemplates.templateMetricAsUserDefined(FCPS_SAMPLES.SAMPLE_LSUN, [[0.5, 0.5], [2.5, 2.5], [3.5, 0.5]], metric, function)
+
+    def testMinkowskiAsUserDefinedSampleLsun(self):
+        metric = distance_metric(type_metric.MINKOWSKI, degree=4)
+        function = lambda point1, point2: numpy.sum(numpy.abs(numpy.subtract(point1, point2)) ** 4) ** 0.25
+        KmediansTestTemplates.templateMetricAsUserDefined(FCPS_SAMPLES.SAMPLE_LSUN, [[0.5, 0.5], [2.5, 2.5], [3.5, 0.5]], metric, function)
+
+    def testApproximateMediansSampleLsun(self):
+        KmediansTestTemplates.templateApproximateMedians(FCPS_SAMPLES.SAMPLE_LSUN, [[0.5, 0.5], [2.5, 2.5], [3.5, 0.5]], 100)
+
+    def testApproximateMediansSampleLsunSmallChunks(self):
+        KmediansTestTemplates.templateApproximateMedians(FCPS_SAMPLES.SAMPLE_LSUN, [[0.5, 0.5], [2.5, 2.5], [3.5, 0.5]], 100, memory_limit=512)
+
+    def testApproximateMediansAllClusters(self):
+        KmediansTestTemplates.templateApproximateMedians(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], 0)
+
+    def testApproximateMediansTheSameCoordinate(self):
+        sample = [[1.0, float(index)] for index in range(20)] + [[1.0, float(index) + 100.0] for index in range(21)]
+        kmedians_instance = kmedians(sample, [[1.0, 0.0], [1.0, 100.0]], ccore=False, approximate_threshold=0).process()
+
+        medians = kmedians_instance.get_medians()
+        self.assertEqual(1.0, medians[0][0])
+        self.assertEqual(1.0, medians[1][0])
+        self.assertAlmostEqual(9.0, medians[0][1], delta=1e-6)
+        self.assertAlmostEqual(110.0, medians[1][1], delta=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
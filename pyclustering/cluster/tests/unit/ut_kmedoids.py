@@ -32,6 +32,9 @@ matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.kmedoids_templates import KmedoidsTestTemplates
 
+from pyclustering.cluster.kmedoids import kmedoids, kmedoids_algorithm
+from pyclustering.cluster.center_initializer import pam_build_initializer
+
 from pyclustering.samples.definitions import SIMPLE_SAMPLES
 
 from pyclustering.utils import read_sample
@@ -215,6 +218,79 @@ class KmedoidsUnitTest(unittest.TestCase):
         KmedoidsTestTemplates.templateAllocateRequestedClusterAmount(sample, 2, None, False)
         KmedoidsTestTemplates.templateAllocateRequestedClusterAmount(sample, 1, None, False)
 
+    def testFastPamSampleSimple1(self):
+        KmedoidsTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [2, 9], [5, 5], False, algorithm=kmedoids_algorithm.FASTPAM)
+
+    def testFastPamSampleSimple1DistanceMatrix(self):
+        KmedoidsTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [2, 9], [5, 5], False, data_type='distance_matrix', algorithm=kmedoids_algorithm.FASTPAM)
+
+    def testFastPamSampleSimple2(self):
+        KmedoidsTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [3, 12, 20], [10, 5, 8], False, algorithm=kmedoids_algorithm.FASTPAM)
+
+    def testFastPamSampleSimple3BadInitialMedoids(self):
+        KmedoidsTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [0, 1, 2, 3], [10, 10, 10, 30], False, algorithm=kmedoids_algorithm.FASTPAM)
+
+    def testFastPamSampleSimple3DistanceMatrixNumpy(self):
+        KmedoidsTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [4, 12, 25, 37], [10, 10, 10, 30], False, data_type='distance_matrix', input_type='numpy', algorithm=kmedoids_algorithm.FASTPAM)
+
+    def testFastPamOneMedoid(self):
+        KmedoidsTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [10], [23], False, algorithm=kmedoids_algorithm.FASTPAM)
+
+    def testFastPamManhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        KmedoidsTestTemplates.templateLengthProcessWithMetric(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [2, 9], [5, 5], metric, False, algorithm=kmedoids_algorithm.FASTPAM)
+
+    def testFastPamUserDefined(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=distance_metric(type_metric.EUCLIDEAN))
+        KmedoidsTestTemplates.templateLengthProcessWithMetric(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [2, 9], [5, 5], metric, False, algorithm=kmedoids_algorithm.FASTPAM)
+
+    def testFastPamTheSameObjects(self):
+        sample = [[0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0]]
+        clusters = kmedoids(sample, [0, 2], ccore=False, algorithm=kmedoids_algorithm.FASTPAM).process().get_clusters()
+        self.assertEqual([[0, 1, 3], [2]], clusters)
+
+    def testFastPamSwapOptimumSampleSimple3(self):
+        KmedoidsTestTemplates.templateFastPamSwapOptimum(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [0, 1, 2, 3])
+
+    def testFastPamSwapOptimumSampleSimple3SmallBlocks(self):
+        KmedoidsTestTemplates.templateFastPamSwapOptimum(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [0, 1, 2, 3], memory_limit=1024)
+
+    def testFastPamSwapOptimumSampleSimple3DistanceMatrix(self):
+        KmedoidsTestTemplates.templateFastPamSwapOptimum(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [0, 1, 2, 3], data_type='distance_matrix', memory_limit=1024)
+
+    def testFastPamSwapOptimumSampleSimple4Manhattan(self):
+        KmedoidsTestTemplates.templateFastPamSwapOptimum(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [0, 5, 10, 15, 20, 25, 30], metric=distance_metric(type_metric.MANHATTAN))
+
+    def testFastPamSwapOptimumSampleSimple3Euclidean(self):
+        KmedoidsTestTemplates.templateFastPamSwapOptimum(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [0, 1, 2, 3], metric=distance_metric(type_metric.EUCLIDEAN))
+
+    def testFastPamSwapOptimumSampleSimple4Minkowski(self):
+        KmedoidsTestTemplates.templateFastPamSwapOptimum(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, [0, 5, 10, 15, 20, 25, 30], metric=distance_metric(type_metric.MINKOWSKI, degree=4))
+
+    def testAlternateMemoryLimit(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        expected = kmedoids(sample, [0, 1, 2, 3], ccore=False).process()
+        actual = kmedoids(sample, [0, 1, 2, 3], ccore=False, memory_limit=64).process()
+
+        self.assertEqual(expected.get_medoids(), actual.get_medoids())
+        self.assertEqual(expected.get_clusters(), actual.get_clusters())
+
+    def testPamBuildInitializerSampleSimple3(self):
+        KmedoidsTestTemplates.templatePamBuildInitializer(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4)
+
+    def testPamBuildInitializerSampleSimple4SmallBlocks(self):
+        KmedoidsTestTemplates.templatePamBuildInitializer(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 5, memory_limit=256)
+
+    def testPamBuildInitializerManhattan(self):
+        KmedoidsTestTemplates.templatePamBuildInitializer(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 3, metric=distance_metric(type_metric.MANHATTAN))
+
+    def testPamBuildInitializerEuclidean(self):
+        KmedoidsTestTemplates.templatePamBuildInitializer(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, metric=distance_metric(type_metric.EUCLIDEAN))
+
+    def testPamBuildInitializerIncorrectArguments(self):
+        self.assertRaises(AttributeError, pam_build_initializer, [[0.0], [1.0]], 0)
+        self.assertRaises(AttributeError, pam_build_initializer, [[0.0], [1.0]], 3)
+
 
 if __name__ == "__main__":
     unittest.main()
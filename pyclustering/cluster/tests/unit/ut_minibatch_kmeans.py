@@ -0,0 +1,135 @@
+"""!
+
+@brief Unit-tests for Mini-Batch K-Means algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.tests.minibatch_kmeans_templates import MinibatchKmeansTestTemplates
+
+from pyclustering.cluster.encoder import type_encoding
+from pyclustering.cluster.minibatch_kmeans import minibatch_kmeans
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.utils import read_sample
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class MinibatchKmeansUnitTest(unittest.TestCase):
+    def testClusterAllocationSampleSimple1(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], 'list')
+
+    def testClusterAllocationSampleSimple1Numpy(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], 'numpy')
+
+    def testClusterAllocationSampleSimple1Memmap(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], 'memmap')
+
+    def testClusterAllocationSampleSimple1Callable(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], 'callable')
+
+    def testClusterAllocationSampleSimple1Iterable(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], 'iterable')
+
+    def testClusterAllocationSampleSimple1Manhattan(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], 'numpy', metric=metric)
+
+    def testClusterAllocationSampleSimple1UserDefined(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=lambda p1, p2: sum((p1 - p2) ** 2))
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5]], [5, 5], 'list', metric=metric)
+
+    def testTheSameAsKmeansEuclideanSampleSimple3(self):
+        metric = distance_metric(type_metric.EUCLIDEAN)
+        MinibatchKmeansTestTemplates.templateTheSameAsKmeans(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], metric)
+
+    def testTheSameAsKmeansEuclideanSampleLsun(self):
+        metric = distance_metric(type_metric.EUCLIDEAN)
+        MinibatchKmeansTestTemplates.templateTheSameAsKmeans(FCPS_SAMPLES.SAMPLE_LSUN, [[1.0, 3.5], [2.0, 0.5], [3.0, 3.0]], metric)
+
+    def testTheSameAsKmeansEuclideanSquareSampleLsun(self):
+        MinibatchKmeansTestTemplates.templateTheSameAsKmeans(FCPS_SAMPLES.SAMPLE_LSUN, [[1.0, 3.5], [2.0, 0.5], [3.0, 3.0]], distance_metric(type_metric.EUCLIDEAN_SQUARE))
+
+    def testClusterOneAllocationSampleSimple1(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[1.0, 2.5]], [10], 'list')
+
+    def testClusterAllocationSampleSimple2(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, [[3.5, 4.8], [6.9, 7], [7.5, 0.5]], [10, 5, 8], 'numpy')
+
+    def testClusterAllocationSampleSimple3(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], 'memmap')
+
+    def testClusterAllocationSampleSimple3Iterable(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], 'iterable')
+
+    def testClusterAllocationSampleSimple3BigBatch(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]], [10, 10, 10, 30], 'callable', batch_size=1000)
+
+    def testClusterOneDimensionSampleSimple7(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, [[-3.0], [2.0]], [10, 10], 'numpy')
+
+    def testClusterAllocationSampleLsun(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(FCPS_SAMPLES.SAMPLE_LSUN, [[0.5, 0.5], [3.0, 0.5], [2.0, 3.5]], None, 'memmap', batch_size=64)
+
+    def testEmptyClustersAreRemoved(self):
+        MinibatchKmeansTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, [[3.7, 5.5], [6.7, 7.5], [100.0, 100.0]], [5, 5], 'numpy')
+
+    def testOneShotIterator(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1)
+        self.assertRaises(ValueError, minibatch_kmeans, iter(sample), [[3.7, 5.5], [6.7, 7.5]])
+
+    def testEmptyStream(self):
+        minibatch_instance = minibatch_kmeans(lambda: iter([]), [[3.7, 5.5], [6.7, 7.5]])
+        self.assertRaises(ValueError, minibatch_instance.process)
+
+    def testDifferentDimensions(self):
+        minibatch_instance = minibatch_kmeans([[0, 1, 5], [0, 2, 3]], [[0, 3]])
+        self.assertRaises(ValueError, minibatch_instance.process)
+
+    def testIncorrectBatchSize(self):
+        self.assertRaises(ValueError, minibatch_kmeans, [[0, 1], [0, 2]], [[0, 3]], 0.001, 0)
+
+    def testIncorrectIterations(self):
+        self.assertRaises(ValueError, minibatch_kmeans, [[0, 1], [0, 2]], [[0, 3]], itermax=0)
+
+    def testRandomStateReproducibility(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        initial_centers = [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [2.3, 3.9]]
+
+        centers1 = minibatch_kmeans(sample, initial_centers, batch_size=5, random_state=1).process().get_centers()
+        centers2 = minibatch_kmeans(sample, initial_centers, batch_size=5, random_state=1).process().get_centers()
+        self.assertEqual(centers1, centers2)
+
+    def testClusterEncoding(self):
+        minibatch_instance = minibatch_kmeans([[0, 1], [0, 2]], [[0, 3]])
+        self.assertEqual(type_encoding.CLUSTER_INDEX_LIST_SEPARATION, minibatch_instance.get_cluster_encoding())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,6 +24,8 @@
 """
 
 
+import os;
+import tempfile;
 import unittest;
 
 # Generate images without having a window appear.
@@ -31,9 +33,12 @@ import matplotlib;
 matplotlib.use('Agg');
 
 from pyclustering.cluster.tests.optics_templates import OpticsTestTemplates;
-from pyclustering.cluster.optics import optics, ordering_analyser, ordering_visualizer;
+from pyclustering.cluster.optics import optics, ordering_analyser, ordering_visualizer, optics_ordering;
 
-from pyclustering.utils import read_sample;
+from pyclustering.container.neighbor_graph import neighbor_graph;
+
+from pyclustering.utils import read_sample, calculate_distance_matrix;
+from pyclustering.utils.metric import distance_metric, type_metric;
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES;
 
@@ -57,6 +62,61 @@ class OpticsUnitTest(unittest.TestCase):
     def testClusteringSampleSimple3DistanceMatrix(self):
         OpticsTestTemplates.templateClusteringResultsDistanceMatrix(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, None, [10, 10, 10, 30], False);
 
+    def testOrderingTiesDistanceMatrix(self):
+        # grid produces many equal reachability distances and their decreases, ties are processed in order of insertion
+        sample = [[x * 0.5, y * 0.5] for x in range(4) for y in range(3)] + [[0.25, 0.25], [1.25, 0.75]] + \
+                 [[3.0, 3.0], [3.0, 3.5], [3.5, 3.0], [3.5, 3.5], [3.25, 3.25]];
+
+        optics_instance = optics(calculate_distance_matrix(sample), 0.8, 2, None, False, data_type='distance_matrix');
+        optics_instance.process();
+
+        self.assertEqual([[0, 12, 1, 3, 4, 2, 6, 5, 7, 9, 8, 13, 10, 11], [14, 18, 15, 16, 17]], optics_instance.get_clusters());
+        self.assertEqual([], optics_instance.get_noise());
+
+    def testOrderingTiesPoints(self):
+        # neighbors are processed in order of search of kd-tree that is filled by points
+        sample = [[x * 0.5, y * 0.5] for x in range(4) for y in range(3)] + [[0.25, 0.25], [1.25, 0.75]] + \
+                 [[3.0, 3.0], [3.0, 3.5], [3.5, 3.0], [3.5, 3.5], [3.25, 3.25]];
+
+        optics_instance = optics(sample, 0.8, 2, None, False);
+        optics_instance.process();
+
+        self.assertEqual([[0, 12, 4, 3, 1, 7, 5, 6, 2, 13, 11, 10, 8, 9], [14, 18, 17, 16, 15]], optics_instance.get_clusters());
+        self.assertEqual([], optics_instance.get_noise());
+
+    def testOrderingDuplicatePoints(self):
+        sample = [[0, 1], [0, 1], [1, 0], [1, 1], [1, 2], [1, 0], [0, 2], [1, 0]];
+
+        optics_instance = optics(sample, 1.5, 2, None, False);
+        optics_instance.process();
+
+        self.assertEqual([1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 0.0], optics_instance.get_ordering());
+        self.assertEqual([[0, 1, 6, 3, 4, 7, 5, 2]], optics_instance.get_clusters());
+        self.assertEqual([], optics_instance.get_noise());
+
+    def testOrderingTiesNeighborGraph(self):
+        # rows of the graph are sorted by distance, neighbors with equal distances are processed in order of indexes as in case of distance matrix
+        sample = [[x * 0.5, y * 0.5] for x in range(4) for y in range(3)] + [[0.25, 0.25], [1.25, 0.75]] + \
+                 [[3.0, 3.0], [3.0, 3.5], [3.5, 3.0], [3.5, 3.5], [3.25, 3.25]];
+
+        optics_instance = optics(neighbor_graph.create(sample, 1.6), 0.8, 2, None, False, data_type='neighbor_graph');
+        optics_instance.process();
+
+        self.assertEqual([[0, 12, 1, 3, 4, 2, 6, 5, 7, 9, 8, 13, 10, 11], [14, 18, 15, 16, 17]], optics_instance.get_clusters());
+        self.assertEqual([], optics_instance.get_noise());
+
+    def testClusteringSampleSimple1NeighborGraph(self):
+        OpticsTestTemplates.templateClusteringResultsNeighborGraph(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 0.4, 2, None, [5, 5], False);
+
+    def testClusteringSampleSimple2NeighborGraph(self):
+        OpticsTestTemplates.templateClusteringResultsNeighborGraph(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 1, 2, None, [5, 8, 10], False);
+
+    def testClusteringSampleSimple3NeighborGraph(self):
+        OpticsTestTemplates.templateClusteringResultsNeighborGraph(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, None, [10, 10, 10, 30], False);
+
+    def testClusteringSampleSimple3NeighborGraphAmountClusters(self):
+        OpticsTestTemplates.templateClusteringResultsNeighborGraph(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 5.0, 3, 4, [10, 10, 10, 30], True);
+
     def testClusteringSampleSimple4(self):
         OpticsTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE4, 0.7, 3, None, [15, 15, 15, 15, 15], False);
 
@@ -159,6 +219,72 @@ class OpticsUnitTest(unittest.TestCase):
         assert None == amount_clusters;
         assert 0 == len(borders);
 
+    def testOrderingExtractionSampleSimple3(self):
+        OpticsTestTemplates.templateOrderingExtraction(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, None, False);
+
+    def testOrderingExtractionHepta(self):
+        OpticsTestTemplates.templateOrderingExtraction(FCPS_SAMPLES.SAMPLE_HEPTA, 1.0, 3, None, False);
+
+    def testOrderingExtractionLsunAmountClusters(self):
+        OpticsTestTemplates.templateOrderingExtraction(FCPS_SAMPLES.SAMPLE_LSUN, 1.0, 3, 3, False);
+
+    def testOrderingPiecewiseClusterAmount(self):
+        ordering = optics_ordering([0, 1, 2, 3, 4], [0.5, 0.5, None, 0.3, 0.3], [None, 0.5, 0.6, 0.9, 0.3], 1.0, 2);
+
+        self.assertEqual(0, ordering.get_cluster_amount(0.2));
+        self.assertEqual(1, ordering.get_cluster_amount(0.3));
+        self.assertEqual(2, ordering.get_cluster_amount(0.5));
+        self.assertEqual(1, ordering.get_cluster_amount(0.9));
+        self.assertEqual(1, ordering.get_cluster_amount(1.0));
+
+        self.assertEqual(([[3, 4]], [0, 1, 2]), ordering.extract_clusters(0.4));
+        self.assertEqual(([[0, 1, 2], [3, 4]], []), ordering.extract_clusters(0.6));
+        self.assertEqual(([[0, 1, 2, 3, 4]], []), ordering.extract_clusters(1.0));
+        self.assertEqual(([], [0, 1, 2, 3, 4]), ordering.extract_clusters(0.0));
+
+        self.assertEqual(0.5, ordering.calculate_radius(2));
+        self.assertEqual(0.9, ordering.calculate_radius(1));
+        self.assertIsNone(ordering.calculate_radius(3));
+
+        self.assertEqual([0.5, 0.6, 0.9, 0.3], ordering.get_ordering());
+
+    def testOrderingIncorrectRadius(self):
+        ordering = optics_ordering([0, 1], [0.5, 0.5], [None, 0.5], 1.0, 1);
+
+        self.assertRaises(ValueError, ordering.extract_clusters, 1.5);
+        self.assertRaises(ValueError, ordering.get_cluster_amount, -0.1);
+
+    def testOrderingSaveLoadFile(self):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE2);
+
+        optics_instance = optics(sample, 1.0, 2, None, False);
+        optics_instance.process();
+
+        ordering = optics_instance.get_optics_ordering();
+
+        directory = tempfile.mkdtemp();
+        try:
+            path = os.path.join(directory, 'ordering.npz');
+            ordering.save(path);
+            loaded_ordering = optics_ordering.load(path);
+        finally:
+            os.remove(os.path.join(directory, 'ordering.npz'));
+            os.rmdir(directory);
+
+        self.assertEqual(ordering.get_indexes().tolist(), loaded_ordering.get_indexes().tolist());
+        self.assertEqual(ordering.get_core_distances().tolist(), loaded_ordering.get_core_distances().tolist());
+        self.assertEqual(ordering.get_reachability_distances().tolist(), loaded_ordering.get_reachability_distances().tolist());
+        self.assertEqual(ordering.extract_clusters(0.5), loaded_ordering.extract_clusters(0.5));
+
+    def testMetricManhattanSampleSimple3(self):
+        OpticsTestTemplates.templateClusteringMetric(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, None, distance_metric(type_metric.MANHATTAN), False);
+
+    def testMetricChebyshevLsunAmountClusters(self):
+        OpticsTestTemplates.templateClusteringMetric(FCPS_SAMPLES.SAMPLE_LSUN, 1.0, 3, 3, distance_metric(type_metric.CHEBYSHEV), True);
+
+    def testMetricMinkowskiSampleSimple2(self):
+        OpticsTestTemplates.templateClusteringMetric(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 1.0, 2, None, distance_metric(type_metric.MINKOWSKI, degree=4), False);
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""!
+
+@brief Unit-tests for Partitioned DBSCAN algorithm.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.cluster.tests.partitioned_dbscan_templates import PartitionedDbscanTestTemplates
+
+from pyclustering.cluster.partitioned_dbscan import partitioned_dbscan
+from pyclustering.cluster.encoder import type_encoding
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+
+class PartitionedDbscanUnitTest(unittest.TestCase):
+    def testClusteringSampleSimple1(self):
+        PartitionedDbscanTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 0.4, 2, [5, 5], 3, 1)
+        PartitionedDbscanTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 10, 2, [10], 3, 1)
+
+    def testClusteringSampleSimple2(self):
+        PartitionedDbscanTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, 1, 2, [5, 8, 10], 4, 1)
+
+    def testClusteringSampleSimple3(self):
+        PartitionedDbscanTestTemplates.templateClusteringResults(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 3, [10, 10, 10, 30], 5, 1)
+
+    def testClusteringSampleLsun(self):
+        PartitionedDbscanTestTemplates.templateClusteringResults(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 3, [100, 101, 202], 8, 1)
+
+    def testClusteringSampleLsunPool(self):
+        PartitionedDbscanTestTemplates.templateClusteringResults(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, 3, [100, 101, 202], 4, 2)
+
+    def testClusteringSampleTwoDiamondsPool(self):
+        PartitionedDbscanTestTemplates.templateClusteringResults(FCPS_SAMPLES.SAMPLE_TWO_DIAMONDS, 0.15, 7, [400, 400], 3, 3)
+
+
+    def testTheSameAsDbscanOneDimension(self):
+        for seed in range(20):
+            PartitionedDbscanTestTemplates.templateTheSameAsDbscan(seed, 60, 1, 0.1, 2, 4, 1)
+
+    def testTheSameAsDbscanTwoDimensions(self):
+        for seed in range(20):
+            PartitionedDbscanTestTemplates.templateTheSameAsDbscan(seed, 100, 2, 0.3, 3, 5, 1)
+
+    def testTheSameAsDbscanThreeDimensions(self):
+        for seed in range(20):
+            PartitionedDbscanTestTemplates.templateTheSameAsDbscan(seed, 100, 3, 0.5, 4, 7, 1)
+
+    def testTheSameAsDbscanManyPartitions(self):
+        for seed in range(10):
+            PartitionedDbscanTestTemplates.templateTheSameAsDbscan(seed, 30, 2, 1.0, 2, 30, 1)
+
+    def testTheSameAsDbscanWithoutNeighbors(self):
+        PartitionedDbscanTestTemplates.templateTheSameAsDbscan(1, 50, 2, 0.2, 0, 4, 1)
+
+    def testTheSameAsDbscanPool(self):
+        PartitionedDbscanTestTemplates.templateTheSameAsDbscan(1, 300, 2, 0.2, 3, 6, 3)
+
+
+    def testEmptyData(self):
+        dbscan_instance = partitioned_dbscan([], 0.5, 2, pool_size=1).process()
+        self.assertEqual([], dbscan_instance.get_clusters())
+        self.assertEqual([], dbscan_instance.get_noise())
+
+    def testMorePartitionsThanPoints(self):
+        dbscan_instance = partitioned_dbscan([[0.0], [0.5], [5.0]], 1.0, 1, partitions=10, pool_size=1).process()
+        self.assertEqual([[0, 1]], dbscan_instance.get_clusters())
+        self.assertEqual([2], dbscan_instance.get_noise())
+
+    def testIncorrectArguments(self):
+        self.assertRaises(ValueError, partitioned_dbscan, [[0.0]], -1.0, 2)
+        self.assertRaises(ValueError, partitioned_dbscan, [[0.0]], 1.0, 2, pool_size=-1)
+        self.assertRaises(ValueError, partitioned_dbscan, [[0.0]], 1.0, 2, partitions=-1)
+
+    def testClusterEncoding(self):
+        self.assertEqual(type_encoding.CLUSTER_INDEX_LIST_SEPARATION, partitioned_dbscan([[0.0]], 1.0, 2).get_cluster_encoding())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -47,6 +47,13 @@ class RockUnitTest(unittest.TestCase):
     def testClusterAllocationSampleSimple3(self):
         RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1, 4, 0.5, [10, 10, 10, 30], False);
         
+    def testClusterAllocationSampleSimple1NeighborGraph(self):
+        RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1, 2, 0.5, [5, 5], False, data_type='neighbor_graph');
+        RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 5, 1, 0.5, [10], True, data_type='neighbor_graph');
+
+    def testClusterAllocationSampleSimple3NeighborGraph(self):
+        RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1, 4, 0.5, [10, 10, 10, 30], False, data_type='neighbor_graph');
+
     def testClusterAllocationSampleSimple3WrongRadius(self):
         RockTestTemplates.templateLengthProcessData(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 1.7, 4, 0.5, [10, 10, 10, 30], False);
         
@@ -72,7 +72,7 @@ class silhouette_unit_tests(unittest.TestCase):
         self.template_correct_scores(SIMPLE_SAMPLES.SAMPLE_SIMPLE8, SIMPLE_ANSWERS.ANSWER_SIMPLE8)
 
 
-    def template_correct_ksearch(self, sample_path, answer_path, kmin, kmax, algorithm):
+    def template_correct_ksearch(self, sample_path, answer_path, kmin, kmax, algorithm, **kwargs):
         attempts = 5
         testing_result = False
 
@@ -80,7 +80,7 @@ class silhouette_unit_tests(unittest.TestCase):
         clusters = answer_reader(answer_path).get_clusters()
 
         for _ in range(attempts):
-            ksearch_instance = silhouette_ksearch(sample, kmin, kmax, algorithm=algorithm).process()
+            ksearch_instance = silhouette_ksearch(sample, kmin, kmax, algorithm=algorithm, **kwargs).process()
             amount = ksearch_instance.get_amount()
             score = ksearch_instance.get_score()
             scores = ksearch_instance.get_scores()
@@ -107,6 +107,18 @@ class silhouette_unit_tests(unittest.TestCase):
         self.template_correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_ANSWERS.ANSWER_SIMPLE1, 2, 10,
                                       silhouette_ksearch_type.KMEDIANS)
 
+    def test_correct_ksearch_simple01_kmeans_python(self):
+        self.template_correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_ANSWERS.ANSWER_SIMPLE1, 2, 10,
+                                      silhouette_ksearch_type.KMEANS, ccore=False, memory_limit=64)
+
+    def test_correct_ksearch_simple01_kmedians_python(self):
+        self.template_correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_ANSWERS.ANSWER_SIMPLE1, 2, 10,
+                                      silhouette_ksearch_type.KMEDIANS, ccore=False, memory_limit=64)
+
+    def test_correct_ksearch_simple01_kmedoids_python(self):
+        self.template_correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, SIMPLE_ANSWERS.ANSWER_SIMPLE1, 2, 10,
+                                      silhouette_ksearch_type.KMEDOIDS, ccore=False, memory_limit=64)
+
     def test_correct_ksearch_simple02(self):
         self.template_correct_ksearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, SIMPLE_ANSWERS.ANSWER_SIMPLE2, 2, 10,
                                       silhouette_ksearch_type.KMEANS)
@@ -31,7 +31,7 @@ import matplotlib
 matplotlib.use('Agg')
 
 from pyclustering.cluster.tests.xmeans_templates import XmeansTestTemplates
-from pyclustering.cluster.xmeans import splitting_type
+from pyclustering.cluster.xmeans import xmeans, splitting_type
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
@@ -160,6 +160,19 @@ class XmeansUnitTest(unittest.TestCase):
         XmeansTestTemplates.templateClusterAllocationOneDimensionData(False);
 
 
+    def testBicPoolSizeSampleSimple3(self):
+        XmeansTestTemplates.templatePoolSize(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1]], splitting_type.BAYESIAN_INFORMATION_CRITERION, 20, 2)
+
+    def testMndlPoolSizeSampleSimple3(self):
+        XmeansTestTemplates.templatePoolSize(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, [[0.2, 0.1]], splitting_type.MINIMUM_NOISELESS_DESCRIPTION_LENGTH, 20, 3)
+
+    def testBicPoolSizeSampleLsun(self):
+        XmeansTestTemplates.templatePoolSize(FCPS_SAMPLES.SAMPLE_LSUN, [[1.0, 1.0], [3.0, 3.0]], splitting_type.BAYESIAN_INFORMATION_CRITERION, 10, 2)
+
+    def testIncorrectPoolSize(self):
+        self.assertRaises(ValueError, xmeans, [[0.0], [1.0]], [[0.0]], 20, 0.025, splitting_type.BAYESIAN_INFORMATION_CRITERION, False, pool_size=0)
+
+
     def testKmax05Amount3Offset02Initial01(self):
         XmeansTestTemplates.templateMaxAllocatedClusters(False, 10, 3, 2, 1, 2)
 
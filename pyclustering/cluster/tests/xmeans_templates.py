@@ -63,6 +63,22 @@ class XmeansTestTemplates:
             assert obtained_cluster_sizes == expected_cluster_length;
 
 
+    @staticmethod
+    def templatePoolSize(input_sample, start_centers, type_splitting, kmax, pool_size):
+        sample = read_sample(input_sample)
+
+        results = []
+        for size in [1, pool_size]:
+            random.seed(1000)
+            xmeans_instance = xmeans(sample, start_centers, kmax, 0.025, type_splitting, False, pool_size=size)
+            xmeans_instance.process()
+
+            results.append((xmeans_instance.get_clusters(), xmeans_instance.get_centers()))
+
+        assertion.eq(results[0][0], results[1][0])
+        assertion.eq(results[0][1], results[1][1])
+
+
     @staticmethod
     def templateClusterAllocationOneDimensionData(ccore_flag):
         input_data = [ [0.0] for _ in range(10) ] + [ [5.0] for _ in range(10) ] + [ [10.0] for _ in range(10) ] + [ [15.0] for _ in range(10) ]
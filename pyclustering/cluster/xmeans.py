@@ -40,7 +40,7 @@ from pyclustering.core.wrapper import ccore_library
 
 import pyclustering.core.xmeans_wrapper as wrapper
 
-from pyclustering.utils import euclidean_distance_square, euclidean_distance
+from pyclustering.utils.shared_dataset import shared_dataset
 
 
 class splitting_type(IntEnum):
@@ -75,6 +75,71 @@ class splitting_type(IntEnum):
     MINIMUM_NOISELESS_DESCRIPTION_LENGTH = 1
 
 
+def _split_cluster_in_worker(indexes, seed, tolerance):
+    """!
+    @brief Divides cluster into two children in worker process using dataset from shared memory.
+
+    @return (tuple) Children clusters, their centers and statistics.
+
+    """
+    return _split_cluster(shared_dataset.get_worker_dataset(), indexes, seed, tolerance)
+
+
+def _split_cluster(data, indexes, seed, tolerance):
+    """!
+    @brief Divides cluster into two children using K-Means algorithm.
+
+    @param[in] data (numpy.array): Input data.
+    @param[in] indexes (numpy.array): Indexes of points of the cluster.
+    @param[in] seed (uint): Seed for K-Means++ initialization of children centers.
+    @param[in] tolerance (double): Stop condition of K-Means algorithm.
+
+    @return (tuple) Children clusters, their centers and statistics (see '_calculate_statistics'). Cluster that
+             consists of one point is not divided.
+
+    """
+    if len(indexes) == 1:
+        return [indexes.tolist()], [data[indexes[0]].tolist()], None
+
+    local_data = data[indexes]
+
+    state = random.getstate()
+    random.seed(seed)
+
+    try:
+        local_centers = kmeans_plusplus_initializer(local_data, 2, kmeans_plusplus_initializer.FARTHEST_CENTER_CANDIDATE).initialize()
+    finally:
+        random.setstate(state)
+
+    kmeans_instance = kmeans(local_data, local_centers, tolerance=tolerance, ccore=False)
+    kmeans_instance.process()
+
+    clusters = [indexes[cluster] for cluster in kmeans_instance.get_clusters()]
+    centers = kmeans_instance.get_centers()
+
+    return [cluster.tolist() for cluster in clusters], centers, _calculate_statistics(data, clusters, centers)
+
+
+def _calculate_statistics(data, clusters, centers):
+    """!
+    @brief Calculates statistics of clusters that are used by splitting criteria instead of points.
+
+    @param[in] data (numpy.array): Input data.
+    @param[in] clusters (list): Clusters, each cluster contains indexes of points.
+    @param[in] centers (list): Centers of the clusters.
+
+    @return (list) Amount of points, sum of square Euclidean distances and sum of Euclidean distances between points
+             and center for each cluster.
+
+    """
+    statistics = []
+    for cluster, center in zip(clusters, centers):
+        distances = numpy.sum(numpy.square(data[cluster] - center), axis=1)
+        statistics.append((len(cluster), float(numpy.sum(distances)), float(numpy.sum(numpy.sqrt(distances)))))
+
+    return statistics
+
+
 class xmeans:
     """!
     @brief Class represents clustering algorithm X-Means.
@@ -120,12 +185,19 @@ class xmeans:
 
     Visualization of clustering results that were obtained using code above and where X-Means algorithm allocates four clusters.
     @image html xmeans_clustering_simple3.png "Fig. 1. X-Means clustering results (data 'Simple3')."
+
+    Python implementation divides clusters independently, therefore they can be processed by pool of processes where
+    dataset is placed to shared memory once:
+    @code
+        xmeans_instance = xmeans(sample, initial_centers, 20, ccore=False, pool_size=4)
+        xmeans_instance.process()
+    @endcode
     
     @see center_initializer
     
     """
     
-    def __init__(self, data, initial_centers = None, kmax = 20, tolerance = 0.025, criterion = splitting_type.BAYESIAN_INFORMATION_CRITERION, ccore = True):
+    def __init__(self, data, initial_centers = None, kmax = 20, tolerance = 0.025, criterion = splitting_type.BAYESIAN_INFORMATION_CRITERION, ccore = True, **kwargs):
         """!
         @brief Constructor of clustering algorithm X-Means.
         
@@ -136,6 +208,10 @@ class xmeans:
         @param[in] tolerance (double): Stop condition for each iteration: if maximum value of change of centers of clusters is less than tolerance than algorithm will stop processing.
         @param[in] criterion (splitting_type): Type of splitting creation.
         @param[in] ccore (bool): Defines should be CCORE (C++ pyclustering library) used instead of Python code or not.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'pool_size').
+
+        <b>Keyword Args:</b><br>
+            - pool_size (uint): Amount of processes that are used by Python implementation to divide clusters (by default: 1).
         
         """
         
@@ -150,6 +226,10 @@ class xmeans:
         self.__kmax = kmax
         self.__tolerance = tolerance
         self.__criterion = criterion
+        self.__pool_size = kwargs.get('pool_size', 1)
+
+        if self.__pool_size <= 0:
+            raise ValueError("Pool size should be greater than 0 (current value: '%d')." % self.__pool_size)
          
         self.__ccore = ccore
         if self.__ccore:
@@ -171,20 +251,46 @@ class xmeans:
             self.__clusters, self.__centers = wrapper.xmeans(self.__pointer_data, self.__centers, self.__kmax, self.__tolerance, self.__criterion)
 
         else:
-            self.__clusters = []
-            while len(self.__centers) <= self.__kmax:
-                current_cluster_number = len(self.__centers)
-                
-                self.__clusters, self.__centers = self.__improve_parameters(self.__centers)
-                allocated_centers = self.__improve_structure(self.__clusters, self.__centers)
-                
-                if current_cluster_number == len(allocated_centers):
-                #if ( (current_cluster_number == len(allocated_centers)) or (len(allocated_centers) > self.__kmax) ):
-                    break
-                else:
-                    self.__centers = allocated_centers
-            
-            self.__clusters, self.__centers = self.__improve_parameters(self.__centers)
+            self.__process_by_python()
+
+
+    def __process_by_python(self):
+        """!
+        @brief Performs cluster analysis using Python code, clusters are divided by pool of processes if it is required.
+
+        """
+        data = numpy.ascontiguousarray(self.__pointer_data, dtype=numpy.float64)
+
+        if self.__pool_size == 1:
+            self.__process_structure(data, None)
+            return
+
+        with shared_dataset(data) as dataset, dataset.create_executor(self.__pool_size) as executor:
+            self.__process_structure(data, executor)
+
+
+    def __process_structure(self, data, executor):
+        """!
+        @brief Improves parameters and structure of clusters until amount of clusters is changed.
+
+        @param[in] data (numpy.array): Input data.
+        @param[in] executor (ProcessPoolExecutor): Pool of processes that divides clusters or None if clusters are
+                    divided by the current process.
+
+        """
+        self.__clusters = []
+        while len(self.__centers) <= self.__kmax:
+            current_cluster_number = len(self.__centers)
+
+            self.__clusters, self.__centers = self.__improve_parameters(data, self.__centers)
+            allocated_centers = self.__improve_structure(data, self.__clusters, self.__centers, executor)
+
+            if current_cluster_number == len(allocated_centers):
+                break
+            else:
+                self.__centers = allocated_centers
+
+        self.__clusters, self.__centers = self.__improve_parameters(data, self.__centers)
 
 
     def get_clusters(self):
@@ -228,86 +334,62 @@ class xmeans:
         return type_encoding.CLUSTER_INDEX_LIST_SEPARATION
 
 
-    def __improve_parameters(self, centers, available_indexes = None):
+    def __improve_parameters(self, data, centers):
         """!
-        @brief Performs k-means clustering in the specified region.
+        @brief Performs k-means clustering of the whole data.
         
+        @param[in] data (numpy.array): Input data.
         @param[in] centers (list): Centers of clusters.
-        @param[in] available_indexes (list): Indexes that defines which points can be used for k-means clustering, if None - then all points are used.
         
-        @return (list) List of allocated clusters, each cluster contains indexes of objects in list of data.
+        @return (tuple) List of allocated clusters, each cluster contains indexes of objects in list of data, and list of centers.
         
         """
 
-        if available_indexes and len(available_indexes) == 1:
-            index_center = available_indexes[0]
-            return [ available_indexes ], self.__pointer_data[index_center]
-
-        local_data = self.__pointer_data
-        if available_indexes:
-            local_data = [ self.__pointer_data[i] for i in available_indexes ]
-
-        local_centers = centers
-        if centers is None:
-            local_centers = kmeans_plusplus_initializer(local_data, 2, kmeans_plusplus_initializer.FARTHEST_CENTER_CANDIDATE).initialize()
-
-        kmeans_instance = kmeans(local_data, local_centers, tolerance=self.__tolerance, ccore=False)
+        kmeans_instance = kmeans(data, centers, tolerance=self.__tolerance, ccore=False)
         kmeans_instance.process()
 
-        local_centers = kmeans_instance.get_centers()
-        
-        clusters = kmeans_instance.get_clusters()
-        if available_indexes:
-            clusters = self.__local_to_global_clusters(clusters, available_indexes)
-        
-        return clusters, local_centers
-
-
-    def __local_to_global_clusters(self, local_clusters, available_indexes):
-        """!
-        @brief Converts clusters in local region define by 'available_indexes' to global clusters.
-
-        @param[in] local_clusters (list): Local clusters in specific region.
-        @param[in] available_indexes (list): Map between local and global point's indexes.
-
-        @return Global clusters.
-
-        """
-
-        clusters = []
-        for local_cluster in local_clusters:
-            current_cluster = []
-            for index_point in local_cluster:
-                current_cluster.append(available_indexes[index_point])
-
-            clusters.append(current_cluster)
-
-        return clusters
+        return kmeans_instance.get_clusters(), kmeans_instance.get_centers()
 
     
-    def __improve_structure(self, clusters, centers):
+    def __improve_structure(self, data, clusters, centers, executor):
         """!
         @brief Check for best structure: divides each cluster into two and checks for best results using splitting criterion.
+        @details Clusters are divided independently, therefore they are processed by pool of processes if it is
+                  specified. Splitting criterion is calculated using statistics of clusters instead of points.
         
+        @param[in] data (numpy.array): Input data.
         @param[in] clusters (list): Clusters that have been allocated (each cluster contains indexes of points from data).
         @param[in] centers (list): Centers of clusters.
+        @param[in] executor (ProcessPoolExecutor): Pool of processes that divides clusters or None.
         
         @return (list) Allocated centers for clustering.
         
         """
 
-        allocated_centers = []
         amount_free_centers = self.__kmax - len(centers)
+        if amount_free_centers <= 0:
+            return centers
 
+        statistics = _calculate_statistics(data, clusters, centers)
+        seeds = [random.randint(0, 2 ** 31 - 1) for _ in range(len(clusters))]
+        indexes = [numpy.asarray(cluster, dtype=numpy.int64) for cluster in clusters]
+
+        if executor is None:
+            children = [_split_cluster(data, cluster, seed, self.__tolerance) for cluster, seed in zip(indexes, seeds)]
+        else:
+            futures = [executor.submit(_split_cluster_in_worker, cluster, seed, self.__tolerance)
+                       for cluster, seed in zip(indexes, seeds)]
+            children = [future.result() for future in futures]
+
+        allocated_centers = []
         for index_cluster in range(len(clusters)):
-            # solve k-means problem for children where data of parent are used.
-            (parent_child_clusters, parent_child_centers) = self.__improve_parameters(None, clusters[index_cluster])
+            (parent_child_clusters, parent_child_centers, parent_child_statistics) = children[index_cluster]
               
             # If it's possible to split current data
             if len(parent_child_clusters) > 1:
                 # Calculate splitting criterion
-                parent_scores = self.__splitting_criterion([ clusters[index_cluster] ], [ centers[index_cluster] ])
-                child_scores = self.__splitting_criterion([ parent_child_clusters[0], parent_child_clusters[1] ], parent_child_centers)
+                parent_scores = self.__splitting_criterion([ statistics[index_cluster] ])
+                child_scores = self.__splitting_criterion(parent_child_statistics)
               
                 split_require = False
                 
@@ -335,48 +417,46 @@ class xmeans:
         return allocated_centers
      
      
-    def __splitting_criterion(self, clusters, centers):
+    def __splitting_criterion(self, statistics):
         """!
         @brief Calculates splitting criterion for input clusters.
         
-        @param[in] clusters (list): Clusters for which splitting criterion should be calculated.
-        @param[in] centers (list): Centers of the clusters.
+        @param[in] statistics (list): Statistics of clusters for which splitting criterion should be calculated (see '_calculate_statistics').
         
         @return (double) Returns splitting criterion. High value of splitting cretion means that current structure is much better.
         
-        @see __bayesian_information_criterion(clusters, centers)
-        @see __minimum_noiseless_description_length(clusters, centers)
+        @see __bayesian_information_criterion(statistics)
+        @see __minimum_noiseless_description_length(statistics)
         
         """
         
         if self.__criterion == splitting_type.BAYESIAN_INFORMATION_CRITERION:
-            return self.__bayesian_information_criterion(clusters, centers)
+            return self.__bayesian_information_criterion(statistics)
         
         elif self.__criterion == splitting_type.MINIMUM_NOISELESS_DESCRIPTION_LENGTH:
-            return self.__minimum_noiseless_description_length(clusters, centers)
+            return self.__minimum_noiseless_description_length(statistics)
         
         else:
             assert 0;
 
 
-    def __minimum_noiseless_description_length(self, clusters, centers):
+    def __minimum_noiseless_description_length(self, statistics):
         """!
         @brief Calculates splitting criterion for input clusters using minimum noiseless description length criterion.
         
-        @param[in] clusters (list): Clusters for which splitting criterion should be calculated.
-        @param[in] centers (list): Centers of the clusters.
+        @param[in] statistics (list): Statistics of clusters for which splitting criterion should be calculated.
         
         @return (double) Returns splitting criterion in line with bayesian information criterion. 
                 Low value of splitting cretion means that current structure is much better.
         
-        @see __bayesian_information_criterion(clusters, centers)
+        @see __bayesian_information_criterion(statistics)
         
         """
         
         scores = float('inf')
         
         W = 0.0
-        K = len(clusters)
+        K = len(statistics)
         N = 0.0
 
         sigma_sqrt = 0.0
@@ -384,17 +464,12 @@ class xmeans:
         alpha = 0.9
         betta = 0.9
         
-        for index_cluster in range(0, len(clusters), 1):
-            Ni = len(clusters[index_cluster])
+        for Ni, _, Wi in statistics:
             if Ni == 0:
                 return float('inf')
             
-            Wi = 0.0
-            for index_object in clusters[index_cluster]:
-                # euclidean_distance_square should be used in line with paper, but in this case results are
-                # very poor, therefore square root is used to improved.
-                Wi += euclidean_distance(self.__pointer_data[index_object], centers[index_cluster])
-            
+            # euclidean_distance_square should be used in line with paper, but in this case results are
+            # very poor, therefore sum of Euclidean distances is used to improved.
             sigma_sqrt += Wi
             W += Wi / Ni
             N += Ni
@@ -411,33 +486,30 @@ class xmeans:
         return scores
 
 
-    def __bayesian_information_criterion(self, clusters, centers):
+    def __bayesian_information_criterion(self, statistics):
         """!
         @brief Calculates splitting criterion for input clusters using bayesian information criterion.
         
-        @param[in] clusters (list): Clusters for which splitting criterion should be calculated.
-        @param[in] centers (list): Centers of the clusters.
+        @param[in] statistics (list): Statistics of clusters for which splitting criterion should be calculated.
         
         @return (double) Splitting criterion in line with bayesian information criterion.
                 High value of splitting criterion means that current structure is much better.
                 
-        @see __minimum_noiseless_description_length(clusters, centers)
+        @see __minimum_noiseless_description_length(statistics)
         
         """
 
-        scores = [float('inf')] * len(clusters)     # splitting criterion
+        scores = [float('inf')] * len(statistics)     # splitting criterion
         dimension = len(self.__pointer_data[0])
           
         # estimation of the noise variance in the data set
         sigma_sqrt = 0.0
-        K = len(clusters)
+        K = len(statistics)
         N = 0.0
           
-        for index_cluster in range(0, len(clusters), 1):
-            for index_object in clusters[index_cluster]:
-                sigma_sqrt += euclidean_distance_square(self.__pointer_data[index_object], centers[index_cluster]);
-
-            N += len(clusters[index_cluster])
+        for n, square_distances, _ in statistics:
+            sigma_sqrt += square_distances
+            N += n
       
         if N - K > 0:
             sigma_sqrt /= (N - K)
@@ -451,8 +523,8 @@ class xmeans:
                 sigma_multiplier = dimension * 0.5 * log(sigma_sqrt)
             
             # splitting criterion    
-            for index_cluster in range(0, len(clusters), 1):
-                n = len(clusters[index_cluster])
+            for index_cluster in range(0, len(statistics), 1):
+                n = statistics[index_cluster][0]
 
                 L = n * log(n) - n * log(N) - n * 0.5 * log(2.0 * numpy.pi) - n * sigma_multiplier - (n - K) * 0.5
                 
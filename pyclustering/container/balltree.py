@@ -0,0 +1,578 @@
+"""!
+
+@brief Data Structure: Ball-Tree
+@details Metric tree for neighbor search in line with any distance metric that satisfies triangle inequality.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import heapq
+import numpy
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class balltree:
+    """!
+    @brief Array-backed ball-tree that is bulk-loaded from points and searches neighbors in line with distance metric.
+    @details Tree is built once level by level: each node is split by median of its widest dimension until it contains
+              not more than leaf size points. Each node is bounded by ball whose center is mean of its points and whose
+              radius is the largest distance from the center to the points. Distance from a point to any point of the
+              node is not less than distance to the center minus radius of the ball (triangle inequality), therefore
+              the tree can be used with any metric: Euclidean, Square Euclidean, Manhattan, Chebyshev, Minkowski
+              (degree is not less than 1), Canberra and user-defined metric. Chi-square distance is not supported since
+              it does not satisfy triangle inequality.
+
+              Nodes are implicit - children of node 'i' are nodes '2i + 1' and '2i + 2', points of each node occupy
+              contiguous range of permutation of points, therefore distances to points of leaves are calculated by
+              NumPy at once.
+
+    Example:
+    @code
+        from pyclustering.container.balltree import balltree
+        from pyclustering.samples.definitions import SIMPLE_SAMPLES
+        from pyclustering.utils import read_sample
+        from pyclustering.utils.metric import distance_metric, type_metric
+
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+
+        # Build tree for Manhattan distance.
+        tree_instance = balltree(sample, distance_metric(type_metric.MANHATTAN))
+
+        # Find three nearest neighbors of the first two points.
+        indexes, distances = tree_instance.query_knn(sample[:2], 3)
+
+        # Find all pairs of points whose distance is not greater than 0.5.
+        pairs, distances = tree_instance.query_pairs(0.5)
+    @endcode
+
+    @see kdtree_balanced
+    @see neighbor_graph
+
+    """
+
+    ## Default maximum amount of points in a leaf node.
+    DEFAULT_LEAF_SIZE = 16
+
+    def __init__(self, data, metric=None, leaf_size=DEFAULT_LEAF_SIZE):
+        """!
+        @brief Builds ball-tree for the specified points.
+
+        @param[in] data (array_like): Points that should be stored in the tree.
+        @param[in] metric (distance_metric): Metric that is used for distance calculation between points (by default Euclidean).
+        @param[in] leaf_size (uint): Maximum amount of points in a leaf node.
+
+        """
+
+        if leaf_size <= 0:
+            raise ValueError("Leaf size '%s' should be greater than 0." % str(leaf_size))
+
+        self.__metric = metric if metric is not None else distance_metric(type_metric.EUCLIDEAN)
+        self.__verify_metric(self.__metric)
+
+        # square Euclidean distance does not satisfy triangle inequality, so the tree is built for Euclidean distance
+        self.__squared = (self.__metric.get_type() == type_metric.EUCLIDEAN_SQUARE)
+        self.__calculate = self.__create_calculator()
+        self.__leaf_size = leaf_size
+
+        self.__coordinates = numpy.array(data, dtype=numpy.float64).reshape(len(data), -1) if len(data) > 0 else numpy.empty((0, 0))
+        self.__indexes = numpy.arange(len(self.__coordinates))
+        self.__sorted = self.__coordinates
+
+        self.__leaves = []      # True for leaf nodes
+        self.__begins = []
+        self.__ends = []
+        self.__radiuses = []
+        self.__centers = numpy.empty((0, self.__coordinates.shape[1]))
+
+        if len(self.__coordinates) > 0:
+            self.__build()
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of points in the tree.
+
+        """
+
+        return len(self.__coordinates)
+
+
+    def get_metric(self):
+        """!
+        @brief Returns metric that is used for distance calculation between points.
+
+        """
+
+        return self.__metric
+
+
+    def query_knn(self, points, k, **kwargs):
+        """!
+        @brief Finds k nearest neighbors for each specified point.
+        @details Each point is processed by depth-first search that keeps the best neighbors in bounded max-heap and
+                  skips nodes whose distance to the point is greater than distance to the current k-th neighbor.
+                  Neighbors with equal distances are ordered by their indexes.
+
+        @param[in] points (array_like): Points whose neighbors should be found.
+        @param[in] k (uint): Amount of neighbors that should be found for each point.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'pool_size').
+
+        <b>Keyword Args:</b><br>
+            - pool_size (uint): Amount of threads that process chunks of points (by default: 1).
+
+        @return (numpy.ndarray, numpy.ndarray) Indexes of neighbors and distances to them (indexes, distances), both
+                 arrays have shape (amount of points, k), neighbors are sorted by distance.
+
+        """
+
+        if (k <= 0) or (k > len(self)):
+            raise ValueError("Amount of neighbors '%s' should be in range [1, %d]." % (str(k), len(self)))
+
+        centers = self.__prepare_points(points)
+        chunks = self.__process_queries(range(len(centers)), lambda chunk: [self.__find_knn(centers[i], k) for i in chunk], kwargs)
+
+        results = [result for chunk in chunks for result in chunk]
+        indexes = numpy.array([result[0] for result in results], dtype=numpy.int64).reshape(len(centers), k)
+        distances = numpy.array([result[1] for result in results], dtype=numpy.float64).reshape(len(centers), k)
+
+        return indexes, self.__to_metric(distances)
+
+
+    def query_radius(self, points, radius, **kwargs):
+        """!
+        @brief Finds neighbors in area of the specified radius for each specified point.
+
+        @param[in] points (array_like): Points whose neighbors should be found.
+        @param[in] radius (double): Radius of the area where neighbors are searched.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'pool_size').
+
+        <b>Keyword Args:</b><br>
+            - pool_size (uint): Amount of threads that process chunks of points (by default: 1).
+
+        @return (numpy.ndarray, numpy.ndarray, numpy.ndarray) Neighbors in CSR format (indptr, indices, distances):
+                 neighbors of point 'i' are indices[indptr[i]:indptr[i + 1]] sorted by index and distances to them
+                 are distances[indptr[i]:indptr[i + 1]].
+
+        """
+
+        centers = self.__prepare_points(points)
+        limit = self.__to_tree_radius(radius)
+
+        if len(self) == 0:
+            return numpy.zeros(len(centers) + 1, dtype=numpy.int64), numpy.empty(0, dtype=numpy.int64), numpy.empty(0)
+
+        def process(chunk):
+            results = []
+            for index_center in chunk:
+                positions = self.__find_candidates(centers[index_center], 0.0, limit, 0)
+                distances = self.__calculate(self.__sorted[positions], centers[index_center])
+                neighbors = distances <= limit
+                results.append((self.__indexes[positions[neighbors]], distances[neighbors]))
+            return results
+
+        results = [result for chunk in self.__process_queries(range(len(centers)), process, kwargs) for result in chunk]
+        lengths = numpy.array([len(result[0]) for result in results], dtype=numpy.int64)
+        indptr = numpy.concatenate(([0], numpy.cumsum(lengths)))
+
+        if len(results) == 0:
+            return indptr, numpy.empty(0, dtype=numpy.int64), numpy.empty(0)
+
+        indices = numpy.concatenate([result[0] for result in results])
+        distances = self.__to_metric(numpy.concatenate([result[1] for result in results]))
+
+        order = numpy.lexsort((indices, numpy.repeat(numpy.arange(len(results)), lengths)))
+        return indptr, indices[order], distances[order]
+
+
+    def query_pairs(self, radius, **kwargs):
+        """!
+        @brief Finds all pairs of stored points whose distance is not greater than the specified radius.
+        @details Points of each leaf are processed together: the leaf is considered as a ball and nodes that cannot
+                  contain neighbors of any point of the leaf are skipped, distances between points of the leaf and
+                  candidates are calculated by blocks.
+
+        @param[in] radius (double): Maximum distance between points of a pair.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'pool_size').
+
+        <b>Keyword Args:</b><br>
+            - pool_size (uint): Amount of threads that process chunks of leaves (by default: 1).
+
+        @return (numpy.ndarray, numpy.ndarray) Pairs (i, j) where i < j that are presented by array with shape
+                 (amount of pairs, 2) and distances between points of pairs (pairs, distances).
+
+        """
+
+        limit = self.__to_tree_radius(radius)
+        leaves = [index_node for index_node, leaf in enumerate(self.__leaves) if leaf is True]
+
+        def process(chunk):
+            results = []
+            for index_node in chunk:
+                begin, end = self.__begins[index_node], self.__ends[index_node]
+                positions = self.__find_candidates(self.__centers[index_node], self.__radiuses[index_node], limit, begin)
+
+                distances = self.__calculate_block(self.__sorted[begin:end], self.__sorted[positions])
+                rows, columns = numpy.nonzero((distances <= limit) & (positions[None, :] > numpy.arange(begin, end)[:, None]))
+                results.append((self.__indexes[rows + begin], self.__indexes[positions[columns]], distances[rows, columns]))
+            return results
+
+        results = [result for chunk in self.__process_queries(leaves, process, kwargs) for result in chunk]
+        if len(results) == 0:
+            return numpy.empty((0, 2), dtype=numpy.int64), numpy.empty(0)
+
+        firsts, seconds = numpy.concatenate([result[0] for result in results]), numpy.concatenate([result[1] for result in results])
+        pairs = numpy.stack((numpy.minimum(firsts, seconds), numpy.maximum(firsts, seconds)), axis=1)
+
+        return pairs, self.__to_metric(numpy.concatenate([result[2] for result in results]))
+
+
+    def __prepare_points(self, points):
+        """!
+        @brief Converts points to two-dimensional array.
+
+        """
+
+        return numpy.array(points, dtype=numpy.float64).reshape(len(points), -1)
+
+
+    def __to_tree_radius(self, radius):
+        """!
+        @brief Converts radius in line with the metric to radius that is used by the tree.
+
+        """
+
+        if radius < 0:
+            raise ValueError("Radius '%s' should be non-negative." % str(radius))
+
+        return numpy.sqrt(radius) if self.__squared else radius
+
+
+    def __to_metric(self, distances):
+        """!
+        @brief Converts distances that are used by the tree to distances in line with the metric.
+
+        """
+
+        return distances * distances if self.__squared else distances
+
+
+    def __process_queries(self, items, processor, kwargs):
+        """!
+        @brief Processes items by chunks that are distributed between threads if pool size is greater than 1.
+
+        @param[in] items (list): Items (indexes of points or nodes) that should be processed.
+        @param[in] processor (callable): Function that processes chunk of items and returns list of results.
+        @param[in] kwargs (dict): Keyword arguments of query ('pool_size').
+
+        @return (list) Results of chunks in order of items.
+
+        """
+
+        pool_size = kwargs.get('pool_size', 1)
+        if pool_size <= 0:
+            raise ValueError("Pool size '%s' should be greater than 0." % str(pool_size))
+
+        if (pool_size == 1) or (len(items) <= 1):
+            return [processor(items)]
+
+        borders = numpy.linspace(0, len(items), min(pool_size, len(items)) + 1).astype(int)
+        with ThreadPoolExecutor(max_workers=len(borders) - 1) as executor:
+            return list(executor.map(processor, [items[borders[i]:borders[i + 1]] for i in range(len(borders) - 1)]))
+
+
+    def __find_knn(self, center, amount):
+        """!
+        @brief Finds the nearest neighbors of the point using bounded max-heap.
+
+        @param[in] center (numpy.ndarray): Point whose neighbors should be found.
+        @param[in] amount (uint): Amount of neighbors.
+
+        @return (list, list) Indexes of neighbors and distances to them sorted by distance (indexes, distances).
+
+        """
+
+        best = []      # max-heap of (-distance, -index) of the best neighbors
+
+        stack = [(0, 0.0)]
+        while len(stack) > 0:
+            index_node, bound = stack.pop()
+            if (len(best) == amount) and (bound > -best[0][0]):
+                continue
+
+            if self.__leaves[index_node] is True:
+                begin, end = self.__begins[index_node], self.__ends[index_node]
+                self.__merge_knn(best, amount, self.__indexes[begin:end], self.__calculate(self.__sorted[begin:end], center))
+                continue
+
+            left, right = 2 * index_node + 1, 2 * index_node + 2
+            left_distance, right_distance = self.__calculate(self.__centers[left:right + 1], center).tolist()
+
+            left = (left, max(self.__get_bound(left_distance, left), 0.0))
+            right = (right, max(self.__get_bound(right_distance, right), 0.0))
+
+            # the closest node is processed first to reduce distance to the k-th neighbor as soon as possible
+            if left[1] <= right[1]:
+                stack.extend((right, left))
+            else:
+                stack.extend((left, right))
+
+        best.sort(reverse=True)
+        return [-index_point for _, index_point in best], [-distance for distance, _ in best]
+
+
+    @staticmethod
+    def __merge_knn(best, amount, candidates, distances):
+        """!
+        @brief Updates max-heap of the best neighbors by candidates.
+
+        @param[in,out] best (list): Max-heap of (-distance, -index) of the best neighbors.
+        @param[in] amount (uint): Maximum amount of neighbors in the heap.
+        @param[in] candidates (numpy.ndarray): Indexes of candidates.
+        @param[in] distances (numpy.ndarray): Distances from the point to candidates.
+
+        """
+
+        if len(best) == amount:
+            suitable = distances <= -best[0][0]
+            candidates, distances = candidates[suitable], distances[suitable]
+
+        for distance, index_point in zip(distances.tolist(), candidates.tolist()):
+            entry = (-distance, -index_point)
+            if len(best) < amount:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+
+
+    def __find_candidates(self, center, center_radius, radius, begin):
+        """!
+        @brief Returns positions of points in leaves that may contain neighbors of points of the specified ball.
+
+        @param[in] center (numpy.ndarray): Center of the ball.
+        @param[in] center_radius (double): Radius of the ball, it is equal to 0 for a point.
+        @param[in] radius (double): Radius of the area where neighbors are searched.
+        @param[in] begin (uint): Position before which points are not considered.
+
+        @return (numpy.ndarray) Positions of candidates in permutation of points.
+
+        """
+
+        begins, ends = [], []
+        limit = radius + center_radius
+
+        stack = [0]
+        while len(stack) > 0:
+            index_node = stack.pop()
+            if self.__leaves[index_node] is True:
+                # leaves are visited from left to right, so ranges of neighboring leaves are joined
+                node_begin = max(self.__begins[index_node], begin)
+                if (len(ends) > 0) and (ends[-1] == node_begin):
+                    ends[-1] = self.__ends[index_node]
+                else:
+                    begins.append(node_begin)
+                    ends.append(self.__ends[index_node])
+                continue
+
+            left, right = 2 * index_node + 1, 2 * index_node + 2
+            left_distance, right_distance = self.__calculate(self.__centers[left:right + 1], center).tolist()
+
+            if (self.__get_bound(right_distance, right) <= limit) and (self.__ends[right] > begin):
+                stack.append(right)
+
+            if (self.__get_bound(left_distance, left) <= limit) and (self.__ends[left] > begin):
+                stack.append(left)
+
+        if len(begins) == 0:
+            return numpy.empty(0, dtype=numpy.int64)
+
+        begins = numpy.array(begins, dtype=numpy.int64)
+        lengths = numpy.array(ends, dtype=numpy.int64) - begins
+        return numpy.repeat(begins - numpy.cumsum(lengths) + lengths, lengths) + numpy.arange(numpy.sum(lengths))
+
+
+    def __get_bound(self, distance, index_node):
+        """!
+        @brief Returns lower bound of distance between a point and points of the node.
+        @details Distance to the center is reduced by relative tolerance, so rounding errors cannot exclude a point
+                  that is located exactly on the border of search area.
+
+        @param[in] distance (double): Distance between the point and center of the node.
+        @param[in] index_node (uint): Index of the node.
+
+        """
+
+        return distance * (1.0 - balltree.__TOLERANCE) - self.__radiuses[index_node]
+
+
+    def __calculate_block(self, points1, points2):
+        """!
+        @brief Calculates matrix of distances between two sets of points, the second set is processed by parts to
+                limit size of intermediate arrays.
+
+        @param[in] points1 (numpy.ndarray): Points that correspond to rows of the matrix.
+        @param[in] points2 (numpy.ndarray): Points that correspond to columns of the matrix.
+
+        @return (numpy.ndarray) Matrix of distances.
+
+        """
+
+        columns = max(1, balltree.__BLOCK_ELEMENTS // max(1, len(points1) * points1.shape[1]))
+        if len(points2) <= columns:
+            return self.__calculate(points1[:, None, :], points2[None, :, :])
+
+        return numpy.concatenate([self.__calculate(points1[:, None, :], points2[None, begin:begin + columns, :])
+                                  for begin in range(0, len(points2), columns)], axis=1)
+
+
+    def __create_calculator(self):
+        """!
+        @brief Creates function that calculates distances between points that are broadcast against each other, the
+                last axis is dimension.
+        @details Distances are calculated in line with the metric except Square Euclidean distance that is replaced
+                  by Euclidean distance. Function is created once since it is called for each visited node.
+
+        @return (callable) Function that takes two arrays of points and returns distances between them.
+
+        """
+
+        metric_type = self.__metric.get_type()
+        if metric_type == type_metric.USER_DEFINED:
+            def calculate_by_metric(points1, points2):
+                points1, points2 = numpy.broadcast_arrays(points1, points2)
+                distances = [self.__metric(point1, point2) for point1, point2 in
+                             zip(points1.reshape(-1, points1.shape[-1]), points2.reshape(-1, points2.shape[-1]))]
+                return numpy.array(distances, dtype=numpy.float64).reshape(points1.shape[:-1])
+            return calculate_by_metric
+
+        elif (metric_type == type_metric.EUCLIDEAN) or (metric_type == type_metric.EUCLIDEAN_SQUARE):
+            def calculate_euclidean(points1, points2):
+                differences = points1 - points2
+                return numpy.sqrt(numpy.einsum('...i,...i->...', differences, differences))
+            return calculate_euclidean
+
+        elif metric_type == type_metric.MANHATTAN:
+            return lambda points1, points2: numpy.add.reduce(numpy.abs(points1 - points2), axis=-1)
+
+        elif metric_type == type_metric.CHEBYSHEV:
+            return lambda points1, points2: numpy.maximum.reduce(numpy.abs(points1 - points2), axis=-1)
+
+        elif metric_type == type_metric.MINKOWSKI:
+            degree = self.__metric.get_arguments().get('degree', 2)
+            return lambda points1, points2: numpy.add.reduce(numpy.abs(points1 - points2) ** degree, axis=-1) ** (1.0 / degree)
+
+        def calculate_canberra(points1, points2):
+            differences = numpy.abs(points1 - points2)
+            dividers = numpy.abs(points1) + numpy.abs(points2)
+            return numpy.add.reduce(numpy.divide(differences, dividers, out=numpy.zeros_like(differences), where=dividers > 0.0), axis=-1)
+        return calculate_canberra
+
+
+    @staticmethod
+    def __verify_metric(metric):
+        """!
+        @brief Verifies that metric can be used by the tree.
+
+        @param[in] metric (distance_metric): Metric that is used for distance calculation between points.
+
+        """
+
+        if metric.get_type() == type_metric.CHI_SQUARE:
+            raise ValueError("Chi-square distance does not satisfy triangle inequality and it cannot be used by ball-tree.")
+
+        if (metric.get_type() == type_metric.MINKOWSKI) and (metric.get_arguments().get('degree', 2) < 1):
+            raise ValueError("Degree of Minkowski distance '%s' should not be less than 1." %
+                             str(metric.get_arguments().get('degree', 2)))
+
+
+    def __build(self):
+        """!
+        @brief Builds the tree for all points, nodes of one level are split at once.
+        @details Points of each node are sorted along the widest dimension of the node and the node is divided by the
+                  median, then balls of children are calculated.
+
+        """
+
+        levels = []
+        nodes = numpy.zeros(1, dtype=numpy.int64)
+        begins, ends = numpy.zeros(1, dtype=numpy.int64), numpy.full(1, len(self.__coordinates), dtype=numpy.int64)
+
+        while len(nodes) > 0:
+            sizes = ends - begins
+            starts = numpy.cumsum(sizes) - sizes
+            point_nodes = numpy.repeat(numpy.arange(len(nodes)), sizes)
+            positions = numpy.repeat(begins - starts, sizes) + numpy.arange(numpy.sum(sizes))
+            points = self.__coordinates[self.__indexes[positions]]
+
+            centers = numpy.add.reduceat(points, starts, axis=0) / sizes[:, None]
+            radiuses = numpy.maximum.reduceat(self.__calculate(points, centers[point_nodes]), starts)
+
+            lowers = numpy.minimum.reduceat(points, starts, axis=0)
+            widths = numpy.maximum.reduceat(points, starts, axis=0) - lowers
+            dimensions = numpy.argmax(widths, axis=1)
+
+            # node of identical points cannot be divided and it remains leaf
+            divided = (sizes > self.__leaf_size) & (numpy.max(widths, axis=1) > 0.0)
+
+            values = points[numpy.arange(len(points)), dimensions[point_nodes]]
+            order = numpy.lexsort((values, point_nodes))
+            self.__indexes[positions] = self.__indexes[positions][order]
+
+            levels.append((nodes, begins, ends, ~divided, radiuses, centers))
+
+            candidates = numpy.flatnonzero(divided)
+            middles = (begins[candidates] + ends[candidates]) // 2
+            nodes = numpy.stack((2 * nodes[candidates] + 1, 2 * nodes[candidates] + 2), axis=1).ravel()
+            begins, ends = numpy.stack((begins[candidates], middles), axis=1).ravel(), numpy.stack((middles, ends[candidates]), axis=1).ravel()
+
+        nodes = numpy.concatenate([level[0] for level in levels])
+        amount_nodes = int(numpy.max(nodes)) + 1
+
+        # nodes are traversed by python code where lists are faster than arrays
+        self.__begins, self.__ends, self.__leaves, self.__radiuses = \
+            [self.__scatter(nodes, numpy.concatenate(arrays), amount_nodes) for arrays in list(zip(*levels))[1:5]]
+
+        self.__centers = numpy.zeros((amount_nodes, self.__coordinates.shape[1]))
+        self.__centers[nodes] = numpy.concatenate([level[5] for level in levels])
+
+        self.__sorted = self.__coordinates[self.__indexes]
+
+
+    @staticmethod
+    def __scatter(nodes, values, amount_nodes):
+        """!
+        @brief Returns list of values of all nodes of the implicit tree, -1 is used for nodes that do not exist.
+
+        """
+
+        result = numpy.full(amount_nodes, -1, dtype=values.dtype)
+        result[nodes] = values
+        return result.tolist()
+
+
+    ## Relative tolerance of distances to centers of nodes that is used to compensate rounding errors.
+    __TOLERANCE = 1e-9
+
+    ## Amount of elements of intermediate arrays that are used for calculation of distances at once.
+    __BLOCK_ELEMENTS = 1024 * 1024
@@ -25,9 +25,13 @@
 """
 
 
+import heapq
 import numpy
 
+from concurrent.futures import ThreadPoolExecutor
+
 from pyclustering.utils import euclidean_distance_square
+from pyclustering.utils.metric import distance_metric, type_metric
 
 
 class kdtree_text_visualizer:
@@ -584,3 +588,748 @@ class kdtree:
                 items += self.traverse(child, level + 1)
         
         return items
+
+
+    @staticmethod
+    def search_order(data_list):
+        """!
+        @brief Returns position of each point in the order in which find_nearest_dist_nodes() returns neighbors when
+                kd-tree is filled by the points.
+        @details Search returns nodes of right subtree, then nodes of left subtree and then the node itself, therefore
+                  neighbors that are sorted by the positions are returned in the same order as by the search, it allows
+                  to resolve ties in the same way as kd-tree does without creation of nodes. The tree is built level by
+                  level: the first point of each subtree becomes its node and other points are sent to its children.
+
+        @param[in] data_list (array_like): Points in order of their insertion to kd-tree.
+
+        @return (numpy.ndarray) Position of each point in the order of search.
+
+        """
+
+        if len(data_list) == 0:
+            return numpy.empty(0, dtype=numpy.int64)
+
+        coordinates = numpy.array(data_list, dtype=numpy.float64).reshape(len(data_list), -1)
+        amount_points = len(coordinates)
+
+        parents = numpy.full(amount_points, -1, dtype=numpy.int64)
+        rights = numpy.zeros(amount_points, dtype=bool)
+        levels = []
+
+        pending = numpy.arange(amount_points)
+        subtrees = numpy.zeros(amount_points, dtype=numpy.int64)     # subtree is defined by parent and side: 2 * parent + right
+        depth = 0
+
+        while len(pending) > 0:
+            # points are pending in order of insertion, so the first point of each subtree becomes its node
+            _, firsts, inverse = numpy.unique(subtrees, return_index=True, return_inverse=True)
+            nodes = pending[firsts]
+            levels.append(nodes)
+
+            if depth > 0:
+                parents[nodes] = subtrees[firsts] // 2
+                rights[nodes] = subtrees[firsts] % 2 == 1
+
+            owners = nodes[inverse.ravel()]
+            descending = pending != owners
+            pending, owners = pending[descending], owners[descending]
+
+            discriminator = depth % coordinates.shape[1]
+            right = coordinates[pending, discriminator] >= coordinates[owners, discriminator]
+            subtrees = 2 * owners + right
+            depth += 1
+
+        sizes = numpy.ones(amount_points, dtype=numpy.int64)
+        for nodes in reversed(levels[1:]):
+            numpy.add.at(sizes, parents[nodes], sizes[nodes])
+
+        right_sizes = numpy.zeros(amount_points, dtype=numpy.int64)
+        right_nodes = numpy.flatnonzero(rights)
+        right_sizes[parents[right_nodes]] = sizes[right_nodes]
+
+        # the first position of subtree: right subtree starts with its parent, left subtree follows right subtree
+        begins = numpy.zeros(amount_points, dtype=numpy.int64)
+        for nodes in levels[1:]:
+            begins[nodes] = begins[parents[nodes]] + numpy.where(rights[nodes], 0, right_sizes[parents[nodes]])
+
+        return begins + sizes - 1
+
+
+class kdtree_balanced:
+    """!
+    @brief Array-backed balanced KD-tree that is bulk-loaded from points and stored in NumPy arrays.
+    @details Tree is built once level by level: each node is split by median of its widest dimension until it contains
+              not more than leaf size points. Nodes are implicit - children of node 'i' are nodes '2i + 1' and '2i + 2',
+              therefore only split dimensions, split values and ranges of points are stored, points of each node occupy
+              contiguous range of permutation of points. Depth of the tree does not depend on order of points.
+
+              Points can be inserted and removed: inserted points are kept in a buffer that is scanned by each search and
+              removed points are marked, the tree is rebuilt when the buffer or amount of removed points become large.
+              Search methods are compatible with kdtree and return nodes (node) with point and its payload, neighbors
+              are returned in order of insertion of their points, so ties are resolved in the same way regardless of
+              structure of the tree.
+
+              Distances are measured by Lp norm that is specified by metric: Euclidean (default), Square Euclidean,
+              Manhattan, Chebyshev or Minkowski. Difference along any dimension does not exceed Lp distance, therefore
+              nodes are pruned by split values for each of them, and distances are compared in reduced form (sum of
+              powers of differences without root) that preserves order. Ball-tree (balltree) should be used for other
+              metrics.
+
+    Example:
+    @code
+        from pyclustering.container.kdtree import kdtree_balanced
+        from pyclustering.samples.definitions import SIMPLE_SAMPLES
+        from pyclustering.utils import read_sample
+
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+
+        # Build tree where payload of each point is its index.
+        tree_instance = kdtree_balanced(sample, range(len(sample)))
+
+        # Search for neighbors in radius 0.3, each neighbor is a pair (square distance, node).
+        nearest_nodes = tree_instance.find_nearest_dist_nodes([1.12, 4.31], 0.3)
+        print("Neighbors:", [kdnode.payload for _, kdnode in nearest_nodes])
+    @endcode
+
+    @see kdtree
+    @see balltree
+
+    """
+
+    ## Default maximum amount of points in a leaf node.
+    DEFAULT_LEAF_SIZE = 16
+
+    def __init__(self, data_list=None, payload_list=None, leaf_size=DEFAULT_LEAF_SIZE, metric=None):
+        """!
+        @brief Builds balanced kd-tree from list of points and from according list of payloads.
+        @details If points are not specified then empty kd-tree is created.
+
+        @param[in] data_list (array_like): Points that should be stored in the tree.
+        @param[in] payload_list (array_like): Payloads of the points, length should be equal to length of 'data_list' if it is specified.
+        @param[in] leaf_size (uint): Maximum amount of points in a leaf node.
+        @param[in] metric (distance_metric): Lp metric that is used for distance calculation between points (by default Euclidean).
+
+        """
+
+        if leaf_size <= 0:
+            raise ValueError("Leaf size '%s' should be greater than 0." % str(leaf_size))
+
+        if (payload_list is not None) and (data_list is not None) and (len(payload_list) != len(data_list)):
+            raise ValueError("Amount of payloads '%d' should be equal to amount of points '%d'." % (len(payload_list), len(data_list)))
+
+        self.__leaf_size = leaf_size
+
+        self.__metric = metric if metric is not None else distance_metric(type_metric.EUCLIDEAN)
+        self.__degree = self.__get_degree(self.__metric)
+        self.__reduce = self.__create_reducer(self.__degree)
+
+        self.__points = []          # points as they have been specified (they are returned by nodes)
+        self.__payloads = []
+        self.__coordinates = None   # coordinates of points, points that have been inserted after build are at the end
+        self.__alive = None         # False for points that have been removed
+        self.__amount = 0           # amount of stored points including removed
+        self.__amount_removed = 0
+
+        self.__indexes = numpy.empty(0, dtype=numpy.int64)      # permutation of points that are stored by the tree
+        self.__sorted = None        # coordinates of points in line with the permutation
+        self.__amount_built = 0
+
+        self.__dimensions = []      # split dimension of each node, -1 for leaf
+        self.__left_maximums = []   # maximum value of left node along split dimension
+        self.__right_minimums = []  # minimum value of right node along split dimension
+        self.__begins = []
+        self.__ends = []
+
+        if (data_list is not None) and (len(data_list) > 0):
+            self.__points = list(data_list)
+            self.__payloads = list(payload_list) if payload_list is not None else [None] * len(self.__points)
+            self.__coordinates = numpy.array(self.__points, dtype=numpy.float64).reshape(len(self.__points), -1)
+            self.__alive = numpy.ones(len(self.__points), dtype=bool)
+            self.__amount = len(self.__points)
+
+            self.__build()
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of points in the tree.
+
+        """
+
+        return self.__amount - self.__amount_removed
+
+
+    def insert(self, point, payload):
+        """!
+        @brief Inserts new point with payload to the tree.
+        @details Point is placed to the buffer, the tree is rebuilt when the buffer becomes large.
+
+        @param[in] point (array_like): Coordinates of the point.
+        @param[in] payload (any-type): Payload of the point.
+
+        """
+
+        if self.__coordinates is None:
+            self.__coordinates = numpy.empty((self.__leaf_size, len(point)), dtype=numpy.float64)
+            self.__alive = numpy.zeros(self.__leaf_size, dtype=bool)
+            self.__sorted = numpy.empty((0, len(point)), dtype=numpy.float64)
+
+        elif self.__amount == len(self.__coordinates):
+            capacity = max(self.__leaf_size, len(self.__coordinates))
+            self.__coordinates = numpy.concatenate((self.__coordinates, numpy.empty((capacity, len(point)), dtype=numpy.float64)))
+            self.__alive = numpy.concatenate((self.__alive, numpy.zeros(capacity, dtype=bool)))
+
+        self.__coordinates[self.__amount] = point
+        self.__alive[self.__amount] = True
+        self.__points.append(point)
+        self.__payloads.append(payload)
+        self.__amount += 1
+
+        if self.__amount - self.__amount_built > max(self.__leaf_size, self.__amount_built // 2):
+            self.__rebuild()
+
+
+    def remove(self, point, **kwargs):
+        """!
+        @brief Removes specified point from the tree.
+        @details It removes the first found point that satisfies to the input parameters.
+
+        @param[in] point (array_like): Coordinates of the point that should be removed.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'payload').
+
+        <b>Keyword Args:</b><br>
+            - payload (any): Payload of the point that should be removed.
+
+        @return (bool) True if point has been removed, otherwise False.
+
+        """
+
+        for index_point in self.__find_indexes(point, 0.0)[0].tolist():
+            if ('payload' not in kwargs) or (self.__payloads[index_point] == kwargs['payload']):
+                self.__alive[index_point] = False
+                self.__amount_removed += 1
+
+                if self.__amount_removed > len(self) // 2:
+                    self.__rebuild()
+
+                return True
+
+        return False
+
+
+    def find_nearest_dist_node(self, point, distance, retdistance=False):
+        """!
+        @brief Find nearest neighbor in area with radius = distance.
+
+        @param[in] point (array_like): Coordinates of the point whose nearest neighbor is searched.
+        @param[in] distance (double): Maximum distance where neighbors are searched.
+        @param[in] retdistance (bool): If True - returns neighbors with distances to them, otherwise only neighbors is returned.
+
+        @return (node|list) Nearest neighbor if 'retdistance' is False and list with two elements [node, distance] if 'retdistance' is True,
+                 where the first element is square distance to the node (distance in line with the metric if it is not
+                 Euclidean) and the second element is the node.
+
+        """
+
+        indexes, distances = self.__find_indexes(point, distance)
+        if len(indexes) == 0:
+            return None
+
+        nearest = int(numpy.argmin(distances))
+        nearest_node = node(self.__points[indexes[nearest]], self.__payloads[indexes[nearest]])
+
+        if retdistance is True:
+            return float(self.__to_result(distances[nearest])), nearest_node
+        else:
+            return nearest_node
+
+
+    def find_nearest_dist_nodes(self, point, distance):
+        """!
+        @brief Find neighbors that are located in area that is covered by specified distance.
+
+        @param[in] point (array_like): Coordinates that is considered as centroind for searching.
+        @param[in] distance (double): Distance from the center where seaching is performed.
+
+        @return (list) Neighbors in area that is specified by point (center) and distance (radius), each neighbor is
+                 a tuple (square distance, node), distance is in line with the metric if it is not Euclidean.
+
+        """
+
+        indexes, distances = self.__find_indexes(point, distance)
+        distances = self.__to_result(distances)
+        return [(candidate_distance, node(self.__points[index_point], self.__payloads[index_point]))
+                for index_point, candidate_distance in zip(indexes.tolist(), distances.tolist())]
+
+
+    def find_nearest_dist_payloads(self, point, distance):
+        """!
+        @brief Find payloads of neighbors that are located in area that is covered by specified distance.
+        @details It is faster than find_nearest_dist_nodes() because nodes are not created for neighbors.
+
+        @param[in] point (array_like): Coordinates that is considered as centroind for searching.
+        @param[in] distance (double): Distance from the center where seaching is performed.
+
+        @return (list, numpy.ndarray) Payloads of neighbors and square distances to them (payloads, distances),
+                 distances are in line with the metric if it is not Euclidean.
+
+        """
+
+        indexes, distances = self.__find_indexes(point, distance)
+        return [self.__payloads[index_point] for index_point in indexes.tolist()], self.__to_result(distances)
+
+
+    def query_knn(self, points, k, **kwargs):
+        """!
+        @brief Finds k nearest neighbors for each specified point.
+        @details Each point is processed by depth-first search that keeps the best neighbors in bounded max-heap and
+                  skips nodes whose distance to the point is greater than distance to the current k-th neighbor.
+                  Neighbors with equal distances are ordered by their indexes.
+
+        @param[in] points (array_like): Points whose neighbors should be found.
+        @param[in] k (uint): Amount of neighbors that should be found for each point.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'pool_size').
+
+        <b>Keyword Args:</b><br>
+            - pool_size (uint): Amount of threads that process chunks of points (by default: 1).
+
+        @return (numpy.ndarray, numpy.ndarray) Indexes of neighbors and distances to them in line with the metric
+                 (indexes, distances), both arrays have shape (amount of points, k), neighbors are sorted by distance. Indexes are positions
+                 of points in the tree (in order of their insertion, removed points are not counted).
+
+        """
+
+        if (k <= 0) or (k > len(self)):
+            raise ValueError("Amount of neighbors '%s' should be in range [1, %d]." % (str(k), len(self)))
+
+        centers = [numpy.asarray(point, dtype=numpy.float64) for point in points]
+        chunks = self.__process_queries(centers, lambda chunk: [self.__find_knn(center, k) for center in chunk], kwargs)
+
+        results = [result for chunk in chunks for result in chunk]
+        indexes = numpy.array([result[0] for result in results], dtype=numpy.int64).reshape(len(centers), k)
+        distances = numpy.array([result[1] for result in results], dtype=numpy.float64).reshape(len(centers), k)
+
+        return self.__get_positions()[indexes], self.__to_metric(distances)
+
+
+    def query_radius(self, points, radius, **kwargs):
+        """!
+        @brief Finds neighbors in area of the specified radius for each specified point.
+
+        @param[in] points (array_like): Points whose neighbors should be found.
+        @param[in] radius (double): Radius of the area where neighbors are searched.
+        @param[in] **kwargs: Arbitrary keyword arguments (available arguments: 'pool_size').
+
+        <b>Keyword Args:</b><br>
+            - pool_size (uint): Amount of threads that process chunks of points (by default: 1).
+
+        @return (numpy.ndarray, numpy.ndarray, numpy.ndarray) Neighbors in CSR format (indptr, indices, distances):
+                 neighbors of point 'i' are indices[indptr[i]:indptr[i + 1]] sorted by index and distances to them in
+                 line with the metric are distances[indptr[i]:indptr[i + 1]]. Indexes are positions of points in the tree (in order of
+                 their insertion, removed points are not counted).
+
+        """
+
+        centers = [numpy.asarray(point, dtype=numpy.float64) for point in points]
+        chunks = self.__process_queries(centers, lambda chunk: [self.__find_indexes(center, radius) for center in chunk], kwargs)
+
+        results = [result for chunk in chunks for result in chunk]
+        lengths = numpy.array([len(result[0]) for result in results], dtype=numpy.int64)
+        indptr = numpy.concatenate(([0], numpy.cumsum(lengths)))
+
+        if len(results) == 0:
+            return indptr, numpy.empty(0, dtype=numpy.int64), numpy.empty(0)
+
+        indices = self.__get_positions()[numpy.concatenate([result[0] for result in results])]
+        distances = self.__to_metric(numpy.concatenate([result[1] for result in results]))
+
+        return indptr, indices, distances
+
+
+    def __process_queries(self, centers, processor, kwargs):
+        """!
+        @brief Processes points by chunks that are distributed between threads if pool size is greater than 1.
+
+        @param[in] centers (numpy.ndarray): Points that should be processed.
+        @param[in] processor (callable): Function that processes chunk of points and returns list of results.
+        @param[in] kwargs (dict): Keyword arguments of query ('pool_size').
+
+        @return (list) Results of chunks in order of points.
+
+        """
+
+        pool_size = kwargs.get('pool_size', 1)
+        if pool_size <= 0:
+            raise ValueError("Pool size '%s' should be greater than 0." % str(pool_size))
+
+        if (pool_size == 1) or (len(centers) <= 1):
+            return [processor(centers)]
+
+        borders = numpy.linspace(0, len(centers), min(pool_size, len(centers)) + 1).astype(int)
+        with ThreadPoolExecutor(max_workers=len(borders) - 1) as executor:
+            return list(executor.map(processor, [centers[borders[i]:borders[i + 1]] for i in range(len(borders) - 1)]))
+
+
+    def __get_positions(self):
+        """!
+        @brief Returns positions of stored points among points that have not been removed.
+
+        """
+
+        if self.__amount_removed == 0:
+            return numpy.arange(self.__amount)
+
+        return numpy.cumsum(self.__alive[:self.__amount]) - 1
+
+
+    def __find_knn(self, center, amount):
+        """!
+        @brief Finds the nearest neighbors of the point using bounded max-heap.
+
+        @param[in] center (numpy.ndarray): Point whose neighbors should be found.
+        @param[in] amount (uint): Amount of neighbors.
+
+        @return (list, list) Indexes of neighbors and reduced distances to them sorted by distance (indexes, distances).
+
+        """
+
+        best = []      # max-heap of (-reduced distance, -index) of the best neighbors
+        coordinates = center.tolist()
+
+        if self.__amount > self.__amount_built:
+            buffer = numpy.arange(self.__amount_built, self.__amount)
+            self.__merge_knn(best, amount, buffer, self.__coordinates[self.__amount_built:self.__amount] - center)
+
+        stack = [(0, 0.0)] if self.__amount_built > 0 else []
+        while len(stack) > 0:
+            index_node, bound = stack.pop()
+            if (len(best) == amount) and (bound > -best[0][0]):
+                continue
+
+            dimension = self.__dimensions[index_node]
+            if dimension < 0:
+                begin, end = self.__begins[index_node], self.__ends[index_node]
+                self.__merge_knn(best, amount, self.__indexes[begin:end], self.__sorted[begin:end] - center)
+                continue
+
+            left_gap = max(coordinates[dimension] - self.__left_maximums[index_node], 0.0)
+            right_gap = max(self.__right_minimums[index_node] - coordinates[dimension], 0.0)
+
+            left = (2 * index_node + 1, max(bound, self.__reduce_gap(left_gap)))
+            right = (2 * index_node + 2, max(bound, self.__reduce_gap(right_gap)))
+
+            # the closest node is processed first to reduce distance to the k-th neighbor as soon as possible
+            if left_gap <= right_gap:
+                stack.extend((right, left))
+            else:
+                stack.extend((left, right))
+
+        best.sort(reverse=True)
+        return [-index_point for _, index_point in best], [-distance for distance, _ in best]
+
+
+    def __merge_knn(self, best, amount, candidates, differences):
+        """!
+        @brief Updates max-heap of the best neighbors by candidates.
+
+        @param[in,out] best (list): Max-heap of (-reduced distance, -index) of the best neighbors.
+        @param[in] amount (uint): Maximum amount of neighbors in the heap.
+        @param[in] candidates (numpy.ndarray): Indexes of candidates.
+        @param[in] differences (numpy.ndarray): Differences between candidates and the point.
+
+        """
+
+        distances = self.__reduce(differences)
+
+        if self.__amount_removed > 0:
+            alive = self.__alive[candidates]
+            candidates, distances = candidates[alive], distances[alive]
+
+        if len(best) == amount:
+            suitable = distances <= -best[0][0]
+            candidates, distances = candidates[suitable], distances[suitable]
+
+        for distance, index_point in zip(distances.tolist(), candidates.tolist()):
+            entry = (-distance, -index_point)
+            if len(best) < amount:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+
+
+    def __find_indexes(self, point, distance):
+        """!
+        @brief Returns indexes of points that are located in area that is covered by specified distance and reduced distances to them.
+
+        @param[in] point (array_like): Coordinates that is considered as centroind for searching.
+        @param[in] distance (double): Distance from the center where seaching is performed.
+
+        @return (numpy.ndarray, numpy.ndarray) Indexes of points and reduced distances to them (indexes, distances),
+                 points are ordered by indexes, so the order does not depend on structure of the tree.
+
+        """
+
+        if self.__amount == 0:
+            return numpy.empty(0, dtype=numpy.int64), numpy.empty(0)
+
+        center = numpy.asarray(point, dtype=numpy.float64)
+        coordinates = center.tolist()
+
+        # Lp distance is used for pruning since difference along any dimension does not exceed it
+        limit = distance if self.__metric.get_type() == type_metric.EUCLIDEAN_SQUARE else self.__reduce_gap(distance)
+        distance = numpy.sqrt(distance) if self.__metric.get_type() == type_metric.EUCLIDEAN_SQUARE else distance
+
+        begins, ends = [], []
+        if self.__amount_built > 0:
+            stack = [0]
+            while len(stack) > 0:
+                index_node = stack.pop()
+                dimension = self.__dimensions[index_node]
+                if dimension < 0:
+                    # leaves are visited from left to right, so ranges of neighboring leaves are joined
+                    if (len(ends) > 0) and (ends[-1] == self.__begins[index_node]):
+                        ends[-1] = self.__ends[index_node]
+                    else:
+                        begins.append(self.__begins[index_node])
+                        ends.append(self.__ends[index_node])
+                    continue
+
+                if coordinates[dimension] + distance >= self.__right_minimums[index_node]:
+                    stack.append(2 * index_node + 2)
+
+                if coordinates[dimension] - distance <= self.__left_maximums[index_node]:
+                    stack.append(2 * index_node + 1)
+
+        if len(begins) == 1:
+            candidates, points = self.__indexes[begins[0]:ends[0]], self.__sorted[begins[0]:ends[0]]
+        else:
+            begins = numpy.array(begins, dtype=numpy.int64)
+            lengths = numpy.array(ends, dtype=numpy.int64) - begins
+            positions = numpy.repeat(begins - numpy.cumsum(lengths) + lengths, lengths) + numpy.arange(numpy.sum(lengths))
+            candidates, points = self.__indexes[positions], self.__sorted[positions]
+
+        if self.__amount > self.__amount_built:
+            candidates = numpy.concatenate((candidates, numpy.arange(self.__amount_built, self.__amount)))
+            points = numpy.concatenate((points, self.__coordinates[self.__amount_built:self.__amount]))
+
+        distances = self.__reduce(points - center)
+
+        neighbors = distances <= limit
+        if self.__amount_removed > 0:
+            neighbors &= self.__alive[candidates]
+
+        candidates, distances = candidates[neighbors], distances[neighbors]
+
+        order = numpy.argsort(candidates)
+        return candidates[order], distances[order]
+
+
+    def __reduce_gap(self, gap):
+        """!
+        @brief Returns reduced distance between points whose difference is equal to the gap along one dimension.
+
+        """
+
+        return gap if self.__degree == float('inf') else gap ** self.__degree
+
+
+    def __to_metric(self, distances):
+        """!
+        @brief Converts reduced distances to distances in line with the metric.
+
+        """
+
+        if (self.__degree in (1, float('inf'))) or (self.__metric.get_type() == type_metric.EUCLIDEAN_SQUARE):
+            return distances
+
+        return numpy.sqrt(distances) if self.__degree == 2 else distances ** (1.0 / self.__degree)
+
+
+    def __to_result(self, distances):
+        """!
+        @brief Converts reduced distances to distances that are returned by search methods that are compatible with
+                kdtree, square distances are returned in case of Euclidean metric.
+
+        """
+
+        return distances if self.__metric.get_type() == type_metric.EUCLIDEAN else self.__to_metric(distances)
+
+
+    @staticmethod
+    def __get_degree(metric):
+        """!
+        @brief Returns degree of Lp norm that corresponds to the metric.
+
+        @param[in] metric (distance_metric): Metric that is used for distance calculation between points.
+
+        @return (double) Degree of Lp norm, infinity in case of Chebyshev distance.
+
+        """
+
+        degrees = { type_metric.EUCLIDEAN: 2, type_metric.EUCLIDEAN_SQUARE: 2, type_metric.MANHATTAN: 1,
+                    type_metric.CHEBYSHEV: float('inf') }
+
+        if metric.get_type() == type_metric.MINKOWSKI:
+            degree = metric.get_arguments().get('degree', 2)
+            if degree <= 0:
+                raise ValueError("Degree of Minkowski distance '%s' should be greater than 0." % str(degree))
+            return degree
+
+        if metric.get_type() not in degrees:
+            raise ValueError("Metric '%s' is not Lp norm and it cannot be used by kd-tree, use ball-tree instead." %
+                             metric.get_type().name)
+
+        return degrees[metric.get_type()]
+
+
+    @staticmethod
+    def __create_reducer(degree):
+        """!
+        @brief Creates function that calculates reduced distances (sum of powers of differences without root, maximum
+                difference in case of Chebyshev distance) for rows of differences.
+
+        @param[in] degree (double): Degree of Lp norm.
+
+        @return (callable) Function that takes differences and returns reduced distances.
+
+        """
+
+        if degree == 2:
+            return lambda differences: numpy.einsum('ij,ij->i', differences, differences)
+        elif degree == 1:
+            return lambda differences: numpy.sum(numpy.abs(differences), axis=1)
+        elif degree == float('inf'):
+            return lambda differences: numpy.max(numpy.abs(differences), axis=1)
+
+        return lambda differences: numpy.sum(numpy.abs(differences) ** degree, axis=1)
+
+
+    def __rebuild(self):
+        """!
+        @brief Removes points that have been marked as removed and builds the tree for all stored points.
+
+        """
+
+        alive = numpy.flatnonzero(self.__alive[:self.__amount])
+
+        self.__points = [self.__points[index_point] for index_point in alive.tolist()]
+        self.__payloads = [self.__payloads[index_point] for index_point in alive.tolist()]
+        self.__coordinates = self.__coordinates[alive]
+        self.__alive = numpy.ones(len(alive), dtype=bool)
+        self.__amount = len(alive)
+        self.__amount_removed = 0
+
+        self.__build()
+
+
+    def __build(self):
+        """!
+        @brief Builds the tree for all stored points, nodes of one level are split at once (see split_levels()).
+
+        """
+
+        self.__amount_built = self.__amount
+        self.__indexes = numpy.arange(self.__amount)
+
+        if self.__amount == 0:
+            self.__begins, self.__ends, self.__dimensions, self.__left_maximums, self.__right_minimums = [0], [0], [-1], [0.0], [0.0]
+            self.__sorted = self.__coordinates[:0]
+            return
+
+        levels = []
+        nodes = numpy.zeros(1, dtype=numpy.int64)
+
+        for begins, ends, _, _, _, dimensions, left_maximums, right_minimums in \
+                kdtree_balanced.split_levels(self.__coordinates[:self.__amount], self.__indexes, self.__leaf_size):
+            levels.append((nodes, begins, ends, dimensions, left_maximums, right_minimums))
+
+            divided = dimensions >= 0
+            nodes = numpy.stack((2 * nodes[divided] + 1, 2 * nodes[divided] + 2), axis=1).ravel()
+
+        nodes = numpy.concatenate([level[0] for level in levels])
+        amount_nodes = int(numpy.max(nodes)) + 1
+
+        # nodes are traversed by python code where lists are faster than arrays
+        self.__begins, self.__ends, self.__dimensions, self.__left_maximums, self.__right_minimums = \
+            [self.__scatter(nodes, numpy.concatenate(arrays), amount_nodes) for arrays in list(zip(*levels))[1:]]
+
+        self.__sorted = self.__coordinates[self.__indexes]
+
+
+    @staticmethod
+    def split_levels(coordinates, indexes, leaf_size):
+        """!
+        @brief Splits points into nodes level by level, each node is divided by median of its widest dimension.
+        @details All nodes of one level are split at once: points of the nodes are sorted along split dimensions by
+                  one sort of values that are normalized inside of each node. Node remains leaf if it contains not more
+                  than leaf size points or if all its points are identical. Points of each node occupy contiguous range
+                  [begin, end) of the permutation, children of divided nodes form the next level in the same order
+                  (left child, right child). The split is shared by kd-tree and filtering tree of K-Means.
+
+        @param[in] coordinates (numpy.ndarray): Coordinates of points, at least one point should be specified.
+        @param[in] indexes (numpy.ndarray): Permutation of points that is reordered in place by the split.
+        @param[in] leaf_size (uint): Maximum amount of points in a leaf node.
+
+        @return (generator) Description of each level (begins, ends, lowers, uppers, sums, dimensions, left_maximums,
+                 right_minimums): ranges of points of nodes, lower and upper corners of bounding boxes, sums of points,
+                 split dimensions (-1 for leaf), maximum value of left child and minimum value of right child along
+                 split dimension (they bound points of children exactly even if sorting is affected by rounding).
+
+        """
+
+        begins, ends = numpy.zeros(1, dtype=numpy.int64), numpy.full(1, len(indexes), dtype=numpy.int64)
+
+        while len(begins) > 0:
+            sizes = ends - begins
+            starts = numpy.cumsum(sizes) - sizes
+
+            point_nodes = numpy.repeat(numpy.arange(len(begins)), sizes)
+            positions = numpy.arange(len(point_nodes)) + numpy.repeat(begins - starts, sizes)
+            points = coordinates[indexes[positions]]
+
+            lowers = numpy.minimum.reduceat(points, starts, axis=0)
+            uppers = numpy.maximum.reduceat(points, starts, axis=0)
+            sums = numpy.add.reduceat(points, starts, axis=0)
+
+            # node of identical points cannot be divided and it remains leaf
+            widths = uppers - lowers
+            divided = (sizes > leaf_size) & (numpy.max(widths, axis=1) > 0.0)
+            dimensions = numpy.where(divided, numpy.argmax(widths, axis=1), -1)
+
+            divided_points = divided[point_nodes]
+            divided_nodes = point_nodes[divided_points]
+            split_dimensions = dimensions[divided_nodes]
+
+            # values are normalized to [0, 0.5] inside of each node, so one sort orders points of all nodes
+            values = points[divided_points, split_dimensions]
+            normalized = (values - lowers[divided_nodes, split_dimensions]) / (2.0 * widths[divided_nodes, split_dimensions])
+
+            order = numpy.argsort(divided_nodes + normalized)
+            divided_positions = positions[divided_points]
+            indexes[divided_positions] = indexes[divided_positions][order]
+
+            left_maximums, right_minimums = numpy.zeros(len(begins)), numpy.zeros(len(begins))
+            if numpy.any(divided):
+                lengths = sizes[divided]
+                divided_starts = numpy.cumsum(lengths) - lengths
+                halves = numpy.stack((divided_starts, divided_starts + lengths // 2), axis=1).ravel()
+
+                left_maximums[divided] = numpy.maximum.reduceat(values[order], halves)[0::2]
+                right_minimums[divided] = numpy.minimum.reduceat(values[order], halves)[1::2]
+
+            yield begins, ends, lowers, uppers, sums, dimensions, left_maximums, right_minimums
+
+            middles = (begins[divided] + ends[divided]) // 2
+            begins, ends = numpy.stack((begins[divided], middles), axis=1).ravel(), numpy.stack((middles, ends[divided]), axis=1).ravel()
+
+
+    @staticmethod
+    def __scatter(nodes, values, amount_nodes):
+        """!
+        @brief Returns list of values of all nodes of the implicit tree, -1 is used for nodes that do not exist.
+
+        """
+
+        result = numpy.full(amount_nodes, -1, dtype=values.dtype)
+        result[nodes] = values
+        return result.tolist()
@@ -0,0 +1,289 @@
+"""!
+
+@brief Data Structure: Radius Neighbor Graph
+@details Sparse graph of neighbors that is built once for the maximum connectivity radius and reused by density-based
+          algorithms (DBSCAN, OPTICS, ROCK) for any smaller radius.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+from pyclustering.container.balltree import balltree
+from pyclustering.utils.metric import type_metric
+
+
+class neighbor_graph:
+    """!
+    @brief Radius neighbor graph where neighbors of each point are stored in compressed sparse rows (CSR) format.
+    @details Neighbors of point 'i' are 'indices[indptr[i]:indptr[i + 1]]' and distances to them are stored in the same
+              positions of 'distances'. Each row is sorted by distance, therefore neighbors in line with any radius that
+              is less or equal to the maximum radius are obtained by truncation of rows, point itself is not stored in
+              its row. In case of points, graph is built using KD-tree for Euclidean distance and using ball-tree for
+              other metrics, in case of distance matrix it is built by blocks of rows. Graph can be saved to file and
+              loaded later.
+
+    Example:
+    @code
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+
+        # graph is built only once for the maximum radius
+        graph = neighbor_graph.create(sample, 0.7)
+        graph.save('lsun_graph.npz')
+
+        # each run of DBSCAN uses truncated rows of the graph instead of region queries
+        for eps in [0.3, 0.4, 0.5, 0.6, 0.7]:
+            dbscan_instance = dbscan(graph, eps, 3, ccore=False, data_type='neighbor_graph')
+            dbscan_instance.process()
+    @endcode
+
+    @see dbscan
+    @see optics
+    @see rock
+
+    """
+
+    def __init__(self, indptr, indices, distances, max_eps):
+        """!
+        @brief Creates neighbor graph from arrays in CSR format.
+
+        @param[in] indptr (array_like): Boundaries of rows, length is amount of points plus one.
+        @param[in] indices (array_like): Indexes of neighbors, each row is sorted by distance.
+        @param[in] distances (array_like): Distances to neighbors.
+        @param[in] max_eps (double): Maximum connectivity radius that has been used to build the graph.
+
+        """
+
+        self.__indptr = numpy.asarray(indptr, dtype=numpy.int64)
+        self.__indices = numpy.asarray(indices, dtype=numpy.int64)
+        self.__distances = numpy.asarray(distances, dtype=numpy.float64)
+        self.__max_eps = float(max_eps)
+
+        if (len(self.__indptr) == 0) or (self.__indptr[-1] != len(self.__indices)) or (len(self.__indices) != len(self.__distances)):
+            raise ValueError("Arrays of neighbor graph are inconsistent (rows: '%d', indices: '%d', distances: '%d')." %
+                             (len(self.__indptr) - 1, len(self.__indices), len(self.__distances)))
+
+
+    @staticmethod
+    def create(data, max_eps, data_type='points', metric=None):
+        """!
+        @brief Builds neighbor graph for the specified maximum connectivity radius.
+
+        @param[in] data (array_like): Input data that is presented as array of points or as distance matrix.
+        @param[in] max_eps (double): Maximum connectivity radius, points are neighbors if distance between them is less or equal to it.
+        @param[in] data_type (string): Data type of input sample 'data' ('points', 'distance_matrix').
+        @param[in] metric (distance_metric): Metric that is used for distance calculation between points (by default
+                    Euclidean), it is not used in case of distance matrix.
+
+        @return (neighbor_graph) Neighbor graph.
+
+        """
+
+        if max_eps < 0:
+            raise ValueError("Maximum connectivity radius should be non-negative (current value: '%s')." % str(max_eps))
+
+        if data_type == 'points':
+            rows, columns, distances = neighbor_graph.__create_pairs_points(data, max_eps, metric)
+        elif data_type == 'distance_matrix':
+            rows, columns, distances = neighbor_graph.__create_pairs_distance_matrix(data, max_eps)
+        else:
+            raise TypeError("Unknown type of data is specified '%s'" % data_type)
+
+        order = numpy.lexsort((columns, distances, rows))
+
+        indptr = numpy.zeros(len(data) + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(rows, minlength=len(data)), out=indptr[1:])
+
+        return neighbor_graph(indptr, columns[order], distances[order], max_eps)
+
+
+    @staticmethod
+    def load(file):
+        """!
+        @brief Loads neighbor graph that has been saved by method save().
+
+        @param[in] file (string|file): Name of the file or file object.
+
+        @return (neighbor_graph) Loaded neighbor graph.
+
+        @see save()
+
+        """
+
+        with numpy.load(file) as content:
+            return neighbor_graph(content['indptr'], content['indices'], content['distances'], content['max_eps'])
+
+
+    def save(self, file):
+        """!
+        @brief Saves neighbor graph to file in NumPy '.npz' format.
+
+        @param[in] file (string|file): Name of the file or file object.
+
+        @see load()
+
+        """
+
+        numpy.savez_compressed(file, indptr=self.__indptr, indices=self.__indices, distances=self.__distances,
+                               max_eps=numpy.float64(self.__max_eps))
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of points in the graph.
+
+        """
+
+        return len(self.__indptr) - 1
+
+
+    def get_max_eps(self):
+        """!
+        @brief Returns maximum connectivity radius that has been used to build the graph.
+
+        """
+
+        return self.__max_eps
+
+
+    def neighbors(self, index_point, eps=None):
+        """!
+        @brief Returns neighbors of the point in line with connectivity radius.
+
+        @param[in] index_point (uint): Index of the point.
+        @param[in] eps (double): Connectivity radius that should be less or equal to the maximum radius (by default the maximum radius).
+
+        @return (tuple) Indexes of neighbors and distances to them, neighbors are sorted by distance.
+
+        """
+
+        self.__verify_eps(eps)
+
+        begin, end = self.__indptr[index_point], self.__indptr[index_point + 1]
+        if (eps is not None) and (eps < self.__max_eps):
+            end = begin + numpy.searchsorted(self.__distances[begin:end], eps, side='right')
+
+        return self.__indices[begin:end], self.__distances[begin:end]
+
+
+    def csr(self, eps=None):
+        """!
+        @brief Returns graph in line with connectivity radius in CSR format.
+
+        @param[in] eps (double): Connectivity radius that should be less or equal to the maximum radius (by default the maximum radius).
+
+        @return (tuple) Boundaries of rows, indexes of neighbors and distances to them (each row is sorted by distance).
+
+        """
+
+        self.__verify_eps(eps)
+        if (eps is None) or (eps >= self.__max_eps):
+            return self.__indptr, self.__indices, self.__distances
+
+        mask = self.__distances <= eps
+
+        # amount of kept neighbors before each position of the original arrays
+        kept = numpy.zeros(len(mask) + 1, dtype=numpy.int64)
+        numpy.cumsum(mask, out=kept[1:])
+        indptr = kept[self.__indptr]
+
+        return indptr, self.__indices[mask], self.__distances[mask]
+
+
+    def __verify_eps(self, eps):
+        """!
+        @brief Verifies that connectivity radius can be processed using the graph.
+
+        @param[in] eps (double): Connectivity radius.
+
+        """
+
+        if (eps is not None) and (eps > self.__max_eps):
+            raise ValueError("Connectivity radius '%s' is greater than maximum radius of neighbor graph '%s'." %
+                             (str(eps), str(self.__max_eps)))
+
+
+    @staticmethod
+    def __create_pairs_points(data, max_eps, metric):
+        """!
+        @brief Finds pairs of neighbor points using KD-tree or ball-tree in case of non-Euclidean metric.
+
+        @param[in] data (array_like): Input data that is presented as array of points.
+        @param[in] max_eps (double): Maximum connectivity radius.
+        @param[in] metric (distance_metric): Metric that is used for distance calculation between points.
+
+        @return (tuple) Indexes of points, indexes of their neighbors and distances between them.
+
+        """
+
+        if len(data) == 0:
+            return numpy.zeros(0, dtype=numpy.int64), numpy.zeros(0, dtype=numpy.int64), numpy.zeros(0)
+
+        points = numpy.asarray(data, dtype=numpy.float64).reshape(len(data), -1)
+        if (metric is None) or (metric.get_type() == type_metric.EUCLIDEAN):
+            # SciPy is imported only when the graph is built, import of the module does not depend on it.
+            from scipy.spatial import cKDTree
+
+            pairs = cKDTree(points).query_pairs(max_eps, output_type='ndarray')
+
+            difference = points[pairs[:, 0]] - points[pairs[:, 1]]
+            distances = numpy.sqrt(numpy.einsum('ij,ij->i', difference, difference))
+        else:
+            pairs, distances = balltree(points, metric).query_pairs(max_eps)
+
+        return (numpy.concatenate((pairs[:, 0], pairs[:, 1])), numpy.concatenate((pairs[:, 1], pairs[:, 0])),
+                numpy.concatenate((distances, distances)))
+
+
+    @staticmethod
+    def __create_pairs_distance_matrix(data, max_eps):
+        """!
+        @brief Finds pairs of neighbor points using distance matrix that is processed by blocks of rows.
+
+        @param[in] data (array_like): Input data that is presented as distance matrix.
+        @param[in] max_eps (double): Maximum connectivity radius.
+
+        @return (tuple) Indexes of points, indexes of their neighbors and distances between them.
+
+        """
+
+        amount_points = len(data)
+        block_size = max(1, neighbor_graph.__BLOCK_ELEMENTS // max(amount_points, 1))
+
+        rows, columns, distances = [numpy.zeros(0, dtype=numpy.int64)], [numpy.zeros(0, dtype=numpy.int64)], [numpy.zeros(0)]
+        for index_begin in range(0, amount_points, block_size):
+            block = numpy.asarray(data[index_begin:index_begin + block_size], dtype=numpy.float64)
+
+            block_rows, block_columns = numpy.nonzero(block <= max_eps)
+            block_distances = block[block_rows, block_columns]
+            block_rows += index_begin
+
+            itself = (block_rows == block_columns)
+            rows.append(block_rows[~itself])
+            columns.append(block_columns[~itself])
+            distances.append(block_distances[~itself])
+
+        return numpy.concatenate(rows), numpy.concatenate(columns), numpy.concatenate(distances)
+
+
+    ## Amount of elements of distance matrix that are compared with the connectivity radius at once.
+    __BLOCK_ELEMENTS = 1024 * 1024
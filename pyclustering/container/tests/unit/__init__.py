@@ -26,8 +26,10 @@
 import unittest;
 from pyclustering.tests.suite_holder import suite_holder;
 
+from pyclustering.container.tests.unit                   import ut_balltree      as container_balltree_unit_tests;
 from pyclustering.container.tests.unit                   import ut_cftree        as container_cftree_unit_tests;
 from pyclustering.container.tests.unit                   import ut_kdtree        as container_kdtree_unit_tests;
+from pyclustering.container.tests.unit                   import ut_neighbor_graph as container_neighbor_graph_unit_tests;
 
 
 class container_unit_tests(suite_holder):
@@ -37,8 +39,10 @@ class container_unit_tests(suite_holder):
 
     @staticmethod
     def fill_suite(unit_container_suite):
+        unit_container_suite.addTests(unittest.TestLoader().loadTestsFromModule(container_balltree_unit_tests));
         unit_container_suite.addTests(unittest.TestLoader().loadTestsFromModule(container_cftree_unit_tests));
         unit_container_suite.addTests(unittest.TestLoader().loadTestsFromModule(container_kdtree_unit_tests));
+        unit_container_suite.addTests(unittest.TestLoader().loadTestsFromModule(container_neighbor_graph_unit_tests));
 
 
 if __name__ == "__main__":
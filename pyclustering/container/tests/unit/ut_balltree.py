@@ -0,0 +1,129 @@
+"""!
+
+@brief Unit-tests for ball-tree.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+
+import numpy
+
+from pyclustering.container.balltree import balltree
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.utils import read_sample
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class BallTreeUnitTest(unittest.TestCase):
+    def templateQueriesTheSameAsBruteForce(self, path, metric, k, radius, leaf_size=4, pool_size=1):
+        sample = read_sample(path)
+        tree = balltree(sample, metric, leaf_size)
+
+        self.assertEqual(len(sample), len(tree))
+        matrix = numpy.array([[metric(point1, point2) for point2 in sample] for point1 in sample])
+
+        indexes, distances = tree.query_knn(sample, k, pool_size=pool_size)
+        self.assertEqual((len(sample), k), indexes.shape)
+        self.assertTrue(numpy.allclose(numpy.sort(matrix, axis=1)[:, :k], distances))
+        self.assertTrue(numpy.allclose(matrix[numpy.arange(len(sample))[:, None], indexes], distances))
+
+        indptr, indices, radius_distances = tree.query_radius(sample, radius, pool_size=pool_size)
+        self.assertEqual(len(sample) + 1, len(indptr))
+        for index_point in range(len(sample)):
+            neighbors = indices[indptr[index_point]:indptr[index_point + 1]]
+            self.assertEqual(numpy.flatnonzero(matrix[index_point] <= radius).tolist(), neighbors.tolist())
+            self.assertTrue(numpy.allclose(matrix[index_point][neighbors], radius_distances[indptr[index_point]:indptr[index_point + 1]]))
+
+        pairs, pair_distances = tree.query_pairs(radius, pool_size=pool_size)
+        expected = numpy.argwhere(numpy.triu(matrix <= radius, 1))
+        self.assertEqual(sorted(map(tuple, expected.tolist())), sorted(map(tuple, pairs.tolist())))
+        self.assertTrue(numpy.allclose(matrix[pairs[:, 0], pairs[:, 1]], pair_distances))
+
+
+    def testEuclideanSampleSimple3(self):
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, distance_metric(type_metric.EUCLIDEAN), 5, 0.5)
+
+    def testEuclideanSquareSampleSimple3(self):
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, distance_metric(type_metric.EUCLIDEAN_SQUARE), 5, 0.25)
+
+    def testManhattanSampleSimple3(self):
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, distance_metric(type_metric.MANHATTAN), 5, 0.7)
+
+    def testChebyshevSampleSimple3(self):
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, distance_metric(type_metric.CHEBYSHEV), 5, 0.4)
+
+    def testMinkowskiSampleSimple3(self):
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, distance_metric(type_metric.MINKOWSKI, degree=4), 5, 0.5)
+
+    def testCanberraSampleSimple3(self):
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, distance_metric(type_metric.CANBERRA), 5, 0.1)
+
+    def testUserDefinedSampleSimple1(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=lambda point1, point2: abs(point1[0] - point2[0]) + abs(point1[1] - point2[1]))
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, metric, 3, 1.0)
+
+    def testManhattanThreeDimensional(self):
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, distance_metric(type_metric.MANHATTAN), 4, 1.5)
+
+    def testManhattanOneDimensional(self):
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, distance_metric(type_metric.MANHATTAN), 3, 0.5)
+
+    def testManhattanTheSameData(self):
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, distance_metric(type_metric.MANHATTAN), 3, 0.0)
+
+    def testChebyshevLsunThreadPool(self):
+        self.templateQueriesTheSameAsBruteForce(FCPS_SAMPLES.SAMPLE_LSUN, distance_metric(type_metric.CHEBYSHEV), 4, 0.3, 16, 3)
+
+    def testDefaultMetricLeafSizeOne(self):
+        self.templateQueriesTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE2, distance_metric(type_metric.EUCLIDEAN), 3, 1.0, 1)
+
+
+    def testEmptyTree(self):
+        tree = balltree([])
+        self.assertEqual(0, len(tree))
+
+        indptr, indices, distances = tree.query_radius([[1.0, 1.0]], 1.0)
+        self.assertEqual([0, 0], indptr.tolist())
+        self.assertEqual(0, len(indices))
+
+        pairs, distances = tree.query_pairs(1.0)
+        self.assertEqual((0, 2), pairs.shape)
+
+
+    def testIncorrectArguments(self):
+        self.assertRaises(ValueError, balltree, [[1.0], [2.0]], None, 0)
+        self.assertRaises(ValueError, balltree, [[1.0], [2.0]], distance_metric(type_metric.CHI_SQUARE))
+        self.assertRaises(ValueError, balltree, [[1.0], [2.0]], distance_metric(type_metric.MINKOWSKI, degree=0.5))
+
+        tree = balltree([[1.0], [2.0]])
+        self.assertEqual(type_metric.EUCLIDEAN, tree.get_metric().get_type())
+        self.assertRaises(ValueError, tree.query_knn, [[1.0]], 0)
+        self.assertRaises(ValueError, tree.query_knn, [[1.0]], 3)
+        self.assertRaises(ValueError, tree.query_radius, [[1.0]], -1.0)
+        self.assertRaises(ValueError, tree.query_pairs, 1.0, pool_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,11 +30,12 @@ import math
 
 import numpy
 
-from pyclustering.container.kdtree import kdtree, kdtree_text_visualizer
+from pyclustering.container.kdtree import kdtree, kdtree_balanced, kdtree_text_visualizer
 
 from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
 
-from pyclustering.utils import read_sample
+from pyclustering.utils import read_sample, euclidean_distance_square
+from pyclustering.utils.metric import distance_metric, type_metric
 
 
 class KDTreeUnitTest(unittest.TestCase):
@@ -415,5 +416,255 @@ class KDTreeUnitTest(unittest.TestCase):
         self.templateTheSameDataSearchAndRemove(numpy.array([ [2] ]), [ None ]);
 
 
+    def templateSearchOrder(self, points, radius):
+        order = kdtree.search_order(points);
+        tree = kdtree(points, range(len(points)));
+
+        for point in points:
+            payloads = [kdnode.payload for _, kdnode in tree.find_nearest_dist_nodes(point, radius)];
+            self.assertEqual(payloads, sorted(payloads, key=lambda index_point: order[index_point]));
+
+        self.assertEqual(sorted(order.tolist()), list(range(len(points))));
+
+    def testSearchOrderSampleSimple3(self):
+        self.templateSearchOrder(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 0.7);
+
+    def testSearchOrderTheSameData(self):
+        self.templateSearchOrder(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE9), 0.5);
+
+    def testSearchOrderDuplicatePoints(self):
+        self.templateSearchOrder([[0, 1], [0, 1], [1, 0], [1, 1], [1, 2], [1, 0], [0, 2], [1, 0]], 1.5);
+
+    def testSearchOrderOneDimensional(self):
+        self.templateSearchOrder([[3], [1], [2], [1], [3], [0], [2]], 1.0);
+
+    def testSearchOrderEmptyData(self):
+        self.assertEqual([], kdtree.search_order([]).tolist());
+
+
+
+    def templateBalancedSearch(self, path, radius, leaf_size):
+        sample = read_sample(path);
+        tree = kdtree_balanced(sample, range(len(sample)), leaf_size);
+
+        assert len(tree) == len(sample);
+        for point in sample:
+            expected = sorted([index for index in range(len(sample)) if euclidean_distance_square(point, sample[index]) <= radius * radius]);
+
+            # neighbors are returned in order of insertion regardless of structure of the tree
+            found_nodes = tree.find_nearest_dist_nodes(point, radius);
+            assert [node.payload for _, node in found_nodes] == expected;
+            for distance, node in found_nodes:
+                assert node.data == sample[node.payload];
+                assert math.isclose(distance, euclidean_distance_square(point, node.data));
+
+            payloads, distances = tree.find_nearest_dist_payloads(point, radius);
+            assert payloads == expected;
+
+            distance, nearest_node = tree.find_nearest_dist_node(point, radius, True);
+            assert distance == 0.0;
+            assert nearest_node.data == point;
+
+    def testBalancedSearchSampleSimple3(self):
+        self.templateBalancedSearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.7, 4);
+
+    def testBalancedSearchOneDimensional(self):
+        self.templateBalancedSearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, 0.5, 2);
+
+    def testBalancedSearchThreeDimensional(self):
+        self.templateBalancedSearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, 1.0, 1);
+
+    def testBalancedSearchLsun(self):
+        self.templateBalancedSearch(FCPS_SAMPLES.SAMPLE_LSUN, 0.5, kdtree_balanced.DEFAULT_LEAF_SIZE);
+
+    def testBalancedSearchTheSameData(self):
+        self.templateBalancedSearch(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, 0.5, 1);
+
+    def testBalancedDepthDoesNotDependOnOrder(self):
+        # sorted points produce degenerate tree in case of insertion one by one
+        sample = [[float(index)] for index in range(2000)];
+        tree = kdtree_balanced(sample, range(len(sample)), 1);
+
+        assert sorted(tree.find_nearest_dist_payloads([1000.2], 1.0)[0]) == [1000, 1001];
+        assert tree.find_nearest_dist_node([2500.0], 10.0) is None;
+
+    def testBalancedInsertRemove(self):
+        random_generator = numpy.random.RandomState(1000);
+        tree = kdtree_balanced(leaf_size=2);
+        points = {};
+
+        for step in range(1000):
+            if (len(points) > 0) and (random_generator.rand() < 0.4):
+                payload = sorted(points.keys())[random_generator.randint(len(points))];
+                assert tree.remove(points.pop(payload), payload=payload) is True;
+            else:
+                points[step] = random_generator.randint(0, 10, 2).tolist();
+                tree.insert(points[step], step);
+
+            assert len(tree) == len(points);
+
+            center = random_generator.randint(0, 10, 2).tolist();
+            expected = sorted([payload for payload, point in points.items() if euclidean_distance_square(center, point) <= 4.0]);
+            assert tree.find_nearest_dist_payloads(center, 2.0)[0] == expected;
+
+        assert tree.remove([100, 100]) is False;
+
+    def testBalancedEmptyTree(self):
+        tree = kdtree_balanced();
+        assert len(tree) == 0;
+        assert tree.find_nearest_dist_nodes([0.0, 0.0], 1.0) == [];
+        assert tree.find_nearest_dist_node([0.0, 0.0], 1.0) is None;
+
+    def templateBalancedSplitLevels(self, data, leaf_size):
+        indexes = numpy.arange(len(data));
+        expected_begins, expected_ends = [0], [len(data)];
+
+        for begins, ends, lowers, uppers, sums, dimensions, left_maximums, right_minimums in kdtree_balanced.split_levels(data, indexes, leaf_size):
+            assert begins.tolist() == expected_begins;
+            assert ends.tolist() == expected_ends;
+
+            expected_begins, expected_ends = [], [];
+            for index_node in range(len(begins)):
+                points = data[indexes[begins[index_node]:ends[index_node]]];
+                assert numpy.array_equal(points.min(axis=0), lowers[index_node]);
+                assert numpy.array_equal(points.max(axis=0), uppers[index_node]);
+                assert numpy.allclose(points.sum(axis=0), sums[index_node]);
+
+                dimension = dimensions[index_node];
+                if dimension < 0:
+                    assert (len(points) <= leaf_size) or numpy.all(points == points[0]);
+                    continue;
+
+                middle = len(points) // 2;
+                assert left_maximums[index_node] == points[:middle, dimension].max();
+                assert right_minimums[index_node] == points[middle:, dimension].min();
+                assert left_maximums[index_node] <= right_minimums[index_node];
+
+                expected_begins += [begins[index_node], begins[index_node] + middle];
+                expected_ends += [begins[index_node] + middle, ends[index_node]];
+
+        assert expected_begins == [];
+        assert sorted(indexes.tolist()) == list(range(len(data)));
+
+    def testBalancedSplitLevelsSampleSimple3(self):
+        self.templateBalancedSplitLevels(numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)), 4);
+
+    def testBalancedSplitLevelsTheSameData(self):
+        data = numpy.random.RandomState(1000).randint(0, 3, (300, 2)).astype(float);
+        self.templateBalancedSplitLevels(data, 1);
+        self.templateBalancedSplitLevels(data, 16);
+
+    def testBalancedIncorrectArguments(self):
+        self.assertRaises(ValueError, kdtree_balanced, [[1.0], [2.0]], None, 0);
+        self.assertRaises(ValueError, kdtree_balanced, [[1.0], [2.0]], [1]);
+
+
+    def templateBalancedQueries(self, path, k, radius, pool_size):
+        sample = read_sample(path);
+        tree = kdtree_balanced(sample);
+
+        indexes, distances = tree.query_knn(sample, k, pool_size=pool_size);
+        indptr, indices, radius_distances = tree.query_radius(sample, radius, pool_size=pool_size);
+
+        assert indexes.shape == (len(sample), k);
+        assert len(indptr) == len(sample) + 1;
+        for index_point in range(len(sample)):
+            expected = sorted([euclidean_distance_square(sample[index_point], point) ** 0.5 for point in sample])[:k];
+            assert numpy.allclose(distances[index_point], expected);
+            for index_neighbor, distance in zip(indexes[index_point], distances[index_point]):
+                assert math.isclose(distance, euclidean_distance_square(sample[index_point], sample[index_neighbor]) ** 0.5, abs_tol=1e-12);
+
+            neighbors = indices[indptr[index_point]:indptr[index_point + 1]].tolist();
+            assert neighbors == [index for index in range(len(sample)) if euclidean_distance_square(sample[index_point], sample[index]) <= radius * radius];
+            for index_neighbor, distance in zip(neighbors, radius_distances[indptr[index_point]:indptr[index_point + 1]]):
+                assert math.isclose(distance, euclidean_distance_square(sample[index_point], sample[index_neighbor]) ** 0.5, abs_tol=1e-12);
+
+    def testBalancedQueriesSampleSimple3(self):
+        self.templateBalancedQueries(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 5, 0.5, 1);
+
+    def testBalancedQueriesSampleSimple3ThreadPool(self):
+        self.templateBalancedQueries(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 5, 0.5, 3);
+
+    def testBalancedQueriesAllNeighbors(self):
+        self.templateBalancedQueries(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 10, 10.0, 2);
+
+    def testBalancedQueriesTheSameData(self):
+        self.templateBalancedQueries(SIMPLE_SAMPLES.SAMPLE_SIMPLE12, 3, 0.0, 1);
+
+    def testBalancedQueriesThreeDimensional(self):
+        self.templateBalancedQueries(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, 4, 1.0, 1);
+
+    def testBalancedQueriesAfterRemove(self):
+        points = [[0.0], [1.0], [2.0], [3.0], [4.0]];
+        tree = kdtree_balanced(points, range(len(points)));
+        tree.remove([1.0], payload=1);
+        tree.insert([1.4], 5);
+
+        # indexes are positions of remaining points: [0.0], [2.0], [3.0], [4.0], [1.4]
+        indexes, distances = tree.query_knn([[1.1], [3.9]], 2);
+        assert indexes.tolist() == [[4, 1], [3, 2]];
+        assert numpy.allclose(distances, [[0.3, 0.9], [0.1, 0.9]]);
+
+        indptr, indices, _ = tree.query_radius([[1.1], [3.9]], 1.0);
+        assert indptr.tolist() == [0, 2, 4];
+        assert indices.tolist() == [1, 4, 2, 3];
+
+    def testBalancedQueriesIncorrectArguments(self):
+        tree = kdtree_balanced([[1.0], [2.0]]);
+        self.assertRaises(ValueError, tree.query_knn, [[1.0]], 0);
+        self.assertRaises(ValueError, tree.query_knn, [[1.0]], 3);
+        self.assertRaises(ValueError, tree.query_radius, [[1.0]], 1.0, pool_size=0);
+
+
+    def templateBalancedMetricQueries(self, path, metric, k, radius):
+        sample = read_sample(path);
+        tree = kdtree_balanced(sample, range(len(sample)), 4, metric);
+
+        indexes, distances = tree.query_knn(sample, k);
+        indptr, indices, radius_distances = tree.query_radius(sample, radius);
+
+        for index_point in range(len(sample)):
+            expected = sorted([metric(sample[index_point], point) for point in sample])[:k];
+            assert numpy.allclose(distances[index_point], expected);
+
+            neighbors = indices[indptr[index_point]:indptr[index_point + 1]].tolist();
+            assert neighbors == [index for index in range(len(sample)) if metric(sample[index_point], sample[index]) <= radius];
+            assert numpy.allclose(radius_distances[indptr[index_point]:indptr[index_point + 1]], [metric(sample[index_point], sample[index]) for index in neighbors]);
+
+            payloads, payload_distances = tree.find_nearest_dist_payloads(sample[index_point], radius);
+            assert sorted(payloads) == neighbors;
+
+    def testBalancedMetricQueriesManhattan(self):
+        self.templateBalancedMetricQueries(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, distance_metric(type_metric.MANHATTAN), 5, 0.7);
+
+    def testBalancedMetricQueriesChebyshev(self):
+        self.templateBalancedMetricQueries(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, distance_metric(type_metric.CHEBYSHEV), 5, 0.4);
+
+    def testBalancedMetricQueriesMinkowski(self):
+        self.templateBalancedMetricQueries(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, distance_metric(type_metric.MINKOWSKI, degree=4), 5, 0.5);
+
+    def testBalancedMetricQueriesEuclideanSquare(self):
+        self.templateBalancedMetricQueries(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, distance_metric(type_metric.EUCLIDEAN_SQUARE), 5, 0.25);
+
+    def testBalancedMetricQueriesThreeDimensional(self):
+        self.templateBalancedMetricQueries(SIMPLE_SAMPLES.SAMPLE_SIMPLE11, distance_metric(type_metric.MANHATTAN), 4, 1.5);
+
+    def testBalancedMetricSearchDistances(self):
+        tree = kdtree_balanced([[0.0, 0.0], [1.0, 1.0], [3.0, 0.0]], range(3), metric=distance_metric(type_metric.MANHATTAN));
+
+        payloads, distances = tree.find_nearest_dist_payloads([0.0, 0.0], 2.0);
+        assert sorted(zip(payloads, distances.tolist())) == [(0, 0.0), (1, 2.0)];
+
+        # square distance is returned in case of Euclidean metric for compatibility with kdtree
+        tree = kdtree_balanced([[0.0, 0.0], [1.0, 1.0], [3.0, 0.0]], range(3));
+        distance, nearest_node = tree.find_nearest_dist_node([3.0, 1.0], 1.5, True);
+        assert (distance, nearest_node.payload) == (1.0, 2);
+
+    def testBalancedMetricIsNotLpNorm(self):
+        self.assertRaises(ValueError, kdtree_balanced, [[1.0], [2.0]], None, 16, distance_metric(type_metric.CANBERRA));
+        self.assertRaises(ValueError, kdtree_balanced, [[1.0], [2.0]], None, 16, distance_metric(type_metric.CHI_SQUARE));
+        self.assertRaises(ValueError, kdtree_balanced, [[1.0], [2.0]], None, 16, distance_metric(type_metric.MINKOWSKI, degree=0));
+
+
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
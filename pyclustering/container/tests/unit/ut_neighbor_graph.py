@@ -0,0 +1,165 @@
+"""!
+
+@brief Unit-tests for radius neighbor graph.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import io
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from pyclustering.container.neighbor_graph import neighbor_graph
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.utils import read_sample, calculate_distance_matrix, euclidean_distance
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class NeighborGraphUnitTest(unittest.TestCase):
+    def templateNeighborsTheSameAsBruteForce(self, path, max_eps, radiuses):
+        sample = read_sample(path)
+        graph = neighbor_graph.create(sample, max_eps)
+
+        self.assertEqual(len(sample), len(graph))
+        self.assertEqual(max_eps, graph.get_max_eps())
+
+        for radius in radiuses:
+            indptr, indices, distances = graph.csr(radius)
+            self.assertEqual(len(sample) + 1, len(indptr))
+
+            for index_point in range(len(sample)):
+                neighbors, neighbor_distances = graph.neighbors(index_point, radius)
+
+                expected = sorted(index for index in range(len(sample)) if (index != index_point) and
+                                  (euclidean_distance(sample[index_point], sample[index]) <= radius))
+
+                self.assertEqual(expected, sorted(neighbors.tolist()))
+                self.assertEqual(neighbors.tolist(), indices[indptr[index_point]:indptr[index_point + 1]].tolist())
+                self.assertTrue(numpy.all(numpy.diff(neighbor_distances) >= 0.0))
+
+                for index_neighbor, distance in zip(neighbors, neighbor_distances):
+                    self.assertAlmostEqual(euclidean_distance(sample[index_point], sample[index_neighbor]), distance)
+
+    def testNeighborsSampleSimple1(self):
+        self.templateNeighborsTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1.0, [0.1, 0.5, 1.0])
+
+    def testNeighborsSampleSimple3(self):
+        self.templateNeighborsTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 2.0, [0.0, 0.3, 0.7, 2.0])
+
+    def testNeighborsTheSameData(self):
+        self.templateNeighborsTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE9, 0.5, [0.0, 0.5])
+
+    def testNeighborsOneDimension(self):
+        self.templateNeighborsTheSameAsBruteForce(SIMPLE_SAMPLES.SAMPLE_SIMPLE7, 1.0, [0.2, 1.0])
+
+
+    def testDistanceMatrixTheSameAsPoints(self):
+        sample = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+
+        expected = neighbor_graph.create(sample, 0.5)
+        actual = neighbor_graph.create(calculate_distance_matrix(sample), 0.5, 'distance_matrix')
+
+        for radius in [0.2, 0.5]:
+            expected_indptr, expected_indices, expected_distances = expected.csr(radius)
+            indptr, indices, distances = actual.csr(radius)
+
+            self.assertEqual(expected_indptr.tolist(), indptr.tolist())
+            self.assertEqual(expected_indices.tolist(), indices.tolist())
+            self.assertTrue(numpy.allclose(expected_distances, distances))
+
+
+    def templateMetricTheSameAsDistanceMatrix(self, path, max_eps, metric):
+        sample = read_sample(path)
+        matrix = [[metric(point1, point2) for point2 in sample] for point1 in sample]
+
+        expected = neighbor_graph.create(matrix, max_eps, 'distance_matrix')
+        actual = neighbor_graph.create(sample, max_eps, metric=metric)
+
+        for index_point in range(len(sample)):
+            expected_neighbors, expected_distances = expected.neighbors(index_point)
+            neighbors, distances = actual.neighbors(index_point)
+
+            self.assertEqual(sorted(expected_neighbors.tolist()), sorted(neighbors.tolist()))
+            self.assertTrue(numpy.allclose(expected_distances, distances))
+
+
+    def testMetricManhattan(self):
+        self.templateMetricTheSameAsDistanceMatrix(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.8, distance_metric(type_metric.MANHATTAN))
+
+
+    def testMetricCanberra(self):
+        self.templateMetricTheSameAsDistanceMatrix(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 0.1, distance_metric(type_metric.CANBERRA))
+
+
+    def testMetricUserDefined(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=lambda point1, point2: max(abs(point1[0] - point2[0]), abs(point1[1] - point2[1])))
+        self.templateMetricTheSameAsDistanceMatrix(SIMPLE_SAMPLES.SAMPLE_SIMPLE1, 1.0, metric)
+
+
+    def testSaveLoadFileObject(self):
+        graph = neighbor_graph.create(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3), 1.0)
+
+        stream = io.BytesIO()
+        graph.save(stream)
+        stream.seek(0)
+
+        loaded = neighbor_graph.load(stream)
+        self.assertEqual(graph.get_max_eps(), loaded.get_max_eps())
+        for expected, actual in zip(graph.csr(0.5), loaded.csr(0.5)):
+            self.assertEqual(expected.tolist(), actual.tolist())
+
+    def testSaveLoadFile(self):
+        graph = neighbor_graph.create(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1), 0.5)
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'graph.npz')
+            graph.save(filename)
+            loaded = neighbor_graph.load(filename)
+
+        self.assertEqual(len(graph), len(loaded))
+        for expected, actual in zip(graph.csr(), loaded.csr()):
+            self.assertEqual(expected.tolist(), actual.tolist())
+
+
+    def testEmptyData(self):
+        for data_type in ['points', 'distance_matrix']:
+            graph = neighbor_graph.create([], 1.0, data_type)
+            self.assertEqual(0, len(graph))
+            self.assertEqual([0], graph.csr(0.5)[0].tolist())
+
+    def testIncorrectArguments(self):
+        graph = neighbor_graph.create([[0.0], [1.0]], 1.0)
+
+        self.assertRaises(ValueError, graph.csr, 1.5)
+        self.assertRaises(ValueError, graph.neighbors, 0, 1.5)
+        self.assertRaises(ValueError, neighbor_graph.create, [[0.0], [1.0]], -1.0)
+        self.assertRaises(TypeError, neighbor_graph.create, [[0.0], [1.0]], 1.0, 'unknown')
+        self.assertRaises(ValueError, neighbor_graph, [0, 1], [1], [], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,4 +21,75 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 @endcond
 
-"""
\ No newline at end of file
+"""
+
+
+def set_thread_amount(amount):
+    """!
+    @brief Sets amount of threads that are used by parallel algorithms of CCORE library (DBSCAN, OPTICS, Elbow, etc.).
+    @details Amount of threads can be also specified using environment variable 'PYCLUSTERING_CCORE_THREADS' before
+              the library is loaded. The setting does not affect Python implementation of algorithms.
+
+    @param[in] amount (uint): Amount of threads, '0' means that amount of threads is defined by hardware concurrency,
+                value that is greater than hardware concurrency is truncated.
+
+    """
+    if amount < 0:
+        raise ValueError("Amount of threads should be non-negative (current value: '%d')." % amount)
+
+    from pyclustering.core.wrapper import ccore_library
+    if ccore_library.workable() is True:
+        from pyclustering.core.parallel_wrapper import parallel_set_thread_amount
+        parallel_set_thread_amount(amount)
+
+
+def get_thread_amount():
+    """!
+    @brief Returns amount of threads that are used by parallel algorithms of CCORE library.
+    @details If CCORE library is not available then '1' is returned.
+
+    @return (uint) Amount of threads.
+
+    """
+    from pyclustering.core.wrapper import ccore_library
+    if ccore_library.workable() is True:
+        from pyclustering.core.parallel_wrapper import parallel_get_thread_amount
+        return parallel_get_thread_amount()
+
+    return 1
+
+
+class thread_amount:
+    """!
+    @brief Context manager that limits amount of threads of CCORE library for a block of code.
+    @details Previous amount of threads is restored when the block is left.
+
+    Example:
+    @code
+        from pyclustering.core import thread_amount
+
+        with thread_amount(1):
+            dbscan_instance = dbscan(sample, 0.5, 3)
+            dbscan_instance.process()
+    @endcode
+
+    """
+
+    def __init__(self, amount):
+        """!
+        @brief Creates context manager that sets amount of threads for CCORE library.
+
+        @param[in] amount (uint): Amount of threads that should be used inside the block.
+
+        """
+        self.__amount = amount
+        self.__previous_amount = None
+
+    def __enter__(self):
+        self.__previous_amount = get_thread_amount()
+        set_thread_amount(self.__amount)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        set_thread_amount(self.__previous_amount)
+        return False
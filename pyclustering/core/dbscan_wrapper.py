@@ -43,6 +43,6 @@ def dbscan(sample, eps, min_neighbors, data_type):
     ccore.free_pyclustering_package(package)
     
     noise = list_of_clusters[len(list_of_clusters) - 1]
-    list_of_clusters.remove(noise)
+    list_of_clusters = list_of_clusters[:len(list_of_clusters) - 1]
 
     return list_of_clusters, noise
\ No newline at end of file
@@ -47,3 +47,6 @@ if (_platform == "linux") or (_platform == "linux2") or (_platform == "cygwin"):
 elif (_platform == "win32"):
     PATH_PYCLUSTERING_CCORE_LIBRARY = core.__path__[0] + os.sep + core_architecture + os.sep + "win" + os.sep + "ccore.dll";
 
+
+# Environment variable that defines amount of threads that is used by parallel algorithms of CCORE library.
+ENVIRONMENT_CCORE_THREAD_AMOUNT = "PYCLUSTERING_CCORE_THREADS";
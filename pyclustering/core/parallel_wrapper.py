@@ -0,0 +1,46 @@
+"""!
+
+@brief CCORE Wrapper for parallel processing settings.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+from ctypes import c_size_t
+
+from pyclustering.core.wrapper import ccore_library
+
+
+def parallel_set_thread_amount(amount):
+    ccore = ccore_library.get()
+    ccore.parallel_set_thread_amount(c_size_t(amount))
+
+
+def parallel_get_thread_amount():
+    ccore = ccore_library.get()
+    ccore.parallel_get_thread_amount.restype = c_size_t
+    return ccore.parallel_get_thread_amount()
+
+
+def parallel_get_hardware_thread_amount():
+    ccore = ccore_library.get()
+    ccore.parallel_get_hardware_thread_amount.restype = c_size_t
+    return ccore.parallel_get_hardware_thread_amount()
@@ -27,7 +27,7 @@
 
 from ctypes import *
 
-import collections
+import collections.abc
 import numpy
 
 
@@ -42,6 +42,9 @@ class pyclustering_package(Structure):
                 unsigned int     type;
                 void *           data;
             }
+    
+            Package that is created from NumPy array does not own its memory, in this case references to the buffers
+            are stored in python attribute 'buffers' of the package to keep them alive.
     """
     
     _fields_ = [ ("size", c_size_t),
@@ -110,8 +113,19 @@ class pyclustering_type_data:
 class package_builder:
     """!
     @brief Package builder provides service to create 'pyclustering_package' from data that is stored in 'list' container.
+    @details NumPy arrays are packed without copying: package of each row points directly to the row inside one
+              C-contiguous buffer that is owned by the package. Regular (rectangular) lists are converted to such
+              buffer once instead of packing each element separately, irregular lists are packed recursively.
 
     """
+
+    __PACKAGE_DTYPE = numpy.dtype({ 'names'    : [ 'size', 'type', 'data' ],
+                                    'formats'  : [ numpy.dtype(c_size_t), numpy.dtype(c_uint), numpy.uintp ],
+                                    'offsets'  : [ pyclustering_package.size.offset,
+                                                   pyclustering_package.type.offset,
+                                                   pyclustering_package.data.offset ],
+                                    'itemsize' : sizeof(pyclustering_package) })
+
     def __init__(self, dataset, c_data_type):
         """!
         @brief Initialize package builder object by dataset.
@@ -131,11 +145,17 @@ class package_builder:
         @return (pointer) ctype-pointer to pyclustering package.
         
         """
+        if isinstance(self.__dataset, ccore_dataset):
+            if (self.__c_data_type is None) or (self.__c_data_type is self.__dataset.get_ctype()):
+                return self.__dataset.get_pointer()
+            
+            return self.__create_package(self.__dataset.get_data())
+        
         return self.__create_package(self.__dataset)
 
 
     def __is_container_type(self, value):
-        return isinstance(value, collections.Iterable)
+        return isinstance(value, collections.abc.Iterable)
 
 
     def __get_type(self, pyclustering_data_type):
@@ -148,8 +168,8 @@ class package_builder:
     def __create_package(self, dataset):
         dataset_package = pyclustering_package()
         
-        if isinstance(dataset, numpy.matrix):
-            return self.__create_package_numpy_matrix(dataset_package, dataset)
+        if isinstance(dataset, numpy.ndarray):
+            return self.__create_package_numpy_array(dataset_package, dataset)
         
         dataset_package.size = len(dataset)
     
@@ -158,6 +178,10 @@ class package_builder:
             dataset_package.data = None
     
             return pointer(dataset_package)
+        
+        array = self.__convert_to_numpy_array(dataset)
+        if array is not None:
+            return self.__create_package_numpy_array(dataset_package, array)
     
         c_data_type = self.__fill_type(dataset_package, dataset)
         self.__fill_data(dataset_package, c_data_type, dataset)
@@ -165,6 +189,18 @@ class package_builder:
         return pointer(dataset_package)
 
 
+    def __convert_to_numpy_array(self, dataset):
+        if (self.__c_data_type is None) or (not self.__is_container_type(dataset[0])):
+            return None
+        
+        try:
+            return numpy.array(dataset, dtype=self.__c_data_type)
+        
+        except (ValueError, TypeError, OverflowError):
+            # irregular container (for example, clusters with different sizes) - it is packed recursively
+            return None
+
+
     def __fill_dataset_type(self, dataset_package, dataset):
         if self.__is_container_type(dataset[0]):
             dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_LIST
@@ -209,50 +245,249 @@ class package_builder:
             dataset_package.data = cast(array_object, POINTER(c_void_p))
 
 
-    def __create_package_numpy_matrix(self, dataset_package, dataset):
-        (rows, cols) = dataset.shape
+    def __get_numpy_ctype(self, dataset):
+        if self.__c_data_type is not None:
+            return self.__c_data_type
         
-        dataset_package.size = rows
-        dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_LIST
+        if dataset.dtype == numpy.float32:
+            return c_float
         
-        package_data = (POINTER(pyclustering_package) * rows)()
-        for row_index in range(rows):
-            array_package = pyclustering_package()
-            array_package.size = cols
-            array_package.type = pyclustering_type_data.get_pyclustering_type(self.__c_data_type)
-            
-            array_object = (self.__c_data_type * cols)()
-            for col_index in range(cols):
-                array_object[col_index] = self.__c_data_type(dataset[row_index, col_index])
+        elif numpy.issubdtype(dataset.dtype, numpy.floating):
+            return c_double
+        
+        elif numpy.issubdtype(dataset.dtype, numpy.integer):
+            return c_long
+        
+        raise NameError("Not supported type of pyclustering package.")
+
+
+    def __create_package_numpy_array(self, dataset_package, dataset):
+        c_data_type = self.__get_numpy_ctype(dataset)
+        
+        # copy is performed only if data type or memory layout is not suitable for the package
+        array = numpy.ascontiguousarray(dataset, dtype=numpy.dtype(c_data_type))
+        if array.ndim == 0:
+            array = array.reshape(1)
+        
+        dataset_package.size = array.shape[0]
+        if array.shape[0] == 0:
+            dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_UNDEFINED
+            dataset_package.data = None
         
-            array_package.data = cast(array_object, POINTER(c_void_p))
-            package_data[row_index] = pointer(array_package)
+        elif array.ndim == 1:
+            dataset_package.type = pyclustering_type_data.get_pyclustering_type(c_data_type)
+            dataset_package.data = cast(c_void_p(array.ctypes.data), POINTER(c_void_p))
+            dataset_package.buffers = (array,)
+        
+        elif array.ndim == 2:
+            self.__fill_numpy_rows(dataset_package, c_data_type, array)
+        
+        else:
+            dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_LIST
             
-        dataset_package.data = cast(package_data, POINTER(c_void_p))
+            package_data = (POINTER(pyclustering_package) * array.shape[0])()
+            for index in range(array.shape[0]):
+                package_data[index] = self.__create_package_numpy_array(pyclustering_package(), array[index])
+            
+            dataset_package.data = cast(package_data, POINTER(c_void_p))
+        
         return pointer(dataset_package)
 
 
+    def __fill_numpy_rows(self, dataset_package, c_data_type, array):
+        (rows, _) = array.shape
+        
+        # row packages are placed in one buffer, each of them refers to the row in the array
+        row_packages = numpy.zeros(rows, dtype=package_builder.__PACKAGE_DTYPE)
+        row_packages['size'] = array.shape[1]
+        row_packages['type'] = pyclustering_type_data.get_pyclustering_type(c_data_type)
+        row_packages['data'] = array.ctypes.data + numpy.arange(rows, dtype=numpy.uintp) * array.strides[0]
+        
+        row_pointers = row_packages.ctypes.data + numpy.arange(rows, dtype=numpy.uintp) * row_packages.itemsize
+        
+        dataset_package.type = pyclustering_type_data.PYCLUSTERING_TYPE_LIST
+        dataset_package.data = cast(c_void_p(row_pointers.ctypes.data), POINTER(c_void_p))
+        
+        # package does not own memory of numpy arrays, therefore they should be alive while package exists
+        dataset_package.buffers = (array, row_packages, row_pointers)
+
+
+
+class ccore_dataset:
+    """!
+    @brief Dataset that is packed to 'pyclustering_package' only once and reused by calls to C++ implementation.
+    @details Each call to C++ implementation packs input data, therefore workflows that process the same data several
+              times (for example, several K-Means restarts, Elbow method, Silhouette K-Search and X-Means) spend time
+              for the same marshaling again and again. Instance of this class can be used by wrappers and by
+              algorithms with 'ccore=True' instead of input data, in this case packed data is reused. The dataset
+              behaves like list of points (and like NumPy array for NumPy functions), therefore Python
+              implementations can use it as well.
+    
+    Example how to use the same packed data for several algorithms:
+    @code
+        from pyclustering.core.pyclustering_package import ccore_dataset
+
+        dataset = ccore_dataset(sample)
+
+        elbow_instance = elbow(dataset, 1, 10)
+        elbow_instance.process()
+
+        xmeans_instance = xmeans(dataset, initial_centers)
+        xmeans_instance.process()
+    @endcode
+    
+    """
+
+    def __init__(self, data, c_data_type=c_double):
+        """!
+        @brief Creates dataset and packs it for C++ implementation.
+        
+        @param[in] data (array_like): Input data that is presented as array of points (objects), C-contiguous
+                    NumPy array of required type is not copied, therefore it should not be changed while the dataset
+                    is used.
+        @param[in] c_data_type (ctype.type): Data type that is used for data storing in package.
+        
+        """
+        if isinstance(data, ccore_dataset):
+            data = data.get_data()
+        
+        self.__c_data_type = c_data_type
+        self.__data = numpy.ascontiguousarray(data, dtype=numpy.dtype(c_data_type)).view()
+        self.__data.flags.writeable = False
+        self.__pointer = package_builder(self.__data, c_data_type).create()
+
+
+    def __len__(self):
+        """!
+        @return (uint) Amount of points in the dataset.
+        
+        """
+        return len(self.__data)
+
+
+    def __getitem__(self, index):
+        """!
+        @return (list) Copy of point (or points) of the dataset.
+        
+        """
+        return self.__data[index].tolist()
+
+
+    def __iter__(self):
+        """!
+        @return (iterator) Iterator over copies of points of the dataset.
+        
+        """
+        return (point.tolist() for point in self.__data)
+
+
+    def __array__(self, dtype=None, copy=None):
+        """!
+        @return (numpy.ndarray) Dataset as NumPy array.
+        
+        """
+        if (dtype is None) or (numpy.dtype(dtype) == self.__data.dtype):
+            return self.__data.copy() if copy is True else self.__data
+        
+        return self.__data.astype(dtype)
+
+
+    def get_data(self):
+        """!
+        @return (numpy.ndarray) Read-only NumPy array that is referenced by the package.
+        
+        """
+        return self.__data
+
+
+    def get_ctype(self):
+        """!
+        @return (ctype.type) Data type that is used for data storing in package.
+        
+        """
+        return self.__c_data_type
+
+
+    def get_pointer(self):
+        """!
+        @return (pointer) ctype-pointer to pyclustering package with the dataset.
+        
+        """
+        return self.__pointer
+
+
 
 class package_extractor:
     """!
     @brief Package extractor provides servies to unpack pyclustering package.
+    @details By default package is unpacked to python lists. NumPy output mode can be enabled for particular extractor
+              or globally using 'package_extractor.set_numpy_output()', in this case each package with data is unpacked
+              to one-dimensional NumPy array and package that consists of packages with floating point data of the
+              same type and size (for example, centers or output dynamic) is unpacked to two-dimensional NumPy array,
+              other packages (for example, clusters, even if they have the same size) are unpacked to lists of NumPy
+              arrays. Data is copied from the package exactly once, therefore the package can be freed right after
+              extraction.
+    
+    Example how to obtain results of C++ implementation as NumPy arrays:
+    @code
+        from pyclustering.core.pyclustering_package import package_extractor
+
+        package_extractor.set_numpy_output(True)
+
+        kmeans_instance = kmeans(sample, initial_centers, ccore=True)
+        kmeans_instance.process()
+
+        centers = kmeans_instance.get_centers()   # two-dimensional NumPy array
+
+        package_extractor.set_numpy_output(False)
+    @endcode
     
     """
-    def __init__(self, package_pointer):
+
+    __numpy_output = False
+
+    def __init__(self, package_pointer, numpy_output=None):
         """!
         @brief Initialize package extractor object by ctype-pointer to 'pyclustering_package'.
         
         @param[in] package_pointer (pointer): ctype-pointer to 'pyclustering_package' that should be used for unpacking.
+        @param[in] numpy_output (bool): If 'True' then data is unpacked to NumPy arrays, if 'None' then global
+                    extraction mode is used (see 'package_extractor.set_numpy_output()').
         
         """
         self.__package_pointer = package_pointer
+        self.__numpy = numpy_output
+        
+        if self.__numpy is None:
+            self.__numpy = package_extractor.__numpy_output
+
+
+    @staticmethod
+    def set_numpy_output(enable):
+        """!
+        @brief Sets global extraction mode that is used by extractors without explicitly specified mode.
+        @details The mode affects results of all '*_wrapper' functions of the core.
+        
+        @param[in] enable (bool): If 'True' then data from packages is extracted to NumPy arrays, otherwise to lists.
+        
+        """
+        package_extractor.__numpy_output = bool(enable)
+
+
+    @staticmethod
+    def get_numpy_output():
+        """!
+        @return (bool) 'True' if data from packages is extracted to NumPy arrays by default.
+        
+        """
+        return package_extractor.__numpy_output
 
 
     def extract(self):
         """!
         @brief Performs unpacking procedure of the pyclustering package to the data.
         
-        @return (list) Extracted data from the pyclustering package.
+        @return (list|numpy.ndarray) Extracted data from the pyclustering package.
         
         """
         return self.__extract_data(self.__package_pointer)
@@ -263,6 +498,9 @@ class package_extractor:
             return []
         
         pointer_package = cast(ccore_package_pointer, POINTER(pyclustering_package))
+        if self.__numpy is True:
+            return self.__unpack_numpy_data(pointer_package)
+        
         return self.__unpack_pointer_data(pointer_package)
     
     
@@ -288,3 +526,67 @@ class package_extractor:
         
         pointer_data = cast(pointer_package[0].data, POINTER(pyclustering_type_data.get_ctype(type_package)))
         return self.__unpack_data(pointer_package, pointer_data, type_package)
+
+
+    def __unpack_numpy_data(self, pointer_package):
+        type_package = pointer_package[0].type
+        size_package = pointer_package[0].size
+        
+        if type_package != pyclustering_type_data.PYCLUSTERING_TYPE_LIST:
+            return self.__unpack_numpy_array(pointer_package[0])
+        
+        if size_package == 0:
+            return []
+        
+        pointer_data = cast(pointer_package[0].data, POINTER(POINTER(pyclustering_package)))
+        subpackages = [ pointer_data[index][0] for index in range(size_package) ]
+        
+        if self.__is_numpy_matrix(subpackages):
+            return self.__unpack_numpy_matrix(subpackages)
+        
+        return [ self.__extract_data(pointer_data[index]) for index in range(size_package) ]
+
+
+    def __is_numpy_matrix(self, subpackages):
+        first = subpackages[0]
+        if (first.type != pyclustering_type_data.PYCLUSTERING_TYPE_FLOAT) and \
+           (first.type != pyclustering_type_data.PYCLUSTERING_TYPE_DOUBLE):
+            return False    # indexes (for example, clusters) are unpacked to list of arrays regardless of their sizes
+        
+        for package in subpackages:
+            if (package.type != first.type) or (package.size != first.size):
+                return False
+        
+        return True
+
+
+    def __unpack_numpy_array(self, package):
+        ctype = pyclustering_type_data.get_ctype(package.type)
+        if (ctype is None) or (package.size == 0):
+            return numpy.empty(0, dtype=self.__get_numpy_type(ctype))
+        
+        array = numpy.empty(package.size, dtype=self.__get_numpy_type(ctype))
+        memmove(array.ctypes.data, package.data, array.nbytes)
+        return array
+
+
+    def __unpack_numpy_matrix(self, subpackages):
+        ctype = pyclustering_type_data.get_ctype(subpackages[0].type)
+        
+        matrix = numpy.empty((len(subpackages), subpackages[0].size), dtype=self.__get_numpy_type(ctype))
+        if matrix.size == 0:
+            return matrix
+        
+        row_address = matrix.ctypes.data
+        for package in subpackages:
+            memmove(row_address, package.data, matrix.strides[0])
+            row_address += matrix.strides[0]
+        
+        return matrix
+
+
+    def __get_numpy_type(self, ctype):
+        if ctype is None:
+            return numpy.float64
+        
+        return numpy.dtype(ctype)
@@ -30,7 +30,9 @@ import numpy;
 
 from pyclustering.core.pyclustering_package import package_builder, package_extractor;
 
-from ctypes import c_ulong, c_size_t, c_double, c_uint, c_float;
+from pyclustering.core.pyclustering_package import pyclustering_package, ccore_dataset;
+
+from ctypes import c_ulong, c_size_t, c_double, c_uint, c_float, cast, POINTER, addressof;
 
 
 class Test(unittest.TestCase):
@@ -39,7 +41,7 @@ class Test(unittest.TestCase):
         unpacked_package = package_extractor(package_pointer).extract();
 
         packing_data = dataset;
-        if (isinstance(packing_data, numpy.matrix)):
+        if (isinstance(packing_data, numpy.ndarray)):
             packing_data = dataset.tolist();
 
         assert self.compare_containers(packing_data, unpacked_package);
@@ -141,6 +143,116 @@ class Test(unittest.TestCase):
     def testNumpyMatrixThreeColumns(self):
         self.templatePackUnpack(numpy.matrix([[1.1, 2.2, 3.3], [2.2, 3.3, 4.4], [3.3, 4.4, 5.5]]), c_double);
 
+    def testNumpyArrayTwoDimensions(self):
+        self.templatePackUnpack(numpy.array([[1.1, 2.2, 3.3], [2.2, 3.3, 4.4]]), c_double);
+
+    def testNumpyArrayOneDimension(self):
+        self.templatePackUnpack(numpy.array([1.1, 2.2, 3.3]), c_double);
+
+    def testNumpyArrayThreeDimensions(self):
+        self.templatePackUnpack(numpy.arange(12).reshape(2, 3, 2), c_size_t);
+
+    def testNumpyArrayFloat(self):
+        self.templatePackUnpack(numpy.array([[1.5, 2.5], [3.5, 4.5]], dtype=numpy.float32));
+
+    def testNumpyArrayNonContiguous(self):
+        self.templatePackUnpack(numpy.arange(12.0).reshape(4, 3)[::2, 1:], c_double);
+
+    def testNumpyArrayEmpty(self):
+        self.templatePackUnpack(numpy.zeros((0, 2)), c_double);
+
+    def testNumpyArrayZeroCopy(self):
+        dataset = numpy.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]);
+        package_pointer = package_builder(dataset, c_double).create();
+
+        rows = cast(package_pointer[0].data, POINTER(POINTER(pyclustering_package)));
+        for index in range(len(dataset)):
+            row_address = cast(rows[index][0].data, POINTER(c_double));
+            self.assertEqual(dataset[index].ctypes.data, addressof(row_address.contents));
+
+    def testListOfListConvertedOnce(self):
+        package_pointer = package_builder([ [1.0, 2.0], [3.0, 4.0] ], c_double).create();
+
+        rows = cast(package_pointer[0].data, POINTER(POINTER(pyclustering_package)));
+        row_address1 = addressof(cast(rows[0][0].data, POINTER(c_double)).contents);
+        row_address2 = addressof(cast(rows[1][0].data, POINTER(c_double)).contents);
+        self.assertEqual(row_address1 + 2 * 8, row_address2);
+
+        unpacked_package = package_extractor(package_pointer).extract();
+        self.assertEqual([ [1.0, 2.0], [3.0, 4.0] ], unpacked_package);
+
+
+    def templatePackUnpackNumpy(self, dataset, c_type_data, expected_type):
+        package_pointer = package_builder(dataset, c_type_data).create();
+        unpacked_package = package_extractor(package_pointer, numpy_output=True).extract();
+
+        self.assertIsInstance(unpacked_package, expected_type);
+        self.assertEqual(len(dataset), len(unpacked_package));
+        for index in range(len(dataset)):
+            self.assertTrue(numpy.array_equal(numpy.array(dataset[index]), numpy.array(unpacked_package[index])));
+
+    def testNumpyOutputList(self):
+        self.templatePackUnpackNumpy([1.1, 1.2, 1.3], c_double, numpy.ndarray);
+
+    def testNumpyOutputListOfList(self):
+        self.templatePackUnpackNumpy([ [1.1, 1.2], [1.3, 1.4], [1.5, 1.6] ], c_double, numpy.ndarray);
+
+    def testNumpyOutputListOfListWithGaps(self):
+        self.templatePackUnpackNumpy([ [1, 2, 3], [], [4, 5] ], c_size_t, list);
+
+    def testNumpyOutputListOfListEqualSizes(self):
+        self.templatePackUnpackNumpy([ [0, 1, 2], [3, 4, 5], [6, 7, 8] ], c_size_t, list);
+
+    def testNumpyOutputDataType(self):
+        package_pointer = package_builder([ [1, 2], [3, 4] ], c_size_t).create();
+        unpacked_package = package_extractor(package_pointer, numpy_output=True).extract();
+        for cluster in unpacked_package:
+            self.assertEqual(1, cluster.ndim);
+            self.assertEqual(numpy.dtype(c_size_t), cluster.dtype);
+
+        package_pointer = package_builder([ [1.0, 2.0], [3.0, 4.0] ], c_float).create();
+        unpacked_package = package_extractor(package_pointer, numpy_output=True).extract();
+        self.assertEqual((2, 2), unpacked_package.shape);
+        self.assertEqual(numpy.dtype(c_float), unpacked_package.dtype);
+
+    def testNumpyOutputGlobalMode(self):
+        package_pointer = package_builder([ [1.0, 2.0], [3.0, 4.0] ], c_double).create();
+
+        package_extractor.set_numpy_output(True);
+        try:
+            self.assertTrue(package_extractor.get_numpy_output());
+            self.assertIsInstance(package_extractor(package_pointer).extract(), numpy.ndarray);
+            self.assertIsInstance(package_extractor(package_pointer, numpy_output=False).extract(), list);
+        finally:
+            package_extractor.set_numpy_output(False);
+
+        self.assertIsInstance(package_extractor(package_pointer).extract(), list);
+
+
+    def testCcoreDatasetPackageReuse(self):
+        dataset = ccore_dataset([ [1.0, 2.0], [3.0, 4.0] ]);
+
+        package_pointer1 = package_builder(dataset, c_double).create();
+        package_pointer2 = package_builder(dataset, c_double).create();
+
+        self.assertEqual(addressof(package_pointer1.contents), addressof(package_pointer2.contents));
+        self.assertEqual([ [1.0, 2.0], [3.0, 4.0] ], package_extractor(package_pointer1).extract());
+
+    def testCcoreDatasetAnotherType(self):
+        dataset = ccore_dataset([ [1.0, 2.0], [3.0, 4.0] ]);
+
+        package_pointer = package_builder(dataset, c_float).create();
+        self.assertNotEqual(addressof(dataset.get_pointer().contents), addressof(package_pointer.contents));
+        self.assertEqual([ [1.0, 2.0], [3.0, 4.0] ], package_extractor(package_pointer).extract());
+
+    def testCcoreDatasetSequence(self):
+        dataset = ccore_dataset(numpy.array([ [1.0, 2.0], [3.0, 4.0], [5.0, 6.0] ]));
+
+        self.assertEqual(3, len(dataset));
+        self.assertEqual([3.0, 4.0], dataset[1]);
+        self.assertEqual([ [1.0, 2.0], [3.0, 4.0], [5.0, 6.0] ], [ point for point in dataset ]);
+        self.assertTrue(numpy.array_equal(dataset.get_data(), numpy.array(dataset)));
+
 
 if __name__ == "__main__":
     unittest.main();
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""!
+
+@brief Unit-tests for parallel processing settings of ccore library.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import unittest
+
+from pyclustering.core import set_thread_amount, get_thread_amount, thread_amount
+from pyclustering.core.wrapper import ccore_library
+
+from pyclustering.cluster.dbscan import dbscan
+from pyclustering.cluster.optics import optics
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES
+
+from pyclustering.utils import read_sample
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.__default_amount = get_thread_amount()
+
+    def tearDown(self):
+        set_thread_amount(0)
+
+    def testSetGetThreadAmount(self):
+        set_thread_amount(1)
+        self.assertEqual(1, get_thread_amount())
+
+        set_thread_amount(0)
+        self.assertEqual(self.__default_amount, get_thread_amount())
+
+    def testThreadAmountTruncatedByHardware(self):
+        set_thread_amount(100000)
+        self.assertLessEqual(get_thread_amount(), self.__default_amount)
+        self.assertGreater(get_thread_amount(), 0)
+
+    def testNegativeThreadAmount(self):
+        self.assertRaises(ValueError, set_thread_amount, -1)
+
+    def testThreadAmountContextManager(self):
+        with thread_amount(1):
+            self.assertEqual(1, get_thread_amount())
+
+        self.assertEqual(self.__default_amount, get_thread_amount())
+
+    def testThreadAmountContextManagerException(self):
+        try:
+            with thread_amount(1):
+                raise RuntimeError()
+
+        except RuntimeError:
+            pass
+
+        self.assertEqual(self.__default_amount, get_thread_amount())
+
+    def templateClusteringSingleThread(self, algorithm, *args):
+        sample = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+
+        default_instance = algorithm(sample, *args, ccore=True)
+        default_instance.process()
+
+        with thread_amount(1):
+            single_instance = algorithm(sample, *args, ccore=True)
+            single_instance.process()
+
+        self.assertEqual(default_instance.get_clusters(), single_instance.get_clusters())
+        self.assertEqual(default_instance.get_noise(), single_instance.get_noise())
+
+    def testDbscanSingleThread(self):
+        if ccore_library.workable() is True:
+            self.templateClusteringSingleThread(dbscan, 0.7, 3)
+
+    def testOpticsSingleThread(self):
+        if ccore_library.workable() is True:
+            self.templateClusteringSingleThread(optics, 0.7, 3)
@@ -24,6 +24,7 @@
 """
 
 
+import os
 import sys
 
 from ctypes import *
@@ -87,6 +88,9 @@ class ccore_library:
                   "Probably library has not been successfully installed.\n" +
                   "Please, contact to 'pyclustering@yandex.ru'.")
 
+        else:
+            ccore_library.__apply_thread_amount()
+
         return ccore_library.__library
 
 
@@ -105,6 +109,25 @@ class ccore_library:
         return ccore_library.__workable
 
 
+    @staticmethod
+    def __apply_thread_amount():
+        value = os.environ.get(ENVIRONMENT_CCORE_THREAD_AMOUNT)
+        if value is None:
+            return
+
+        try:
+            thread_amount = int(value)
+            if thread_amount < 0:
+                raise ValueError()
+
+        except ValueError:
+            print("Incorrect amount of threads is specified by '" + ENVIRONMENT_CCORE_THREAD_AMOUNT + "' ('" +
+                  value + "'), default amount of threads is used.")
+            return
+
+        ccore_library.__library.parallel_set_thread_amount(c_size_t(thread_amount))
+
+
     @staticmethod
     def __check_library_version():
         version = "unknown"
@@ -27,16 +27,10 @@
 import math
 import numpy
 import random
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
+from pyclustering.utils.lazy_import import lazy_module
 
-    from matplotlib import rcParams
-    from matplotlib.font_manager import FontProperties
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+plt = lazy_module('matplotlib.pyplot', ['mpl_toolkits.mplot3d'])
 
 from enum import IntEnum
 
@@ -475,7 +469,9 @@ class cnn_network:
         @return (tuple) Description of surface for drawing network structure.
         
         """
-        
+        from matplotlib.font_manager import FontProperties
+        from matplotlib import rcParams
+
         rcParams['font.sans-serif'] = ['Arial']
         rcParams['font.size'] = 12
 
@@ -26,20 +26,13 @@
 
 import random
 import numpy
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is partially not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+Image = lazy_module('PIL.Image')
+plt = lazy_module('matplotlib.pyplot')
+animation = lazy_module('matplotlib.animation')
 
-try:
-    from PIL import Image
-except Exception as error_instance:
-    warnings.warn("Impossible to import PIL (please, install 'PIL'), pyclustering's visualization "
-                  "functionality is partially not available (details: '%s')." % str(error_instance))
 
 from pyclustering.nnet import *
 
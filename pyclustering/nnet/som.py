@@ -27,13 +27,10 @@
 
 import math
 import random
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot', ['mpl_toolkits.mplot3d'])
 
 import pyclustering.core.som_wrapper as wrapper
 
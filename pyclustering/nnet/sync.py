@@ -27,21 +27,16 @@
 import math
 import numpy
 import random
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot')
+animation = lazy_module('matplotlib.animation')
 
 import pyclustering.core.sync_wrapper as wrapper
 
 from pyclustering.core.wrapper import ccore_library
 
-from scipy.integrate import odeint
-
 from pyclustering.nnet import network, conn_represent, conn_type, initial_type, solve_type
 from pyclustering.utils import pi, draw_dynamics, draw_dynamics_set, set_ax_param
 
@@ -1004,6 +999,7 @@ class sync_network(network):
                 next_phases[index] = self._phase_normalization(result);
                 
             elif ( (solution == solve_type.RK4) or (solution == solve_type.RKF45) ):
+                from scipy.integrate import odeint
                 result = odeint(self._phase_kuramoto, self._phases[index], numpy.arange(t - step, t, int_step), (index , ));
                 next_phases[index] = self._phase_normalization(result[len(result) - 1][0]);
             
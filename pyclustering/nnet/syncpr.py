@@ -27,7 +27,6 @@
 import math
 import cmath
 import numpy
-import warnings
 
 from pyclustering.nnet          import solve_type, initial_type, conn_type,conn_represent
 from pyclustering.nnet.sync     import sync_network, sync_dynamic, sync_visualizer
@@ -36,18 +35,12 @@ import pyclustering.core.syncpr_wrapper as wrapper
 
 from pyclustering.core.wrapper import ccore_library
 
-try:
-    from PIL import Image
-except Exception as error_instance:
-    warnings.warn("Impossible to import PIL (please, install 'PIL'), pyclustering's visualization "
-                  "functionality is partially not available (details: '%s')." % str(error_instance))
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.animation as animation
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+Image = lazy_module('PIL.Image')
+plt = lazy_module('matplotlib.pyplot')
+animation = lazy_module('matplotlib.animation')
 
 
 class syncpr_dynamic(sync_dynamic):
@@ -24,15 +24,12 @@
 
 """
 
-import warnings
 
 from math import floor
 
-try:
-    from PIL import Image
-except Exception as error_instance:
-    warnings.warn("Impossible to import PIL (please, install 'PIL'), pyclustering's visualization "
-                  "functionality is partially not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+Image = lazy_module('PIL.Image')
 
 from pyclustering.cluster.syncnet import syncnet
 
@@ -25,22 +25,14 @@
 
 import time
 import numpy
-import warnings
 
 from numpy import array
 
-try:
-    from PIL import Image
-except Exception as error_instance:
-    warnings.warn("Impossible to import PIL (please, install 'PIL'), pyclustering's visualization "
-                  "functionality is partially not available (details: '%s')." % str(error_instance))
 
-try:
-    import matplotlib.pyplot as plt
-    from mpl_toolkits.mplot3d import Axes3D
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+Image = lazy_module('PIL.Image')
+plt = lazy_module('matplotlib.pyplot', ['mpl_toolkits.mplot3d'])
 
 from sys import platform as _platform
 
@@ -212,22 +204,12 @@ def average_neighbor_distance(points, num_neigh):
     if num_neigh > len(points) - 1:
         raise NameError('Impossible to calculate average distance to neighbors when number of object is less than number of neighbors.');
     
-    dist_matrix = [ [ 0.0 for i in range(len(points)) ] for j in range(len(points)) ];
-    for i in range(0, len(points), 1):
-        for j in range(i + 1, len(points), 1):
-            distance = euclidean_distance(points[i], points[j]);
-            dist_matrix[i][j] = distance;
-            dist_matrix[j][i] = distance;
-            
-        dist_matrix[i] = sorted(dist_matrix[i]);
-
-    total_distance = 0;
-    for i in range(0, len(points), 1):
-        # start from 0 - first element is distance to itself.
-        for j in range(0, num_neigh, 1):
-            total_distance += dist_matrix[i][j + 1];
-            
-    return ( total_distance / (num_neigh * len(points)) );
+    # KD-tree module depends on this module, therefore it is imported here.
+    from pyclustering.container.kdtree import kdtree_balanced;
+    
+    # the first neighbor of each point is the point itself (or its duplicate) with zero distance.
+    _, distances = kdtree_balanced(points).query_knn(points, num_neigh + 1);
+    return float(numpy.sum(distances[:, 1:])) / (num_neigh * len(points));
 
 
 def median(data, indexes = None, **kwargs):
@@ -0,0 +1,423 @@
+"""!
+
+@brief Blockwise calculation of distances between points and centers with bounded peak memory.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class blockwise_distance:
+    """!
+    @brief Calculator of distances between points of a dataset and a set of centers that processes the dataset by tiles.
+    @details Dense matrix of distances between N points and K centers requires N * K * 8 bytes, for example, 160GB in
+              case of ten million points and two thousand centers. The calculator splits the matrix into tiles of rows
+              (points) and columns (centers), each tile fits into memory limit that is specified by user, so peak
+              memory consumption does not depend on size of the dataset and amount of centers.
+
+              Square Euclidean distance is calculated by matrix multiplication (GEMM) using the following expansion:
+              ||x - c||^2 = ||x||^2 - 2 * (x, c) + ||c||^2,
+              where squared norms of points are calculated once per dataset and cached by the calculator, Euclidean
+              distance is a square root of the tile that is calculated in the same way. Manhattan and
+              Chebyshev distances are accumulated coordinate by coordinate over the whole tile when dimension of data is
+              not greater than amount of centers in the tile. Other metrics are calculated by the metric itself for
+              each tile. Therefore instance of the calculator can be shared by
+              algorithms that process the same dataset several times, for example, K-Means that is used by Elbow method.
+
+    Example:
+    @code
+        data = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+        calculator = blockwise_distance(data, memory_limit=16 * 1024 * 1024)
+
+        centers = kmeans_plusplus_initializer(data, 3).initialize()
+        labels, distances = calculator.nearest(centers, distance_metric(type_metric.EUCLIDEAN_SQUARE))
+    @endcode
+
+    """
+
+    ## Default amount of memory in bytes that is used by one tile of distance matrix.
+    DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+
+    def __init__(self, data, memory_limit=DEFAULT_MEMORY_LIMIT):
+        """!
+        @brief Creates calculator of distances for the specified dataset.
+
+        @param[in] data (array_like): Input data that is presented as array of points (objects), each point should be represented by array_like data structure.
+        @param[in] memory_limit (uint): Amount of memory in bytes that can be used by one tile (by default 64MB).
+
+        """
+        if memory_limit <= 0:
+            raise ValueError("Memory limit '%s' should be greater than 0." % str(memory_limit))
+
+        self.__data = numpy.asarray(data)
+        self.__memory_limit = int(memory_limit)
+        self.__squared_norms = None
+
+
+    def __len__(self):
+        """!
+        @brief Returns amount of points in the dataset.
+
+        """
+        return len(self.__data)
+
+
+    def get_data(self):
+        """!
+        @brief Returns dataset that is processed by the calculator.
+
+        @return (numpy.array) Dataset.
+
+        """
+        return self.__data
+
+
+    def get_memory_limit(self):
+        """!
+        @brief Returns amount of memory in bytes that can be used by one tile.
+
+        """
+        return self.__memory_limit
+
+
+    def get_tile_shape(self, amount_centers):
+        """!
+        @brief Returns amount of rows (points) and columns (centers) in one tile.
+        @details Centers are split into several column tiles only when even the smallest row tile that contains all
+                  centers does not fit into the memory limit.
+
+        @param[in] amount_centers (uint): Amount of centers.
+
+        @return (tuple) Amount of rows and amount of columns.
+
+        """
+        capacity = max(1, self.__memory_limit // numpy.dtype(numpy.float64).itemsize)
+        dimension = self.__data.shape[1] if self.__data.ndim > 1 else 1
+
+        columns = max(1, min(amount_centers, capacity // blockwise_distance.__MINIMUM_TILE_ROWS - dimension))
+        rows = max(1, min(len(self.__data), capacity // (columns + dimension)))
+
+        return rows, columns
+
+
+    def get_squared_norms(self):
+        """!
+        @brief Returns squared Euclidean norms of points, norms are calculated once and cached.
+
+        @return (numpy.array) Squared norm of each point.
+
+        """
+        if self.__squared_norms is None:
+            self.__squared_norms = numpy.einsum('ij,ij->i', self.__data, self.__data, dtype=numpy.float64)
+
+        return self.__squared_norms
+
+
+    def tiles(self, centers, metric):
+        """!
+        @brief Generates tiles of distance matrix between points and centers.
+        @details Tile is a dense matrix of distances where rows correspond to points [row_begin, row_end) and columns
+                  correspond to centers [column_begin, column_end). Tile is reused by the generator, therefore it
+                  should be copied if it is required after the next iteration.
+
+        @param[in] centers (array_like): Centers to which distances are calculated.
+        @param[in] metric (distance_metric): Metric that is used for distance calculation.
+
+        @return (generator) Tuples (row_begin, row_end, column_begin, column_end, tile).
+
+        """
+        centers = numpy.asarray(centers)
+        rows, columns = self.get_tile_shape(len(centers))
+
+        calculator = self.__create_calculator(centers, metric, rows, columns)
+
+        for row_begin in range(0, len(self.__data), rows):
+            row_end = min(row_begin + rows, len(self.__data))
+
+            for column_begin in range(0, len(centers), columns):
+                column_end = min(column_begin + columns, len(centers))
+                yield row_begin, row_end, column_begin, column_end, calculator(row_begin, row_end, column_begin, column_end)
+
+
+    def matrix(self, centers, metric):
+        """!
+        @brief Calculates dense matrix of distances between all points and centers as one tile.
+        @details Memory limit is not applied, therefore the method should be used only when the matrix is known to fit
+                  into memory, for example, when the dataset itself is a small block of a larger dataset.
+
+        @param[in] centers (array_like): Centers to which distances are calculated.
+        @param[in] metric (distance_metric): Metric that is used for distance calculation.
+
+        @return (numpy.array) Matrix where rows correspond to points and columns correspond to centers.
+
+        """
+        centers = numpy.asarray(centers)
+        calculator = self.__create_calculator(centers, metric, len(self.__data), len(centers))
+        return calculator(0, len(self.__data), 0, len(centers))
+
+
+    def nearest(self, centers, metric):
+        """!
+        @brief Finds the nearest center for each point.
+        @details Ties are resolved in favour of center with smaller index. Tiles that are calculated by matrix
+                  multiplication contain rounding errors, therefore distances to centers that are within rounding
+                  margin of the minimum are recalculated directly by the metric before the nearest center is chosen
+                  and distance to the chosen center is recalculated as well, so the result is the same as if all
+                  distances were calculated directly.
+
+        @param[in] centers (array_like): Centers that are considered.
+        @param[in] metric (distance_metric): Metric that is used for distance calculation.
+
+        @return (tuple) Index of the nearest center for each point and distance to it.
+
+        """
+        centers = numpy.asarray(centers)
+
+        labels = numpy.zeros(len(self.__data), dtype=numpy.int64)
+        distances = numpy.full(len(self.__data), float('inf'))
+
+        tile_metric, exact_metric, centers_norms = metric, None, None
+        if metric.get_type() in blockwise_distance.__GEMM_METRICS:
+            tile_metric = distance_metric(type_metric.EUCLIDEAN_SQUARE)
+            exact_metric = blockwise_distance.create_numpy_metric(metric)
+            centers_norms = numpy.einsum('ij,ij->i', centers, centers, dtype=numpy.float64)
+
+        for row_begin, row_end, column_begin, column_end, tile in self.tiles(centers, tile_metric):
+            tile_labels = numpy.argmin(tile, axis=1)
+            tile_distances = tile[numpy.arange(len(tile)), tile_labels]
+
+            if exact_metric is not None:
+                margins = self.get_squared_norms()[row_begin:row_end] + numpy.max(centers_norms[column_begin:column_end])
+                margins *= blockwise_distance.__ROUNDING_RELATIVE_MARGIN
+
+                ambiguous, ambiguous_labels = self.__resolve_ties(tile, row_begin, tile_distances, margins,
+                                                                  centers[column_begin:column_end], exact_metric)
+
+                tile_labels[ambiguous] = ambiguous_labels
+                tile_distances = exact_metric(self.__data[row_begin:row_end], centers[tile_labels + column_begin])
+
+            improved = tile_distances < distances[row_begin:row_end]
+            labels[row_begin:row_end][improved] = tile_labels[improved] + column_begin
+            distances[row_begin:row_end][improved] = tile_distances[improved]
+
+        return labels, distances
+
+
+    def assigned(self, centers, labels, metric):
+        """!
+        @brief Calculates distance between each point and center that is assigned to the point.
+        @details Distances are calculated directly by the metric (without GEMM expansion) since only one center is
+                  considered for each point, therefore they can be used for precise calculation of clustering errors.
+
+        @param[in] centers (array_like): Centers of clusters.
+        @param[in] labels (array_like): Index of center for each point.
+        @param[in] metric (distance_metric): Metric that is used for distance calculation.
+
+        @return (numpy.array) Distance between each point and its center.
+
+        """
+        centers = numpy.asarray(centers)
+        labels = numpy.asarray(labels)
+
+        distances = numpy.zeros(len(self.__data))
+        rows, _ = self.get_tile_shape(1)
+        numpy_metric = blockwise_distance.create_numpy_metric(metric)
+
+        for row_begin in range(0, len(self.__data), rows):
+            row_end = min(row_begin + rows, len(self.__data))
+            points = self.__data[row_begin:row_end]
+            point_centers = centers[labels[row_begin:row_end]]
+
+            if numpy_metric is None:
+                distances[row_begin:row_end] = [metric(point, center) for point, center in zip(points, point_centers)]
+            else:
+                distances[row_begin:row_end] = numpy_metric(points, point_centers)
+
+        return distances
+
+
+    @staticmethod
+    def create_numpy_metric(metric):
+        """!
+        @brief Creates function that calculates distances between rows of two arrays using numpy, user's metric is not
+                changed.
+        @details Euclidean and Minkowski distances are calculated by exact kernels of the calculator, other metrics
+                  are represented by copy of the metric that uses numpy.
+
+        @param[in] metric (distance_metric): Metric that is used for distance calculation.
+
+        @return (callable) Function that takes points and centers and returns distances or None in case of
+                 user-defined metric.
+
+        """
+        metric_type = metric.get_type()
+
+        if metric_type == type_metric.USER_DEFINED:
+            return None
+
+        elif metric_type == type_metric.EUCLIDEAN:
+            return lambda points, centers: numpy.sqrt(numpy.sum(numpy.square(points - centers), axis=1))
+
+        elif metric_type == type_metric.MINKOWSKI:
+            degree = metric.get_arguments().get('degree', 2)
+            return lambda points, centers: numpy.sum(numpy.abs(points - centers) ** degree, axis=1) ** (1.0 / degree)
+
+        arguments = dict(metric.get_arguments())
+        arguments['numpy_usage'] = True
+        return distance_metric(metric.get_type(), **arguments)
+
+
+    def __create_calculator(self, centers, metric, rows, columns):
+        """!
+        @brief Creates function that calculates tile of distance matrix.
+
+        @param[in] centers (numpy.array): Centers to which distances are calculated.
+        @param[in] metric (distance_metric): Metric that is used for distance calculation.
+        @param[in] rows (uint): Maximum amount of rows in a tile.
+        @param[in] columns (uint): Maximum amount of columns in a tile.
+
+        @return (callable) Function that takes borders of tile and returns tile.
+
+        """
+        buffer = numpy.empty(rows * columns)
+
+        if metric.get_type() in blockwise_distance.__GEMM_METRICS:
+            square_root = (metric.get_type() == type_metric.EUCLIDEAN)
+            points_norms = self.get_squared_norms()
+            centers = numpy.asarray(centers, dtype=numpy.float64)
+            centers_norms = numpy.einsum('ij,ij->i', centers, centers)
+
+            def calculate_gemm(row_begin, row_end, column_begin, column_end):
+                tile = blockwise_distance.__get_tile(buffer, row_end - row_begin, column_end - column_begin)
+                numpy.dot(self.__data[row_begin:row_end], centers[column_begin:column_end].T, out=tile)
+                tile *= -2.0
+                tile += points_norms[row_begin:row_end, None]
+                tile += centers_norms[None, column_begin:column_end]
+                numpy.maximum(tile, 0.0, out=tile)
+
+                if square_root is True:
+                    numpy.sqrt(tile, out=tile)
+
+                return tile
+
+            return calculate_gemm
+
+        coordinate_reducers = { type_metric.MANHATTAN: numpy.add, type_metric.CHEBYSHEV: numpy.maximum }
+        reducer = coordinate_reducers.get(metric.get_type(), None)
+
+        if (reducer is not None) and (self.__data.ndim == 2) and (self.__data.shape[1] <= columns):
+            centers = numpy.asarray(centers, dtype=numpy.float64)
+            differences = numpy.empty(rows * columns)
+
+            def calculate_by_coordinates(row_begin, row_end, column_begin, column_end):
+                tile = blockwise_distance.__get_tile(buffer, row_end - row_begin, column_end - column_begin)
+                difference = blockwise_distance.__get_tile(differences, row_end - row_begin, column_end - column_begin)
+
+                tile.fill(0.0)
+                for index_dimension in range(self.__data.shape[1]):
+                    numpy.subtract(self.__data[row_begin:row_end, index_dimension, None],
+                                   centers[None, column_begin:column_end, index_dimension], out=difference)
+                    numpy.absolute(difference, out=difference)
+                    reducer(tile, difference, out=tile)
+
+                return tile
+
+            return calculate_by_coordinates
+
+        numpy_metric = blockwise_distance.create_numpy_metric(metric)
+
+        def calculate_by_metric(row_begin, row_end, column_begin, column_end):
+            tile = blockwise_distance.__get_tile(buffer, row_end - row_begin, column_end - column_begin)
+            points = self.__data[row_begin:row_end]
+
+            for index_center in range(column_begin, column_end):
+                if numpy_metric is None:
+                    tile[:, index_center - column_begin] = [metric(point, centers[index_center]) for point in points]
+                else:
+                    tile[:, index_center - column_begin] = numpy_metric(points, centers[index_center])
+
+            return tile
+
+        return calculate_by_metric
+
+
+    def __resolve_ties(self, tile, row_begin, minimums, margins, centers, exact_metric):
+        """!
+        @brief Chooses the nearest center for points whose several centers are within rounding margin of the minimum
+                of square Euclidean distance that is calculated by matrix multiplication.
+
+        @param[in] tile (numpy.array): Tile of square Euclidean distances that is calculated by matrix multiplication.
+        @param[in] row_begin (uint): Index of point that corresponds to the first row of the tile.
+        @param[in] minimums (numpy.array): Minimum of each row of the tile.
+        @param[in] margins (numpy.array): Rounding margin of each row of the tile.
+        @param[in] centers (numpy.array): Centers that correspond to columns of the tile.
+        @param[in] exact_metric (callable): Function that calculates distances directly.
+
+        @return (tuple) Indexes of ambiguous rows and index of the nearest center (column) for each of them.
+
+        """
+        candidates = tile <= (minimums + margins)[:, None]
+        ambiguous = numpy.nonzero(numpy.count_nonzero(candidates, axis=1) > 1)[0]
+
+        if len(ambiguous) == 0:
+            return ambiguous, numpy.empty(0, dtype=numpy.int64)
+
+        rows, columns = numpy.nonzero(candidates[ambiguous])
+        distances = exact_metric(self.__data[row_begin + ambiguous[rows]], centers[columns])
+
+        borders = numpy.flatnonzero(numpy.r_[True, rows[1:] != rows[:-1]])
+        nearest_distances = numpy.minimum.reduceat(distances, borders)
+
+        # candidates are ordered by columns within each row, so the first minimum has the smallest index
+        nearest = numpy.flatnonzero(distances == nearest_distances[rows])
+        nearest = nearest[numpy.r_[True, rows[nearest[1:]] != rows[nearest[:-1]]]]
+
+        return ambiguous, columns[nearest]
+
+
+    @staticmethod
+    def __get_tile(buffer, rows, columns):
+        """!
+        @brief Returns contiguous tile of the specified shape that uses the buffer, contiguous memory is required by
+                matrix multiplication with output argument.
+
+        @param[in] buffer (numpy.array): One-dimensional buffer that is reused by tiles.
+        @param[in] rows (uint): Amount of rows in the tile.
+        @param[in] columns (uint): Amount of columns in the tile.
+
+        @return (numpy.array) Tile.
+
+        """
+        return buffer[:rows * columns].reshape(rows, columns)
+
+
+    ## Metrics that are calculated by matrix multiplication.
+    __GEMM_METRICS = {type_metric.EUCLIDEAN_SQUARE, type_metric.EUCLIDEAN}
+
+    ## Margin of rounding errors of matrix multiplication relatively to sum of squared norms of point and center.
+    __ROUNDING_RELATIVE_MARGIN = 1e-9
+
+    ## Amount of rows in a tile that is considered as a minimum before splitting of centers into several tiles.
+    __MINIMUM_TILE_ROWS = 256
@@ -23,14 +23,11 @@
 
 """
 
-import warnings
 
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib import colors
-except Exception as error_instance:
-    warnings.warn("Impossible to import matplotlib (please, install 'matplotlib'), pyclustering's visualization "
-                  "functionality is not available (details: '%s')." % str(error_instance))
+from pyclustering.utils.lazy_import import lazy_module
+
+plt = lazy_module('matplotlib.pyplot')
+colors = lazy_module('matplotlib.colors')
 
 from enum import IntEnum
 
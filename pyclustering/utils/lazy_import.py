@@ -0,0 +1,110 @@
+"""!
+
+@brief Lazy loading of optional modules that are used by pyclustering library for visualization.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import importlib
+import importlib.util
+import warnings
+
+
+class lazy_module:
+    """!
+    @brief Proxy of a module that is imported when one of its attributes is used for the first time.
+    @details Visualization modules (matplotlib, its backends and toolkits) are heavy and they are not required for
+              cluster analysis itself, therefore algorithms refer to them via the proxy and the modules are imported
+              only when visualizer is used. Import of an algorithm module should take less than 0.5 second in a new
+              interpreter (including import of NumPy), the budget is checked by unit-tests of the module.
+
+    Example:
+    @code
+        plt = lazy_module('matplotlib.pyplot')
+
+        plt.plot([1, 2, 3])     # 'matplotlib.pyplot' is imported here
+        plt.show()
+    @endcode
+
+    """
+
+    __reported_packages = set()
+
+    def __init__(self, name, dependencies=None):
+        """!
+        @brief Creates proxy of a module without its import.
+        @details Warning is displayed once if top-level package of the module is not installed.
+
+        @param[in] name (string): Full name of the module, for example, 'matplotlib.pyplot'.
+        @param[in] dependencies (list): Names of modules that should be imported together with the module, for example,
+                    'mpl_toolkits.mplot3d' that registers 3-D projection.
+
+        """
+        self.__name = name
+        self.__dependencies = dependencies or []
+        self.__module = None
+
+        package = name.split('.')[0]
+        if (package not in lazy_module.__reported_packages) and (lazy_module.__is_installed(package) is False):
+            lazy_module.__reported_packages.add(package)
+            warnings.warn("Impossible to import %s (please, install '%s'), pyclustering's visualization "
+                          "functionality is not available." % (package, package))
+
+
+    def __getattr__(self, attribute):
+        """!
+        @brief Returns attribute of the module, the module is imported if it has not been imported yet.
+
+        @param[in] attribute (string): Name of the attribute.
+
+        """
+        if attribute.startswith('_lazy_module__'):
+            raise AttributeError(attribute)
+
+        if self.__module is None:
+            self.__load()
+
+        return getattr(self.__module, attribute)
+
+
+    def __repr__(self):
+        state = "loaded" if self.__module is not None else "not loaded"
+        return "<lazy module '%s' (%s)>" % (self.__name, state)
+
+
+    def __load(self):
+        for dependency in self.__dependencies:
+            try:
+                importlib.import_module(dependency)
+            except Exception as error_instance:
+                warnings.warn("Impossible to import '%s' (details: '%s')." % (dependency, str(error_instance)))
+
+        self.__module = importlib.import_module(self.__name)
+
+
+    @staticmethod
+    def __is_installed(package):
+        # Only top-level package is checked, search of a sub-module imports its parent packages.
+        try:
+            return importlib.util.find_spec(package) is not None
+        except (ImportError, ValueError):
+            return False
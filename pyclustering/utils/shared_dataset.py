@@ -0,0 +1,186 @@
+"""!
+
+@brief Dataset that is placed to shared memory to be processed by pool of processes.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+@cond GNU_PUBLIC_LICENSE
+    PyClustering is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    
+    PyClustering is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+@endcond
+
+"""
+
+
+import numpy
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+## Dataset of a worker process that is attached to shared memory by '_initialize_worker' or received with a task.
+_worker_dataset = None
+
+## Shared memory block of a worker process, reference is kept while the worker is alive.
+_worker_memory = None
+
+
+def _initialize_worker(memory_name, shape, dtype):
+    """!
+    @brief Attaches worker process to the shared memory block that contains dataset.
+
+    @param[in] memory_name (string): Name of the shared memory block.
+    @param[in] shape (tuple): Shape of the dataset.
+    @param[in] dtype (numpy.dtype): Type of elements of the dataset.
+
+    """
+    global _worker_dataset, _worker_memory
+
+    import multiprocessing.shared_memory as shared_memory
+
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    _worker_dataset = numpy.ndarray(shape, dtype=dtype, buffer=_worker_memory.buf)
+
+
+def _call_with_dataset(data, function, args, kwargs):
+    """!
+    @brief Calls task function in worker process with dataset that has been pickled together with the task.
+
+    @param[in] data (numpy.array): Dataset that is used by the task.
+    @param[in] function (callable): Task function.
+    @param[in] args (tuple): Positional arguments of the task function.
+    @param[in] kwargs (dict): Keyword arguments of the task function.
+
+    @return (any) Result of the task function.
+
+    """
+    global _worker_dataset
+
+    _worker_dataset = data
+    return function(*args, **kwargs)
+
+
+class _pickled_dataset_executor(ProcessPoolExecutor):
+    """!
+    @brief Pool of processes that sends dataset to worker processes with each task, it is used when shared memory is
+            not available (Python 3.7 and older).
+
+    """
+
+    def __init__(self, max_workers, data):
+        super().__init__(max_workers=max_workers)
+        self.__data = data
+
+
+    def submit(self, function, *args, **kwargs):
+        return super().submit(_call_with_dataset, self.__data, function, args, kwargs)
+
+
+class shared_dataset:
+    """!
+    @brief Dataset that is copied to shared memory once and is available for each process of a pool without pickling.
+    @details The dataset is used as a context manager, shared memory block is released when the context is left.
+              Tasks that are submitted to the pool obtain the dataset using get_worker_dataset(). Module
+              'multiprocessing.shared_memory' is imported only when pool is created, if it is not available (Python
+              3.7 and older) then the dataset is pickled together with each task.
+
+    Example:
+    @code
+        def process_task(index):
+            data = shared_dataset.get_worker_dataset()
+            return data[index].sum()
+
+        with shared_dataset(data) as dataset, dataset.create_executor(4) as executor:
+            results = list(executor.map(process_task, range(len(data))))
+    @endcode
+
+    """
+
+    def __init__(self, data):
+        """!
+        @brief Constructor of the dataset that is placed to shared memory.
+
+        @param[in] data (numpy.array): C-contiguous dataset that should be shared.
+
+        """
+        self.__data = data
+        self.__memory = None
+
+
+    def __enter__(self):
+        """!
+        @brief Creates shared memory block and copies dataset to it if shared memory is available.
+
+        @return (shared_dataset) Returns itself.
+
+        """
+        try:
+            import multiprocessing.shared_memory as shared_memory
+        except ImportError:
+            return self
+
+        self.__memory = shared_memory.SharedMemory(create=True, size=max(self.__data.nbytes, 1))
+        try:
+            numpy.ndarray(self.__data.shape, dtype=self.__data.dtype, buffer=self.__memory.buf)[:] = self.__data
+        except BaseException:
+            self.__release()
+            raise
+
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """!
+        @brief Releases shared memory block.
+
+        """
+        if self.__memory is not None:
+            self.__release()
+
+
+    def create_executor(self, max_workers):
+        """!
+        @brief Creates pool of processes where each process has access to the dataset.
+
+        @param[in] max_workers (uint): Amount of processes in the pool.
+
+        @return (ProcessPoolExecutor) Pool of processes.
+
+        """
+        if self.__memory is None:
+            return _pickled_dataset_executor(max_workers, self.__data)
+
+        return ProcessPoolExecutor(max_workers=max_workers, initializer=_initialize_worker,
+                                   initargs=(self.__memory.name, self.__data.shape, self.__data.dtype))
+
+
+    @staticmethod
+    def get_worker_dataset():
+        """!
+        @brief Returns dataset in a process of a pool that is created by create_executor().
+
+        @return (numpy.array) Shared dataset.
+
+        """
+        return _worker_dataset
+
+
+    def __release(self):
+        """!
+        @brief Closes and removes shared memory block.
+
+        """
+        self.__memory.close()
+        self.__memory.unlink()
+        self.__memory = None
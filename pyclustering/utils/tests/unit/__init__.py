@@ -31,8 +31,11 @@ matplotlib.use('Agg');
 
 from pyclustering.tests.suite_holder import suite_holder;
 
+from pyclustering.utils.tests.unit                   import ut_blockwise_distance as blockwise_distance_unit_tests;
 from pyclustering.utils.tests.unit                   import ut_dimension    as dimension_unit_tests;
+from pyclustering.utils.tests.unit                   import ut_lazy_import  as lazy_import_unit_tests;
 from pyclustering.utils.tests.unit                   import ut_metric       as metric_unit_tests;
+from pyclustering.utils.tests.unit                   import ut_shared_dataset as shared_dataset_unit_tests;
 from pyclustering.utils.tests.unit                   import ut_utils        as utils_general_unit_tests;
 
 
@@ -44,8 +47,11 @@ class utils_unit_tests(suite_holder):
 
     @staticmethod
     def fill_suite(utils_suite):
+        utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(blockwise_distance_unit_tests));
         utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(dimension_unit_tests));
+        utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(lazy_import_unit_tests));
         utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(metric_unit_tests));
+        utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(shared_dataset_unit_tests));
         utils_suite.addTests(unittest.TestLoader().loadTestsFromModule(utils_general_unit_tests));
 
 
@@ -0,0 +1,205 @@
+"""!
+
+Unit-tests for blockwise distance calculator.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+pyclustering is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+pyclustering is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import unittest
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.cluster.kmeans import kmeans
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES, FCPS_SAMPLES
+
+from pyclustering.utils import read_sample
+from pyclustering.utils.blockwise_distance import blockwise_distance
+from pyclustering.utils.metric import distance_metric, type_metric
+
+
+class BlockwiseDistanceUnitTest(unittest.TestCase):
+    def templateDistanceMatrix(self, path, amount_centers, metric, memory_limit):
+        data = numpy.array(read_sample(path))
+        centers = data[numpy.linspace(0, len(data) - 1, amount_centers, dtype=int)] + 0.25
+
+        expected = numpy.array([[metric(point, center) for center in centers] for point in data])
+
+        calculator = blockwise_distance(data, memory_limit)
+        actual = numpy.full(expected.shape, float('nan'))
+        for row_begin, row_end, column_begin, column_end, tile in calculator.tiles(centers, metric):
+            assertion.ge(memory_limit, tile.nbytes)
+            actual[row_begin:row_end, column_begin:column_end] = tile
+
+        assertion.true(numpy.allclose(expected, actual, rtol=1e-9, atol=1e-9))
+
+        labels, distances = calculator.nearest(centers, metric)
+        assertion.eq(numpy.argmin(expected, axis=1).tolist(), labels.tolist())
+        assertion.true(numpy.allclose(numpy.min(expected, axis=1), distances, rtol=1e-9, atol=1e-9))
+
+        assigned = calculator.assigned(centers, labels, metric)
+        assertion.true(numpy.allclose(expected[numpy.arange(len(data)), labels], assigned, rtol=1e-12, atol=0.0))
+
+    def testEuclideanSquareOneTile(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_LSUN, 5, distance_metric(type_metric.EUCLIDEAN_SQUARE), 64 * 1024 * 1024)
+
+    def testEuclideanSquareRowTiles(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_LSUN, 5, distance_metric(type_metric.EUCLIDEAN_SQUARE), 1024)
+
+    def testEuclideanSquareRowAndColumnTiles(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_LSUN, 40, distance_metric(type_metric.EUCLIDEAN_SQUARE), 4096)
+
+    def testEuclideanSquarePartialColumnTile(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_LSUN, 41, distance_metric(type_metric.EUCLIDEAN_SQUARE), 10240)
+
+    def testEuclideanSquareOneValuePerTile(self):
+        self.templateDistanceMatrix(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, distance_metric(type_metric.EUCLIDEAN_SQUARE), 8)
+
+    def testEuclideanOneTile(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_LSUN, 5, distance_metric(type_metric.EUCLIDEAN), 64 * 1024 * 1024)
+
+    def testEuclideanRowAndColumnTiles(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_LSUN, 40, distance_metric(type_metric.EUCLIDEAN), 4096)
+
+    def testEuclideanPartialColumnTile(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_LSUN, 41, distance_metric(type_metric.EUCLIDEAN), 10240)
+
+    def testMinkowskiRowTiles(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_HEPTA, 7, distance_metric(type_metric.MINKOWSKI, degree=4), 2048)
+
+    def testMinkowskiExactDistance(self):
+        calculator = blockwise_distance([[0.0, 0.0], [3.0, 4.0]])
+
+        for degree, expected in [(1, 7.0), (2, 5.0), (3, 91.0 ** (1.0 / 3.0))]:
+            metric = distance_metric(type_metric.MINKOWSKI, degree=degree)
+
+            assertion.true(numpy.allclose([[0.0, expected], [expected, 0.0]], calculator.matrix([[0.0, 0.0], [3.0, 4.0]], metric)))
+            assertion.true(numpy.allclose([expected, expected], calculator.assigned([[0.0, 0.0], [3.0, 4.0]], [1, 0], metric)))
+
+    def testEuclideanExactDistance(self):
+        calculator = blockwise_distance([[0.0, 0.0], [3.0, 4.0]])
+        metric = distance_metric(type_metric.EUCLIDEAN)
+
+        assertion.true(numpy.allclose([[0.0, 5.0], [5.0, 0.0]], calculator.matrix([[0.0, 0.0], [3.0, 4.0]], metric)))
+        assertion.eq([5.0, 5.0], calculator.assigned([[0.0, 0.0], [3.0, 4.0]], [1, 0], metric).tolist())
+
+    def templateNearestTies(self, metric, memory_limit):
+        # distances to several centers are equal, but they are different after matrix multiplication
+        data = numpy.array([[3.0, 1.0, 5.0], [5.0, 3.0, 5.0], [4.0, 2.0, 1.0]])
+        centers = numpy.array([[4.1, 1.6, 0.1], [3.1, 2.1, 3.6], [5.1, 5.6, 4.1], [3.6, 3.6, 2.6], [2.1, 1.6, 2.6],
+                               [4.1, 1.1, 3.6], [2.1, 0.1, 3.6], [1.6, 0.1, 1.1]])
+
+        numpy_metric = blockwise_distance.create_numpy_metric(metric)
+        expected = numpy.array([numpy_metric(data, center) for center in centers]).T
+
+        labels, distances = blockwise_distance(data, memory_limit).nearest(centers, metric)
+        assertion.eq(numpy.argmin(expected, axis=1).tolist(), labels.tolist())
+        assertion.eq(numpy.min(expected, axis=1).tolist(), distances.tolist())
+
+    def testNearestTiesEuclideanSquare(self):
+        self.templateNearestTies(distance_metric(type_metric.EUCLIDEAN_SQUARE), 64 * 1024 * 1024)
+
+    def testNearestTiesEuclideanSquareColumnTiles(self):
+        self.templateNearestTies(distance_metric(type_metric.EUCLIDEAN_SQUARE), 16)
+
+    def testNearestTiesEuclidean(self):
+        self.templateNearestTies(distance_metric(type_metric.EUCLIDEAN), 64 * 1024 * 1024)
+
+    def testNearestTiesEuclideanColumnTiles(self):
+        self.templateNearestTies(distance_metric(type_metric.EUCLIDEAN), 16)
+
+    def testManhattanRowAndColumnTiles(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_LSUN, 40, distance_metric(type_metric.MANHATTAN), 4096)
+
+    def testManhattanDimensionGreaterThanCenters(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_HEPTA, 2, distance_metric(type_metric.MANHATTAN), 2048)
+
+    def testChebyshevRowTiles(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_HEPTA, 7, distance_metric(type_metric.CHEBYSHEV), 2048)
+
+    def testCanberraRowTiles(self):
+        self.templateDistanceMatrix(FCPS_SAMPLES.SAMPLE_HEPTA, 7, distance_metric(type_metric.CANBERRA), 2048)
+
+    def testUserDefinedRowTiles(self):
+        metric = distance_metric(type_metric.USER_DEFINED, func=lambda p1, p2: float(numpy.sum(numpy.abs(p1 - p2))))
+        self.templateDistanceMatrix(SIMPLE_SAMPLES.SAMPLE_SIMPLE3, 4, metric, 1024)
+
+    def testMatrix(self):
+        data = numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3))
+
+        for metric in [distance_metric(type_metric.EUCLIDEAN_SQUARE), distance_metric(type_metric.MANHATTAN)]:
+            expected = numpy.array([[metric(point, center) for center in data[:7]] for point in data])
+            actual = blockwise_distance(data, 8).matrix(data[:7], metric)
+
+            assertion.eq(expected.shape, actual.shape)
+            assertion.true(numpy.allclose(expected, actual, rtol=1e-9, atol=1e-9))
+
+    def testMetricIsNotChanged(self):
+        metric = distance_metric(type_metric.MANHATTAN)
+        blockwise_distance([[0.0, 0.0], [1.0, 1.0]]).nearest([[0.0, 0.0]], metric)
+        assertion.eq(2.0, metric([0.0, 0.0], [1.0, 1.0]))
+
+    def testSquaredNormsAreCached(self):
+        calculator = blockwise_distance([[3.0, 4.0], [1.0, 0.0]])
+        norms = calculator.get_squared_norms()
+
+        assertion.eq([25.0, 1.0], norms.tolist())
+        assertion.true(norms is calculator.get_squared_norms())
+
+    def testTileShape(self):
+        calculator = blockwise_distance(numpy.zeros((100000, 2)), 8 * 1024 * 1024)
+        assertion.eq((100000, 8), calculator.get_tile_shape(8))
+
+        rows, columns = calculator.get_tile_shape(100000)
+        assertion.gt(100000, columns)
+        assertion.ge(1024 * 1024, rows * (columns + 2))
+
+    def testIncorrectMemoryLimit(self):
+        self.assertRaises(ValueError, blockwise_distance, [[0.0]], 0)
+
+    def testKMeansMemoryLimit(self):
+        data = read_sample(FCPS_SAMPLES.SAMPLE_LSUN)
+        centers = [[0.5, 0.5], [2.5, 2.5], [3.5, 0.5]]
+
+        expected = kmeans(data, centers, ccore=False).process()
+        actual = kmeans(data, centers, ccore=False, memory_limit=1024).process()
+
+        assertion.eq(expected.get_clusters(), actual.get_clusters())
+        assertion.gt(1e-7, abs(expected.get_total_wce() - actual.get_total_wce()))
+
+    def testKMeansSharedCalculator(self):
+        data = read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3)
+        calculator = blockwise_distance(data, 512)
+
+        for centers in [[[0.2, 0.1], [4.0, 1.0]], [[0.2, 0.1], [4.0, 1.0], [2.0, 2.0], [5.0, 5.0]]]:
+            expected = kmeans(data, centers, ccore=False).process()
+            actual = kmeans(data, centers, ccore=False, distance_calculator=calculator).process()
+
+            assertion.eq(expected.get_clusters(), actual.get_clusters())
+
+
+if __name__ == "__main__":
+    unittest.main()
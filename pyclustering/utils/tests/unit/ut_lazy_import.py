@@ -0,0 +1,98 @@
+"""!
+
+Unit-tests for lazy import of modules.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+pyclustering is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+pyclustering is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import json
+import subprocess
+import sys
+import unittest
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+from pyclustering.utils.lazy_import import lazy_module
+
+
+## Modules that are checked by import-time tests, none of them should import visualization modules and SciPy.
+IMPORT_TIME_MODULES = [ 'pyclustering.cluster', 'pyclustering.cluster.kmeans', 'pyclustering.cluster.xmeans',
+                        'pyclustering.cluster.kmedoids', 'pyclustering.cluster.dbscan', 'pyclustering.cluster.optics',
+                        'pyclustering.nnet.sync' ]
+
+## Import-time budget (in seconds) of an algorithm module in a new interpreter, i.e. time that is spent by pyclustering
+## and modules that it imports (NumPy).
+IMPORT_TIME_BUDGET = 0.5
+
+
+class LazyImportUnitTest(unittest.TestCase):
+    @staticmethod
+    def measure_import(module_name):
+        script = "import json, sys, time\n" \
+                 "start = time.perf_counter()\n" \
+                 "import %s\n" \
+                 "duration = time.perf_counter() - start\n" \
+                 "loaded = [name for name in ('matplotlib', 'mpl_toolkits', 'PIL', 'scipy') if name in sys.modules]\n" \
+                 "print(json.dumps({'duration': duration, 'loaded': loaded}))" % module_name
+
+        output = subprocess.check_output([sys.executable, "-W", "ignore", "-c", script])
+        return json.loads(output.decode().strip().splitlines()[-1])
+
+
+    def testHeavyModulesAreNotImported(self):
+        for module_name in IMPORT_TIME_MODULES:
+            result = self.measure_import(module_name)
+            self.assertEqual([], result['loaded'], "'%s' imports visualization modules or SciPy." % module_name)
+
+
+    def testImportTimeBudget(self):
+        for module_name in IMPORT_TIME_MODULES:
+            result = self.measure_import(module_name)
+            self.assertLess(result['duration'], IMPORT_TIME_BUDGET, "'%s' is imported too long (%f sec.)." %
+                            (module_name, result['duration']))
+
+
+    def testModuleIsLoadedOnFirstUsage(self):
+        module = lazy_module('json')
+        self.assertIn("not loaded", repr(module))
+
+        self.assertEqual("[1, 2]", module.dumps([1, 2]))
+        self.assertNotIn("not loaded", repr(module))
+
+
+    def testDependenciesAreLoaded(self):
+        module = lazy_module('json', ['json.decoder'])
+        self.assertIs(json.decoder.JSONDecoder, module.decoder.JSONDecoder)
+
+
+    def testNotExistedAttribute(self):
+        module = lazy_module('json')
+        self.assertRaises(AttributeError, getattr, module, 'not_existed_attribute')
+
+
+    def testNotInstalledModule(self):
+        module = lazy_module('pyclustering_not_installed_module')
+        self.assertRaises(ImportError, getattr, module, 'attribute')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""!
+
+Unit-tests for dataset in shared memory.
+
+@authors Andrei Novikov (pyclustering@yandex.ru)
+@date 2014-2019
+@copyright GNU Public License
+
+pyclustering is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+pyclustering is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import sys
+import unittest
+
+from unittest.mock import patch
+
+# Generate images without having a window appear.
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy
+
+from pyclustering.tests.assertion import assertion
+
+from pyclustering.samples.definitions import SIMPLE_SAMPLES
+
+from pyclustering.utils import read_sample
+from pyclustering.utils.shared_dataset import shared_dataset
+
+
+def _get_worker_dataset():
+    return shared_dataset.get_worker_dataset().copy()
+
+
+def _sum_rows(begin, end):
+    return shared_dataset.get_worker_dataset()[begin:end].sum(axis=0)
+
+
+class SharedDatasetUnitTest(unittest.TestCase):
+    def templateWorkerDataset(self, data, pool_size):
+        with shared_dataset(data) as dataset, dataset.create_executor(pool_size) as executor:
+            futures = [executor.submit(_get_worker_dataset) for _ in range(pool_size * 2)]
+            for future in futures:
+                actual = future.result()
+                assertion.eq(data.shape, actual.shape)
+                assertion.eq(data.dtype, actual.dtype)
+                assertion.true(numpy.array_equal(data, actual))
+
+    def testWorkerDatasetSampleSimple3(self):
+        data = numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3))
+        self.templateWorkerDataset(data, 2)
+
+    def testWorkerDatasetIntegerType(self):
+        data = numpy.arange(60, dtype=numpy.int32).reshape(20, 3)
+        self.templateWorkerDataset(data, 2)
+
+    def testWorkerDatasetEmpty(self):
+        self.templateWorkerDataset(numpy.zeros((0, 2)), 1)
+
+    def testTasksSampleSimple3(self):
+        data = numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3))
+        bounds = list(range(0, len(data), 7)) + [len(data)]
+
+        with shared_dataset(data) as dataset, dataset.create_executor(3) as executor:
+            futures = [executor.submit(_sum_rows, begin, end) for begin, end in zip(bounds[:-1], bounds[1:])]
+            actual = numpy.sum([future.result() for future in futures], axis=0)
+
+        assertion.true(numpy.allclose(data.sum(axis=0), actual))
+
+    def testWorkerDatasetWithoutSharedMemory(self):
+        data = numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE3))
+
+        # import of 'multiprocessing.shared_memory' fails as in case of Python 3.7 and older
+        with patch.dict(sys.modules, {'multiprocessing.shared_memory': None}):
+            self.templateWorkerDataset(data, 2)
+
+    def testDatasetIsNotChanged(self):
+        data = numpy.array(read_sample(SIMPLE_SAMPLES.SAMPLE_SIMPLE1))
+        expected = data.copy()
+
+        with shared_dataset(data) as dataset, dataset.create_executor(1) as executor:
+            executor.submit(_get_worker_dataset).result()
+
+        assertion.true(numpy.array_equal(expected, data))
+
+
+if __name__ == "__main__":
+    unittest.main()
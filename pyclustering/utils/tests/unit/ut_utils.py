@@ -79,6 +79,13 @@ class Test(unittest.TestCase):
         assert self.float_comparasion(average_neighbor_distance(points, 3), 1.1381);
     
     
+    def testAverageNeighborDistanceTheSamePoints(self):
+        points = [[1.0, 1.0], [1.0, 1.0], [3.0, 1.0]];
+        
+        assert self.float_comparasion(average_neighbor_distance(points, 1), 2.0 / 3.0);
+        assert self.float_comparasion(average_neighbor_distance(points, 2), 8.0 / 6.0);
+    
+    
     def float_comparasion(self, float1, float2, eps = 0.0001):
         return ( (float1 + eps) > float2 and (float1 - eps) < float2 );
     